@@ -8,6 +8,7 @@ from desdeo.api.routers import (
     cumulus,
     enautilus,
     generic,
+    jobs,
     nautilus_navigator,
     nimbus,
     problem,
@@ -47,6 +48,7 @@ app.include_router(site_selection.router)
 app.include_router(gdm_score_bands_routers.router)
 app.include_router(nautilus_navigator.router)
 app.include_router(solution_description.router)
+app.include_router(jobs.router)
 
 
 @app.get("/health")
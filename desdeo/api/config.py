@@ -83,8 +83,18 @@ class AuthDeployConfig(BaseSettings):
     cookie_domain: str = os.getenv("COOKIE_DOMAIN", "")
 
 
+class EMOSettings(BaseSettings):
+    """Settings of the pool of worker processes that runs the EMO methods."""
+
+    callback_url: str = os.getenv("EMO_CALLBACK_URL", config_data["emo"]["callback_url"])
+    max_workers: int = int(os.getenv("EMO_MAX_WORKERS", config_data["emo"]["max_workers"]))
+    max_queued: int = int(os.getenv("EMO_MAX_QUEUED", config_data["emo"]["max_queued"]))
+
+
 AuthConfig = AuthDebugConfig() if SettingsConfig.debug else AuthDeployConfig()
 
 DatabaseConfig = DatabaseDebugConfig() if SettingsConfig.debug else DatabaseDeployConfig()
 
 ServerConfig = ServerDebugConfig() if SettingsConfig.debug else None
+
+EMOConfig = EMOSettings()
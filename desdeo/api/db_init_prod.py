@@ -8,7 +8,12 @@ What it does
 ------------
 1. Creates all SQLModel tables if they do not already exist.
    (Uses create_all which is a no-op for tables that are present.)
-2. Seeds an initial analyst user whose credentials come from env vars.
+2. Adds the columns that earlier versions did not have to existing tables
+   (create_all does not alter tables).
+3. Converts representative solution sets stored as JSON by earlier versions
+   to Arrow IPC, changing the type of the column from JSON to BYTEA on
+   PostgreSQL. Skipped once the column is binary.
+4. Seeds an initial analyst user whose credentials come from env vars.
    If the user already exists the step is skipped.
 
 Environment variables required
@@ -26,12 +31,14 @@ DESDEO_ADMIN_GROUP    Group name for the seeded user (default: "admin").
 import os
 import sys
 
+from sqlalchemy import Engine, LargeBinary, column, inspect, table, text, update
 from sqlmodel import Session, SQLModel, select
 
 # Import the engine after DATABASE_URL is in the environment so the config
 # module picks it up correctly.
 from desdeo.api.db import engine
-from desdeo.api.models import User, UserRole
+from desdeo.api.models import ProblemDB, RepresentativeNonDominatedSolutions, User, UserRole
+from desdeo.api.models.representative_solution import SolutionDataType
 from desdeo.api.routers.user_authentication import get_password_hash
 
 
@@ -41,6 +48,58 @@ def create_tables() -> None:
     print("[db-init] Tables ready.")
 
 
+def add_missing_columns(db_engine: Engine = engine) -> None:
+    """Add the revision column of the problems to a database created before it existed. Safe to run again."""
+    table_name = ProblemDB.__tablename__
+    if "revision" in {col["name"] for col in inspect(db_engine).get_columns(table_name)}:
+        return
+
+    print(f"[db-init] Adding the revision column to {table_name}...")
+    with db_engine.begin() as connection:
+        # the problems stored so far share an empty revision, and get a new one when they are changed
+        connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN revision VARCHAR NOT NULL DEFAULT ''"))
+
+
+def convert_solution_data(db_engine: Engine = engine) -> None:
+    """Convert the representative solution sets stored as JSON to Arrow IPC in a binary column.
+
+    Rows that are already Arrow IPC are left as they are, so the conversion is safe to run again.
+    """
+    table_name = RepresentativeNonDominatedSolutions.__tablename__
+    inspector = inspect(db_engine)
+    if not inspector.has_table(table_name):
+        return
+
+    column_type = next(col["type"] for col in inspector.get_columns(table_name) if col["name"] == "solution_data")
+    if isinstance(column_type, LargeBinary):
+        print("[db-init] Representative solution sets are stored as Arrow IPC — skipping conversion.")
+        return
+
+    print("[db-init] Converting representative solution sets from JSON to Arrow IPC...")
+    solution_sets = table(table_name, column("id"), column("solution_data"))
+    solution_data_type = SolutionDataType()
+
+    with db_engine.begin() as connection:
+        if db_engine.dialect.name == "postgresql":
+            # The JSON is kept as UTF-8 text in the binary column until the rows are rewritten below.
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table_name} ALTER COLUMN solution_data TYPE BYTEA "
+                    "USING convert_to(solution_data::text, 'UTF8')"
+                )
+            )
+
+        n_converted = 0
+        for row_id, value in connection.execute(select(solution_sets.c.id, solution_sets.c.solution_data)).all():
+            if value is None or solution_data_type.is_arrow(value):
+                continue
+            payload = solution_data_type.process_bind_param(solution_data_type.process_result_value(value, None), None)
+            connection.execute(update(solution_sets).where(solution_sets.c.id == row_id).values(solution_data=payload))
+            n_converted += 1
+
+    print(f"[db-init] Converted {n_converted} representative solution sets.")
+
+
 def seed_admin_user() -> None:
     username = os.environ.get("DESDEO_ADMIN_USERNAME")
     password = os.environ.get("DESDEO_ADMIN_PASSWORD")
@@ -76,6 +135,8 @@ def main() -> None:
 
     print(f"[db-init] Using database: {database_url.split('@')[-1]}")  # hide credentials
     create_tables()
+    add_missing_columns()
+    convert_solution_data()
     seed_admin_user()
     print("[db-init] Done.")
 
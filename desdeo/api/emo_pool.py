@@ -0,0 +1,367 @@
+"""A bounded pool of worker processes that runs the evolutionary algorithms of the EMO endpoints.
+
+Each evolutionary algorithm runs in a process of its own, so that the algorithms of a request run in
+parallel and do not hold the GIL of the server. Starting fresh processes for every request, however,
+lets concurrent requests start any number of processes, each of which imports DESDEO from scratch.
+The pool instead keeps a fixed number of worker processes alive, which import the modules of the
+evolutionary algorithms once, when they start. Algorithms wait in a queue for a free worker, and new
+runs are refused once the queue is full, so that the memory the workers use stays bounded.
+
+A worker writes the solutions its algorithm found to a block of shared memory as Arrow IPC, and the
+server reads them from there, so that the dataframes are not pickled on the way. Workers message the
+clients through the EMO websocket endpoint at a configurable URL, and each algorithm watches a flag in
+shared memory that tells it to stop early, in addition to the termination criteria of its template.
+"""
+
+import asyncio
+import importlib
+import io
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from warnings import warn
+
+import polars as pl
+from websockets.asyncio.client import connect
+
+from desdeo.api.config import EMOConfig
+from desdeo.emo.options.templates import EMOOptions, PreferenceOptions, TemplateOptions, emo_constructor
+from desdeo.emo.options.termination import CompositeTerminatorOptions, ExternalCheckTerminatorOptions
+from desdeo.problem import Problem
+
+# Imported by each worker when it starts, so that algorithms do not wait for them.
+_PRELOADED_MODULES = (
+    "polars",
+    "desdeo.problem",
+    "desdeo.emo.options.templates",
+    "desdeo.emo.operators.evaluator",
+)
+
+EMOResultFrames = tuple[pl.DataFrame, pl.DataFrame]
+"""The decision variables and the outputs of the solutions found by an evolutionary algorithm."""
+
+
+class EMOPoolFullError(Exception):
+    """Raised when the queue of the pool has no room for the algorithms of a new run."""
+
+
+class EMOWorkerPool:
+    """A pool of worker processes for evolutionary algorithms, with a bounded queue.
+
+    The worker processes are started the first time they are needed, and stay alive until the pool is
+    shut down.
+    """
+
+    def __init__(
+        self, max_workers: int = 2, max_queued: int = 8, callback_url: str = "ws://localhost:8000/method/emo/ws"
+    ):
+        """Create a pool, without starting its workers yet.
+
+        Args:
+            max_workers (int, optional): the number of worker processes, i.e., the number of algorithms run at the
+                same time. Defaults to 2.
+            max_queued (int, optional): the number of algorithms that can wait for a free worker. Defaults to 8.
+            callback_url (str, optional): the URL of the EMO websocket endpoint, without the id of the method,
+                which the workers connect to in order to message the clients. Defaults to
+                "ws://localhost:8000/method/emo/ws".
+
+        Raises:
+            ValueError: `max_workers` is not positive, or `max_queued` is negative.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}.")
+        if max_queued < 0:
+            raise ValueError(f"max_queued must be a non-negative integer, got {max_queued}.")
+
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.callback_url = callback_url.rstrip("/")
+
+        self._executor: ProcessPoolExecutor | None = None
+        # Reentrant, because the callback of a future that is already done runs right away, in the same thread.
+        self._lock = threading.RLock()
+        self._admitted = 0
+        self._stop_flags: dict[str, SharedMemory] = {}
+
+    @property
+    def admitted(self) -> int:
+        """The number of algorithms that are running or waiting for a free worker."""
+        return self._admitted
+
+    def has_room(self, n_algorithms: int) -> bool:
+        """Check whether the queue has room for the algorithms of a new run.
+
+        Args:
+            n_algorithms (int): the number of algorithms in the run.
+
+        Returns:
+            bool: whether a run with that many algorithms would be admitted right now.
+        """
+        with self._lock:
+            return self._admitted + n_algorithms <= self.max_workers + self.max_queued
+
+    def submit(
+        self,
+        problem: Problem,
+        templates: list[TemplateOptions],
+        preference_options: PreferenceOptions | None,
+        method_ids: list[str],
+        client_id: str,
+        on_complete: Callable[[list[EMOResultFrames]], None],
+    ):
+        """Queue the algorithms of a run, one per template.
+
+        Once every algorithm has finished, `on_complete` is called in a thread of the server with the
+        solutions of the algorithms that succeeded. Algorithms that failed are warned about and left out.
+
+        Args:
+            problem (Problem): the problem to solve.
+            templates (list[TemplateOptions]): the templates of the algorithms.
+            preference_options (PreferenceOptions | None): the preferences given to every algorithm.
+            method_ids (list[str]): the websocket ids of the algorithms, one per template.
+            client_id (str): the websocket id of the client the algorithms message.
+            on_complete (Callable[[list[EMOResultFrames]], None]): stores the solutions of the run.
+
+        Raises:
+            EMOPoolFullError: there is no room in the queue for every algorithm of the run.
+        """
+        with self._lock:
+            if not self.has_room(len(templates)):
+                raise EMOPoolFullError(
+                    f"The EMO worker pool is busy: {self._admitted} algorithms are running or queued, "
+                    f"and at most {self.max_workers + self.max_queued} are allowed."
+                )
+
+            futures = []
+            for method_id, template in zip(method_ids, templates, strict=True):
+                stop_flag = SharedMemory(create=True, size=1)
+                stop_flag.buf[0] = 0
+                self._stop_flags[method_id] = stop_flag
+
+                future = self._submit_algorithm(
+                    problem,
+                    template,
+                    preference_options,
+                    method_id,
+                    client_id,
+                    self.callback_url,
+                    stop_flag.name,
+                )
+                self._admitted += 1
+                future.add_done_callback(self._release)
+                futures.append(future)
+
+        threading.Thread(
+            target=self._collect, args=(method_ids, futures, on_complete), name="desdeo-emo-collect", daemon=True
+        ).start()
+
+    def stop(self, method_id: str) -> bool:
+        """Tell a running or queued algorithm to stop early. It still stores the solutions it has found.
+
+        Args:
+            method_id (str): the websocket id of the algorithm.
+
+        Returns:
+            bool: whether there was such an algorithm.
+        """
+        with self._lock:
+            stop_flag = self._stop_flags.get(method_id)
+            if stop_flag is None:
+                return False
+            stop_flag.buf[0] = 1
+            return True
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers. Queued algorithms are dropped.
+
+        Args:
+            wait (bool, optional): whether to wait for the running algorithms to finish. Defaults to True.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _submit_algorithm(self, *args) -> Future:
+        """Submit an algorithm to the workers, starting new workers if the old ones have died."""
+        if self._executor is None:
+            self._executor = _new_executor(self.max_workers)
+        try:
+            return self._executor.submit(_run_algorithm, *args)
+        except BrokenProcessPool:
+            # A worker that dies, e.g., because it ran out of memory, breaks the whole pool for good.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = _new_executor(self.max_workers)
+            return self._executor.submit(_run_algorithm, *args)
+
+    def _release(self, _future: Future):
+        with self._lock:
+            self._admitted -= 1
+
+    def _collect(
+        self, method_ids: list[str], futures: list[Future], on_complete: Callable[[list[EMOResultFrames]], None]
+    ):
+        """Wait for the algorithms of a run, read their solutions from shared memory and store them."""
+        results = []
+        for method_id, future in zip(method_ids, futures, strict=True):
+            try:
+                results.append(_read_shared_results(*future.result()))
+            except Exception as e:
+                warn(f"The EMO method {method_id} failed: {e!r}", stacklevel=2)
+            finally:
+                with self._lock:
+                    stop_flag = self._stop_flags.pop(method_id)
+                stop_flag.close()
+                stop_flag.unlink()
+
+        if len(results) == 0:
+            warn(f"Every EMO method of the run {method_ids} failed; nothing was stored.", stacklevel=2)
+            return
+        on_complete(results)
+
+
+emo_pool = EMOWorkerPool(
+    max_workers=EMOConfig.max_workers, max_queued=EMOConfig.max_queued, callback_url=EMOConfig.callback_url
+)
+"""The EMO worker pool of this server process."""
+
+
+def _new_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Create the worker processes of a pool.
+
+    The workers are spawned rather than forked, so that they do not inherit the threads and the open
+    connections of the server.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"), initializer=_initialize_worker
+    )
+
+
+def _initialize_worker():
+    """Import the modules of the evolutionary algorithms once, when a worker starts."""
+    for module in _PRELOADED_MODULES:
+        importlib.import_module(module)
+
+
+def _run_algorithm(
+    problem: Problem,
+    template: TemplateOptions,
+    preference_options: PreferenceOptions | None,
+    method_id: str,
+    client_id: str,
+    callback_url: str,
+    stop_flag_name: str,
+) -> tuple[str, int, int]:
+    """Run an evolutionary algorithm in a worker and share its solutions.
+
+    Args:
+        problem (Problem): the problem to solve.
+        template (TemplateOptions): the template of the algorithm.
+        preference_options (PreferenceOptions | None): the preferences given to the algorithm.
+        method_id (str): the websocket id of the algorithm.
+        client_id (str): the websocket id of the client to message.
+        callback_url (str): the URL of the EMO websocket endpoint, without the id of the method.
+        stop_flag_name (str): the name of the shared memory whose first byte is set to stop the algorithm.
+
+    Returns:
+        tuple[str, int, int]: the name of the shared memory the solutions were written to, and the sizes of the
+            Arrow IPC files of the decision variables and the outputs in it.
+    """
+    stop_flag = SharedMemory(name=stop_flag_name)
+    try:
+        frames = asyncio.run(
+            _run_algorithm_async(
+                problem=problem,
+                template=template,
+                preference_options=preference_options,
+                method_id=method_id,
+                client_id=client_id,
+                callback_url=callback_url,
+                stop_requested=lambda: stop_flag.buf[0] != 0,
+            )
+        )
+    finally:
+        stop_flag.close()
+
+    return _write_shared_results(frames)
+
+
+async def _run_algorithm_async(
+    problem: Problem,
+    template: TemplateOptions,
+    preference_options: PreferenceOptions | None,
+    method_id: str,
+    client_id: str,
+    callback_url: str,
+    stop_requested: Callable[[], bool],
+) -> EMOResultFrames:
+    """Run an evolutionary algorithm, messaging the client when it starts and finishes."""
+    async with connect(f"{callback_url}/{method_id}") as ws:
+        await ws.send(f'{{"message": "Started {method_id}", "send_to": "{client_id}"}}')
+        emo_options = EMOOptions(template=_stoppable(template), preference=preference_options)
+        solver, extras = emo_constructor(emo_options, problem=problem, external_check=stop_requested)
+        results = solver()
+        if extras.archive is not None:
+            results = extras.archive.results
+        await ws.send(f'{{"message": "Finished {method_id}", "send_to": "{client_id}"}}')
+        return results.optimal_variables, results.optimal_outputs
+
+
+def _stoppable(template: TemplateOptions) -> TemplateOptions:
+    """Add a check of the stop flag to the termination of a template, so that its algorithm can be stopped early.
+
+    A composite termination that needs all of its criteria to be met is left as it is, since the check
+    cannot be added to it.
+    """
+    termination = template.termination
+    if isinstance(termination, ExternalCheckTerminatorOptions):
+        return template
+    if isinstance(termination, CompositeTerminatorOptions):
+        if termination.mode == "all" or any(
+            isinstance(criterion, ExternalCheckTerminatorOptions) for criterion in termination.terminators
+        ):
+            return template
+        termination = termination.model_copy(
+            update={"terminators": [*termination.terminators, ExternalCheckTerminatorOptions()]}
+        )
+    else:
+        termination = CompositeTerminatorOptions(terminators=[termination, ExternalCheckTerminatorOptions()])
+    return template.model_copy(update={"termination": termination})
+
+
+def _write_shared_results(frames: EMOResultFrames) -> tuple[str, int, int]:
+    """Write dataframes to a new block of shared memory as Arrow IPC files.
+
+    The block is left for the reader to unlink.
+    """
+    payloads = []
+    for frame in frames:
+        buffer = io.BytesIO()
+        frame.write_ipc(buffer)
+        payloads.append(buffer.getbuffer())
+
+    shared = SharedMemory(create=True, size=sum(len(payload) for payload in payloads))
+    offset = 0
+    for payload in payloads:
+        shared.buf[offset : offset + len(payload)] = payload
+        offset += len(payload)
+
+    name = shared.name
+    shared.close()
+    return name, len(payloads[0]), len(payloads[1])
+
+
+def _read_shared_results(name: str, variables_size: int, outputs_size: int) -> EMOResultFrames:
+    """Read the dataframes written by `_write_shared_results`, and unlink the shared memory they were in."""
+    shared = SharedMemory(name=name)
+    try:
+        # Copy the files out, so that no views of the memory are left when it is closed.
+        variables = pl.read_ipc(bytes(shared.buf[:variables_size]))
+        outputs = pl.read_ipc(bytes(shared.buf[variables_size : variables_size + outputs_size]))
+    finally:
+        shared.close()
+        shared.unlink()
+    return variables, outputs
@@ -0,0 +1,430 @@
+"""A queue of background jobs that run long solves outside of the request that submitted them.
+
+Solving a subproblem of an interactive method can take minutes, e.g., for mixed-integer nonlinear
+problems, and the endpoints of the methods solve synchronously. Requests that wait that long tie up
+the workers of the server and run into the timeouts of proxies. The solve endpoints therefore have
+variants that submit the very same endpoint as a job to a pool of worker threads in this process,
+and respond with the id of the job right away. The client follows the job by polling its status or
+by streaming its events, and the endpoint stores its state in the database as usual when the job
+completes. No external broker is needed.
+
+Each job runs in its own database session. A job can be cancelled while it is queued, or while it
+runs; a running job cannot be interrupted in the middle of a solve, but once it has been cancelled,
+its session refuses to commit, so nothing it computes from then on is stored. Each user can have only a limited
+number of jobs queued or running at a time, so that a single user cannot occupy every worker.
+
+Jobs are kept in memory, and finished jobs are forgotten after a while. Jobs do not survive a restart
+of the server, and a job can only be followed through the process that runs it.
+"""
+
+import asyncio
+import contextvars
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlmodel import Session
+
+from desdeo.api.models import User
+from desdeo.api.models.jobs import FINISHED_JOB_STATUSES, JobEvent, JobInfo, JobStatus
+from desdeo.api.routers.utils import SessionContext, SessionContextGuard
+
+_current_job: contextvars.ContextVar["Job | None"] = contextvars.ContextVar("current_job", default=None)
+
+
+class JobCancelledError(Exception):
+    """Raised inside a job that has been cancelled, to stop it from storing anything."""
+
+
+class JobLimitError(Exception):
+    """Raised when a user already has as many unfinished jobs as they are allowed."""
+
+
+class Job:
+    """A background job and the events that have happened to it.
+
+    The status of a job is only changed by the queue that runs it, but it can be read, and the job
+    cancelled, from any thread.
+    """
+
+    def __init__(self, user_id: int, kind: str, limited: bool = True):
+        """Create a queued job.
+
+        Args:
+            user_id (int): the id of the user who submitted the job.
+            kind (str): what the job runs, e.g., `nimbus.solve`.
+            limited (bool, optional): whether the job counts towards the limit of jobs of the user. Defaults
+                to True.
+        """
+        self.job_id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.kind = kind
+        self.limited = limited
+        self.status = JobStatus.QUEUED
+        self.submitted_at = datetime.now(UTC)
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+        self.progress: str | None = None
+        self.result: Any | None = None
+        self.error: str | None = None
+        self.status_code: int | None = None
+        self.exception: BaseException | None = None
+        """The exception the job failed with, for code that runs jobs of its own and handles their errors."""
+
+        self.events: list[JobEvent] = []
+        self._lock = threading.Lock()
+        self._cancel_requested = threading.Event()
+        self._done = threading.Event()
+        self._future: Future | None = None
+
+        self._record(JobStatus.QUEUED)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has succeeded, failed or been cancelled."""
+        return self.status in FINISHED_JOB_STATUSES
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether the job has been asked to cancel."""
+        return self._cancel_requested.is_set()
+
+    def report(self, message: str):
+        """Report the progress of the job to whoever follows it.
+
+        Args:
+            message (str): what the job is doing.
+        """
+        self.progress = message
+        self._record(self.status, message=message)
+
+    def raise_if_cancelled(self):
+        """Stop the job if it has been cancelled.
+
+        Raises:
+            JobCancelledError: the job has been cancelled.
+        """
+        if self.cancel_requested:
+            raise JobCancelledError(f"Job {self.job_id} was cancelled.")
+
+    def events_after(self, index: int) -> list[JobEvent]:
+        """The events of the job from the given index on.
+
+        Args:
+            index (int): the index of the first event to return.
+
+        Returns:
+            list[JobEvent]: the events, oldest first.
+        """
+        with self._lock:
+            return self.events[index:]
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the job has finished.
+
+        Args:
+            timeout (float | None, optional): the longest time to wait in seconds. If None, waits until the job
+                has finished. Defaults to None.
+
+        Returns:
+            bool: whether the job has finished.
+        """
+        return self._done.wait(timeout)
+
+    async def wait_async(self, poll_interval: float = 0.1):
+        """Wait until the job has finished without blocking the event loop.
+
+        Args:
+            poll_interval (float, optional): how often to check the job, in seconds. Defaults to 0.1.
+        """
+        while not self._done.is_set():
+            await asyncio.sleep(poll_interval)
+
+    def info(self) -> JobInfo:
+        """The status of the job, as returned to the client."""
+        return JobInfo(
+            job_id=self.job_id,
+            kind=self.kind,
+            status=self.status,
+            submitted_at=self.submitted_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            progress=self.progress,
+            error=self.error,
+            status_code=self.status_code,
+            result=self.result,
+        )
+
+    def _record(self, job_status: JobStatus, message: str | None = None, result: Any | None = None):
+        """Change the status of the job and add an event about it."""
+        with self._lock:
+            self.status = job_status
+            self.events.append(JobEvent(index=len(self.events), status=job_status, message=message, result=result))
+
+    def _start(self):
+        self.started_at = datetime.now(UTC)
+        self._record(JobStatus.RUNNING)
+
+    def _finish(self, job_status: JobStatus, message: str | None = None, result: Any | None = None):
+        self.finished_at = datetime.now(UTC)
+        self._record(job_status, message=message, result=result)
+        self._done.set()
+
+
+class JobQueue:
+    """Runs background jobs on a pool of worker threads, a limited number per user at a time."""
+
+    def __init__(self, max_workers: int = 4, max_jobs_per_user: int = 2, retention: timedelta = timedelta(hours=1)):
+        """Create a queue with idle workers.
+
+        The workers are threads, which suits the solvers used by the interactive methods: they either
+        run as separate processes or release the GIL while they solve.
+
+        Args:
+            max_workers (int, optional): the number of jobs run at the same time. Defaults to 4.
+            max_jobs_per_user (int, optional): the number of jobs a user can have queued or running at the same
+                time. Defaults to 2.
+            retention (timedelta, optional): how long finished jobs are kept around for their results to be
+                fetched. Defaults to one hour.
+
+        Raises:
+            ValueError: `max_workers` or `max_jobs_per_user` is not positive.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}.")
+        if max_jobs_per_user < 1:
+            raise ValueError(f"max_jobs_per_user must be a positive integer, got {max_jobs_per_user}.")
+
+        self.max_workers = max_workers
+        self.max_jobs_per_user = max_jobs_per_user
+        self.retention = retention
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="desdeo-job")
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, user_id: int, kind: str, func: Callable[[Job], Any], limited: bool = True) -> Job:
+        """Queue a job.
+
+        Args:
+            user_id (int): the id of the user who submits the job.
+            kind (str): what the job runs, e.g., `nimbus.solve`.
+            func (Callable[[Job], Any]): runs the job, given the job so that it can report its progress, and
+                returns its result. If it raises an `HTTPException`, the job fails with the status code and
+                detail of the exception.
+            limited (bool, optional): whether the job counts towards the limit of jobs of the user. Jobs that
+                the user did not ask for themselves, e.g., the solves of a group, are not limited. Defaults to True.
+
+        Raises:
+            JobLimitError: the user already has `max_jobs_per_user` jobs queued or running.
+
+        Returns:
+            Job: the queued job.
+        """
+        with self._lock:
+            self._forget_expired()
+            unfinished = sum(
+                1 for job in self._jobs.values() if job.user_id == user_id and job.limited and not job.finished
+            )
+            if limited and unfinished >= self.max_jobs_per_user:
+                raise JobLimitError(
+                    f"User {user_id} already has {unfinished} unfinished jobs, "
+                    f"which is the most allowed ({self.max_jobs_per_user})."
+                )
+
+            job = Job(user_id=user_id, kind=kind, limited=limited)
+            self._jobs[job.job_id] = job
+            job._future = self._executor.submit(self._run, job, func)
+            return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Find a job.
+
+        Args:
+            job_id (str): the id of the job.
+
+        Returns:
+            Job | None: the job, or None if there is no such job or it has been forgotten.
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs_of(self, user_id: int) -> list[Job]:
+        """List the jobs of a user, oldest first.
+
+        Args:
+            user_id (int): the id of the user.
+
+        Returns:
+            list[Job]: the jobs that have not been forgotten yet.
+        """
+        with self._lock:
+            return [job for job in self._jobs.values() if job.user_id == user_id]
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job.
+
+        A queued job is cancelled right away. A running job is stopped the next time it tries to commit to the
+        database, so that it stores nothing from then on; a job that has already stored its results by then
+        succeeds regardless.
+
+        Args:
+            job_id (str): the id of the job.
+
+        Returns:
+            bool: whether the job was cancelled, i.e., False if it does not exist or has already finished.
+        """
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+
+        job._cancel_requested.set()
+        if job._future is not None and job._future.cancel():
+            job._finish(JobStatus.CANCELLED, message="Cancelled before it started.")
+        return True
+
+    def shutdown(self, wait: bool = True):
+        """Cancel the queued jobs and stop the workers.
+
+        Args:
+            wait (bool, optional): whether to wait for the running jobs to finish. Defaults to True.
+        """
+        for job in list(self._jobs.values()):
+            if job.status == JobStatus.QUEUED:
+                self.cancel(job.job_id)
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, func: Callable[[Job], Any]):
+        """Run a job on a worker, recording how it ended."""
+        if job.cancel_requested:
+            job._finish(JobStatus.CANCELLED, message="Cancelled before it started.")
+            return
+
+        job._start()
+        token = _current_job.set(job)
+        try:
+            result = func(job)
+        except JobCancelledError:
+            job._finish(JobStatus.CANCELLED, message="Cancelled while running; nothing was stored.")
+        except HTTPException as e:
+            job.exception = e
+            job.error = str(e.detail)
+            job.status_code = e.status_code
+            job._finish(JobStatus.FAILED, message=job.error)
+        except Exception as e:
+            job.exception = e
+            job.error = f"{type(e).__name__}: {e}"
+            job.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            job._finish(JobStatus.FAILED, message=job.error)
+        else:
+            job.result = result
+            job._finish(JobStatus.SUCCEEDED, result=result)
+        finally:
+            _current_job.reset(token)
+
+    def _forget_expired(self):
+        """Drop the jobs that finished longer than `retention` ago."""
+        cutoff = datetime.now(UTC) - self.retention
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+job_queue = JobQueue()
+"""The job queue of this worker process."""
+
+
+def report_progress(message: str):
+    """Report the progress of the job the calling code runs in, if any.
+
+    Code that is run both in requests and in jobs can call this freely; outside of a job, it does nothing.
+
+    Args:
+        message (str): what the job is doing.
+    """
+    job = _current_job.get()
+    if job is not None:
+        job.report(message)
+
+
+def progress_reporter(unit: str) -> Callable[[int, int], None]:
+    """Make a callback that reports how much of its work the job the calling code runs in has done.
+
+    The callback is meant for the `progress` argument of the solve functions, e.g.,
+    `desdeo.mcdm.nimbus.solve_sub_problems`, which call it with the number of units done so far and
+    the number of units in total. Like `report_progress`, it does nothing outside of a job.
+
+    Args:
+        unit (str): what the work is counted in, e.g., `sub-problems`.
+
+    Returns:
+        Callable[[int, int], None]: the callback.
+    """
+
+    def report(done: int, total: int):
+        report_progress(f"Solved {done} of {total} {unit}.")
+
+    return report
+
+
+def submit_endpoint_job(
+    kind: str,
+    endpoint: Callable[[BaseModel, SessionContext], BaseModel],
+    request: BaseModel,
+    context: SessionContext,
+    guard: SessionContextGuard,
+    queue: JobQueue | None = None,
+) -> JobInfo:
+    """Run a solve endpoint as a background job.
+
+    The request has already been validated by the guard when this is called, so that a bad request is
+    refused before it is queued. The job builds the context of the endpoint again with the same guard
+    in a session of its own, because the session of the request is closed once it has been responded to.
+
+    Args:
+        kind (str): what the job runs, e.g., `nimbus.solve`.
+        endpoint (Callable[[BaseModel, SessionContext], BaseModel]): the endpoint, which takes the request and
+            the context, stores its state and returns its response.
+        request (BaseModel): the request to the endpoint.
+        context (SessionContext): the context of the request that submits the job.
+        guard (SessionContextGuard): the guard that built the context.
+        queue (JobQueue | None, optional): the queue to submit the job to. If None, the queue of this worker
+            process is used. Defaults to None.
+
+    Raises:
+        HTTPException: the user already has too many unfinished jobs.
+
+    Returns:
+        JobInfo: the status of the queued job.
+    """
+    queue = queue if queue is not None else job_queue
+    bind = context.db_session.get_bind()
+    user_id = context.user.id
+
+    def run(job: Job) -> Any:
+        with Session(bind) as db_session:
+            # A cancelled job may still finish its solve, but it must not store anything.
+            event.listen(db_session, "before_commit", lambda _session: job.raise_if_cancelled())
+
+            user = db_session.get(User, user_id)
+            job_context = guard.post(user=user, db_session=db_session, request=request)
+            report_progress("Solving.")
+            return jsonable_encoder(endpoint(request, job_context))
+
+    try:
+        job = queue.submit(user_id, kind, run)
+    except JobLimitError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e)) from e
+
+    return job.info()
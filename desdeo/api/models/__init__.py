@@ -44,6 +44,9 @@ __all__ = [  # noqa: RUF022
     "IntermediateSolutionRequest",
     "IntermediateSolutionResponse",
     "IntermediateSolutionState",
+    "JobEvent",
+    "JobInfo",
+    "JobStatus",
     "CumulusClassificationRequest",
     "CumulusClassificationResponse",
     "CumulusClassificationState",
@@ -273,6 +276,7 @@ from .generic_states import (
     StateDB,
     UserSavedSolutionDB,
 )
+from .jobs import JobEvent, JobInfo, JobStatus
 from .nautilus_navigator import (
     NautilusNavigatorInitializationState,
     NautilusNavigatorInitRequest,
@@ -1,11 +1,15 @@
 """Defines models for representing the state of various interactive methods."""
 
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
 from pydantic import ConfigDict, computed_field
+from sqlalchemy import Index, inspect
 from sqlalchemy.orm import object_session
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import (
     JSON,
     Column,
@@ -105,6 +109,8 @@ class StateDB(SQLModel, table=True):
     """State holder with a single relationship to the base State."""
 
     __tablename__ = "statedb"
+    # The states of a session are fetched together and joined to their base states to filter them by kind.
+    __table_args__ = (Index("ix_statedb_session_id_state_id", "session_id", "state_id"),)
 
     id: int | None = Field(primary_key=True, default=None)
 
@@ -180,7 +186,8 @@ class StateDB(SQLModel, table=True):
         """Return the concrete substate instance (e.g., NIMBUSSaveState)...
 
         Return the concrete substate instance (e.g., NIMBUSSaveState)
-        resolved from the stored `base_state`.
+        resolved from the stored `base_state`. Substates already loaded into the
+        session, e.g., by `resolve_substates`, are returned without a query.
         """
         if self.base_state is None:
             return None
@@ -195,7 +202,7 @@ class StateDB(SQLModel, table=True):
             # No bound state
             raise RuntimeError("StateDB.state accessed without a bound Session")
 
-        return db_session.exec(select(table).where(table.id == self.base_state.id)).first()
+        return db_session.get(table, self.base_state.id)
 
 
 KIND_TO_TABLE: dict[StateKind, SQLModel] = {
@@ -261,6 +268,99 @@ def _method_phase_from_kind(kind: StateKind) -> tuple[str, str]:
     return method, phase
 
 
+# The number of ids looked up with a single IN clause, well within the parameter limits of every database.
+_RESOLVE_BATCH = 500
+
+
+def resolve_substates(database_session: Session, state_dbs: Iterable[StateDB]) -> dict[int, SQLModel | None]:
+    """Resolve the substates of many `StateDB` rows at once.
+
+    Accessing `StateDB.state` row by row issues a query for the base state and
+    another for the substate of every row. This function instead loads the base
+    states with one query, and the substates with one query per substate table.
+    The substates are loaded into the session, so `StateDB.state` of the given
+    rows returns them without further queries.
+
+    Args:
+        database_session (Session): the database session the rows are bound to.
+        state_dbs (Iterable[StateDB]): the rows whose substates to resolve.
+
+    Returns:
+        dict[int, SQLModel | None]: the substate of each row, keyed by the id of the `StateDB` row.
+    """
+    state_dbs = list(state_dbs)
+
+    # The base states are loaded with one query and set as the loaded value of `StateDB.base_state`, which
+    # would otherwise be lazy loaded with a query per row.
+    unloaded = [state_db for state_db in state_dbs if "base_state" in inspect(state_db).unloaded]
+    base_states = {
+        base_state.id: base_state
+        for base_state in _select_in(
+            database_session, State, [state_db.state_id for state_db in unloaded if state_db.state_id is not None]
+        )
+    }
+    for state_db in unloaded:
+        set_committed_value(state_db, "base_state", base_states.get(state_db.state_id))
+
+    ids_by_table: dict[type[SQLModel], list[int]] = defaultdict(list)
+    for state_db in state_dbs:
+        if state_db.base_state is not None and state_db.base_state.kind in KIND_TO_TABLE:
+            ids_by_table[KIND_TO_TABLE[state_db.base_state.kind]].append(state_db.base_state.id)
+
+    substates: dict[tuple[type[SQLModel], int], SQLModel] = {}
+    for table, ids in ids_by_table.items():
+        substates.update(((table, substate.id), substate) for substate in _select_in(database_session, table, ids))
+
+    return {
+        state_db.id: substates.get((KIND_TO_TABLE[state_db.base_state.kind], state_db.base_state.id))
+        if state_db.base_state is not None and state_db.base_state.kind in KIND_TO_TABLE
+        else None
+        for state_db in state_dbs
+    }
+
+
+def _select_in(database_session: Session, table: type[SQLModel], ids: list[int]) -> list[SQLModel]:
+    """Select the rows of a table with the given ids, in batches."""
+    unique_ids = list(dict.fromkeys(ids))
+    rows = []
+    for start in range(0, len(unique_ids), _RESOLVE_BATCH):
+        batch = unique_ids[start : start + _RESOLVE_BATCH]
+        rows.extend(database_session.exec(select(table).where(table.id.in_(batch))).all())
+    return rows
+
+
+def state_depths(parent_ids: dict[int, int | None]) -> dict[int, int]:
+    """Compute the depth of every state in a forest of states.
+
+    The depth of a state is the number of its ancestors among the given states.
+    A state whose parent is not among the given states is a root, with depth 0.
+    Each state is visited once, however deep the trees are.
+
+    Args:
+        parent_ids (dict[int, int | None]): the id of the parent of each state, keyed by the id of the state.
+
+    Returns:
+        dict[int, int]: the depth of each state, keyed by the id of the state.
+    """
+    depths: dict[int, int] = {}
+    for state_id in parent_ids:
+        # walk up until a state whose depth is known, or a root, is found
+        chain = []
+        current = state_id
+        while current not in depths:
+            chain.append(current)
+            parent = parent_ids[current]
+            if parent is None or parent not in parent_ids:
+                depths[current] = 0
+                chain.pop()
+                break
+            current = parent
+        # then assign the depths on the way back down
+        for node in reversed(chain):
+            depths[node] = depths[parent_ids[node]] + 1
+    return depths
+
+
 def _attach_substate(session, base: State, sub: SQLModel | None) -> None:
     """Persist base; link sub.id = base.id; persist sub."""
     session.add(base)
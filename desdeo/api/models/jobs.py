@@ -0,0 +1,59 @@
+"""Models of the background jobs that run long solves outside of the request."""
+
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from sqlmodel import SQLModel
+
+
+class JobStatus(StrEnum):
+    """The stages of a background job."""
+
+    QUEUED = "queued"
+    """Waiting for a free worker."""
+    RUNNING = "running"
+    """Being run by a worker."""
+    SUCCEEDED = "succeeded"
+    """Finished, with its result stored in the job and its state stored in the database."""
+    FAILED = "failed"
+    """Finished with an error."""
+    CANCELLED = "cancelled"
+    """Cancelled before it could store anything in the database."""
+
+
+FINISHED_JOB_STATUSES = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED})
+"""The statuses a job does not leave once it has reached them."""
+
+
+class JobEvent(SQLModel):
+    """Something that happened to a job, as streamed to the client."""
+
+    index: int
+    """The position of the event among the events of the job, starting from zero."""
+    status: JobStatus
+    """The status of the job after the event."""
+    message: str | None = None
+    """Progress reported by the job, or the reason it failed."""
+    result: Any | None = None
+    """The response of the job's endpoint, in the event that marks its success."""
+
+
+class JobInfo(SQLModel):
+    """The status of a background job."""
+
+    job_id: str
+    kind: str
+    """What the job runs, e.g., `nimbus.solve`."""
+    status: JobStatus
+    submitted_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    progress: str | None = None
+    """The latest progress reported by the job."""
+    error: str | None = None
+    """Why the job failed."""
+    status_code: int | None = None
+    """The HTTP status code the endpoint would have responded with, if the job failed."""
+    result: Any | None = None
+    """The response of the job's endpoint, once it has succeeded."""
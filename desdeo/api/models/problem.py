@@ -4,13 +4,19 @@ import json
 from pathlib import Path
 from types import UnionType
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
+import polars as pl
 from fastapi import UploadFile
-from pydantic import BaseModel, ConfigDict, create_model, field_validator
+from pydantic import BaseModel, ConfigDict, create_model, field_serializer, field_validator
 from sqlalchemy.types import JSON, String, TypeDecorator
 from sqlmodel import Column, Field, Relationship, SQLModel
 
-from desdeo.api.models.representative_solution import RepresentativeSolutionSetBase
+from desdeo.api.models.representative_solution import (
+    ColumnarSolutionData,
+    RepresentativeSolutionSetBase,
+    SolutionDataType,
+)
 from desdeo.problem.schema import (
     Constant,
     Constraint,
@@ -158,6 +164,9 @@ class ProblemDB(ProblemBase, table=True):
     is_temporary: bool = Field(default=False)
     parent_problem_id: int | None = Field(default=None, foreign_key="problemdb.id")
 
+    # Replaced whenever the problem or any of the rows it is made of changes, see `desdeo.api.problem_cache`.
+    revision: str = Field(default_factory=lambda: uuid4().hex)
+
     # Back populates
     user: "User" = Relationship(back_populates="problems")
     solutions: list["UserSavedSolutionDB"] = Relationship(back_populates="problem", cascade_delete=True)
@@ -277,11 +286,12 @@ class RepresentativeNonDominatedSolutions(RepresentativeSolutionSetBase, SQLMode
     metadata_type: str = "representative_non_dominated_solutions"
 
     solution_data: dict[str, list[float]] = Field(
-        sa_column=Column(JSON),
+        sa_column=Column(SolutionDataType),
         description="The non-dominated solutions. It is assumed that columns "
         "exist for each variable and objective function. For functions, the "
         "`_min` variant should be present, and any tensor variables should be "
-        "unrolled.",
+        "unrolled. Stored as an Arrow IPC file and read back as a `ColumnarSolutionData`, "
+        "whose `to_polars` reads the set, or only some of its columns, as a dataframe.",
     )
     ideal: dict[str, float] = Field(
         sa_column=Column(JSON), description="The ideal objective function values of the representative set."
@@ -292,6 +302,30 @@ class RepresentativeNonDominatedSolutions(RepresentativeSolutionSetBase, SQLMode
 
     metadata_instance: "ProblemMetaDataDB" = Relationship(back_populates="representative_nd_metadata")
 
+    @field_serializer("solution_data")
+    def _serialize_solution_data(
+        self, value: ColumnarSolutionData | pl.DataFrame | dict[str, list[float]]
+    ) -> dict[str, list[float]]:
+        # a stored set is decoded only when it is serialized, e.g., in the responses of the endpoints
+        return value.to_dict(as_series=False) if isinstance(value, pl.DataFrame) else dict(value)
+
+    def solutions_frame(self, columns: list[str] | None = None) -> pl.DataFrame:
+        """Read the solution set, or some of its columns, as a Polars dataframe.
+
+        Args:
+            columns (list[str] | None, optional): the columns to read. If None, every column is read.
+                Defaults to None.
+
+        Returns:
+            pl.DataFrame: the solutions, one per row.
+        """
+        if isinstance(self.solution_data, ColumnarSolutionData):
+            # read only the requested columns from the stored file
+            return self.solution_data.to_polars(columns)
+        # the set has not been stored yet, so it is still as it was given
+        df = self.solution_data if isinstance(self.solution_data, pl.DataFrame) else pl.DataFrame(self.solution_data)
+        return df if columns is None else df.select(columns)
+
 
 class SolverSelectionMetadata(SQLModel, table=True):
     """A problem metadata class to store the preferred solver of a problem.
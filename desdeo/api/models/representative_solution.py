@@ -1,4 +1,149 @@
-from sqlmodel import SQLModel  # noqa: D100
+"""Models and storage of representative solution sets."""
+
+import io
+import json
+from collections.abc import Iterator, Mapping
+
+import polars as pl
+from sqlalchemy.types import LargeBinary, TypeDecorator
+from sqlmodel import SQLModel
+
+# Arrow IPC files start with these magic bytes, which tell them apart from sets stored as JSON.
+_ARROW_MAGIC = b"ARROW1"
+
+
+class ColumnarSolutionData(Mapping[str, list[float]]):
+    """A representative solution set stored as an Arrow IPC file.
+
+    Behaves as a read-only `dict[str, list[float]]`, but the columns are only decoded when they are
+    accessed, and `to_polars` gives the set, or some of its columns, as a dataframe without going
+    through Python lists at all.
+
+    When every column has the same length, the set is stored as a table with one row per solution.
+    Otherwise, each column is stored as a list in a table with a single row.
+    """
+
+    def __init__(self, payload: bytes):
+        """Wrap an Arrow IPC file written by `from_dict` or `from_polars`.
+
+        Args:
+            payload (bytes): the contents of the file.
+        """
+        self.payload = payload
+        self._schema = pl.read_ipc_schema(io.BytesIO(payload))
+        self._ragged = any(dtype == pl.List for dtype in self._schema.values())
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, list[float]]) -> "ColumnarSolutionData":
+        """Store a solution set given as a dict of lists.
+
+        Args:
+            data (Mapping[str, list[float]]): the columns of the set.
+
+        Returns:
+            ColumnarSolutionData: the stored set.
+        """
+        if isinstance(data, ColumnarSolutionData):
+            return data
+        if len({len(column) for column in data.values()}) <= 1:
+            return cls.from_polars(pl.DataFrame(dict(data), strict=False))
+        return cls.from_polars(pl.DataFrame({name: [column] for name, column in data.items()}, strict=False))
+
+    @classmethod
+    def from_polars(cls, df: pl.DataFrame) -> "ColumnarSolutionData":
+        """Store a solution set given as a dataframe, with one row per solution.
+
+        Args:
+            df (pl.DataFrame): the set.
+
+        Returns:
+            ColumnarSolutionData: the stored set.
+        """
+        buffer = io.BytesIO()
+        df.write_ipc(buffer, compression="zstd")
+        return cls(buffer.getvalue())
+
+    def to_polars(self, columns: list[str] | None = None) -> pl.DataFrame:
+        """Read the set, or some of its columns, as a dataframe.
+
+        Args:
+            columns (list[str] | None, optional): the columns to read. Only these are decoded. If None, every
+                column is read. Defaults to None.
+
+        Raises:
+            ValueError: the columns of the set have different lengths, so they do not form a dataframe.
+
+        Returns:
+            pl.DataFrame: the set, with one row per solution.
+        """
+        df = pl.read_ipc(io.BytesIO(self.payload), columns=columns)
+        if self._ragged:
+            if len({len(column) for column in df.row(0)}) > 1:
+                raise ValueError("The columns of the solution set have different lengths.")
+            df = df.explode(df.columns)
+        return df
+
+    def __getitem__(self, key: str) -> list[float]:
+        """Decode a single column."""
+        if key not in self._schema:
+            raise KeyError(key)
+        column = pl.read_ipc(io.BytesIO(self.payload), columns=[key])[key]
+        return column[0].to_list() if self._ragged else column.to_list()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the columns."""
+        return iter(self._schema)
+
+    def __len__(self) -> int:
+        """The number of columns."""
+        return len(self._schema)
+
+    def __repr__(self) -> str:
+        """Show the columns, but not their contents."""
+        return f"ColumnarSolutionData(columns={list(self._schema)})"
+
+
+class SolutionDataType(TypeDecorator):
+    """SQLAlchemy custom type to store solution sets as Arrow IPC files.
+
+    Solution sets can be given as dicts of lists, as polars dataframes or as `ColumnarSolutionData`, and
+    they are always read back as `ColumnarSolutionData`. Sets stored as JSON by earlier versions are still
+    read.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Mapping[str, list[float]] | pl.DataFrame | None, dialect):
+        """Solution set to Arrow IPC."""
+        if value is None:
+            return None
+        if isinstance(value, pl.DataFrame):
+            return ColumnarSolutionData.from_polars(value).payload
+        return ColumnarSolutionData.from_dict(value).payload
+
+    def process_result_value(self, value: bytes | memoryview | str | dict | list | None, dialect):
+        """Arrow IPC, or legacy JSON, to solution set.
+
+        Legacy JSON is accepted as text or bytes, and as the dicts (or lists of rows) that drivers give for
+        columns still typed as JSON.
+        """
+        if value is None:
+            return None
+        if isinstance(value, memoryview):
+            value = bytes(value)
+        if isinstance(value, bytes) and value.startswith(_ARROW_MAGIC):
+            return ColumnarSolutionData(value)
+        if isinstance(value, bytes | str):
+            value = json.loads(value)
+        if isinstance(value, list):
+            return ColumnarSolutionData.from_polars(pl.DataFrame(value))
+        return ColumnarSolutionData.from_dict(value)
+
+    @staticmethod
+    def is_arrow(value: bytes | memoryview | str | dict | list | None) -> bool:
+        """Tell whether a stored value is an Arrow IPC file, rather than legacy JSON or NULL."""
+        return isinstance(value, bytes | memoryview) and bytes(value[: len(_ARROW_MAGIC)]) == _ARROW_MAGIC
 
 
 class RepresentativeSolutionSetBase(SQLModel):
@@ -0,0 +1,181 @@
+"""An in-process cache of the `Problem` instances hydrated from the database.
+
+Nearly every endpoint of an interactive method needs the problem it operates on as a `Problem`, and
+building one from a `ProblemDB` loads every related row and validates every function expression
+again. Problems are not modified once they are in the database (variants are stored as new problems),
+so each worker process keeps the problems it has hydrated in a least recently used cache, keyed by
+the id of the problem.
+
+Each entry also records the revision of the problem's row, a random token that is replaced whenever the
+problem, or any of the rows it is made of, is changed through the ORM, and that is new for every new
+problem. If the row has another revision, e.g., because another worker process changed the problem, or
+because the problem was deleted and its id reused, the problem is hydrated again. Changes made in this
+process also invalidate the entry right away. `Problem` instances are frozen, so the cached instances can
+safely be shared between requests.
+"""
+
+import threading
+from collections import OrderedDict
+from uuid import uuid4
+
+from sqlalchemy import event, update
+from sqlalchemy.orm import object_session
+
+from desdeo.api.models.problem import (
+    ConstantDB,
+    ConstraintDB,
+    DiscreteRepresentationDB,
+    ExtraFunctionDB,
+    ObjectiveDB,
+    ProblemDB,
+    ScalarizationFunctionDB,
+    SimulatorDB,
+    TensorConstantDB,
+    TensorVariableDB,
+    VariableDB,
+)
+from desdeo.problem import Problem
+
+# The tables whose rows make up a problem, and that thus invalidate it when they change.
+_PROBLEM_PART_TABLES = (
+    ConstantDB,
+    TensorConstantDB,
+    VariableDB,
+    TensorVariableDB,
+    ObjectiveDB,
+    ConstraintDB,
+    ScalarizationFunctionDB,
+    ExtraFunctionDB,
+    DiscreteRepresentationDB,
+    SimulatorDB,
+)
+
+
+class ProblemCache:
+    """A thread-safe least recently used cache of hydrated problems, keyed by problem id."""
+
+    def __init__(self, max_entries: int = 128):
+        """Create an empty cache.
+
+        Args:
+            max_entries (int, optional): the largest number of problems kept. Defaults to 128.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[str, Problem]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, problem_db: ProblemDB) -> Problem:
+        """Return the problem stored in a `ProblemDB`, hydrating it only if it is not in the cache.
+
+        Args:
+            problem_db (ProblemDB): the problem in the database.
+
+        Returns:
+            Problem: the problem.
+        """
+        if problem_db.id is None:
+            # not stored yet, so there is nothing to key the problem on
+            return Problem.from_problemdb(problem_db)
+
+        revision = problem_db.revision
+        with self._lock:
+            entry = self._entries.get(problem_db.id)
+            if entry is not None and entry[0] == revision:
+                self._entries.move_to_end(problem_db.id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # hydrate outside of the lock, so that other problems can be served in the meantime
+        problem = Problem.from_problemdb(problem_db)
+
+        with self._lock:
+            self._entries[problem_db.id] = (revision, problem)
+            self._entries.move_to_end(problem_db.id)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return problem
+
+    def invalidate(self, problem_id: int | None = None):
+        """Drop a problem from the cache, so that it is hydrated again on next use.
+
+        Args:
+            problem_id (int | None, optional): the id of the problem. If None, every problem is dropped.
+                Defaults to None.
+        """
+        with self._lock:
+            if problem_id is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(problem_id, None) is not None:
+                self.invalidations += 1
+
+    def stats(self) -> dict[str, int | float]:
+        """Report how well the cache is doing.
+
+        Returns:
+            dict[str, int | float]: the number of cached problems, hits, misses and invalidations, and the
+                hit rate.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / total if total > 0 else 0.0,
+            }
+
+
+problem_cache = ProblemCache()
+"""The cache of the worker process."""
+
+
+def hydrate_problem(problem_db: ProblemDB) -> Problem:
+    """Return the problem stored in a `ProblemDB`, using the cache of the worker process.
+
+    Use this instead of `Problem.from_problemdb` in endpoints.
+
+    Args:
+        problem_db (ProblemDB): the problem in the database.
+
+    Returns:
+        Problem: the problem.
+    """
+    return problem_cache.get(problem_db)
+
+
+@event.listens_for(ProblemDB, "before_update")
+def _revise_problem(mapper, connection, target: ProblemDB):
+    """Give a problem a new revision when its row is changed."""
+    # also called when only the collections of the problem changed, e.g., when a state was added to it
+    if object_session(target).is_modified(target, include_collections=False):
+        target.revision = uuid4().hex
+
+
+@event.listens_for(ProblemDB, "after_update")
+@event.listens_for(ProblemDB, "after_delete")
+def _invalidate_problem(mapper, connection, target: ProblemDB):
+    """Drop a problem from the cache when its row is changed or deleted."""
+    problem_cache.invalidate(target.id)
+
+
+def _invalidate_problem_of_part(mapper, connection, target):
+    """Revise a problem, and drop it from the cache, when one of its rows is added, changed or deleted."""
+    if target.problem_id is not None:
+        connection.execute(
+            update(ProblemDB.__table__)
+            .where(ProblemDB.__table__.c.id == target.problem_id)
+            .values(revision=uuid4().hex)
+        )
+        problem_cache.invalidate(target.problem_id)
+
+
+for _table in _PROBLEM_PART_TABLES:
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_table, _event, _invalidate_problem_of_part)
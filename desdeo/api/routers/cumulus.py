@@ -6,6 +6,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlmodel import Session, select
 
 from desdeo.api.db import engine, get_session
+from desdeo.api.job_queue import progress_reporter, submit_endpoint_job
 from desdeo.api.models import (
     CumulusFinalState,
     CumulusInitializationState,
@@ -14,6 +15,7 @@ from desdeo.api.models import (
     CumulusSaveState,
     IntermediateSolutionRequest,
     IntermediateSolutionState,
+    JobInfo,
     ReferencePoint,
     StateDB,
     User,
@@ -43,11 +45,12 @@ from desdeo.api.models.generic_states import SolutionReference, SolutionReferenc
 from desdeo.api.models.problem import ConstraintDB, ProblemDB
 from desdeo.api.models.scenario import ScenarioModelDB
 from desdeo.api.models.state import CumulusClassificationState
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.api.routers.problem import check_solver
 from desdeo.api.routers.user_authentication import get_current_user
 from desdeo.mcdm.cumulus import CumulusScalarization, generate_starting_point, solve_sub_problems
 from desdeo.mcdm.reference_point_method import rpm_intermediate_solutions
-from desdeo.problem import Problem, ScenarioModel
+from desdeo.problem import ScenarioModel
 from desdeo.problem.schema import Constraint
 from desdeo.tools import SolverResults, guess_best_solver
 from desdeo.tools.utils import payoff_table_method
@@ -90,7 +93,7 @@ def _load_scenario_model(
     sm_db = db_session.get(ScenarioModelDB, scenario_model_id)
     if sm_db is None or sm_db.base_problem is None:
         return None
-    return sm_db.to_scenario_model(base_problem=Problem.from_problemdb(sm_db.base_problem))
+    return sm_db.to_scenario_model(base_problem=hydrate_problem(sm_db.base_problem))
 
 
 def _get_objective_constraint_ids(
@@ -118,7 +121,7 @@ def solve_solutions(
     parent_state = context.parent_state
 
     solver = check_solver(problem_db=problem_db)
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     try:
         scalarizations = [CumulusScalarization(s) for s in request.scalarizations]
@@ -152,6 +155,7 @@ def solve_solutions(
         hard_constraints=hard_constraints,
         soft_constraints=soft_constraints,
         scenario_model=scenario_model,
+        progress=progress_reporter("sub-problems"),
     )
     # Filter out infeasible scalarizations (None values); store only valid results.
     solver_results: list[SolverResults] = [r for r in results_by_scalarization.values() if r is not None]
@@ -211,6 +215,21 @@ def solve_solutions(
     )
 
 
+@router.post("/solve/job", status_code=status.HTTP_202_ACCEPTED)
+def submit_solve_job(
+    request: CumulusClassificationRequest,
+    context: Annotated[SessionContext, Depends(SessionContextGuard(require=[ContextField.PROBLEM]).post)],
+) -> JobInfo:
+    """Solve the problem using the CUMULUS method in a background job.
+
+    Responds right away with the queued job, which can be followed, and cancelled, under `/jobs`. Once the
+    job has succeeded, its result is the response `/solve` would have given.
+    """
+    return submit_endpoint_job(
+        "cumulus.solve", solve_solutions, request, context, SessionContextGuard(require=[ContextField.PROBLEM])
+    )
+
+
 @router.post("/initialize")
 def initialize(
     request: CumulusInitializationRequest,
@@ -224,7 +243,7 @@ def initialize(
     parent_state = context.parent_state
 
     solver = check_solver(problem_db=problem_db)
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     if isinstance(ref_point := request.starting_point, ReferencePoint):
         starting_point = ref_point.aspiration_levels
@@ -471,7 +490,7 @@ def get_or_initialize(  # noqa: C901
 
         if request.uncertainty_measures is None:
             # Ask the frontend which uncertainty aggregates the DM wants to include.
-            problem = Problem.from_problemdb(problem_db)
+            problem = hydrate_problem(problem_db)
             # Include objectives from both the base problem and the scenario pool (e.g. f_3).
             seen: set[str] = set()
             all_symbols: list[str] = []
@@ -491,7 +510,7 @@ def get_or_initialize(  # noqa: C901
             return initialize(request, context)
 
         # The DM has chosen measures — build and persist the combined scenario problem.
-        problem = Problem.from_problemdb(problem_db)
+        problem = hydrate_problem(problem_db)
         mods = ProblemModification(uncertainty_measures=request.uncertainty_measures)
         try:
             combined_problem = apply_problem_modifications(problem, mods, db_session)
@@ -650,7 +669,7 @@ def solve_intermediate(
 
         var_and_obj_values_of_references.append((var_values, obj_values))
 
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
     solver = check_solver(problem_db=problem_db)
 
     solver_results: list[SolverResults] = rpm_intermediate_solutions(
@@ -811,7 +830,7 @@ def _run_payoff_table_background(new_problem_id: int, cumulus_state_id: int, sol
             if problem_db is None or mod_state is None:
                 return
 
-            problem = Problem.from_problemdb(problem_db)
+            problem = hydrate_problem(problem_db)
             effective_solver = solver_class if solver_class is not None else guess_best_solver(problem)
 
             error_msg = None
@@ -848,7 +867,7 @@ def modify_problem(
     interactive_session = context.interactive_session
     parent_state = context.parent_state
 
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
     modified_problem = apply_problem_modifications(problem, request.modifications, db_session)
 
     # Save the modified problem immediately (ideal/nadir will be updated by the background task)
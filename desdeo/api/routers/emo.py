@@ -1,12 +1,8 @@
 """Router for evolutionary multiobjective optimization (EMO) methods."""
 
 import json
-from asyncio import run
-from collections.abc import Callable
 from datetime import datetime
-from multiprocessing import Manager as ProcessManager
-from multiprocessing import Process
-from multiprocessing.synchronize import Event as EventClass  # only for typing, can be removed
+from functools import partial
 from pathlib import Path
 from typing import Annotated
 from warnings import warn
@@ -15,10 +11,10 @@ import polars as pl
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
-from sqlmodel import select
-from websockets.asyncio.client import connect
+from sqlalchemy import Engine
+from sqlmodel import Session
 
-from desdeo.api.db import get_session
+from desdeo.api.emo_pool import EMOPoolFullError, EMOResultFrames, emo_pool
 from desdeo.api.models import StateDB
 from desdeo.api.models.emo import (
     EMOFetchRequest,
@@ -28,7 +24,8 @@ from desdeo.api.models.emo import (
     EMOScoreResponse,
 )
 from desdeo.api.models.state import EMOIterateState, EMOSCOREState
-from desdeo.emo.options.templates import EMOOptions, PreferenceOptions, TemplateOptions, emo_constructor
+from desdeo.api.problem_cache import hydrate_problem
+from desdeo.emo.options.templates import EMOOptions, TemplateOptions
 from desdeo.problem import Problem
 from desdeo.tools.score_bands import SCOREBandsConfig, score_json
 
@@ -107,6 +104,9 @@ async def websocket_endpoint(
     try:
         while True:
             data = await websocket.receive_json()
+            # A stop message sent to an EMO method is for the worker pool, which tells the method to stop early.
+            if data.get("message") == "stop" and emo_pool.stop(data.get("send_to", "")):
+                continue
             if "send_to" in data:
                 try:
                     await ws_manager.send_private_message(data, data["send_to"])
@@ -116,16 +116,6 @@ async def websocket_endpoint(
         ws_manager.disconnect(websocket)
 
 
-async def handle_stop_event(stop_event: EventClass, listener_id: str):
-    """Handles the stop event for the WebSocket connections."""
-    async with connect(f"ws://localhost:8000/method/emo/ws/{listener_id}") as websocket:
-        while True:
-            data = await websocket.receive_json()
-            if "message" in data and data["message"] == "stop":
-                stop_event.set()
-                break
-
-
 def get_templates() -> list[TemplateOptions]:
     """Fetches available EMO templates."""
     current_dir = Path(__file__)
@@ -160,7 +150,7 @@ def iterate(
     # Get context objects
     db_session = context.db_session
     problem_db = context.problem_db
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     interactive_session = context.interactive_session
     parent_state = context.parent_state
@@ -174,6 +164,12 @@ def iterate(
 
     client_id = f"client_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
 
+    if not emo_pool.has_room(len(templates)):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The EMO worker pool is busy. Try again once the running methods have finished.",
+        )
+
     # 4) Create incomplete state
     emo_iterate_state = EMOIterateState(
         template_options=jsonable_encoder(templates),
@@ -199,161 +195,63 @@ def iterate(
             detail="Failed to create a new state in the database.",
         )
 
-    # Start process
-    Process(
-        target=_spawn_emo_process,
-        args=(
+    # Queue the methods on the worker pool, which stores their results in the state once they have all finished
+    try:
+        emo_pool.submit(
             problem,
             templates,
             request.preference_options,
             web_socket_ids,
             client_id,
-            state_id,
-        ),
-    ).start()
+            on_complete=partial(_store_emo_results, db_session.get_bind(), state_id, problem),
+        )
+    except EMOPoolFullError as e:
+        # The pool filled up after the check above; the state is left without results, like that of a failed run.
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)) from e
 
     return EMOIterateResponse(method_ids=web_socket_ids, client_id=client_id, state_id=state_id)
 
 
-def _spawn_emo_process(
-    problem: Problem,
-    templates: list[TemplateOptions],
-    preference_options: PreferenceOptions | None,
-    websocket_ids: list[str],
-    client_id: str,
-    state_id: int,
-):
-    """Spawns a new process to handle the EMO method.
-
-    In turn, this will start multiple processes for each evolutionary algorithm.
-    It will collect results and update the database.
+def _store_emo_results(bind: Engine, state_id: int, problem: Problem, results: list[EMOResultFrames]):
+    """Combine the solutions of the EMO methods of a run and store them in its state.
 
-    Args:
-        problem (Problem): The problem object.
-        templates (List[TemplateOptions]): The list of templates to use.
-        preference_options (PreferenceOptions | None): The preference options to use.
-        websocket_ids (list[str]): The list of WebSocket IDs.
-        client_id (str): The client ID for WebSocket communication.
-        state_id (int): The state ID in the database to update with results.
-    """
-    process_manager = ProcessManager()
-    stop_event = process_manager.Event()
-    results_dict = process_manager.dict()
-    # Spawn a bunch of EAs
-    processes = []
-
-    for w_id, template in zip(
-        websocket_ids, templates, strict=True
-    ):  # Skip the first id, which is for the webui client
-        p = Process(
-            target=_ea_sync,
-            args=(problem, template, preference_options, stop_event.is_set, w_id, client_id, results_dict),
-        )
-        processes.append(p)
-        p.start()
-
-    # collect results
-    for p in processes:
-        p.join()
-
-    # Combine results
-    optimal_variables = pl.concat([results.optimal_variables for results in results_dict.values()])
-    optimal_outputs = pl.concat([results.optimal_outputs for results in results_dict.values()])
-    # update DB
-    session = next(get_session())
-    statement = select(StateDB).where(StateDB.id == state_id)
-    state = session.exec(statement).first()
-    if state is None:
-        raise ValueError(f"Could not find state with id={state_id} to update with results.")
-    emo_state = state.state
-    if not isinstance(emo_state, EMOIterateState):
-        raise TypeError(f"State with id={state_id} is not of type EMOIterateState.")
-    # TODO(@light-weaver): Just a dirty way to handle this. Use non-dominated merge and also split dec and obj vars
-    var_names = [var.symbol for var in problem.get_flattened_variables()]
-    obj_names = [obj.symbol for obj in problem.objectives]
-    if problem.constraints is not None:  # noqa: SIM108
-        constr_names = [constr.symbol for constr in problem.constraints]
-    else:
-        constr_names = []
-    if problem.extra_funcs is not None:  # noqa: SIM108
-        extra_names = [extra.symbol for extra in problem.extra_funcs]
-    else:
-        extra_names = []
-
-    emo_state.decision_variables = optimal_variables[var_names].to_dict(as_series=False)
-    emo_state.objective_values = optimal_outputs[obj_names].to_dict(as_series=False)
-    emo_state.constraint_values = optimal_outputs[constr_names].to_dict(as_series=False) if constr_names else None
-    emo_state.extra_func_values = optimal_outputs[extra_names].to_dict(as_series=False) if extra_names else None
-
-    session.add(emo_state)
-    session.commit()
-    session.close()
-
-
-def _ea_sync(
-    problem: Problem,
-    template: TemplateOptions,
-    preference_options: PreferenceOptions | None,
-    stop_event: Callable[[], bool],
-    websocket_id: str,
-    client_id: str,
-    results_dict: dict,
-):
-    """Synchronous wrapper to run the evolutionary algorithm in an async event loop.
+    Called by the EMO worker pool once every method of the run has finished.
 
     Args:
-        problem (Problem): The problem object.
-        template (TemplateOptions): The template options for the EMO method.
-        preference_options (PreferenceOptions | None): The preference options for the EMO method.
-        stop_event (Callable[[], bool]): A callable that returns True if the algorithm should stop.
-        websocket_id (str): The WebSocket ID for the current EMO method for communication.
-        client_id (str): The ID of the client to send websocket messages to.
-        results_dict (dict): A shared ProcessManager dictionary to store results.
+        bind (Engine): the database to store the solutions in.
+        state_id (int): the id of the state to store the solutions in.
+        problem (Problem): the problem the methods solved.
+        results (list[EMOResultFrames]): the decision variables and the outputs found by each method.
     """
-    run(
-        _ea_async(
-            problem=problem,
-            websocket_id=websocket_id,
-            client_id=client_id,
-            stop_event=stop_event,
-            results_dict=results_dict,
-            template=template,
-            preference_options=preference_options,
-        )
-    )
-
+    optimal_variables = pl.concat([variables for variables, _ in results])
+    optimal_outputs = pl.concat([outputs for _, outputs in results])
+
+    with Session(bind) as session:
+        state = session.get(StateDB, state_id)
+        if state is None:
+            raise ValueError(f"Could not find state with id={state_id} to update with results.")
+        emo_state = state.state
+        if not isinstance(emo_state, EMOIterateState):
+            raise TypeError(f"State with id={state_id} is not of type EMOIterateState.")
+        # TODO(@light-weaver): Just a dirty way to handle this. Use non-dominated merge and also split dec and obj vars
+        var_names = [var.symbol for var in problem.get_flattened_variables()]
+        obj_names = [obj.symbol for obj in problem.objectives]
+        if problem.constraints is not None:  # noqa: SIM108
+            constr_names = [constr.symbol for constr in problem.constraints]
+        else:
+            constr_names = []
+        if problem.extra_funcs is not None:  # noqa: SIM108
+            extra_names = [extra.symbol for extra in problem.extra_funcs]
+        else:
+            extra_names = []
 
-async def _ea_async(
-    problem: Problem,
-    websocket_id: str,
-    client_id: str,
-    stop_event: Callable[[], bool],
-    results_dict: dict,
-    template: TemplateOptions,
-    preference_options: PreferenceOptions | None = None,
-):
-    """Executes an evolutionary algorithm.
+        emo_state.decision_variables = optimal_variables[var_names].to_dict(as_series=False)
+        emo_state.objective_values = optimal_outputs[obj_names].to_dict(as_series=False)
+        emo_state.constraint_values = optimal_outputs[constr_names].to_dict(as_series=False) if constr_names else None
+        emo_state.extra_func_values = optimal_outputs[extra_names].to_dict(as_series=False) if extra_names else None
 
-    Args:
-        problem (Problem): The problem object.
-        websocket_id (str): The WebSocket ID for the current EMO method for communication.
-        client_id (str): The ID of the client to send websocket messages to.
-        stop_event (Event): The stop event to signal when to stop the algorithm.
-        results_dict (dict): A shared ProcessManager dictionary to store results.
-        template (TemplateOptions): The template options for the EMO method.
-        preference_options (PreferenceOptions | None): The preference options for the EMO method.
-    """
-    # TODO: the url should not be hardcoded
-    async with connect(f"ws://localhost:8000/method/emo/ws/{websocket_id}") as ws:
-        text = f'{{"message": "Started {websocket_id}", "send_to": "{client_id}"}}'
-        await ws.send(text)
-        emo_options = EMOOptions(template=template, preference=preference_options)
-        solver, extras = emo_constructor(emo_options, problem=problem, external_check=stop_event)
-        results = solver()
-        if extras.archive is not None:
-            results = extras.archive.results
-        await ws.send(f'{{"message": "Finished {websocket_id}", "send_to": "{client_id}"}}')
-        results_dict[websocket_id] = results
+        session.add(emo_state)
+        session.commit()
 
 
 @router.post("/fetch")
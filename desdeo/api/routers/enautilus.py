@@ -2,8 +2,6 @@
 
 from typing import Annotated
 
-import numpy as np
-import polars as pl
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select
 
@@ -27,9 +25,9 @@ from desdeo.api.models import (
     RepresentativeNonDominatedSolutions,
     StateDB,
 )
-from desdeo.api.models.generic_states import State, StateKind
+from desdeo.api.models.generic_states import State, StateKind, resolve_substates, state_depths
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.mcdm import ENautilusResult, enautilus_get_representative_solutions, enautilus_step
-from desdeo.problem import Problem
 
 from .utils import ContextField, SessionContext, SessionContextGuard
 
@@ -44,7 +42,7 @@ def step(
     """Steps the E-NAUTILUS method."""
     db_session = context.db_session
     problem_db = context.problem_db
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     interactive_session = context.interactive_session
     parent_state = context.parent_state
@@ -64,15 +62,17 @@ def step(
             ),
         )
 
+    # E-NAUTILUS only looks at the minimized objective values, so only those columns are read
+    non_dominated_points = representative_solutions.solutions_frame([f"{obj.symbol}_min" for obj in problem.objectives])
+
     if request.current_iteration == 0:
         # First iteration, nadir as 'selected_point' and all points are reachable
         # Nadir point is expected in 'True' values, hence the multiplication by -1 for maximized objectives
         selected_point = {
-            f"{obj.symbol}": (-1 if obj.maximize else 1)
-            * np.max(representative_solutions.solution_data[f"{obj.symbol}_min"])
+            f"{obj.symbol}": (-1 if obj.maximize else 1) * non_dominated_points[f"{obj.symbol}_min"].max()
             for obj in problem.objectives
         }
-        reachable_point_indices = list(range(len(representative_solutions.solution_data[problem.objectives[0].symbol])))
+        reachable_point_indices = list(range(non_dominated_points.height))
     else:
         # Not first iteration
         selected_point = request.selected_point
@@ -81,7 +81,7 @@ def step(
     # iterate E-NAUTILUS
     results: ENautilusResult = enautilus_step(
         problem=problem,
-        non_dominated_points=representative_solutions.solution_data,
+        non_dominated_points=non_dominated_points,
         current_iteration=request.current_iteration,
         iterations_left=request.iterations_left,
         selected_point=selected_point,
@@ -225,7 +225,7 @@ def get_representative(
             ),
         )
 
-    non_dom_solutions = pl.DataFrame(non_dom_solutions_db.solution_data)
+    non_dom_solutions = non_dom_solutions_db.solutions_frame()
 
     problem_db = db_session.exec(select(ProblemDB).where(ProblemDB.id == state_db.problem_id)).first()
 
@@ -234,7 +234,7 @@ def get_representative(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Could not find 'ProblemDB' with id={state_db.problem_id}"
         )
 
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     representative_solutions = enautilus_get_representative_solutions(problem, enautilus_result, non_dom_solutions)
 
@@ -327,10 +327,10 @@ def finalize_enautilus(
             ),
         )
 
-    non_dom_solutions = pl.DataFrame(non_dom_solutions_db.solution_data)
+    non_dom_solutions = non_dom_solutions_db.solutions_frame()
 
     # Get representative solutions (project to Pareto front)
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
     representative_solutions = enautilus_get_representative_solutions(problem, result, non_dom_solutions)
 
     # Get the solution corresponding to the selected point
@@ -381,41 +381,25 @@ def get_session_tree(
     """
     db_session = context.db_session
 
-    # Query step states
-    step_stmt = (
+    # Query the step and final states together, and resolve their substates in bulk
+    statement = (
         select(StateDB)
         .join(State, StateDB.state_id == State.id)
         .where(StateDB.session_id == session_id)
-        .where(State.kind == StateKind.ENAUTILUS_STEP)
+        .where(State.kind.in_((StateKind.ENAUTILUS_STEP, StateKind.ENAUTILUS_FINAL)))
         .order_by(StateDB.id)
     )
-    step_state_dbs: list[StateDB] = list(db_session.exec(step_stmt).all())
+    state_dbs: list[StateDB] = list(db_session.exec(statement).all())
+    resolve_substates(db_session, state_dbs)
 
-    # Query final states
-    final_stmt = (
-        select(StateDB)
-        .join(State, StateDB.state_id == State.id)
-        .where(StateDB.session_id == session_id)
-        .where(State.kind == StateKind.ENAUTILUS_FINAL)
-        .order_by(StateDB.id)
-    )
-    final_state_dbs: list[StateDB] = list(db_session.exec(final_stmt).all())
+    step_state_dbs = [sdb for sdb in state_dbs if sdb.base_state.kind == StateKind.ENAUTILUS_STEP]
+    final_state_dbs = [sdb for sdb in state_dbs if sdb.base_state.kind == StateKind.ENAUTILUS_FINAL]
 
     all_state_dbs = step_state_dbs + final_state_dbs
     all_node_ids = {sdb.id for sdb in all_state_dbs}
 
     # Compute depths
-    parent_map = {sdb.id: sdb.parent_id for sdb in all_state_dbs}
-    depths: dict[int, int] = {}
-    for node_id in all_node_ids:
-        depth = 0
-        current = node_id
-        while parent_map.get(current) is not None:
-            parent = parent_map[current]
-            if parent in all_node_ids:
-                depth += 1
-            current = parent
-        depths[node_id] = depth
+    depths = state_depths({sdb.id: sdb.parent_id for sdb in all_state_dbs})
 
     nodes: list[ENautilusTreeNodeResponse] = []
     edges: list[list[int]] = []
@@ -545,7 +529,7 @@ def simulate(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"ProblemDB with id={state_db.problem_id} not found."
         )
 
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     # Validate preferred_objective
     obj_symbols = [obj.symbol for obj in problem.objectives]
@@ -572,7 +556,7 @@ def simulate(
             detail=f"RepresentativeNonDominatedSolutions with id={enautilus_state.non_dominated_solutions_id} not found.",
         )
 
-    non_dom_solutions = non_dom_db.solution_data
+    non_dom_solutions = non_dom_db.solutions_frame()
 
     # Start from the existing result's intermediate points
     current_intermediate_points = result.intermediate_points
@@ -647,8 +631,7 @@ def simulate(
         reachable_point_indices=current_reachable_indices,
     )
 
-    non_dom_df = pl.DataFrame(non_dom_solutions)
-    representative_solutions = enautilus_get_representative_solutions(problem, final_result, non_dom_df)
+    representative_solutions = enautilus_get_representative_solutions(problem, final_result, non_dom_solutions)
     final_solution = representative_solutions[final_best_idx]
 
     return ENautilusSimulateResponse(
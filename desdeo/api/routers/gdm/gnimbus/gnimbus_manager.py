@@ -10,6 +10,7 @@ import numpy as np
 from pydantic import ValidationError
 from sqlmodel import Session, select
 
+from desdeo.api.job_queue import job_queue
 from desdeo.api.models import (
     BaseGroupInfoContainer,
     EndProcessPreference,
@@ -18,12 +19,14 @@ from desdeo.api.models import (
     GNIMBUSVotingState,
     Group,
     GroupIteration,
+    JobStatus,
     OptimizationPreference,
     ProblemDB,
     ReferencePoint,
     StateDB,
     VotingPreference,
 )
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.api.routers.gdm.gdm_base import GroupManager
 from desdeo.mcdm.gnimbus import solve_group_sub_problems, voting_procedure
 from desdeo.problem import Problem
@@ -209,6 +212,15 @@ class GNIMBUSManager(GroupManager):
             return None
         return prev_state.state
 
+    async def report_optimization_error(self, error: Exception):
+        """Tell the group that the optimization failed, and log the error."""
+        if isinstance(error, ScalarizationError):
+            await self.broadcast(f"ERROR: Error while scalarizing: {error}")
+            logger.error("Found an error while scalarizing.", exc_info=error)
+        else:
+            await self.broadcast(f"ERROR: An error occured while optimizing: {error}")
+            logger.error("Found an error when scalarizing.", exc_info=error)
+
     async def set_state(  # noqa: PLR0913
         self,
         session: Session,
@@ -323,7 +335,7 @@ class GNIMBUSManager(GroupManager):
             return None
 
         # If all preferences are in, begin optimization.
-        problem: Problem = Problem.from_problemdb(problem_db)
+        problem: Problem = hydrate_problem(problem_db)
         prefs = current_iteration.info_container.set_preferences
 
         formatted_prefs = {}
@@ -345,14 +357,31 @@ class GNIMBUSManager(GroupManager):
 
         user_len = len(group.user_ids)
 
-        # Begin optimization
-        try:
-            results: list[SolverResults] = solve_group_sub_problems(
+        # Begin optimization. The solve runs on the job queue, so that the event loop, and thus the other groups,
+        # are not blocked while it runs. It is a job of the group's owner, but it does not count towards their limit.
+        phase = current_iteration.info_container.phase
+        job = job_queue.submit(
+            group.owner_id,
+            "gnimbus.optimize",
+            lambda _job: solve_group_sub_problems(
                 problem,
                 current_objectives=prev_sol,
                 reference_points=formatted_prefs,
-                phase=current_iteration.info_container.phase,
-            )
+                phase=phase,
+            ),
+            limited=False,
+        )
+        await job.wait_async()
+
+        if job.exception is not None:
+            await self.report_optimization_error(job.exception)
+            return None
+        if job.status == JobStatus.CANCELLED:
+            await self.broadcast("ERROR: The optimization was cancelled.")
+            return None
+
+        try:
+            results: list[SolverResults] = job.result
             logger.info(f"Result amount: {len(results)}")
             if current_iteration.info_container.phase in ["learning", "crp"]:
                 logger.info(f"Amount on common solutions before filtering: {len(results[user_len:])}")
@@ -362,14 +391,8 @@ class GNIMBUSManager(GroupManager):
 
             logger.info(f"Optimization for group {self.group_id} done.")
 
-        except ScalarizationError as e:
-            await self.broadcast(f"ERROR: Error while scalarizing: {e}")
-            logger.exception("Found an error while scalarizing.")
-            return None
-
         except Exception as e:
-            await self.broadcast(f"ERROR: An error occured while optimizing: {e}")
-            logger.exception("Found an error when scalarizing.")
+            await self.report_optimization_error(e)
             return None
 
         # All good, attach results to state and attach that to iteration.
@@ -445,7 +468,7 @@ class GNIMBUSManager(GroupManager):
         for key, value in preferences.set_preferences.items():
             formatted_votes[str(key)] = value
 
-        problem: Problem = Problem.from_problemdb(problem_db)
+        problem: Problem = hydrate_problem(problem_db)
 
         actual_state = await self.get_state(
             session,
@@ -35,11 +35,11 @@ from desdeo.api.models import (
     User,
     VotingPreference,
 )
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.api.routers.gdm.gdm_aggregate import manager
 from desdeo.api.routers.problem import check_solver
 from desdeo.api.routers.user_authentication import get_current_user
 from desdeo.mcdm.nimbus import generate_starting_point
-from desdeo.problem import Problem
 
 logging.basicConfig(
     stream=sys.stdout, format="[%(filename)s:%(lineno)d] %(levelname)s: %(message)s", level=logging.INFO
@@ -77,7 +77,7 @@ def gnimbus_initialize(
 
     solver = check_solver(problem_db=problem_db)
 
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     # Create the first iteration for the group
     # As if we just voted for a result, but really is just the starting point.
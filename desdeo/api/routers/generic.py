@@ -16,8 +16,8 @@ from desdeo.api.models import (
     StateDB,
 )
 from desdeo.api.models.generic import GenericIntermediateSolutionResponse
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.mcdm.nimbus import solve_intermediate_solutions
-from desdeo.problem import Problem
 from desdeo.tools import SolverResults
 from desdeo.tools.score_bands import calculate_axes_positions, cluster, order_dimensions
 
@@ -82,7 +82,7 @@ def solve_intermediate(
 
         var_and_obj_values_of_references.append((var_values, obj_values))
 
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     solver_results: list[SolverResults] = solve_intermediate_solutions(
         problem=problem,
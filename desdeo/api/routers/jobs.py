@@ -0,0 +1,94 @@
+"""Defines end-points to follow and cancel the background jobs of the solve endpoints."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from desdeo.api.job_queue import Job, job_queue
+from desdeo.api.models import JobInfo, User
+from desdeo.api.routers.user_authentication import get_current_user
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+# How often, in seconds, an event stream checks its job for new events.
+_EVENT_POLL_INTERVAL = 0.2
+# How often, in seconds, an idle event stream sends a comment, so that proxies keep the connection open.
+_KEEPALIVE_INTERVAL = 15.0
+
+
+def _fetch_job(job_id: str, user: User) -> Job:
+    """Find a job of the user, or respond with 404."""
+    job = job_queue.get(job_id)
+    if job is None or job.user_id != user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} not found.")
+    return job
+
+
+@router.get("")
+def list_jobs(user: Annotated[User, Depends(get_current_user)]) -> list[JobInfo]:
+    """List the jobs of the current user, oldest first, without their results."""
+    return [job.info().model_copy(update={"result": None}) for job in job_queue.jobs_of(user.id)]
+
+
+@router.get("/{job_id}")
+def get_job(job_id: str, user: Annotated[User, Depends(get_current_user)]) -> JobInfo:
+    """Get the status of a job, and its result once it has succeeded."""
+    return _fetch_job(job_id, user).info()
+
+
+@router.post("/{job_id}/cancel")
+def cancel_job(job_id: str, user: Annotated[User, Depends(get_current_user)]) -> JobInfo:
+    """Cancel a job.
+
+    A queued job is cancelled right away. A running job finishes its current solve, but stores nothing
+    from then on. Cancelling a finished job does nothing.
+    """
+    job = _fetch_job(job_id, user)
+    job_queue.cancel(job_id)
+    return job.info()
+
+
+@router.get("/{job_id}/events")
+def stream_job_events(
+    job_id: str,
+    user: Annotated[User, Depends(get_current_user)],
+    last_event_id: Annotated[int | None, Header()] = None,
+) -> StreamingResponse:
+    """Stream the events of a job as server-sent events, until the job has finished.
+
+    Every event is sent with its index as its id, and the events that happened before the stream was
+    opened are sent first. A client that reconnects with the `Last-Event-ID` header gets the events after
+    that one only. The event that marks the success of the job carries its result.
+    """
+    job = _fetch_job(job_id, user)
+    start = last_event_id + 1 if last_event_id is not None else 0
+
+    async def event_stream() -> AsyncIterator[str]:
+        index = start
+        idle = 0.0
+        while True:
+            events = job.events_after(index)
+            for job_event in events:
+                yield f"id: {job_event.index}\nevent: {job_event.status}\ndata: {job_event.model_dump_json()}\n\n"
+            index += len(events)
+
+            if job.finished and len(job.events_after(index)) == 0:
+                return
+
+            if len(events) > 0:
+                idle = 0.0
+            elif idle >= _KEEPALIVE_INTERVAL:
+                idle = 0.0
+                yield ": keepalive\n\n"
+
+            await asyncio.sleep(_EVENT_POLL_INTERVAL)
+            idle += _EVENT_POLL_INTERVAL
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,7 +4,9 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from desdeo.api.job_queue import progress_reporter, submit_endpoint_job
 from desdeo.api.models import (
+    JobInfo,
     NautilusNavigatorInitRequest,
     NautilusNavigatorInitResponse,
     NautilusNavigatorNavigateRequest,
@@ -16,12 +18,12 @@ from desdeo.api.models.nautilus_navigator import (
     NautilusNavigatorInitializationState,
     NautilusNavigatorNavigationState,
 )
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.mcdm.nautilus_navigator import (
     NAUTILUS_Response,
     navigator_all_steps,
     navigator_init,
 )
-from desdeo.problem import Problem
 
 from .utils import ContextField, SessionContext, SessionContextGuard
 
@@ -52,7 +54,7 @@ def initialize_navigator(
     """Initialize NAUTILUS Navigator."""
     db_session = context.db_session
     problem_db = context.problem_db
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
     interactive_session = context.interactive_session
     parent_state = context.parent_state
 
@@ -92,7 +94,7 @@ def navigate_navigator(
     """Perform NAUTILUS navigation steps."""
     db_session = context.db_session
     problem_db = context.problem_db
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
     interactive_session = context.interactive_session
     parent_state = context.parent_state
 
@@ -127,6 +129,7 @@ def navigate_navigator(
             reference_point=request.reference_point,
             previous_responses=previous_responses,
             bounds=request.bounds,
+            progress=progress_reporter("steps"),
         )
     except IndexError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Bounds are too restrictive.") from e
@@ -157,3 +160,22 @@ def navigate_navigator(
         state_id=state_db.id,
         steps=steps,
     )
+
+
+@router.post("/navigate/job", status_code=status.HTTP_202_ACCEPTED)
+def submit_navigate_job(
+    request: NautilusNavigatorNavigateRequest,
+    context: Annotated[SessionContext, Depends(SessionContextGuard(require=[ContextField.PROBLEM]).post)],
+) -> JobInfo:
+    """Perform NAUTILUS navigation steps in a background job.
+
+    Responds right away with the queued job, which can be followed, and cancelled, under `/jobs`. Once the
+    job has succeeded, its result is the response `/navigate` would have given.
+    """
+    return submit_endpoint_job(
+        "nautilus_navigator.navigate",
+        navigate_navigator,
+        request,
+        context,
+        SessionContextGuard(require=[ContextField.PROBLEM]),
+    )
@@ -5,8 +5,10 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import select
 
+from desdeo.api.job_queue import progress_reporter, submit_endpoint_job
 from desdeo.api.models import (
     IntermediateSolutionRequest,
+    JobInfo,
     NIMBUSClassificationRequest,
     NIMBUSClassificationResponse,
     NIMBUSClassificationState,
@@ -32,6 +34,7 @@ from desdeo.api.models.generic import SolutionInfo
 from desdeo.api.models.generic_states import StateKind
 from desdeo.api.models.nimbus import NIMBUSMultiplierRequest, NIMBUSMultiplierResponse
 from desdeo.api.models.state import IntermediateSolutionState
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.api.routers.generic import solve_intermediate
 from desdeo.api.routers.problem import check_solver
 from desdeo.explanations.lagrange import (
@@ -41,7 +44,6 @@ from desdeo.explanations.lagrange import (
     filter_lagrange_multipliers,
 )
 from desdeo.mcdm.nimbus import generate_starting_point, solve_sub_problems
-from desdeo.problem import Problem
 from desdeo.tools import SolverResults
 
 from .utils import (
@@ -69,7 +71,7 @@ def solve_solutions(
     parent_state = context.parent_state
 
     solver = check_solver(problem_db=problem_db)
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     solver_results: list[SolverResults] = solve_sub_problems(
         problem=problem,
@@ -79,6 +81,7 @@ def solve_solutions(
         scalarization_options=request.scalarization_options,
         solver=solver,
         solver_options=request.solver_options,
+        progress=progress_reporter("sub-problems"),
     )
 
     nimbus_state = NIMBUSClassificationState(
@@ -123,6 +126,21 @@ def solve_solutions(
     )
 
 
+@router.post("/solve/job", status_code=status.HTTP_202_ACCEPTED)
+def submit_solve_job(
+    request: NIMBUSClassificationRequest,
+    context: Annotated[SessionContext, Depends(SessionContextGuard(require=[ContextField.PROBLEM]).post)],
+) -> JobInfo:
+    """Solve the problem using the NIMBUS method in a background job.
+
+    Responds right away with the queued job, which can be followed, and cancelled, under `/jobs`. Once the
+    job has succeeded, its result is the response `/solve` would have given.
+    """
+    return submit_endpoint_job(
+        "nimbus.solve", solve_solutions, request, context, SessionContextGuard(require=[ContextField.PROBLEM])
+    )
+
+
 @router.post("/initialize")
 def initialize(
     request: NIMBUSInitializationRequest,
@@ -136,7 +154,7 @@ def initialize(
     parent_state = context.parent_state
 
     solver = check_solver(problem_db=problem_db)
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     if isinstance(ref_point := request.starting_point, ReferencePoint):
         starting_point = ref_point.aspiration_levels
@@ -3,7 +3,8 @@
 import json
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, status
+import polars as pl
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, UploadFile, status
 from fastapi.responses import JSONResponse
 from sqlmodel import Session, select
 
@@ -30,6 +31,7 @@ from desdeo.api.models.representative_solution import (
     RepresentativeSolutionSetFull,
     RepresentativeSolutionSetInfo,
 )
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.api.routers.user_authentication import get_current_user
 from desdeo.problem import Problem
 from desdeo.problem.schema import Constraint, ConstraintTypeEnum, TensorVariable
@@ -39,6 +41,10 @@ from .utils import ContextField, SessionContext, SessionContextGuard
 
 router = APIRouter(prefix="/problem")
 
+# The magic bytes that Parquet and Arrow IPC files start with. Arrow IPC streams have none.
+_PARQUET_MAGIC = b"PAR1"
+_ARROW_FILE_MAGIC = b"ARROW1"
+
 
 def check_solver(problem_db: ProblemDB):
     """Check if a preferred solver is set in the metadata.
@@ -391,6 +397,9 @@ def add_representative_solution_set(
 ):
     """Add a new representative solution set as metadata to a problem.
 
+    For large sets, prefer `upload_representative_solution_set`, which takes the solutions as a Parquet or
+    Arrow file instead of a JSON body.
+
     Args:
         problem_id: int,
         request (RepresentativeSolutionSetBase): The JSON body containing the
@@ -403,6 +412,77 @@ def add_representative_solution_set(
     Returns:
         RepresentativeSolutionSetInfo: information about the added set.
     """
+    return _add_representative_solution_set(
+        context, request.name, request.description, request.solution_data, request.ideal, request.nadir
+    )
+
+
+@router.post("/{problem_id}/upload_representative_solution_set")
+def upload_representative_solution_set(
+    problem_id: int,
+    solution_file: UploadFile,
+    name: Annotated[str, Form()],
+    ideal: Annotated[str, Form()],
+    nadir: Annotated[str, Form()],
+    context: Annotated[SessionContext, Depends(SessionContextGuard(require=[ContextField.PROBLEM]).post)],
+    description: Annotated[str | None, Form()] = None,
+) -> RepresentativeSolutionSetInfo:
+    """Add a new representative solution set, given as a Parquet or Arrow file, as metadata to a problem.
+
+    The file is read as it was uploaded, without ever converting the solutions to JSON or to Python
+    lists, which makes this the endpoint to use for large sets.
+
+    Args:
+        problem_id (int): the id of the problem.
+        solution_file (UploadFile): the solutions as a Parquet file, an Arrow IPC file, or an Arrow IPC stream,
+            with one row per solution. The columns are as in `RepresentativeNonDominatedSolutions.solution_data`.
+        name (str): the name of the set.
+        ideal (str): the ideal objective function values of the set, as a JSON object.
+        nadir (str): the nadir objective function values of the set, as a JSON object.
+        context (SessionContext): The session context providing the current user and database session.
+        description (str | None): the description of the set. Defaults to None.
+
+    Raises:
+        HTTPException: If problem not found or unauthorized user, or if the file or the ideal and nadir points
+            cannot be read.
+
+    Returns:
+        RepresentativeSolutionSetInfo: information about the added set.
+    """
+    magic = solution_file.file.read(len(_PARQUET_MAGIC))
+    solution_file.file.seek(0)
+
+    try:
+        if magic == _PARQUET_MAGIC:
+            solutions = pl.read_parquet(solution_file.file)
+        elif magic == _ARROW_FILE_MAGIC[: len(magic)]:
+            solutions = pl.read_ipc(solution_file.file)
+        else:
+            solutions = pl.read_ipc_stream(solution_file.file)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not read the solutions as a Parquet file, an Arrow IPC file or an Arrow IPC stream.",
+        ) from e
+
+    try:
+        ideal_point = json.loads(ideal)
+        nadir_point = json.loads(nadir)
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail="Invalid JSON in the ideal or nadir point.") from e
+
+    return _add_representative_solution_set(context, name, description, solutions, ideal_point, nadir_point)
+
+
+def _add_representative_solution_set(
+    context: SessionContext,
+    name: str,
+    description: str | None,
+    solution_data: dict[str, list[float]] | pl.DataFrame,
+    ideal: dict[str, float],
+    nadir: dict[str, float],
+) -> RepresentativeSolutionSetInfo:
+    """Store a representative solution set as metadata of the problem in the context."""
     db_session: Session = context.db_session
     problem_db = context.problem_db
 
@@ -414,11 +494,11 @@ def add_representative_solution_set(
     # Add new representative solution set
     repr_metadata = RepresentativeNonDominatedSolutions(
         metadata_id=problem_metadata.id,
-        name=request.name,
-        description=request.description,
-        solution_data=request.solution_data,
-        ideal=request.ideal,
-        nadir=request.nadir,
+        name=name,
+        description=description,
+        solution_data=solution_data,
+        ideal=ideal,
+        nadir=nadir,
         metadata_instance=problem_metadata,
     )
 
@@ -577,7 +657,7 @@ def get_problem_json(
     if user.role not in (UserRole.analyst, UserRole.admin) and problem_db.user_id != user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Unauthorized user.")
 
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
     return JSONResponse(content=json.loads(problem.model_dump_json()), status_code=status.HTTP_200_OK)
 
 
@@ -603,7 +683,7 @@ def create_constrained_variant(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Unauthorized user.")
 
     # Reconstruct in-memory Problem
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     # Build a mapping from valid variable symbols to their MathJSON reference expression.
     # Scalar variables: "x" → "x" (plain symbol in MathJSON).
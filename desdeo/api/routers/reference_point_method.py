@@ -10,9 +10,9 @@ from desdeo.api.models import (
     RPMState,
     StateDB,
 )
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.api.routers.problem import check_solver
 from desdeo.mcdm import rpm_solve_solutions
-from desdeo.problem import Problem
 from desdeo.tools import SolverResults
 
 from .utils import ContextField, SessionContext, SessionContextGuard
@@ -50,7 +50,7 @@ def solve_solutions(
         )
 
     solver = check_solver(problem_db=problem_db)
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     solver_results: list[SolverResults] = rpm_solve_solutions(
         problem,
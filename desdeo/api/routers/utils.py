@@ -30,7 +30,7 @@ from desdeo.api.models import (
     UserSavedSolutionDB,
 )
 from desdeo.api.models.cumulus import ProblemModification
-from desdeo.api.models.generic_states import StateKind
+from desdeo.api.models.generic_states import State, StateKind, resolve_substates
 from desdeo.api.models.problem import (
     ForestProblemMetaData,
     ProblemMetaDataDB,
@@ -635,12 +635,15 @@ def iter_states_of_kinds(
     """Yield resolved substates (newest first) for *problem_id*/*session_id* whose kind is in *kinds*."""
     statement = (
         select(StateDB)
+        .join(State, StateDB.state_id == State.id)
         .where(StateDB.problem_id == problem_id, StateDB.session_id == session_id)
+        .where(State.kind.in_(kinds))
         .order_by(StateDB.id.desc())
     )
-    for state_db in db_session.exec(statement).all():
-        if state_db.base_state is not None and state_db.base_state.kind in kinds:
-            yield state_db.state
+    state_dbs = db_session.exec(statement).all()
+    substates = resolve_substates(db_session, state_dbs)
+    for state_db in state_dbs:
+        yield substates[state_db.id]
 
 
 class ContextField(StrEnum):
@@ -822,6 +825,8 @@ def collect_all_solutions(user: User, problem_id: int, session: Session) -> list
         .order_by(StateDB.id.desc())
     )
     states = session.exec(statement).all()
+    # resolve every substate up front instead of one query per state
+    resolve_substates(session, states)
     all_solutions = []
     for state in states:
         for i in range(state.state.num_solutions):
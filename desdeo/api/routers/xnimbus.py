@@ -36,13 +36,13 @@ from desdeo.api.models.generic import SolutionInfo
 from desdeo.api.models.generic_states import StateKind
 from desdeo.api.models.nimbus import NIMBUSMultiplierRequest, NIMBUSMultiplierResponse
 from desdeo.api.models.state import IntermediateSolutionState
+from desdeo.api.problem_cache import hydrate_problem
 from desdeo.api.routers.generic import solve_intermediate
 from desdeo.api.routers.nimbus import (
     get_multipliers_info as nimbus_get_multipliers_info,
 )
 from desdeo.api.routers.problem import check_solver
 from desdeo.mcdm.nimbus import generate_starting_point, solve_sub_problems
-from desdeo.problem import Problem
 from desdeo.tools import SolverResults
 
 from .utils import ContextField, SessionContext, SessionContextGuard, collect_all_solutions, collect_saved_solutions
@@ -63,7 +63,7 @@ def solve_solutions(
     parent_state = context.parent_state
 
     solver = check_solver(problem_db=problem_db)
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     solver_results: list[SolverResults] = solve_sub_problems(
         problem=problem,
@@ -129,7 +129,7 @@ def initialize(
     parent_state = context.parent_state
 
     solver = check_solver(problem_db=problem_db)
-    problem = Problem.from_problemdb(problem_db)
+    problem = hydrate_problem(problem_db)
 
     if isinstance(ref_point := request.starting_point, ReferencePoint):
         starting_point = ref_point.aspiration_levels
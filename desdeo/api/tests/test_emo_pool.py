@@ -0,0 +1,172 @@
+"""Tests for the pool of worker processes of the EMO methods."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures.process import BrokenProcessPool
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+from websockets.asyncio.server import serve
+
+from desdeo.api.emo_pool import (
+    EMOPoolFullError,
+    EMOResultFrames,
+    EMOWorkerPool,
+    _new_executor,
+    _read_shared_results,
+    _write_shared_results,
+)
+from desdeo.api.routers.emo import get_templates
+from desdeo.emo.options.templates import TemplateOptions
+from desdeo.emo.options.termination import MaxGenerationsTerminatorOptions
+from desdeo.problem.testproblems import dtlz2
+
+
+@pytest.fixture
+def callback_server():
+    """A websocket server that stands in for the EMO endpoint, and records the messages the workers send to it."""
+    messages = []
+    server_state = {}
+    started = threading.Event()
+
+    async def record(ws):
+        async for message in ws:
+            messages.append(json.loads(message)["message"])
+
+    async def run():
+        async with serve(record, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            server_state["url"] = f"ws://127.0.0.1:{port}/method/emo/ws"
+            server_state["loop"] = asyncio.get_running_loop()
+            server_state["stopped"] = server_state["loop"].create_future()
+            started.set()
+            await server_state["stopped"]
+
+    thread = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+    thread.start()
+    assert started.wait(timeout=10)
+
+    yield server_state["url"], messages
+
+    server_state["loop"].call_soon_threadsafe(server_state["stopped"].set_result, None)
+    thread.join(timeout=10)
+
+
+def _tiny_template(max_generations: int) -> TemplateOptions:
+    """A template of NSGA-III with a small population, which stops after the given number of generations."""
+    template = get_templates()[0].model_copy(deep=True)
+    template.generator.n_points = 10
+    template.selection.reference_vector_options.number_of_vectors = 10
+    template.termination = MaxGenerationsTerminatorOptions(max_generations=max_generations)
+    return template
+
+
+def _wait_until(condition: Callable[[], bool], timeout: float = 60):
+    """Wait until the condition holds, or fail once the timeout has passed."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for the pool."
+        time.sleep(0.05)
+
+
+def _run(pool: EMOWorkerPool, templates: list[TemplateOptions], method_ids: list[str]) -> list[list[EMOResultFrames]]:
+    """Submit a run to the pool, and return the list the solutions of the run are appended to once it completes."""
+    completed = []
+    pool.submit(dtlz2(5, 3), templates, None, method_ids, "client", on_complete=completed.append)
+    return completed
+
+
+def test_results_round_trip_through_shared_memory():
+    """Test that the solutions of a method are read back as they were written, and the memory is freed."""
+    variables = pl.DataFrame({"x_1": [0.1, 0.2], "x_2": [0.3, 0.4]})
+    outputs = pl.DataFrame({"f_1": [1.0, 2.0], "f_2": [3.0, 4.0], "c_1": [0.0, -1.0]})
+
+    handle = _write_shared_results((variables, outputs))
+    read_variables, read_outputs = _read_shared_results(*handle)
+
+    assert_frame_equal(read_variables, variables)
+    assert_frame_equal(read_outputs, outputs)
+
+    # the memory was unlinked after it was read
+    with pytest.raises(FileNotFoundError):
+        _read_shared_results(*handle)
+
+
+def test_pool_refuses_runs_it_has_no_room_for():
+    """Test that a run with more methods than the pool can run or queue is refused before anything starts."""
+    pool = EMOWorkerPool(max_workers=1, max_queued=1, callback_url="ws://example.com/method/emo/ws/")
+    assert pool.callback_url == "ws://example.com/method/emo/ws"
+
+    assert pool.has_room(2)
+    assert not pool.has_room(3)
+
+    templates = get_templates() * 3
+
+    with pytest.raises(EMOPoolFullError):
+        pool.submit(dtlz2(5, 3), templates, None, ["a", "b", "c"], "client", on_complete=lambda _results: None)
+
+    assert pool.admitted == 0
+    assert pool._executor is None
+    assert not pool.stop("a")
+
+
+def test_pool_runs_algorithms_and_stops_them_early(callback_server):
+    """Test that a run goes through the workers of the pool, and that a long run can be stopped early."""
+    callback_url, messages = callback_server
+    pool = EMOWorkerPool(max_workers=1, max_queued=1, callback_url=callback_url)
+
+    try:
+        completed = _run(pool, [_tiny_template(max_generations=3)], ["short"])
+        _wait_until(lambda: len(completed) == 1)
+
+        assert len(completed[0]) == 1
+        variables, outputs = completed[0][0]
+        assert {f"x_{i}" for i in range(1, 6)} <= set(variables.columns)
+        assert {"f_1", "f_2", "f_3"} <= set(outputs.columns)
+        assert variables.height == outputs.height > 0
+
+        _wait_until(lambda: pool.admitted == 0)
+        _wait_until(lambda: "Finished short" in messages)
+        assert messages.index("Started short") < messages.index("Finished short")
+
+        # a run that would take practically forever ends once it is told to stop
+        completed = _run(pool, [_tiny_template(max_generations=10**9)], ["long"])
+        _wait_until(lambda: "Started long" in messages)
+        assert pool.admitted == 1
+
+        assert pool.stop("long")
+        _wait_until(lambda: len(completed) == 1)
+        _wait_until(lambda: pool.admitted == 0)
+
+        _wait_until(lambda: "Finished long" in messages)
+        assert completed[0][0][1].height > 0
+        assert not pool.stop("long")
+    finally:
+        pool.shutdown()
+
+
+def test_pool_replaces_broken_workers(callback_server):
+    """Test that a pool whose worker has died starts new workers for the next run."""
+    callback_url, _messages = callback_server
+    pool = EMOWorkerPool(max_workers=1, max_queued=1, callback_url=callback_url)
+
+    # a worker that exits abruptly, e.g., because it ran out of memory, breaks its executor for good
+    broken = _new_executor(1)
+    with pytest.raises(BrokenProcessPool):
+        broken.submit(os._exit, 1).result(timeout=60)
+    pool._executor = broken
+
+    try:
+        completed = _run(pool, [_tiny_template(max_generations=2)], ["after-break"])
+        assert pool._executor is not broken
+
+        _wait_until(lambda: len(completed) == 1)
+        _wait_until(lambda: pool.admitted == 0)
+        assert len(completed[0]) == 1
+    finally:
+        pool.shutdown()
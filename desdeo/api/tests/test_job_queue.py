@@ -0,0 +1,140 @@
+"""Tests for the background jobs of the solve endpoints."""
+
+import json
+import threading
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from desdeo.api.job_queue import JobLimitError, JobQueue, job_queue, report_progress
+from desdeo.api.models import (
+    JobInfo,
+    JobStatus,
+    NautilusNavigatorInitRequest,
+    NautilusNavigatorInitResponse,
+    NautilusNavigatorNavigateRequest,
+    NautilusNavigatorNavigateResponse,
+    ProblemDB,
+    StateDB,
+    User,
+)
+
+from .conftest import login, post_json
+
+
+def test_job_queue_runs_jobs_and_records_events():
+    """Test that jobs run in the background, report their progress and end up with a result or an error."""
+    queue = JobQueue(max_workers=2)
+
+    def succeed(_job):
+        report_progress("Halfway.")
+        return 42
+
+    def fail(_job):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Bad preference.")
+
+    succeeding = queue.submit(1, "test.succeed", succeed)
+    failing = queue.submit(1, "test.fail", fail)
+    assert succeeding.wait(timeout=10)
+    assert failing.wait(timeout=10)
+
+    assert succeeding.status == JobStatus.SUCCEEDED
+    assert succeeding.result == 42
+    assert [event.status for event in succeeding.events] == [
+        JobStatus.QUEUED,
+        JobStatus.RUNNING,
+        JobStatus.RUNNING,
+        JobStatus.SUCCEEDED,
+    ]
+    assert succeeding.events[2].message == "Halfway."
+    assert succeeding.events[-1].result == 42
+
+    assert failing.status == JobStatus.FAILED
+    assert failing.status_code == status.HTTP_400_BAD_REQUEST
+    assert failing.error == "Bad preference."
+
+    queue.shutdown()
+
+
+def test_job_queue_limits_and_cancellation():
+    """Test that users are limited to a number of unfinished jobs, and that queued jobs can be cancelled."""
+    queue = JobQueue(max_workers=1, max_jobs_per_user=2)
+    release = threading.Event()
+
+    running = queue.submit(1, "test.block", lambda _job: release.wait(timeout=10))
+    queued = queue.submit(1, "test.block", lambda _job: release.wait(timeout=10))
+
+    with pytest.raises(JobLimitError):
+        queue.submit(1, "test.block", lambda _job: None)
+
+    # other users, and jobs that are not limited, are not affected
+    other = queue.submit(2, "test.noop", lambda _job: None)
+    unlimited = queue.submit(1, "test.noop", lambda _job: None, limited=False)
+
+    assert queue.cancel(queued.job_id)
+    assert queued.status == JobStatus.CANCELLED
+
+    release.set()
+    for job in (running, other, unlimited):
+        assert job.wait(timeout=10)
+        assert job.status == JobStatus.SUCCEEDED
+
+    assert not queue.cancel(running.job_id)
+    assert [job.job_id for job in queue.jobs_of(2)] == [other.job_id]
+
+    queue.shutdown()
+
+
+def test_navigate_job(client: TestClient, session_and_user: dict[str, Session | list[User]]):
+    """Test that navigating in a job stores the same state, and gives the same response, as navigating directly."""
+    session = session_and_user["session"]
+    access_token = login(client)
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    problem_db = session.exec(select(ProblemDB).where(ProblemDB.name == "The river pollution problem")).first()
+
+    init_request = NautilusNavigatorInitRequest(problem_id=problem_db.id)
+    init_raw = post_json(client, "/nautilus/initialize", init_request.model_dump(), access_token)
+    init_response = NautilusNavigatorInitResponse.model_validate(json.loads(init_raw.content))
+
+    nav_request = NautilusNavigatorNavigateRequest(
+        problem_id=problem_db.id,
+        parent_state_id=init_response.state_id,
+        reference_point={"f_1": 6.0, "f_2": 3.2, "f_3": 5.0, "f_4": -1.0, "f_5": 0.1},
+        steps_remaining=5,
+    )
+
+    submit_raw = post_json(client, "/nautilus/navigate/job", nav_request.model_dump(), access_token)
+    assert submit_raw.status_code == status.HTTP_202_ACCEPTED
+    submitted = JobInfo.model_validate(json.loads(submit_raw.content))
+    assert submitted.kind == "nautilus_navigator.navigate"
+
+    assert job_queue.get(submitted.job_id).wait(timeout=60)
+
+    job_raw = client.get(f"/jobs/{submitted.job_id}", headers=headers)
+    assert job_raw.status_code == status.HTTP_200_OK
+    job = JobInfo.model_validate(json.loads(job_raw.content))
+    assert job.status == JobStatus.SUCCEEDED
+
+    nav_response = NautilusNavigatorNavigateResponse.model_validate(job.result)
+    assert len(nav_response.steps) == 5
+
+    # each step taken was reported as progress
+    messages = [job_event.message for job_event in job_queue.get(submitted.job_id).events]
+    for step in range(1, 6):
+        assert f"Solved {step} of 5 steps." in messages
+    assert session.get(StateDB, nav_response.state_id).parent_id == init_response.state_id
+
+    # the event stream replays the events of the job, ending with its result
+    events_raw = client.get(f"/jobs/{submitted.job_id}/events", headers=headers)
+    assert events_raw.headers["content-type"].startswith("text/event-stream")
+    assert "event: queued" in events_raw.text
+    assert "event: succeeded" in events_raw.text
+
+    events_raw = client.get(f"/jobs/{submitted.job_id}/events", headers={**headers, "Last-Event-ID": "1"})
+    assert "event: queued" not in events_raw.text
+
+    # unknown jobs are not found
+    assert client.get("/jobs/not-a-job", headers=headers).status_code == status.HTTP_404_NOT_FOUND
@@ -1,6 +1,7 @@
 """Tests related to the SQLModels."""
 
 import numpy as np
+from sqlalchemy import event
 from sqlmodel import Session, select
 
 from desdeo.api.models import (
@@ -37,6 +38,7 @@ from desdeo.api.models import (
 from desdeo.api.models.gdm.gnimbus import (
     OptimizationPreference,
 )
+from desdeo.api.models.generic_states import StateKind, resolve_substates, state_depths
 from desdeo.mcdm import enautilus_step, rpm_solve_solutions
 from desdeo.mcdm.nimbus import generate_starting_point, solve_sub_problems
 from desdeo.problem.schema import (
@@ -1172,3 +1174,47 @@ def test_nimbus_initialize_w_multidimensional_constraints(session_and_user: dict
         [x for _, x in results_1.optimal_objectives.items()],
         0.001,
     )
+
+
+def test_resolve_substates_in_bulk(session_and_user: dict[str, Session | list[User]]):
+    """Test that the substates of many states are resolved with one query per table, and their depths computed."""
+    session = session_and_user["session"]
+
+    root = StateDB.create(session, problem_id=1, state=NIMBUSSaveState(solutions=[]))
+    session.commit()
+    child = StateDB.create(session, problem_id=1, parent_id=root.id, state=NIMBUSSaveState(solutions=[]))
+    other_kind = StateDB.create(
+        session, problem_id=1, parent_id=root.id, state=NIMBUSSaveState(solutions=[]), kind=StateKind.XNIMBUS_SAVE
+    )
+    session.commit()
+    grandchild = StateDB.create(session, problem_id=1, parent_id=child.id, state=NIMBUSSaveState(solutions=[]))
+    session.commit()
+
+    ids = [root.id, child.id, other_kind.id, grandchild.id]
+    session.expire_all()
+    state_dbs = session.exec(select(StateDB).where(StateDB.id.in_(ids))).all()
+
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count)
+    try:
+        substates = resolve_substates(session, state_dbs)
+        # one query for the base states, one for the only substate table, and one that loads the saved
+        # solutions of all of its rows, which the relationship loads with a single SELECT ... IN
+        assert len(statements) == 3
+
+        # the substates are now in the session, so accessing them issues no queries
+        assert all(state_db.state is substates[state_db.id] for state_db in state_dbs)
+        assert all(isinstance(substate, NIMBUSSaveState) for substate in substates.values())
+        assert len(statements) == 3
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count)
+
+    depths = state_depths({state_db.id: state_db.parent_id for state_db in state_dbs})
+    assert depths == {root.id: 0, child.id: 1, other_kind.id: 1, grandchild.id: 2}
+
+    # a state whose parent is not among the given states is a root
+    assert state_depths({child.id: root.id, grandchild.id: child.id}) == {child.id: 0, grandchild.id: 1}
@@ -0,0 +1,118 @@
+"""Tests for the in-process cache of hydrated problems."""
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from desdeo.api.models import ProblemDB, User
+from desdeo.api.models.problem import ExtraFunctionDB
+from desdeo.api.problem_cache import ProblemCache, problem_cache
+from desdeo.problem import ExtraFunction, Problem
+from desdeo.problem.testproblems import dtlz2
+
+from .conftest import login
+
+
+def test_problem_cache_hits_and_invalidation(session_and_user: dict):
+    """Test that a problem is hydrated once, and again after one of its rows changes."""
+    session: Session = session_and_user["session"]
+    user: User = session_and_user["user"]
+
+    problem_db = ProblemDB.from_problem(dtlz2(5, 3), user=user)
+    session.add(problem_db)
+    session.commit()
+    session.refresh(problem_db)
+
+    problem_cache.invalidate()
+    before = problem_cache.stats()
+
+    first = problem_cache.get(problem_db)
+    assert first == Problem.from_problemdb(problem_db)
+    assert problem_cache.get(problem_db) is first
+    assert problem_cache.stats()["hits"] == before["hits"] + 1
+    assert problem_cache.stats()["misses"] == before["misses"] + 1
+
+    # adding a row to the problem invalidates it
+    extra_dump = ExtraFunction(name="Extra", symbol="e_1", func="x_1 + x_2").model_dump()
+    extra_dump["problem_id"] = problem_db.id
+    session.add(ExtraFunctionDB.model_validate(extra_dump))
+    session.commit()
+    session.refresh(problem_db)
+    assert problem_cache.stats()["invalidations"] == before["invalidations"] + 1
+
+    second = problem_cache.get(problem_db)
+    assert second is not first
+    assert [extra.symbol for extra in second.extra_funcs] == [extra.symbol for extra in first.extra_funcs] + ["e_1"]
+
+
+def test_problem_cache_sees_changes_made_in_other_processes(session_and_user: dict):
+    """Test that a cache that was not told about a change sees it from the revision of the problem."""
+    session: Session = session_and_user["session"]
+    user: User = session_and_user["user"]
+
+    problem_db = ProblemDB.from_problem(dtlz2(5, 3), user=user)
+    session.add(problem_db)
+    session.commit()
+    session.refresh(problem_db)
+
+    # the cache of another worker process, which the events of this process do not reach
+    other_cache = ProblemCache()
+    first = other_cache.get(problem_db)
+    revision = problem_db.revision
+
+    extra_dump = ExtraFunction(name="Extra", symbol="e_1", func="x_1 + x_2").model_dump()
+    extra_dump["problem_id"] = problem_db.id
+    session.add(ExtraFunctionDB.model_validate(extra_dump))
+    session.commit()
+    session.refresh(problem_db)
+    assert problem_db.revision != revision
+
+    second = other_cache.get(problem_db)
+    assert second is not first
+    assert [extra.symbol for extra in second.extra_funcs] == [extra.symbol for extra in first.extra_funcs] + ["e_1"]
+
+    # changing the row of the problem itself gives it a new revision as well
+    revision = problem_db.revision
+    problem_db.description = "A changed description."
+    session.add(problem_db)
+    session.commit()
+    session.refresh(problem_db)
+    assert problem_db.revision != revision
+    assert other_cache.get(problem_db).description == "A changed description."
+    assert other_cache.stats()["misses"] == 3
+
+
+def test_problem_cache_evicts_least_recently_used(session_and_user: dict):
+    """Test that the cache keeps only the most recently used problems."""
+    session: Session = session_and_user["session"]
+    user: User = session_and_user["user"]
+
+    problem_dbs = [ProblemDB.from_problem(dtlz2(5, 3), user=user) for _ in range(3)]
+    session.add_all(problem_dbs)
+    session.commit()
+
+    cache = ProblemCache(max_entries=2)
+    for problem_db in problem_dbs:
+        cache.get(problem_db)
+
+    assert list(cache._entries) == [problem_dbs[1].id, problem_dbs[2].id]
+
+
+def test_deleted_problem_is_dropped_from_cache(client: TestClient, session_and_user: dict):
+    """Test that deleting a problem through the endpoint drops it from the worker's cache."""
+    session: Session = session_and_user["session"]
+    user: User = session_and_user["user"]
+    access_token = login(client)
+
+    problem_db = ProblemDB.from_problem(dtlz2(5, 3), user=user)
+    session.add(problem_db)
+    session.commit()
+    session.refresh(problem_db)
+    problem_id = problem_db.id
+
+    problem_cache.get(problem_db)
+    assert problem_id in problem_cache._entries
+
+    response = client.delete(f"/problem/{problem_id}", headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert problem_id not in problem_cache._entries
@@ -3,14 +3,23 @@
 Covers representative solution sets and solution description metadata.
 """
 
+import io
+import json
 from types import SimpleNamespace
 
+import polars as pl
 from fastapi.testclient import TestClient
-from sqlmodel import select
+from sqlalchemy import JSON, LargeBinary, MetaData, insert
+from sqlmodel import Session, SQLModel, create_engine, select
 
+from desdeo.api.db_init_prod import convert_solution_data
 from desdeo.api.models import ProblemDB, ProblemMetaDataDB, RepresentativeNonDominatedSolutions
 from desdeo.api.models.problem import SolutionDescriptionMetaData
-from desdeo.api.models.representative_solution import RepresentativeSolutionSetBase
+from desdeo.api.models.representative_solution import (
+    ColumnarSolutionData,
+    RepresentativeSolutionSetBase,
+    SolutionDataType,
+)
 from desdeo.api.routers.utils import SessionContextGuard
 from desdeo.problem.testproblems import dtlz2
 
@@ -205,6 +214,113 @@ def test_get_representative_solution_set(client: TestClient, session_and_user: d
     assert data["nadir"] == solution_set_payload["nadir"]
 
 
+def test_upload_representative_solution_set(client: TestClient, session_and_user: dict):
+    """Test that a representative solution set can be uploaded as a Parquet file and is stored as columns."""
+    session = session_and_user["session"]
+    user = session_and_user["user"]
+    access_token = login(client)
+
+    problem = ProblemDB.from_problem(dtlz2(5, 3), user=user)
+    session.add(problem)
+    session.commit()
+    session.refresh(problem)
+
+    solutions = pl.DataFrame({"x_1": [0.1, 0.2, 0.3], "f_1": [1.0, 0.5, 0.0], "f_1_min": [1.0, 0.5, 0.0]})
+    parquet = io.BytesIO()
+    solutions.write_parquet(parquet)
+
+    response = client.post(
+        f"/problem/{problem.id}/upload_representative_solution_set",
+        headers={"Authorization": f"Bearer {access_token}"},
+        files={"solution_file": ("solutions.parquet", parquet.getvalue(), "application/octet-stream")},
+        data={"name": "Uploaded set", "ideal": json.dumps({"f_1": 0.0}), "nadir": json.dumps({"f_1": 1.0})},
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "Uploaded set"
+
+    session.expire_all()
+    repr_metadata = session.get(RepresentativeNonDominatedSolutions, response.json()["id"])
+
+    # the set is read back from its columnar form, whole or only some of its columns
+    assert isinstance(repr_metadata.solution_data, ColumnarSolutionData)
+    assert repr_metadata.solutions_frame().equals(solutions)
+    assert repr_metadata.solutions_frame(["f_1_min"]).columns == ["f_1_min"]
+    assert repr_metadata.solution_data == solutions.to_dict(as_series=False)
+
+    # the same set can be uploaded as an Arrow IPC stream, but not as JSON
+    stream = io.BytesIO()
+    solutions.write_ipc_stream(stream)
+    for payload, expected_status in ((stream.getvalue(), 200), (b'{"x_1": [0.1]}', 400)):
+        response = client.post(
+            f"/problem/{problem.id}/upload_representative_solution_set",
+            headers={"Authorization": f"Bearer {access_token}"},
+            files={"solution_file": ("solutions", payload, "application/octet-stream")},
+            data={"name": "Uploaded set", "ideal": json.dumps({"f_1": 0.0}), "nadir": json.dumps({"f_1": 1.0})},
+        )
+        assert response.status_code == expected_status
+
+
+def test_columnar_solution_data_with_columns_of_different_lengths():
+    """Test that solution sets whose columns have different lengths are stored and read back as they were."""
+    data = {"f_1": [0.1, 0.5, 0.9], "f_1_min": []}
+    stored = SolutionDataType().process_result_value(SolutionDataType().process_bind_param(data, None), None)
+
+    assert stored == data
+    assert stored["f_1_min"] == []
+    # sets stored as JSON by earlier versions are still read, whether the driver gives text, bytes or dicts
+    assert SolutionDataType().process_result_value(json.dumps(data), None) == data
+    assert SolutionDataType().process_result_value(json.dumps(data).encode(), None) == data
+    assert SolutionDataType().process_result_value(data, None) == data
+    rows = [{"f_1": 0.1, "f_2": 0.9}, {"f_1": 0.5, "f_2": 0.5}]
+    assert SolutionDataType().process_result_value(rows, None) == {"f_1": [0.1, 0.5], "f_2": [0.9, 0.5]}
+
+
+def test_convert_legacy_json_solution_data():
+    """Test that a solution set stored in a JSON typed column by an earlier version is converted to Arrow IPC."""
+    engine = create_engine("sqlite://")
+    table_name = RepresentativeNonDominatedSolutions.__tablename__
+
+    # the tables as earlier versions created them, with the solution set in a JSON column
+    legacy_metadata = MetaData()
+    for legacy_table in SQLModel.metadata.sorted_tables:
+        legacy_table.to_metadata(legacy_metadata)
+    legacy_metadata.tables[table_name].c.solution_data.type = JSON()
+    legacy_metadata.create_all(engine)
+
+    data = {"x_1": [0.1, 0.2], "f_1": [1.0, 2.0], "f_1_min": [1.0, 2.0]}
+    with engine.begin() as connection:
+        connection.execute(
+            insert(legacy_metadata.tables[table_name]).values(
+                id=1,
+                name="Legacy set",
+                metadata_type="representative_non_dominated_solutions",
+                solution_data=data,
+                ideal={"f_1": 1.0},
+                nadir={"f_1": 2.0},
+            )
+        )
+
+    convert_solution_data(engine)
+    with engine.connect() as connection:
+        converted = connection.execute(select(legacy_metadata.tables[table_name].c.solution_data.cast(LargeBinary)))
+        payload = converted.scalar_one()
+    assert SolutionDataType.is_arrow(payload)
+
+    # converting again leaves the converted rows as they are
+    convert_solution_data(engine)
+    with engine.connect() as connection:
+        converted = connection.execute(select(legacy_metadata.tables[table_name].c.solution_data.cast(LargeBinary)))
+        assert converted.scalar_one() == payload
+
+    with Session(engine) as session:
+        stored = session.get(RepresentativeNonDominatedSolutions, 1)
+
+        assert isinstance(stored.solution_data, ColumnarSolutionData)
+        assert stored.solution_data == data
+        assert stored.solutions_frame().equals(pl.DataFrame(data))
+        assert stored.ideal == {"f_1": 1.0}
+
+
 def test_delete_representative_solution_set(client: TestClient, session_and_user: dict):
     """Test that a representative solution set can be deleted by its ID."""
     session = session_and_user["session"]
@@ -2,6 +2,7 @@
 
 from collections.abc import Sequence
 
+import numpy as np
 import polars as pl
 
 from desdeo.problem import Problem
@@ -44,11 +45,38 @@ class BaseArchive(Subscriber):
             publisher (Publisher): The publisher object.
         """
         super().__init__(publisher, verbosity=0)
-        self.solutions: pl.DataFrame = None
-        self.selections: pl.DataFrame = None
+        # The archived data is collected in batches, which are concatenated only when the data is accessed.
+        self._solution_batches: list[pl.DataFrame] = []
+        self._selection_batches: list[pl.DataFrame] = []
         self.problem = problem
         self.generation_number = 1
 
+    @property
+    def solutions(self) -> pl.DataFrame | None:
+        """The archived solutions, or None if nothing has been archived yet."""
+        if not self._solution_batches:
+            return None
+        if len(self._solution_batches) > 1:
+            self._solution_batches = [pl.concat(self._solution_batches, how="vertical")]
+        return self._solution_batches[0]
+
+    @solutions.setter
+    def solutions(self, value: pl.DataFrame | None) -> None:
+        self._solution_batches = [] if value is None else [value]
+
+    @property
+    def selections(self) -> pl.DataFrame | None:
+        """The archived selections, or None if nothing has been archived yet."""
+        if not self._selection_batches:
+            return None
+        if len(self._selection_batches) > 1:
+            self._selection_batches = [pl.concat(self._selection_batches, how="vertical")]
+        return self._selection_batches[0]
+
+    @selections.setter
+    def selections(self, value: pl.DataFrame | None) -> None:
+        self._selection_batches = [] if value is None else [value]
+
     def state(self) -> Sequence[Message]:
         """Return the state of the archiver."""
         return []
@@ -67,10 +95,7 @@ class BaseArchive(Subscriber):
         if message.topic == SelectorMessageTopics.SELECTED_VERBOSE_OUTPUTS:
             data: pl.DataFrame = message.value
             data = data.with_columns(generation=self.generation_number)
-            if self.selections is None:
-                self.selections = data
-            else:
-                self.selections = pl.concat([self.selections, data], how="vertical")
+            self._selection_batches.append(data)
             return
 
     @property
@@ -114,10 +139,7 @@ class FeasibleArchive(BaseArchive):
         feasible_mask = (data[self.cons_symb] <= 0).to_numpy().all(axis=1)
         feasible_data = data.filter(feasible_mask)
         feasible_data = feasible_data.with_columns(generation=self.generation_number)
-        if self.solutions is None:
-            self.solutions = feasible_data
-        else:
-            self.solutions = pl.concat([self.solutions, feasible_data])
+        self._solution_batches.append(feasible_data)
 
 
 class Archive(BaseArchive):
@@ -137,14 +159,17 @@ class Archive(BaseArchive):
             return
         data = message.value
         data = data.with_columns(generation=self.generation_number)
-        if self.solutions is None:
-            self.solutions = data
-        else:
-            self.solutions = pl.concat([self.solutions, data])
+        self._solution_batches.append(data)
 
 
 class NonDominatedArchive(Archive):
-    """An archiver that stores only the feasible non-dominated solutions evaluated during evolution."""
+    """An archiver that stores only the feasible non-dominated solutions evaluated during evolution.
+
+    The target values of the archived solutions are kept in a preallocated NumPy buffer, which grows
+    geometrically. A new batch of solutions is compared only against the archived solutions that lie
+    within the bounding box of the batch, i.e., those that may dominate or be dominated by a solution
+    in the batch. The archived rows are materialized as a DataFrame only when `solutions` is accessed.
+    """
 
     def __init__(self, *, problem: Problem, publisher: Publisher):
         """Initialize the archiver.
@@ -160,6 +185,54 @@ class NonDominatedArchive(Archive):
         else:
             self.cons_symb = [x.symbol for x in problem.constraints]
 
+        # target values of the archived solutions, and the rows of the solutions in the stored batches
+        self._target_buffer = np.empty((0, len(self.targets)))
+        self._row_buffer = np.empty(0, dtype=np.int64)
+        self._size = 0
+        # the number of rows in the stored batches, including rows of solutions dominated since
+        self._n_stored = 0
+
+    @property
+    def solutions(self) -> pl.DataFrame | None:
+        """The archived non-dominated solutions, or None if nothing has been archived yet."""
+        if not self._solution_batches:
+            return None
+        if len(self._solution_batches) > 1 or self._n_stored != self._size:
+            # drop the rows of dominated solutions, the buffers then index the materialized solutions
+            stored = pl.concat(self._solution_batches, how="vertical")
+            self._solution_batches = [stored[self._row_buffer[: self._size]]]
+            self._row_buffer[: self._size] = np.arange(self._size)
+            self._n_stored = self._size
+        return self._solution_batches[0]
+
+    @solutions.setter
+    def solutions(self, value: pl.DataFrame | None) -> None:
+        self._solution_batches = []
+        self._size = 0
+        self._n_stored = 0
+        if value is not None:
+            self._reserve(len(value))
+            self._target_buffer[: len(value)] = value[self.targets].to_numpy()
+            self._row_buffer[: len(value)] = np.arange(len(value))
+            self._solution_batches = [value]
+            self._size = len(value)
+            self._n_stored = len(value)
+
+    def _reserve(self, size: int) -> None:
+        """Grows the buffers, if needed, so that they fit at least `size` solutions."""
+        capacity = len(self._target_buffer)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+
+        target_buffer = np.empty((capacity, len(self.targets)))
+        target_buffer[: self._size] = self._target_buffer[: self._size]
+        row_buffer = np.empty(capacity, dtype=np.int64)
+        row_buffer[: self._size] = self._row_buffer[: self._size]
+
+        self._target_buffer = target_buffer
+        self._row_buffer = row_buffer
+
     def update(self, message: Message) -> None:
         """Update the archiver with the new data.
 
@@ -173,16 +246,41 @@ class NonDominatedArchive(Archive):
             super().update(message)
             return
         data = message.value
-        data = data.with_columns(generation=self.generation_number)
         if type(data) is not pl.DataFrame:
             raise ValueError("Data should be a polars DataFrame")
+        data = data.with_columns(generation=self.generation_number)
         if self.cons_symb:
             feasible_mask = (data[self.cons_symb] <= 0).to_numpy().all(axis=1)
             data = data.filter(feasible_mask)
-        if self.solutions is None:
-            non_dom_mask = non_dominated(data[self.targets].to_numpy())
-            self.solutions = data.filter(non_dom_mask)
-        else:
-            to_add = data.filter(non_dominated(data[self.targets].to_numpy()))
-            mask1, mask2 = non_dominated_merge(self.solutions[self.targets].to_numpy(), to_add[self.targets].to_numpy())
-            self.solutions = pl.concat([self.solutions.filter(mask1), to_add.filter(mask2)])
+        if data.is_empty():
+            return
+
+        new_targets = data[self.targets].to_numpy().astype(np.float64)
+        batch_mask = non_dominated(new_targets)
+        data = data.filter(batch_mask)
+        new_targets = new_targets[batch_mask]
+
+        archived = self._target_buffer[: self._size]
+        # only the archived solutions within the bounding box of the batch can dominate or be dominated by it
+        candidates = np.flatnonzero(
+            np.all(archived <= new_targets.max(axis=0), axis=1) | np.all(archived >= new_targets.min(axis=0), axis=1)
+        )
+        candidates_mask, new_mask = non_dominated_merge(archived[candidates], new_targets)
+
+        keep = np.ones(self._size, dtype=np.bool_)
+        keep[candidates[~candidates_mask]] = False
+        n_keep = int(keep.sum())
+        n_new = int(new_mask.sum())
+
+        kept_targets = archived[keep]
+        kept_rows = self._row_buffer[: self._size][keep]
+        self._reserve(n_keep + n_new)
+
+        self._target_buffer[:n_keep] = kept_targets
+        self._row_buffer[:n_keep] = kept_rows
+        self._target_buffer[n_keep : n_keep + n_new] = new_targets[new_mask]
+        self._row_buffer[n_keep : n_keep + n_new] = np.arange(self._n_stored, self._n_stored + n_new)
+
+        self._solution_batches.append(data.filter(new_mask))
+        self._n_stored += n_new
+        self._size = n_keep + n_new
@@ -32,7 +32,7 @@ def template1(
 
     Args:
         evaluator (EMOEvaluator): A class that evaluates the solutions and provides the objective vectors, constraint
-            vectors, and targets.
+            vectors, and targets. It is closed when the run ends.
         crossover (BaseCrossover): The crossover operator.
         mutation (BaseMutation): The mutation operator.
         generator (BaseGenerator): A class that generates the initial population.
@@ -45,17 +45,21 @@ def template1(
     Returns:
         EMOResult: The final population and their objective vectors, constraint vectors, and targets
     """
-    solutions, outputs = generator.do()
+    try:
+        solutions, outputs = generator.do()
 
-    while not terminator.check():
-        offspring = crossover.do(population=solutions)
-        offspring = mutation.do(offspring, solutions)
-        # Repair offspring if they go out of bounds
-        offspring = repair(offspring)
-        offspring_outputs = evaluator.evaluate(offspring)
-        solutions, outputs = selection.do(parents=(solutions, outputs), offsprings=(offspring, offspring_outputs))
+        while not terminator.check():
+            offspring = crossover.do(population=solutions)
+            offspring = mutation.do(offspring, solutions)
+            # Repair offspring if they go out of bounds
+            offspring = repair(offspring)
+            offspring_outputs = evaluator.evaluate(offspring)
+            solutions, outputs = selection.do(parents=(solutions, outputs), offsprings=(offspring, offspring_outputs))
 
-    return EMOResult(optimal_variables=solutions, optimal_outputs=outputs)
+        return EMOResult(optimal_variables=solutions, optimal_outputs=outputs)
+    finally:
+        # stop the simulator workers the evaluator may have started
+        evaluator.close()
 
 
 def template2(
@@ -72,7 +76,7 @@ def template2(
 
     Args:
         evaluator (EMOEvaluator): A class that evaluates the solutions and provides the objective vectors, constraint
-            vectors, and targets.
+            vectors, and targets. It is closed when the run ends.
         crossover (BaseCrossover): The crossover operator.
         mutation (BaseMutation): The mutation operator.
         generator (BaseGenerator): A class that generates the initial population.
@@ -87,29 +91,33 @@ def template2(
     Returns:
         EMOResult: The final population and their objective vectors, constraint vectors, and targets
     """
-    solutions, outputs = generator.do()
-    # This is just a hack to make all selection operators work (they require offsprings to be passed separately rn)
-    offspring = pl.DataFrame(
-        schema=solutions.schema,
-    )
-    offspring_outputs = pl.DataFrame(
-        schema=outputs.schema,
-    )
-
-    while True:
-        solutions, outputs = selection.do(parents=(solutions, outputs), offsprings=(offspring, offspring_outputs))
-        if terminator.check():
-            # Weird way to do looping, but IBEA does environmental selection before the loop check, and...
-            # does mating afterwards.
-            break
-        parents, _ = mate_selection.do((solutions, outputs))
-        offspring = crossover.do(population=parents)
-        offspring = mutation.do(offspring, solutions)
-        # Repair offspring if they go out of bounds
-        offspring = repair(offspring)
-        offspring_outputs = evaluator.evaluate(offspring)
-
-    return EMOResult(optimal_variables=solutions, optimal_outputs=outputs)
+    try:
+        solutions, outputs = generator.do()
+        # This is just a hack to make all selection operators work (they require offsprings to be passed separately rn)
+        offspring = pl.DataFrame(
+            schema=solutions.schema,
+        )
+        offspring_outputs = pl.DataFrame(
+            schema=outputs.schema,
+        )
+
+        while True:
+            solutions, outputs = selection.do(parents=(solutions, outputs), offsprings=(offspring, offspring_outputs))
+            if terminator.check():
+                # Weird way to do looping, but IBEA does environmental selection before the loop check, and...
+                # does mating afterwards.
+                break
+            parents, _ = mate_selection.do((solutions, outputs))
+            offspring = crossover.do(population=parents)
+            offspring = mutation.do(offspring, solutions)
+            # Repair offspring if they go out of bounds
+            offspring = repair(offspring)
+            offspring_outputs = evaluator.evaluate(offspring)
+
+        return EMOResult(optimal_variables=solutions, optimal_outputs=outputs)
+    finally:
+        # stop the simulator workers the evaluator may have started
+        evaluator.close()
 
 
 def template3(
@@ -132,7 +140,7 @@ def template3(
 
     Args:
         evaluator (EMOEvaluator): A class that evaluates the solutions and provides the objective vectors, constraint
-            vectors, and targets.
+            vectors, and targets. It is closed when the run ends.
         crossover (BaseCrossover): The crossover operator.
         mutation (BaseMutation): The mutation operator.
         generator (BaseGenerator): A class that generates the initial population.
@@ -147,26 +155,30 @@ def template3(
         EMOResult: The final population and their objective vectors, constraint vectors, and targets
     """
     rng = np.random.default_rng(seed)
-    solutions, outputs = generator.do()  # Algorithm 1 line 1
-
-    while not terminator.check():
-        # Generate one offspring at a time
-        # choose two random parents from the current population
-        parents_idx = rng.choice(solutions.height, size=2, replace=False).tolist()
-        offsprings = crossover.do(population=solutions, to_mate=parents_idx)  # Algorithm 1 line 4
-        offsprings = mutation.do(offsprings, solutions)  # Algorithm 1 line 4
-        # Repair offspring if they go out of bounds
-        offsprings = repair(offsprings)
-        # The crossover generates two offsprings, but we only want to keep one of them,
-        # so we randomly choose one of the two (i think just always choosing the first one is not fine)
-        offspring_idx = rng.choice(offsprings.height, size=1, replace=False).tolist()
-        offspring = offsprings[offspring_idx, :]
-        offspring_outputs = evaluator.evaluate(offspring)
-        solutions, outputs = selection.do(
-            parents=(solutions, outputs), offsprings=(offspring, offspring_outputs)
-        )  # Algorithm 1 line 5
-
-    return EMOResult(optimal_variables=solutions, optimal_outputs=outputs)
+    try:
+        solutions, outputs = generator.do()  # Algorithm 1 line 1
+
+        while not terminator.check():
+            # Generate one offspring at a time
+            # choose two random parents from the current population
+            parents_idx = rng.choice(solutions.height, size=2, replace=False).tolist()
+            offsprings = crossover.do(population=solutions, to_mate=parents_idx)  # Algorithm 1 line 4
+            offsprings = mutation.do(offsprings, solutions)  # Algorithm 1 line 4
+            # Repair offspring if they go out of bounds
+            offsprings = repair(offsprings)
+            # The crossover generates two offsprings, but we only want to keep one of them,
+            # so we randomly choose one of the two (i think just always choosing the first one is not fine)
+            offspring_idx = rng.choice(offsprings.height, size=1, replace=False).tolist()
+            offspring = offsprings[offspring_idx, :]
+            offspring_outputs = evaluator.evaluate(offspring)
+            solutions, outputs = selection.do(
+                parents=(solutions, outputs), offsprings=(offspring, offspring_outputs)
+            )  # Algorithm 1 line 5
+
+        return EMOResult(optimal_variables=solutions, optimal_outputs=outputs)
+    finally:
+        # stop the simulator workers the evaluator may have started
+        evaluator.close()
 
 
 def template_xlemoo(
@@ -189,7 +201,7 @@ def template_xlemoo(
     selector for what happens inside that generation.
 
     Args:
-        evaluator (EMOEvaluator): Evaluator for objective and target values.
+        evaluator (EMOEvaluator): Evaluator for objective and target values. It is closed when the run ends.
         crossover (BaseCrossover): The crossover operator.
         mutation (BaseMutation): The mutation operator.
         generator (BaseGenerator): Initial population generator.
@@ -215,26 +227,30 @@ def template_xlemoo(
         raise ValueError("At least one of n_darwin_per_cycle and n_learning_per_cycle must be > 0.")
 
     cycle_len = n_darwin_per_cycle + n_learning_per_cycle
-    solutions, outputs = generator.do()
-    gen_in_cycle = 0
-
-    while not terminator.check():
-        if gen_in_cycle < n_darwin_per_cycle:
-            offspring = crossover.do(population=solutions)
-            offspring = mutation.do(offspring, solutions)
-            offspring = repair(offspring)
-            offspring_outputs = evaluator.evaluate(offspring)
-            combined_decvars = solutions.vstack(offspring)
-            combined_outputs = outputs.vstack(offspring_outputs)
-            solutions, outputs = selection.do((combined_decvars, combined_outputs))
-        else:
-            instantiated = learning_operator.do()
-            if instantiated is not None:
-                instantiated_outputs = evaluator.evaluate(instantiated)
-                combined_decvars = solutions.vstack(instantiated)
-                combined_outputs = outputs.vstack(instantiated_outputs)
+    try:
+        solutions, outputs = generator.do()
+        gen_in_cycle = 0
+
+        while not terminator.check():
+            if gen_in_cycle < n_darwin_per_cycle:
+                offspring = crossover.do(population=solutions)
+                offspring = mutation.do(offspring, solutions)
+                offspring = repair(offspring)
+                offspring_outputs = evaluator.evaluate(offspring)
+                combined_decvars = solutions.vstack(offspring)
+                combined_outputs = outputs.vstack(offspring_outputs)
                 solutions, outputs = selection.do((combined_decvars, combined_outputs))
-            # else: no usable rules this round; keep the current population unchanged
-        gen_in_cycle = (gen_in_cycle + 1) % cycle_len
-
-    return EMOResult(optimal_variables=solutions, optimal_outputs=outputs)
+            else:
+                instantiated = learning_operator.do()
+                if instantiated is not None:
+                    instantiated_outputs = evaluator.evaluate(instantiated)
+                    combined_decvars = solutions.vstack(instantiated)
+                    combined_outputs = outputs.vstack(instantiated_outputs)
+                    solutions, outputs = selection.do((combined_decvars, combined_outputs))
+                # else: no usable rules this round; keep the current population unchanged
+            gen_in_cycle = (gen_in_cycle + 1) % cycle_len
+
+        return EMOResult(optimal_variables=solutions, optimal_outputs=outputs)
+    finally:
+        # stop the simulator workers the evaluator may have started
+        evaluator.close()
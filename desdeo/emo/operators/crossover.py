@@ -237,49 +237,53 @@ class SimulatedBinaryCrossover(BaseCrossover):
         """
         mating_pop = self.get_parents(population=population, to_mate=to_mate)
         mating_pop = mating_pop[self.variable_symbols].to_numpy().astype(float)
-        mate_size = mating_pop.shape[0]
-        num_var = mating_pop.shape[1]
+        # `get_parents` mates consecutive rows, so the first parents of all pairs are the even rows
+        # and the second parents the odd ones. Every pair and every gene is handled at once.
+        parents_1 = mating_pop[0::2]
+        parents_2 = mating_pop[1::2]
+        pairs_shape = parents_1.shape
 
-        offspring = np.zeros_like(mating_pop)
+        miu = self.rng.random(pairs_shape)
+        binary_mask = self.rng.random(pairs_shape) <= self.uniform_xover_probability
+        xover_mask = self.rng.random(pairs_shape) <= self.xover_probability
 
         HALF = 0.5  # NOQA: N806
-        # TODO(@light-weaver): Extract into a numba jitted function.
-        for i in range(0, mate_size, 2):
-            beta = np.zeros(num_var)
-            miu = self.rng.random(num_var)
-            # Simulated binary crossover (SBX) operator tries to mimic the behavior of single-point crossover by
-            # trying to attain similar distribution of offspring as single-point crossover.
-            # The distribution itself can be contracting or expanding.
-            # beta is calculated such that the integral (over (0, beta)) of the distribution matches the random number
-            # mu. At mu <= 0.5, the distribution is contracting, and at mu > 0.5, the distribution is expanding.
-            # You can integrate equations 18 and 19 from the reference in the docstring to see how the equations below
-            # are derived. Integrate 18 from 0 to beta, and set it equal to mu. Solve for beta.
-            # for 19, first integrate 18 from 0 to 1 (which is equal to 0.5 so you don't actually need to integrate it)
-            # Then add the integral of 19 from 1 to beta, and set it equal to mu. Solve for beta.
-            beta[miu <= HALF] = (2 * miu[miu <= HALF]) ** (1 / (self.xover_distribution + 1))  # 18
-            beta[miu > HALF] = (2 - 2 * miu[miu > HALF]) ** (-1 / (self.xover_distribution + 1))  # 18 + 19
-            # if beta is negative, the offspring 1 gets decision var component closer to parent 2 and vice versa.
-            # In this implementation, there is an equal chance of beta being negative or positive.
-            # TBH, this is more similar to uniform crossover than single-point crossover.
-            binary_mask = self.rng.random(num_var) <= self.uniform_xover_probability
-            binary_mask = (binary_mask * 2) - 1  # Convert to -1 or 1
-            beta = beta * binary_mask
-            # At beta = -1 no crossover occurs and the dec var components are copied from the parents:
-            # offspring[i] = avg + diff = mating_pop[i]. (Beta = +1 would swap the parents instead,
-            # which is what PlatEMO's opposite sign convention on the offspring expression means by
-            # setting the sentinel to +1 there.)
-            beta[self.rng.random(num_var) > self.xover_probability] = -1
-            # Note that when mu < 0.5, abs(beta) ends up being less than 1, resulting in a contracting crossover.
-            # The opposite is true when mu > 0.5, resulting in an expanding crossover.
-            avg = (mating_pop[i] + mating_pop[i + 1]) / 2
-            diff = (mating_pop[i] - mating_pop[i + 1]) / 2
-            offspring[i] = avg - beta * diff
-            offspring[i + 1] = avg + beta * diff
+        # Simulated binary crossover (SBX) operator tries to mimic the behavior of single-point crossover by
+        # trying to attain similar distribution of offspring as single-point crossover.
+        # The distribution itself can be contracting or expanding.
+        # beta is calculated such that the integral (over (0, beta)) of the distribution matches the random number
+        # mu. At mu <= 0.5, the distribution is contracting, and at mu > 0.5, the distribution is expanding.
+        # You can integrate equations 18 and 19 from the reference in the docstring to see how the equations below
+        # are derived. Integrate 18 from 0 to beta, and set it equal to mu. Solve for beta.
+        # for 19, first integrate 18 from 0 to 1 (which is equal to 0.5 so you don't actually need to integrate it)
+        # Then add the integral of 19 from 1 to beta, and set it equal to mu. Solve for beta.
+        beta = np.where(
+            miu <= HALF,
+            (2 * miu) ** (1 / (self.xover_distribution + 1)),  # 18
+            (2 - 2 * miu) ** (-1 / (self.xover_distribution + 1)),  # 18 + 19
+        )
+        # if beta is negative, the offspring 1 gets decision var component closer to parent 2 and vice versa.
+        # In this implementation, there is an equal chance of beta being negative or positive.
+        # TBH, this is more similar to uniform crossover than single-point crossover.
+        beta = np.where(binary_mask, beta, -beta)
+        # At beta = -1 no crossover occurs and the dec var components are copied from the parents:
+        # offspring[i] = avg + diff = mating_pop[i]. (Beta = +1 would swap the parents instead,
+        # which is what PlatEMO's opposite sign convention on the offspring expression means by
+        # setting the sentinel to +1 there.)
+        beta[~xover_mask] = -1
+        # Note that when mu < 0.5, abs(beta) ends up being less than 1, resulting in a contracting crossover.
+        # The opposite is true when mu > 0.5, resulting in an expanding crossover.
+        avg = (parents_1 + parents_2) / 2
+        diff = (parents_1 - parents_2) / 2
+
+        offspring = self._offspring_buffer(mating_pop.shape)
+        np.subtract(avg, beta * diff, out=offspring[0::2])
+        np.add(avg, beta * diff, out=offspring[1::2])
         # Clip the offspring to the bounds
         lower_bounds = np.asarray(self.lower_bounds, dtype=float)
         upper_bounds = np.asarray(self.upper_bounds, dtype=float)
-        offspring = np.clip(offspring, lower_bounds, upper_bounds)
-        return pl.from_numpy(offspring, schema=self.variable_symbols, orient="row")
+        np.clip(offspring, lower_bounds, upper_bounds, out=offspring)
+        return self._offspring_frame(offspring)
 
     def bounded_offsprings(
         self,
@@ -335,8 +339,6 @@ class SimulatedBinaryCrossover(BaseCrossover):
         """
         mating_pop = self.get_parents(population=population, to_mate=to_mate)
         mating_pop = mating_pop[self.variable_symbols].to_numpy().astype(float)
-        mate_size = mating_pop.shape[0]
-        num_var = mating_pop.shape[1]
 
         lower_bounds = np.asarray(self.lower_bounds, dtype=float)
         upper_bounds = np.asarray(self.upper_bounds, dtype=float)
@@ -346,91 +348,100 @@ class SimulatedBinaryCrossover(BaseCrossover):
         # Pull such parents onto the bound instead.
         mating_pop = np.clip(mating_pop, lower_bounds, upper_bounds)
 
-        offspring = np.zeros_like(mating_pop)
-
-        # TODO(@light-weaver): Extract into a numba jitted function.
-        for i in range(0, mate_size, 2):
-            beta = np.zeros(num_var)
-            miu = self.rng.random(num_var)
-            # Apply crossover only for certain decision variables
-            sbx_mask = self.rng.random(num_var) <= self.xover_probability
-            # Apply binary crossover only for certain decision variables
-            binary_mask = self.rng.random(num_var) <= self.uniform_xover_probability
-            binary_mask = binary_mask & sbx_mask  # Only apply binary crossover where SBX is applied
-            avg = (mating_pop[i] + mating_pop[i + 1]) / 2
-
-            x1 = np.minimum(mating_pop[i], mating_pop[i + 1])
-            x2 = np.maximum(mating_pop[i], mating_pop[i + 1])
-            # The two children are derived in *sorted* order: one steps from the midpoint down towards
-            # the lower bound, the other up towards the upper bound, and each uses the beta capped by
-            # the distance to the bound it is stepping towards. The half-difference must therefore be
-            # taken between the sorted values, not between the parents in whatever order the mating
-            # pool happens to hold them. Using the unsorted difference pairs the lower-bound beta with
-            # an upward step (and vice versa) whenever mating_pop[i] is the smaller parent, which lets
-            # the offspring escape the variable bounds.
-            diff = (x2 - x1) / 2
-
-            # Child stepping towards the lower bound.
-            with np.errstate(divide="ignore", invalid="ignore"):  # Handles x1 == x2 case
-                beta_max = 1 + 2 * (x1 - lower_bounds) / (x2 - x1)
-            beta_max[np.isnan(beta_max)] = np.inf  # Handles x1 == x2 == lower_bound case
-
-            # Technically, this code can handle the unbounded case by setting alpha to an array of 2s.
-            alpha = 2 - (1 / beta_max) ** (self.xover_distribution + 1)
+        # `get_parents` mates consecutive rows, so the first parents of all pairs are the even rows
+        # and the second parents the odd ones. Every pair and every gene is handled at once.
+        parents_1 = mating_pop[0::2]
+        parents_2 = mating_pop[1::2]
+        pairs_shape = parents_1.shape
+
+        miu = self.rng.random(pairs_shape)
+        # Apply crossover only for certain decision variables
+        sbx_mask = self.rng.random(pairs_shape) <= self.xover_probability
+        # Apply binary crossover only for certain decision variables
+        binary_mask = self.rng.random(pairs_shape) <= self.uniform_xover_probability
+        binary_mask = binary_mask & sbx_mask  # Only apply binary crossover where SBX is applied
+        avg = (parents_1 + parents_2) / 2
+
+        x1 = np.minimum(parents_1, parents_2)
+        x2 = np.maximum(parents_1, parents_2)
+        # The two children are derived in *sorted* order: one steps from the midpoint down towards
+        # the lower bound, the other up towards the upper bound, and each uses the beta capped by
+        # the distance to the bound it is stepping towards. The half-difference must therefore be
+        # taken between the sorted values, not between the parents in whatever order the mating
+        # pool happens to hold them. Using the unsorted difference pairs the lower-bound beta with
+        # an upward step (and vice versa) whenever the first parent is the smaller one, which lets
+        # the offspring escape the variable bounds.
+        diff = (x2 - x1) / 2
+
+        # Child stepping towards the lower bound.
+        with np.errstate(divide="ignore", invalid="ignore"):  # Handles x1 == x2 case
+            beta_max = 1 + 2 * (x1 - lower_bounds) / (x2 - x1)
+        child_low = avg - self._truncated_beta(beta_max, miu) * diff
+
+        # Child stepping towards the upper bound. The same miu is reused deliberately: every
+        # reference implementation draws one uniform per variable and shares it between the two
+        # children, so that the pair is perfectly correlated.
+        with np.errstate(divide="ignore", invalid="ignore"):  # Handles x1 == x2 case
+            beta_max = 1 + 2 * (upper_bounds - x2) / (x2 - x1)
+        child_high = avg + self._truncated_beta(beta_max, miu) * diff
+
+        # Preserve the parent identity: the child that stepped down belongs to whichever parent
+        # held the smaller value, as in Deb's reference implementation and in pymoo.
+        first_is_lower = parents_1 <= parents_2
+        child_1 = np.where(first_is_lower, child_low, child_high)
+        child_2 = np.where(first_is_lower, child_high, child_low)
+
+        # Decision variables not selected for SBX are inherited unchanged. This has to be an
+        # explicit copy rather than a beta = 1 sentinel: with the sorted difference above, beta = 1
+        # would hand every untouched variable's smaller value to the first child and the larger to
+        # the second, biasing the pair instead of leaving it alone.
+        # Where binary crossover is applied, the children are swapped.
+        offspring = self._offspring_buffer(mating_pop.shape)
+        offspring[0::2] = np.where(sbx_mask, np.where(binary_mask, child_2, child_1), parents_1)
+        offspring[1::2] = np.where(sbx_mask, np.where(binary_mask, child_1, child_2), parents_2)
 
-            SPLIT_POINT1 = 1 / alpha  # NOQA: N806
-            beta[miu <= SPLIT_POINT1] = (alpha[miu <= SPLIT_POINT1] * miu[miu <= SPLIT_POINT1]) ** (
-                1 / (self.xover_distribution + 1)
-            )
-            beta[miu > SPLIT_POINT1] = (2 - alpha[miu > SPLIT_POINT1] * miu[miu > SPLIT_POINT1]) ** (
-                -1 / (self.xover_distribution + 1)
-            )
-            # Turning beta negative does not work for truncated SBX. Manually swap the offspring instead.
-            child_low = avg - beta * diff
-
-            # Child stepping towards the upper bound. The same miu is reused deliberately: every
-            # reference implementation draws one uniform per variable and shares it between the two
-            # children, so that the pair is perfectly correlated.
-            with np.errstate(divide="ignore", invalid="ignore"):  # Handles x1 == x2 case
-                beta_max = 1 + 2 * (upper_bounds - x2) / (x2 - x1)
-            beta_max[np.isnan(beta_max)] = np.inf  # Handles x1 == x2 == upper_bound case
-            # The error states only occur when x1==x2, which means that the parents are equal, and thus the offspring
-            # will be equal to the parents. So, np.inf is fine.
+        # The mathematics above already keeps the offspring feasible; this only absorbs floating point
+        # drift at the bounds. Every reference implementation of truncated SBX clamps here as well.
+        np.clip(offspring, lower_bounds, upper_bounds, out=offspring)
+        return self._offspring_frame(offspring)
 
-            alpha = 2 - (1 / beta_max) ** (self.xover_distribution + 1)
+    def _truncated_beta(self, beta_max: np.ndarray, miu: np.ndarray) -> np.ndarray:
+        """Sample the spread factors of the truncated SBX distribution.
 
-            SPLIT_POINT2 = 1 / alpha  # NOQA: N806
-            beta[miu <= SPLIT_POINT2] = (alpha[miu <= SPLIT_POINT2] * miu[miu <= SPLIT_POINT2]) ** (
-                1 / (self.xover_distribution + 1)
-            )
-            beta[miu > SPLIT_POINT2] = (2 - alpha[miu > SPLIT_POINT2] * miu[miu > SPLIT_POINT2]) ** (
-                -1 / (self.xover_distribution + 1)
-            )
-            child_high = avg + beta * diff
-
-            # Preserve the parent identity: the child that stepped down belongs to whichever parent
-            # held the smaller value, as in Deb's reference implementation and in pymoo.
-            first_is_lower = mating_pop[i] <= mating_pop[i + 1]
-            offspring[i] = np.where(first_is_lower, child_low, child_high)
-            offspring[i + 1] = np.where(first_is_lower, child_high, child_low)
-
-            # Decision variables not selected for SBX are inherited unchanged. This has to be an
-            # explicit copy rather than a beta = 1 sentinel: with the sorted difference above, beta = 1
-            # would hand every untouched variable's smaller value to offspring i and the larger to
-            # offspring i + 1, biasing the pair instead of leaving it alone.
-            offspring[i, ~sbx_mask] = mating_pop[i, ~sbx_mask]
-            offspring[i + 1, ~sbx_mask] = mating_pop[i + 1, ~sbx_mask]
-
-            # Swap the offspring for decision variables where binary crossover is applied
-            offspring[i, binary_mask], offspring[i + 1, binary_mask] = (
-                offspring[i + 1, binary_mask].copy(),
-                offspring[i, binary_mask].copy(),
-            )
+        Args:
+            beta_max (np.ndarray): the largest spread factor that keeps each child inside the bound
+                it steps towards. NaN marks a pair of equal parents sitting on that bound.
+            miu (np.ndarray): uniform random numbers, one per pair and decision variable.
 
-        # The mathematics above already keeps the offspring feasible; this only absorbs floating point
-        # drift at the bounds. Every reference implementation of truncated SBX clamps here as well.
-        offspring = np.clip(offspring, lower_bounds, upper_bounds)
-        return pl.from_numpy(offspring, schema=self.variable_symbols, orient="row")
+        Returns:
+            np.ndarray: the spread factors, with the same shape as `miu`.
+        """
+        # The error states only occur when x1==x2, which means that the parents are equal, and thus the offspring
+        # will be equal to the parents. So, np.inf is fine.
+        beta_max = np.where(np.isnan(beta_max), np.inf, beta_max)
+
+        # Technically, this code can handle the unbounded case by setting alpha to an array of 2s.
+        alpha = 2 - (1 / beta_max) ** (self.xover_distribution + 1)
+
+        # 1 / alpha is the split point between the contracting and the expanding case. Since alpha lies
+        # in (1, 2] and miu in [0, 1), both branches are finite everywhere and can be evaluated eagerly.
+        return np.where(
+            miu <= 1 / alpha,
+            (alpha * miu) ** (1 / (self.xover_distribution + 1)),
+            (2 - alpha * miu) ** (-1 / (self.xover_distribution + 1)),
+        )
+
+    def _offspring_buffer(self, shape: tuple[int, int]) -> np.ndarray:
+        """Allocate the array the offspring are written into.
+
+        The buffer is column-major, so that every decision variable is a contiguous column that
+        `_offspring_frame` can hand to polars without copying it.
+        """
+        return np.empty(shape, dtype=np.float64, order="F")
+
+    def _offspring_frame(self, offspring: np.ndarray) -> pl.DataFrame:
+        """Wrap an offspring buffer from `_offspring_buffer` in a DataFrame, one column per variable."""
+        return pl.DataFrame([pl.Series(symbol, offspring[:, i]) for i, symbol in enumerate(self.variable_symbols)])
 
     def update(self, *_, **__):
         """Do nothing. This is just the basic SBX operator."""
@@ -6,6 +6,7 @@ from collections.abc import Sequence
 import polars as pl
 
 from desdeo.problem import Problem, SimulatorEvaluator
+from desdeo.problem.surrogate_registry import MmapMode
 from desdeo.tools.message import (
     EvaluatorMessageTopics,
     IntMessage,
@@ -40,17 +41,38 @@ class EMOEvaluator(Subscriber):
         """The topics that the Evaluator is interested in."""
         return []
 
-    def __init__(self, problem: Problem, verbosity: int, publisher: Publisher):
-        """Initialize the EMOEvaluator class."""
+    def __init__(
+        self,
+        problem: Problem,
+        verbosity: int,
+        publisher: Publisher,
+        simulator_workers: int | None = None,
+        surrogate_mmap_mode: MmapMode | None = None,
+    ):
+        """Initialize the EMOEvaluator class.
+
+        Args:
+            problem (Problem): the problem to evaluate.
+            verbosity (int): the verbosity level of the evaluator.
+            publisher (Publisher): the publisher to which the evaluator sends messages.
+            simulator_workers (int | None, optional): the number of persistent worker processes to keep
+                each file based simulator loaded in. See `SimulatorEvaluator`. Defaults to None, in which
+                case a simulator file is run as a new process for every generation.
+            surrogate_mmap_mode (MmapMode | None, optional): if given, the arrays of the surrogate models are
+                memory-mapped from their files in this mode. See `SimulatorEvaluator`. Defaults to None.
+        """
         super().__init__(
             verbosity=verbosity,
             publisher=publisher,
         )
         self.problem = problem
-        # TODO(@light-weaver, @gialmisi): This can be so much more efficient.
-        self.evaluator = lambda x: SimulatorEvaluator(problem).evaluate(
-            {name.symbol: x[name.symbol].to_list() for name in problem.get_flattened_variables()}, flat=True
+        # The evaluator is created once and reused for every generation, so that the
+        # problem's functions are parsed and any surrogates loaded only once per run.
+        self.simulator_evaluator = SimulatorEvaluator(
+            problem, simulator_workers=simulator_workers, surrogate_mmap_mode=surrogate_mmap_mode
         )
+        self.flat_variable_symbols = [var.symbol for var in problem.get_flattened_variables()]
+        self.evaluator = lambda x: self.simulator_evaluator.evaluate(x.select(self.flat_variable_symbols), flat=True)
         self.variable_symbols = [name.symbol for name in problem.variables]
         self.population: pl.DataFrame
         self.out: pl.DataFrame
@@ -75,6 +97,22 @@ class EMOEvaluator(Subscriber):
         self.notify()
         return self.out
 
+    def close(self):
+        """Stop the persistent simulator workers and close the connections to simulator servers, if any were opened.
+
+        Called by the templates when a run ends. The evaluator can still be used afterwards, in which case
+        the workers and connections are opened again.
+        """
+        self.simulator_evaluator.close()
+
+    def __enter__(self):
+        """Use the evaluator as a context manager that calls `close` on exit."""
+        return self
+
+    def __exit__(self, *_):
+        """Stop the simulator workers and close the connections to simulator servers."""
+        self.close()
+
     def state(self) -> Sequence[Message]:
         """The state of the evaluator sent to the Publisher."""
         if self.population is None or self.out is None or self.population is None or self.verbosity == 0:
@@ -710,22 +710,34 @@ class MPTMutation(BaseMutation):
             1 / len(self.variable_symbols) if mutation_probability is None else mutation_probability
         )
 
-    def _mutate_value(self, x, lower_bound, upper_bound):
-        """Apply small mutation to a single float value using mutation exponent."""
-        if upper_bound == lower_bound:
-            # A fixed variable has a single feasible value; scaling by the width would divide by zero.
-            return lower_bound
-        t = (x - lower_bound) / (upper_bound - lower_bound)
-        rnd = self.rng.uniform(0, 1)
-
-        if rnd < t:
-            tm = t - t * ((t - rnd) / t) ** self.mutation_exponent
-        elif rnd > t:
-            tm = t + (1 - t) * ((rnd - t) / (1 - t)) ** self.mutation_exponent
-        else:
-            tm = t
+    def _mutate_values(
+        self, x: np.ndarray, lower_bounds: np.ndarray, upper_bounds: np.ndarray, rnd: np.ndarray
+    ) -> np.ndarray:
+        """Apply small mutation to a block of float values using the mutation exponent.
+
+        Args:
+            x (np.ndarray): the values to mutate.
+            lower_bounds (np.ndarray): the lower bounds, broadcastable against `x`.
+            upper_bounds (np.ndarray): the upper bounds, broadcastable against `x`.
+            rnd (np.ndarray): uniform random numbers in [0, 1), one per value in `x`.
+
+        Returns:
+            np.ndarray: the mutated values.
+        """
+        width = upper_bounds - lower_bounds
+        # A fixed variable has a single feasible value; scaling by the width would divide by zero.
+        # Both branches below are evaluated for every value, so silence the warnings of the branch
+        # that `np.where` then discards.
+        with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+            t = (x - lower_bounds) / width
+            tm = np.where(
+                rnd < t,
+                t - t * ((t - rnd) / t) ** self.mutation_exponent,
+                np.where(rnd > t, t + (1 - t) * ((rnd - t) / (1 - t)) ** self.mutation_exponent, t),
+            )
+            mutated = (1 - tm) * lower_bounds + tm * upper_bounds
 
-        return (1 - tm) * lower_bound + tm * upper_bound
+        return np.where(width == 0, lower_bounds, mutated)
 
     def do(self, offsprings: pl.DataFrame, parents: pl.DataFrame) -> pl.DataFrame:
         """Perform the MPT mutation operation.
@@ -742,15 +754,18 @@ class MPTMutation(BaseMutation):
         self.parents = parents
 
         population = offsprings.to_numpy(writable=True).astype(float)
+        lower_bounds = np.asarray(self.lower_bounds, dtype=float)
+        upper_bounds = np.asarray(self.upper_bounds, dtype=float)
 
-        bounds = list(zip(self.lower_bounds, self.upper_bounds, self.is_discrete, strict=True))
-        for i in range(population.shape[0]):
-            for j, (lower_bound, upper_bound, discrete) in enumerate(bounds):
-                if self.rng.random() < self.mutation_probability:
-                    mutated = self._mutate_value(population[i, j], lower_bound, upper_bound)
-                    # Round after float mutation to keep integer domain. `np.round` rather than
-                    # `round`, which raises on the NaN some crossover operators produce.
-                    population[i, j] = np.round(mutated) if discrete else mutated
+        # The whole population is mutated at once, drawing every random number in a single batch.
+        mutation_mask = self.rng.random(population.shape) < self.mutation_probability
+        rnd = self.rng.random(population.shape)
+
+        mutated = self._mutate_values(population, lower_bounds, upper_bounds, rnd)
+        # Round after float mutation to keep integer domain. `np.round` rather than `round`, which
+        # raises on the NaN some crossover operators produce.
+        mutated[:, self.is_discrete] = np.round(mutated[:, self.is_discrete])
+        population = np.where(mutation_mask, mutated, population)
 
         self.offspring = (
             pl.from_numpy(population, schema=self.variable_symbols, orient="row").select(pl.all()).cast(pl.Float64)
@@ -914,34 +929,34 @@ class NonUniformMutation(BaseMutation):
         # Nothing bounds the run (e.g. a time based terminator), so keep the mutation at full strength.
         return 0.0
 
-    def _mutate_value(self, x: float, lower_bound: float, upper_bound: float, mutation_threshold: float = 0.5) -> float:
-        """Apply non-uniform mutation to a single float value.
+    def _mutate_values(
+        self,
+        x: np.ndarray,
+        lower_bounds: np.ndarray,
+        upper_bounds: np.ndarray,
+        r: np.ndarray,
+        u_rand: np.ndarray,
+        mutation_threshold: float = 0.5,
+    ) -> np.ndarray:
+        """Apply non-uniform mutation to a block of float values.
 
         Args:
-            x (float): The current value of the gene to be mutated.
-            lower_bound (float): The lower bound of the gene.
-            upper_bound (float): The upper bound of the gene.
+            x (np.ndarray): The current values of the genes to be mutated.
+            lower_bounds (np.ndarray): The lower bounds of the genes, broadcastable against `x`.
+            upper_bounds (np.ndarray): The upper bounds of the genes, broadcastable against `x`.
+            r (np.ndarray): Uniform random numbers choosing the direction of each mutation.
+            u_rand (np.ndarray): Uniform random numbers choosing the strength of each mutation.
             mutation_threshold (float): The mutation threshold. Defaults to 0.5.
 
         Returns:
-            float: The mutated gene value, clipped within the bounds [l, u].
+            np.ndarray: The mutated gene values, clipped within the bounds.
         """
-        r = self.rng.uniform(0, 1)  # Random number to choose direction
-        b = self.b
+        tau = (1 - self.decay_progress) ** self.b
+        strength = 1 - u_rand**tau
 
-        u_rand = self.rng.uniform(0, 1)  # Random number for mutation strength
-        tau = (1 - self.decay_progress) ** b
+        xm = np.where(r <= mutation_threshold, x + (upper_bounds - x) * strength, x - (x - lower_bounds) * strength)
 
-        if r <= mutation_threshold:
-            y = upper_bound - x
-            delta = y * (1 - u_rand**tau)
-            xm = x + delta
-        else:
-            y = x - lower_bound
-            delta = y * (1 - u_rand**tau)
-            xm = x - delta
-
-        return np.clip(xm, lower_bound, upper_bound)
+        return np.clip(xm, lower_bounds, upper_bounds)
 
     def do(self, offsprings: pl.DataFrame, parents: pl.DataFrame) -> pl.DataFrame:
         """Perform non-uniform mutation.
@@ -958,15 +973,19 @@ class NonUniformMutation(BaseMutation):
         self.parents = parents
 
         population = offsprings.to_numpy(writable=True).astype(float)
+        lower_bounds = np.asarray(self.lower_bounds, dtype=float)
+        upper_bounds = np.asarray(self.upper_bounds, dtype=float)
+
+        # The whole population is mutated at once, drawing every random number in a single batch.
+        mutation_mask = self.rng.random(population.shape) < self.mutation_probability
+        r = self.rng.random(population.shape)
+        u_rand = self.rng.random(population.shape)
 
-        bounds = list(zip(self.lower_bounds, self.upper_bounds, self.is_discrete, strict=True))
-        for i in range(population.shape[0]):
-            for j, (lower_bound, upper_bound, discrete) in enumerate(bounds):
-                if self.rng.random() < self.mutation_probability:
-                    mutated = self._mutate_value(population[i, j], lower_bound, upper_bound)
-                    # Round to keep the integer domain. `np.round` rather than `round`, which
-                    # raises on the NaN some crossover operators produce.
-                    population[i, j] = np.round(mutated) if discrete else mutated
+        mutated = self._mutate_values(population, lower_bounds, upper_bounds, r, u_rand)
+        # Round to keep the integer domain. `np.round` rather than `round`, which raises on the
+        # NaN some crossover operators produce.
+        mutated[:, self.is_discrete] = np.round(mutated[:, self.is_discrete])
+        population = np.where(mutation_mask, mutated, population)
 
         self.offspring = pl.from_numpy(population, schema=self.variable_symbols, orient="row").cast(pl.Float64)
         self.notify()
@@ -1142,16 +1161,14 @@ class SelfAdaptiveGaussianMutation(BaseMutation):
         Returns:
             tuple[np.ndarray, np.ndarray]: Mutated population and updated step sizes.
         """
-        new_variables = variables.copy()
-        new_eta = eta.copy()
-
-        for i in range(variables.shape[0]):
-            common_noise = self.rng.normal()
-            for j in range(variables.shape[1]):
-                if self.rng.random() < self.mutation_probability:
-                    rnd_number = self.rng.normal()  # random number in the interval [0, 1]
-                    new_eta[i, j] *= np.exp(self.tau_prime * common_noise + self.tau * rnd_number)
-                    new_variables[i, j] += new_eta[i, j] * rnd_number
+        # One common noise term per individual, shared by all of its genes, and one local noise
+        # term per gene. Every random number is drawn in a single batch for the whole population.
+        common_noise = self.rng.normal(size=(variables.shape[0], 1))
+        mutation_mask = self.rng.random(variables.shape) < self.mutation_probability
+        rnd_numbers = self.rng.normal(size=variables.shape)
+
+        new_eta = np.where(mutation_mask, eta * np.exp(self.tau_prime * common_noise + self.tau * rnd_numbers), eta)
+        new_variables = np.where(mutation_mask, variables + new_eta * rnd_numbers, variables)
 
         # Gaussian noise is unbounded, so keep the offspring inside the feasible box. Without this
         # the operator relies on a repair function that the templates only apply afterwards.
@@ -32,7 +32,7 @@ from desdeo.tools.message import (
     SelectorMessageTopics,
     TerminatorMessageTopics,
 )
-from desdeo.tools.non_dominated_sorting import fast_non_dominated_sort, fast_non_dominated_sort_indices
+from desdeo.tools.non_dominated_sorting import fast_non_dominated_sort, non_dominated_sort_ranks
 from desdeo.tools.patterns import Publisher, Subscriber
 
 SolutionType = TypeVar("SolutionType", list, pl.DataFrame)
@@ -420,7 +420,59 @@ class ParameterAdaptationStrategy(StrEnum):
     OTHER = "OTHER"  # As of yet undefined strategies.
 
 
-@njit
+def _grouped_argmin(values: np.ndarray, groups: np.ndarray, num_groups: int) -> np.ndarray:
+    """Find the index of the smallest value in each group.
+
+    Args:
+        values (np.ndarray): The values. NaN values are never selected.
+        groups (np.ndarray): The group of each value, integers in [0, num_groups).
+        num_groups (int): The number of groups.
+
+    Returns:
+        np.ndarray: The index of the smallest value in each group, the first one in case of ties.
+            Groups without any (non-NaN) values get the index -1.
+    """
+    candidates = np.flatnonzero(~np.isnan(values))
+    # stable sort by group and then value, the first element of each group is its minimum
+    order = candidates[np.lexsort((values[candidates], groups[candidates]))]
+    group_starts = np.ones(len(order), dtype=np.bool_)
+    group_starts[1:] = groups[order][1:] != groups[order][:-1]
+    first_of_group = order[group_starts]
+
+    argmins = np.full(num_groups, -1, dtype=np.int64)
+    argmins[groups[first_of_group]] = first_of_group
+    return argmins
+
+
+def _rvea_angles_and_apd(
+    fitness: np.ndarray, reference_vectors: np.ndarray, ideal: np.ndarray, partial_penalty: float, gamma: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Assign the individuals to their closest reference vectors and compute their APD values.
+
+    Args:
+        fitness (np.ndarray): The fitness values of the individuals.
+        reference_vectors (np.ndarray): The (unit) reference vectors.
+        ideal (np.ndarray): The ideal point.
+        partial_penalty (float): The partial penalty in APD.
+        gamma (np.ndarray): The angle between current and closest reference vector.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The index of the reference vector of each individual and their APD values.
+    """
+    tranlated_fitness = fitness - ideal
+    norms = np.linalg.norm(tranlated_fitness, axis=1)
+
+    # cosine between each solution and reference vector
+    cos_matrix = (tranlated_fitness @ reference_vectors.T) / np.maximum(1e-10, norms)[:, None]  # Avoid division by 0
+
+    assignment = np.argmax(cos_matrix, axis=1)
+    cosines = cos_matrix[np.arange(len(fitness)), assignment]
+
+    apd_fitness = (1 + (partial_penalty * np.arccos(cosines) / gamma[assignment])) * norms
+
+    return assignment, apd_fitness
+
+
 def _rvea_selection(
     fitness: np.ndarray, reference_vectors: np.ndarray, ideal: np.ndarray, partial_penalty: float, gamma: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -436,42 +488,21 @@ def _rvea_selection(
     Returns:
         tuple[np.ndarray, np.ndarray]: The selected individuals and their APD fitness values.
     """
-    tranlated_fitness = fitness - ideal
     num_vectors = reference_vectors.shape[0]
     num_solutions = fitness.shape[0]
 
-    cos_matrix = np.zeros((num_solutions, num_vectors))
-
-    for i in range(num_solutions):
-        solution = tranlated_fitness[i]
-        norm = np.linalg.norm(solution)
-        for j in range(num_vectors):
-            cos_matrix[i, j] = np.dot(solution, reference_vectors[j]) / max(1e-10, norm)  # Avoid division by zero
-
-    assignment_matrix = np.zeros((num_solutions, num_vectors), dtype=np.bool_)
+    assignment, apd_fitness = _rvea_angles_and_apd(fitness, reference_vectors, ideal, partial_penalty, gamma)
 
-    for i in range(num_solutions):
-        assignment_matrix[i, np.argmax(cos_matrix[i])] = True
+    # the individual with the smallest APD for each reference vector
+    select = _grouped_argmin(apd_fitness, assignment, num_vectors)
 
     selection = np.zeros(num_solutions, dtype=np.bool_)
-    apd_fitness = np.zeros(num_solutions, dtype=np.float64)
-
-    for j in range(num_vectors):
-        min_apd = np.inf
-        select = -1
-        for i in np.where(assignment_matrix[:, j])[0]:
-            solution = tranlated_fitness[i]
-            apd = (1 + (partial_penalty * np.arccos(cos_matrix[i, j]) / gamma[j])) * np.linalg.norm(solution)
-            apd_fitness[i] = apd
-            if apd < min_apd:
-                min_apd = apd
-                select = i
-        selection[select] = True
+    # a reference vector without a selectable individual selects the last one (index -1)
+    selection[select] = True
 
     return selection, apd_fitness
 
 
-@njit
 def _rvea_selection_constrained(
     fitness: np.ndarray,
     constraints: np.ndarray,
@@ -493,50 +524,24 @@ def _rvea_selection_constrained(
     Returns:
         tuple[np.ndarray, np.ndarray]: The selected individuals and their APD fitness values.
     """
-    tranlated_fitness = fitness - ideal
     num_vectors = reference_vectors.shape[0]
     num_solutions = fitness.shape[0]
 
     violations = np.maximum(0, constraints)
+    feasible = np.all(violations == 0, axis=1)
+    total_violations = np.sum(violations, axis=1)
 
-    cos_matrix = np.zeros((num_solutions, num_vectors))
-
-    for i in range(num_solutions):
-        solution = tranlated_fitness[i]
-        norm = np.linalg.norm(solution)
-        for j in range(num_vectors):
-            cos_matrix[i, j] = np.dot(solution, reference_vectors[j]) / max(1e-10, norm)  # Avoid division by zero
+    assignment, apd_fitness = _rvea_angles_and_apd(fitness, reference_vectors, ideal, partial_penalty, gamma)
 
-    assignment_matrix = np.zeros((num_solutions, num_vectors), dtype=np.bool_)
-
-    for i in range(num_solutions):
-        assignment_matrix[i, np.argmax(cos_matrix[i])] = True
+    # the feasible individual with the smallest APD for each reference vector, or if there are no
+    # feasible individuals, the individual with the smallest constraint violation
+    select_feasible = _grouped_argmin(np.where(feasible, apd_fitness, np.nan), assignment, num_vectors)
+    select_violation = _grouped_argmin(np.where(feasible, np.nan, total_violations), assignment, num_vectors)
+    select = np.where(select_feasible != -1, select_feasible, select_violation)
 
     selection = np.zeros(num_solutions, dtype=np.bool_)
-    apd_fitness = np.zeros(num_solutions, dtype=np.float64)
-
-    for j in range(num_vectors):
-        min_apd = np.inf
-        min_violation = np.inf
-        select = -1
-        select_violation = -1
-        for i in np.where(assignment_matrix[:, j])[0]:
-            solution = tranlated_fitness[i]
-            apd = (1 + (partial_penalty * np.arccos(cos_matrix[i, j]) / gamma[j])) * np.linalg.norm(solution)
-            apd_fitness[i] = apd
-            feasible = np.all(violations[i] == 0)
-            current_violation = np.sum(violations[i])
-            if feasible:
-                if apd < min_apd:
-                    min_apd = apd
-                    select = i
-            elif current_violation < min_violation:
-                min_violation = current_violation
-                select_violation = i
-        if select != -1:
-            selection[select] = True
-        else:
-            selection[select_violation] = True
+    # a reference vector without a selectable individual selects the last one (index -1)
+    selection[select] = True
 
     return selection, apd_fitness
 
@@ -810,20 +815,14 @@ class RVEASelector(BaseDecompositionSelector):
             self.adapted_reference_vectors / np.linalg.norm(self.adapted_reference_vectors, axis=1)[:, None]
         )
 
-        self.reference_vectors_gamma = np.zeros(self.adapted_reference_vectors.shape[0])
-        for i in range(self.adapted_reference_vectors.shape[0]):
-            closest_angle = np.inf
-            for j in range(self.adapted_reference_vectors.shape[0]):
-                if i != j:
-                    angle = np.arccos(
-                        np.clip(np.dot(self.adapted_reference_vectors[i], self.adapted_reference_vectors[j]), -1.0, 1.0)
-                    )
-                    if angle < closest_angle and angle > 0:
-                        # In cases with extreme differences in obj func ranges
-                        # sometimes, the closest reference vectors are so close that
-                        # the angle between them is 0 according to arccos (literally 0)
-                        closest_angle = angle
-            self.reference_vectors_gamma[i] = closest_angle
+        # angles between all pairs of reference vectors
+        angles = np.arccos(np.clip(self.adapted_reference_vectors @ self.adapted_reference_vectors.T, -1.0, 1.0))
+        np.fill_diagonal(angles, np.inf)
+        # In cases with extreme differences in obj func ranges
+        # sometimes, the closest reference vectors are so close that
+        # the angle between them is 0 according to arccos (literally 0)
+        angles[angles <= 0] = np.inf
+        self.reference_vectors_gamma = np.min(angles, axis=1)
 
 
 @njit
@@ -986,8 +985,9 @@ class NSGA3Selector(BaseDecompositionSelector):
         fitness = targets
         # Calculating fronts and ranks
         # fronts, dl, dc, rank = nds(fitness)
-        fronts = fast_non_dominated_sort(fitness)
-        fronts = [np.where(fronts[i])[0] for i in range(len(fronts))]
+        # only the fronts needed to cover the survivors are computed
+        ranks = non_dominated_sort_ranks(fitness, n_survive=self.n_survive)
+        fronts = [np.flatnonzero(ranks == i) for i in range(ranks.max() + 1)]
         non_dominated = fronts[0]
 
         if self.worst_fitness is None:
@@ -1504,7 +1504,6 @@ class IBEASelector(BaseSelector):
         """Handle an incoming message. This operator does not react to messages."""
 
 
-@njit
 def _nsga2_crowding_distance_assignment(
     non_dominated_front: np.ndarray, f_mins: np.ndarray, f_maxs: np.ndarray
 ) -> np.ndarray:
@@ -1542,20 +1541,25 @@ def _nsga2_crowding_distance_assignment(
     num_vectors = vectors.shape[0]  # l
     num_objectives = vectors.shape[1]
 
-    crowding_distances = np.zeros(num_vectors)  # I[i]_distance
+    if num_vectors == 0:
+        return np.zeros(0)
+
+    # sort by each column (objective)
+    orders = vectors.argsort(axis=0, kind="stable")
+    sorted_vectors = np.take_along_axis(vectors, orders, axis=0)
 
-    for m in range(num_objectives):
-        # sort by column (objective)
-        m_order = vectors[:, m].argsort()
-        # inlcude boundary points
-        crowding_distances[m_order[0]], crowding_distances[m_order[-1]] = np.inf, np.inf
+    # the normalized distance between the neighbours of each inner point, for each objective
+    distances = np.zeros((num_vectors, num_objectives))
+    distances[1:-1] = (sorted_vectors[2:] - sorted_vectors[:-2]) / (f_maxs - f_mins)
 
-        for i in range(1, num_vectors - 1):
-            crowding_distances[m_order[i]] = crowding_distances[m_order[i]] + (
-                vectors[m_order[i + 1], m] - vectors[m_order[i - 1], m]
-            ) / (f_maxs[m] - f_mins[m])
+    # inlcude boundary points
+    distances[0], distances[-1] = np.inf, np.inf
 
-    return crowding_distances
+    # back to the original order of the vectors
+    crowding_distances = np.zeros((num_vectors, num_objectives))
+    np.put_along_axis(crowding_distances, orders, distances, axis=0)
+
+    return crowding_distances.sum(axis=1)
 
 
 class NSGA2Selector(BaseSelector):
@@ -1626,11 +1630,9 @@ class NSGA2Selector(BaseSelector):
         if offsprings[0].is_empty() and offsprings[1].is_empty():
             # just compute non-dominated ranks of population and be done
             parents_a = parents[1][self.target_symbols].to_numpy()
-            fronts = fast_non_dominated_sort(parents_a)
 
             # assign fitness according to non-dom rank (lower better)
-            scores = np.arange(len(fronts))
-            fitness_values = scores @ fronts
+            fitness_values = non_dominated_sort_ranks(parents_a)
             self.fitness = fitness_values
 
             # all selected in first iteration
@@ -1652,8 +1654,8 @@ class NSGA2Selector(BaseSelector):
         # the minimum and maximum target values in the whole current population
         f_mins, f_maxs = np.min(r_targets_arr, axis=0), np.max(r_targets_arr, axis=0)
 
-        # Do fast non-dominated sorting on R_t -> F
-        fronts = fast_non_dominated_sort(r_targets_arr)
+        # Do fast non-dominated sorting on R_t -> F, only the fronts needed for P_t+1 are computed
+        fronts = fast_non_dominated_sort(r_targets_arr, n_survive=self.population_size)
         crowding_distances = np.ones(self.population_size) * np.nan
         rankings = np.ones(self.population_size) * np.nan
         fitness_values = np.ones(self.population_size) * np.nan
@@ -1954,10 +1956,10 @@ class SMSEMOASelector(BaseSelector):
         Returns:
             int: The index of the individual to be removed.
         """
-        fronts = fast_non_dominated_sort_indices(targets)
-        last_front = fronts[-1]
+        ranks = non_dominated_sort_ranks(targets)
+        last_front = np.flatnonzero(ranks == ranks.max())
         if len(last_front) == 1:
-            return last_front[0]
+            return int(last_front[0])
         # last front has more than one individual, compute hypervolume contributions
         max_hv = -np.inf
         worst_index = -1
@@ -1968,7 +1970,7 @@ class SMSEMOASelector(BaseSelector):
             targets[last_front], ref=np.ones(targets.shape[1]) * self.reference_point_component
         )
         min_contrib_index = np.argmin(hv_contribs)
-        return last_front[min_contrib_index]
+        return int(last_front[min_contrib_index])
         for i in last_front:
             remaining_front = [j for j in last_front if j != i]
             current_hv = hv(targets[remaining_front], reference_point_component=self.reference_point_component)
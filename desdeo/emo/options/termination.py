@@ -125,19 +125,20 @@ def terminator_constructor(
         "ExternalCheckTerminator": ExternalCheckTerminator,
         "CompositeTerminator": CompositeTerminator,
     }
-    options: dict = options.model_dump()
-    name = options.pop("name")
+    option_values: dict = options.model_dump()
+    name = option_values.pop("name")
     if name not in ("ExternalCheckTerminator", "CompositeTerminator"):
-        return terminators[name](publisher=publisher, **options)
+        return terminators[name](publisher=publisher, **option_values)
     if name == "ExternalCheckTerminator":
         if external_check is None:
             raise ValueError("External check function must be provided for ExternalCheckTerminator.")
-        return terminators[name](external_check=external_check, **options)
+        return terminators[name](check_function=external_check, publisher=publisher)
     if name == "CompositeTerminator":
         sub_terminators = []
-        for term_options in options.pop("terminators"):
+        # the options of the sub-terminators are taken as models, not as their dumped dicts
+        for term_options in options.terminators:
             sub_terminators.append(terminator_constructor(term_options, publisher, external_check))
             # sub_name = term_options.pop("name")
             # sub_terminators.append(terminators[sub_name](publisher=publisher, **term_options))
-        return CompositeTerminator(terminators=sub_terminators, publisher=publisher, mode=options["mode"])
+        return CompositeTerminator(terminators=sub_terminators, publisher=publisher, mode=options.mode)
     raise ValueError(f"Unknown terminator name: {name}")
@@ -4,6 +4,8 @@ References:
     TBD
 """
 
+from collections.abc import Callable
+from concurrent.futures import Executor
 from enum import Enum
 
 import numpy as np
@@ -27,6 +29,7 @@ from desdeo.tools import (
     add_cumulonimbus_diff,
     build_scenario_symbol_maps,
     guess_best_solver,
+    solve_scalarized_problems,
 )
 
 
@@ -278,7 +281,7 @@ def _solve_with_constraints(
     scalarizations: list["CumulusScalarization"],
     hard_constraints: list[Constraint] | None,
     soft_constraints: list[Constraint] | None,
-    solve_one,
+    solve_all,
     init_solver,
     solver_options,
 ) -> "dict[CumulusScalarization, SolverResults | None]":
@@ -295,9 +298,7 @@ def _solve_with_constraints(
     if soft_constraints:
         base_problem = base_problem.add_constraints(soft_constraints)
 
-    solutions: dict[CumulusScalarization, SolverResults | None] = {
-        sf: solve_one(base_problem, sf) for sf in scalarizations
-    }
+    solutions: dict[CumulusScalarization, SolverResults | None] = solve_all(base_problem, scalarizations)
 
     if any(r is not None for r in solutions.values()) or not soft_constraints:
         return solutions
@@ -317,7 +318,7 @@ def _solve_with_constraints(
         ]
     )
 
-    return {sf: solve_one(relaxed_problem, sf) for sf in scalarizations}
+    return solve_all(relaxed_problem, scalarizations)
 
 
 def _minimize_soft_constraint_violations(
@@ -457,6 +458,8 @@ def solve_sub_problems(
     hard_constraints: list[Constraint] | None = None,
     soft_constraints: list[Constraint] | None = None,
     scenario_model: ScenarioModel | None = None,
+    executor: Executor | None = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> dict[CumulusScalarization, SolverResults | None]:
     r"""Solves one sub-problem per requested scalarization using a partial reference point.
 
@@ -512,6 +515,14 @@ def solve_sub_problems(
             objectives present in ``reference_point`` receive weight 0.  Always overrides
             any ``"weights_aug"`` already present in ``scalarization_options``.
             Defaults to None.
+        executor (Executor | None, optional): an executor, e.g., a ``ThreadPoolExecutor`` or a
+            ``ProcessPoolExecutor``, used to solve the independent sub-problems concurrently.
+            Solvers that run on Pyomo, e.g., ``PyomoIpoptSolver``, are not thread-safe and need a
+            ``ProcessPoolExecutor``; see ``desdeo.tools.solve_scalarized_problems`` for the other
+            solvers.  If None, the sub-problems are solved sequentially.  Defaults to None.
+        progress (Callable[[int, int], None] | None, optional): called each time a sub-problem has
+            been solved, with the number of sub-problems solved so far and the number of sub-problems
+            in the batch.  A relaxed problem is solved as a new batch.  Defaults to None.
 
     Returns:
         dict[CumulusScalarization, SolverResults | None]: maps each scalarization type to
@@ -540,18 +551,22 @@ def solve_sub_problems(
         effective_scalarization_options["weights_aug"] = _scenario_aug_weights(problem, reference_point, _symbol_maps)
         effective_scalarization_options.setdefault("rho", 1e-2)
 
-    def _solve(base: Problem, sf: CumulusScalarization) -> SolverResults | None:
-        p, target = _apply_scalarization(base, sf, effective_scalarization_options, current_objectives, reference_point)
-        inst = init_solver(p, _solver_options) if _solver_options else init_solver(p)
-        result = inst.solve(target)
-        return result if result.success else None
+    def _solve_all(
+        base: Problem, sfs: list[CumulusScalarization]
+    ) -> dict[CumulusScalarization, SolverResults | None]:
+        sub_problems = [
+            _apply_scalarization(base, sf, effective_scalarization_options, current_objectives, reference_point)
+            for sf in sfs
+        ]
+        solved = solve_scalarized_problems(sub_problems, init_solver, _solver_options, executor, progress)
+        return {sf: result if result.success else None for sf, result in zip(sfs, solved, strict=True)}
 
     if hard_constraints or soft_constraints:
         results = _solve_with_constraints(
-            problem, scalarizations, hard_constraints, soft_constraints, _solve, init_solver, _solver_options
+            problem, scalarizations, hard_constraints, soft_constraints, _solve_all, init_solver, _solver_options
         )
     else:
-        results = {sf: _solve(problem, sf) for sf in scalarizations}
+        results = _solve_all(problem, scalarizations)
 
     if _symbol_maps is not None:
         results = {
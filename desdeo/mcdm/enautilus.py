@@ -188,10 +188,8 @@ def enautilus_step(
     # calculate intermediate points
     intermediate_points = calculate_intermediate_points(z_h, representative_points, iterations_left)
 
-    # calculate lower bounds
-    intermediate_lower_bounds = [
-        calculate_lower_bounds(p_h, intermediate_point) for intermediate_point in intermediate_points
-    ]
+    # calculate lower bounds, for all the intermediate points at once
+    intermediate_lower_bounds = calculate_lower_bounds(p_h, intermediate_points)
 
     # calculate closeness measures
     closeness_measures = [
@@ -297,48 +295,70 @@ def calculate_reachable_subset(
         z_preferred (np.ndarray): the selected intermediate point subject to the reachable subset is calculated.
 
     Returns:
-        list[int]: the indices of the reachable solutions
+        list[int]: the indices of the reachable solutions, in ascending order.
     """
-    return [
-        i
-        for i, z in enumerate(non_dominated_points)
-        if np.all(lower_bounds <= z) and np.all(z <= z_preferred) and i in reachable_indices
-    ]
+    # only the currently reachable points can be reachable from the intermediate point
+    candidates = np.unique(np.asarray(reachable_indices, dtype=int))
+    candidate_points = non_dominated_points[candidates]
+
+    mask = np.all((lower_bounds <= candidate_points) & (candidate_points <= z_preferred), axis=1)
+
+    return candidates[mask].tolist()
+
+
+# the largest number of elements in the (intermediate points, non-dominated points, objectives) arrays
+# `calculate_lower_bounds` creates at once
+_LOWER_BOUNDS_CHUNK_ELEMENTS = 2**22
 
 
 def calculate_lower_bounds(non_dominated_points: np.ndarray, z_intermediate: np.ndarray) -> np.ndarray:
     """Calculates the lower bounds of reachable solutions from an intermediate point.
 
     The lower bounds are calculated by solving an epsilon-constraint problem
-    with the epsilon values taken from the intermediate point.
+    with the epsilon values taken from the intermediate point. The bounds of
+    multiple intermediate points can be calculated at once by stacking the
+    points in a 2D array.
 
     Args:
         non_dominated_points (np.ndarray): a set of non-dominated points
             according to which the reachable values are computed.
         z_intermediate (np.ndarray): the intermediate point according to which
-            the lower bounds are calculated.
+            the lower bounds are calculated, or a 2D array of intermediate points.
 
     Returns:
         np.ndarray: the lower bounds of reachable solutions on the non-dominated
-            set based from the intermediate point.
+            set based from the intermediate point. If `z_intermediate` is a 2D
+            array, each row has the lower bounds of the respective intermediate point.
     """
-    k = non_dominated_points.shape[1]
-    bounds = []
+    zs = np.atleast_2d(z_intermediate)
+
+    if len(non_dominated_points) == 0:
+        # No feasible point in any projection
+        bounds = np.full(zs.shape, np.inf)
+        return bounds if np.ndim(z_intermediate) > 1 else bounds[0]
+
+    # the intermediate points are handled in chunks, so that the temporaries stay bounded in size
+    n_points, n_objectives = non_dominated_points.shape
+    chunk_size = max(1, _LOWER_BOUNDS_CHUNK_ELEMENTS // (n_points * n_objectives))
+
+    bounds = np.empty(zs.shape, dtype=float)
+    for start in range(0, len(zs), chunk_size):
+        bounds[start : start + chunk_size] = _lower_bounds_chunk(non_dominated_points, zs[start : start + chunk_size])
+
+    return bounds if np.ndim(z_intermediate) > 1 else bounds[0]
 
-    for r in range(k):
-        # Indices of objectives other than r
-        other = np.delete(np.arange(k), r)
 
-        # Find points that are no worse than z_intermediate in all objectives except r
-        mask = np.all(non_dominated_points[:, other] <= z_intermediate[other], axis=1)
-        feasible = non_dominated_points[mask]
+def _lower_bounds_chunk(non_dominated_points: np.ndarray, zs: np.ndarray) -> np.ndarray:
+    """Calculates the lower bounds of reachable solutions for each row of a 2D array of intermediate points."""
+    # worse[i, j, r] is True when point j is worse than intermediate point i in objective r
+    worse = non_dominated_points[None, :, :] > zs[:, None, :]
+    n_worse = worse.sum(axis=2, keepdims=True)
 
-        if feasible.size > 0:
-            bounds.append(np.min(feasible[:, r]))
-        else:
-            bounds.append(np.inf)  # No feasible point in this projection
+    # Points that are no worse than the intermediate point in all objectives except r
+    feasible = (n_worse - worse) == 0
 
-    return np.array(bounds)
+    # the minimum of objective r over the feasible points, np.inf when no point is feasible
+    return np.where(feasible, non_dominated_points[None, :, :], np.inf).min(axis=1)
 
 
 def calculate_closeness(z_intermediate: np.ndarray, z_nadir: np.ndarray, z_representative: np.ndarray) -> float:
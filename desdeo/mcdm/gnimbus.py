@@ -4,6 +4,7 @@ References:
 TBA
 """
 
+from concurrent.futures import Executor
 from typing import Literal
 
 import numpy as np
@@ -34,6 +35,7 @@ from desdeo.tools import (
     add_group_stom_agg_diff,
     add_group_stom_diff,
     guess_best_solver,
+    solve_scalarized_problems,
 )
 
 
@@ -167,6 +169,7 @@ def solve_group_sub_problems(  # noqa: C901
     scalarization_options: dict | None = None,
     create_solver: BaseSolver | None = None,
     solver_options: SolverOptions | None = None,
+    executor: Executor | None = None,
 ) -> list[SolverResults]:
     r"""Solves a number of sub-problems as defined in the GNIMBUS methods.
 
@@ -209,6 +212,11 @@ def solve_group_sub_problems(  # noqa: C901
         solver_options(SolverOptions | None, optional): optional options passed
             to the `create_solver` routine. Ignored if `create_solver` is `None`.
             Defaults to None.
+        executor(Executor | None, optional): an executor, e.g., a `ThreadPoolExecutor` or a
+            `ProcessPoolExecutor`, used to solve the independent sub-problems, and the individual
+            solutions of the DMs, concurrently. Solvers that run on Pyomo, e.g., `PyomoIpoptSolver`, are not
+            thread-safe and need a `ProcessPoolExecutor`; see `desdeo.tools.solve_scalarized_problems` for the
+            other solvers. If None, they are solved sequentially. Defaults to None.
 
     Returns:
         list[SolverResults]: a list of `SolverResults` objects. Contains as many elements
@@ -253,22 +261,26 @@ def solve_group_sub_problems(  # noqa: C901
     classification_list = []
     achievable_prefs = []
 
-    ind_sols = []
     reference_points_list = dict_of_rps_to_list_of_rps(reference_points)
 
     # Solve for individual solutions using nimbus scalarization.
-    for dm_rp in reference_points:
-        ind_sols.append(
-            solve_sub_problems(
-                problem=problem,
-                current_objectives=current_objectives,
-                reference_point=reference_points[dm_rp],
-                num_desired=1,
-                scalarization_options=None,
-                solver=init_solver,
-                solver_options=_solver_options,
-            )[0],
-        )
+    ind_kwargs = [
+        {
+            "problem": problem,
+            "current_objectives": current_objectives,
+            "reference_point": reference_points[dm_rp],
+            "num_desired": 1,
+            "scalarization_options": None,
+            "solver": init_solver,
+            "solver_options": _solver_options,
+        }
+        for dm_rp in reference_points
+    ]
+    if executor is None:
+        ind_sols = [solve_sub_problems(**kwargs)[0] for kwargs in ind_kwargs]
+    else:
+        futures = [executor.submit(solve_sub_problems, **kwargs) for kwargs in ind_kwargs]
+        ind_sols = [future.result()[0] for future in futures]
 
     achievable_prefs = []
     for q in range(len(reference_points)):
@@ -361,59 +373,38 @@ def solve_group_sub_problems(  # noqa: C901
         gnimbus_scala = add_group_nimbus_diff if problem.is_twice_differentiable else add_group_nimbus
         add_nimbus_sf = gnimbus_scala
 
-        problem_w_nimbus, nimbus_target = add_nimbus_sf(
-            problem,
-            "nimbus_sf",
-            classification_list,
-            current_objectives,
-            agg_bounds,
-            delta,
-            **(scalarization_options or {}),
-        )
-
-        if _solver_options:
-            nimbus_solver = init_solver(problem_w_nimbus, _solver_options)  # type:ignore
-        else:
-            nimbus_solver = init_solver(problem_w_nimbus)  # type:ignore
-
-        solutions.append(nimbus_solver.solve(nimbus_target))
+        sub_problems = [
+            add_nimbus_sf(
+                problem,
+                "nimbus_sf",
+                classification_list,
+                current_objectives,
+                agg_bounds,
+                delta,
+                **(scalarization_options or {}),
+            )
+        ]
 
         """ SOLVING Group Scals with scaled delta, original RPs and hard_constraints """
-        # solve STOM
+        # STOM
         add_stom_sf = add_group_stom_diff if problem.is_twice_differentiable else add_group_stom
-        problem_w_stom, stom_target = add_stom_sf(
-            problem, "stom_sf", reference_points_list, agg_bounds, delta, **(scalarization_options or {})
+        sub_problems.append(
+            add_stom_sf(problem, "stom_sf", reference_points_list, agg_bounds, delta, **(scalarization_options or {}))
         )
-        if _solver_options:  # noqa: SIM108
-            stom_solver = init_solver(problem_w_stom, _solver_options)  # type:ignore
-        else:
-            stom_solver = init_solver(problem_w_stom)  # type:ignore
-
-        solutions.append(stom_solver.solve(stom_target))
 
-        # solve ASF
+        # ASF
         add_asf = add_group_asf_diff if problem.is_twice_differentiable else add_group_asf
-        problem_w_asf, asf_target = add_asf(
-            problem, "asf", reference_points_list, agg_bounds, delta, **(scalarization_options or {})
+        sub_problems.append(
+            add_asf(problem, "asf", reference_points_list, agg_bounds, delta, **(scalarization_options or {}))
         )
-        if _solver_options:  # noqa: SIM108
-            asf_solver = init_solver(problem_w_asf, _solver_options)  # type:ignore
-        else:
-            asf_solver = init_solver(problem_w_asf)  # type:ignore
 
-        solutions.append(asf_solver.solve(asf_target))
-
-        # Solve GUESS
+        # GUESS
         add_guess_sf = add_group_guess_diff if problem.is_twice_differentiable else add_group_guess
-        problem_w_guess, guess_target = add_guess_sf(
-            problem, "guess_sf", reference_points_list, agg_bounds, delta, **(scalarization_options or {})
+        sub_problems.append(
+            add_guess_sf(problem, "guess_sf", reference_points_list, agg_bounds, delta, **(scalarization_options or {}))
         )
-        if _solver_options:
-            guess_solver = init_solver(problem_w_guess, _solver_options)  # type:ignore
-        else:
-            guess_solver = init_solver(problem_w_guess)  # type:ignore
 
-        solutions.append(guess_solver.solve(guess_target))
+        solutions.extend(solve_scalarized_problems(sub_problems, init_solver, _solver_options, executor))
 
         infer_group_classifications(problem, current_objectives, reference_points, silent=False)
 
@@ -433,60 +424,36 @@ def solve_group_sub_problems(  # noqa: C901
     gnimbus_scala = add_group_nimbus_diff if problem.is_twice_differentiable else add_group_nimbus
     add_nimbus_sf = gnimbus_scala
 
-    problem_w_nimbus, nimbus_target = add_nimbus_sf(
-        problem,
-        "nimbus_sf",
-        classification_list,
-        current_objectives,
-        agg_bounds,
-        delta,
-        **(scalarization_options or {}),
-    )
-
-    if _solver_options:  # noqa: SIM108
-        nimbus_solver = init_solver(problem_w_nimbus, _solver_options)  # type:ignore
-    else:
-        nimbus_solver = init_solver(problem_w_nimbus)  # type:ignore
-
-    solutions.append(nimbus_solver.solve(nimbus_target))
+    sub_problems = [
+        add_nimbus_sf(
+            problem,
+            "nimbus_sf",
+            classification_list,
+            current_objectives,
+            agg_bounds,
+            delta,
+            **(scalarization_options or {}),
+        )
+    ]
 
     """ SOLVING Group Scals with scaled delta, agg. aspirations and hard_constraints """
 
     add_stom_sf2 = add_group_stom_agg_diff if problem.is_twice_differentiable else add_group_stom_agg
-
-    problem_g_stom, stomg_target = add_stom_sf2(
-        problem, "stom_sf2", agg_aspirations, agg_bounds, delta, **(scalarization_options or {})
+    sub_problems.append(
+        add_stom_sf2(problem, "stom_sf2", agg_aspirations, agg_bounds, delta, **(scalarization_options or {}))
     )
-    if _solver_options:  # noqa: SIM108
-        stomg_solver = init_solver(problem_g_stom, _solver_options)  # type:ignore
-    else:
-        stomg_solver = init_solver(problem_g_stom)  # type:ignore
-
-    solutions.append(stomg_solver.solve(stomg_target))
 
     add_asf2 = add_group_asf_agg_diff if problem.is_twice_differentiable else add_group_asf_agg
-    problem_g_asf, asfg_target = add_asf2(
-        problem, "asf2", agg_aspirations, agg_bounds, delta, **(scalarization_options or {})
+    sub_problems.append(
+        add_asf2(problem, "asf2", agg_aspirations, agg_bounds, delta, **(scalarization_options or {}))
     )
-    if _solver_options:  # noqa: SIM108
-        asfg_solver = init_solver(problem_g_asf, _solver_options)  # type:ignore
-    else:
-        asfg_solver = init_solver(problem_g_asf)  # type:ignore
-
-    solutions.append(asfg_solver.solve(asfg_target))
 
     add_guess_sf2 = add_group_guess_agg_diff if problem.is_twice_differentiable else add_group_guess_agg
-
-    problem_g_guess, guess2_target = add_guess_sf2(
-        problem, "guess_sf2", agg_aspirations, agg_bounds, delta, **(scalarization_options or {})
+    sub_problems.append(
+        add_guess_sf2(problem, "guess_sf2", agg_aspirations, agg_bounds, delta, **(scalarization_options or {}))
     )
 
-    if _solver_options:  # noqa: SIM108
-        guess2_solver = init_solver(problem_g_guess, _solver_options)  # type:ignore
-    else:
-        guess2_solver = init_solver(problem_g_guess)  # type:ignore
-
-    solutions.append(guess2_solver.solve(guess2_target))
+    solutions.extend(solve_scalarized_problems(sub_problems, init_solver, _solver_options, executor))
 
     infer_group_classifications(problem, current_objectives, reference_points, silent=False)
 
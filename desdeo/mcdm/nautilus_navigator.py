@@ -7,23 +7,26 @@ optimization without trading-off." Journal of Global Optimization 74.2 (2019):
 213-231.
 """
 
+from collections.abc import Callable
+
 import numpy as np
 from pydantic import BaseModel, Field
 
 from desdeo.problem import (
+    Constant,
     Constraint,
     ConstraintTypeEnum,
+    Objective,
     Problem,
     ScalarizationFunction,
     get_nadir_dict,
     numpy_array_to_objective_dict,
     objective_dict_to_numpy_array,
 )
-from desdeo.tools.generics import BaseSolver, SolverResults
+from desdeo.tools.generics import BaseSolver, PersistentSolver, SolverResults
 from desdeo.tools.scalarization import (
     add_asf_diff,
     add_asf_nondiff,
-    add_epsilon_constraints,
 )
 from desdeo.tools.utils import guess_best_solver
 
@@ -88,62 +91,52 @@ def calculate_navigation_point(
     return numpy_array_to_objective_dict(problem, z)
 
 
-def solve_reachable_bounds(
-    problem: Problem,
-    navigation_point: dict[str, float],
-    bounds: dict[str, float] | None = None,
-    solver: BaseSolver | None = None,
-    bound_th: float = 1e-3,
-) -> tuple[dict[str, float], dict[str, float]]:
-    """Computes the current reachable (upper and lower) bounds of the solutions in the objective space.
+class ReachableBoundsSolver:
+    """Computes the reachable bounds of NAUTILUS Navigator repeatedly for the same problem.
 
-    The reachable bound are computed based on the current navigation point. The bounds are computed by
-    solving an epsilon constraint problem.
+    The reachable bounds are computed by solving two epsilon constraint
+    problems per objective function, and the problems differ between the
+    steps of the method only in the navigation point, i.e., in the epsilon
+    values. Therefore, the epsilon constraint problems are built once and
+    only the epsilon values are changed between solves.
 
-    Args:
-        problem (Problem): the problem being solved.
-        navigation_point (dict[str, float]): the navigation point limiting the
-            reachable area. The key is the objective function's symbol and the value
-            the navigation point.
-        bounds (dict[str, float]): the user provided bounds preference.
-        solver (BaseSolver | None, optional): solver used to solve the problem.
-            If None, then a solver is utilized bases on the problem's properties. Defaults to None.
-        bound_th (float, optional): a threshold for comparing the bounds to the set epsilon constraints.
-
-    Raises:
-        NautilusNavigationError: when optimization of an epsilon constraint problem is not successful.
-
-    Returns:
-        tuple[dict[str, float], dict[str, float]]: a tuple of dicts, where the first dict are the lower bounds and the
-            second element the upper bounds, the key is the symbol of each objective.
+    If the given solver is a `PersistentSolver`, a single solver (model) is
+    created and only the epsilon constraints are replaced between solves.
+    Otherwise, the epsilon values are defined as constants of the epsilon
+    constraint problems, and only the values of the constants are changed
+    before a solver is created for each problem.
     """
-    # If an objective is to be maximized, then the navigation point component of that objective should be
-    # multiplied by -1.
-    const_bounds = {
-        objective.symbol: -1 * navigation_point[objective.symbol]
-        if objective.maximize
-        else navigation_point[objective.symbol]
-        for objective in problem.objectives
-    }
-
-    # if a solver creator was provided, use that, else, guess the best one
-    solver_init = guess_best_solver(problem) if solver is None else solver
-
-    lower_bounds = {}
-    upper_bounds = {}
-    for objective in problem.objectives:
-        # Lower bounds
-        eps_problem, target, _ = add_epsilon_constraints(
-            problem,
-            "target",
-            {f"{obj.symbol}": f"{obj.symbol}_eps" for obj in problem.objectives},
-            objective.symbol,
-            const_bounds,
-        )
+
+    def __init__(
+        self,
+        problem: Problem,
+        bounds: dict[str, float] | None = None,
+        solver: BaseSolver | None = None,
+        bound_th: float = 1e-3,
+    ):
+        """Builds the epsilon constraint problems, or the persistent solver, for computing the reachable bounds.
+
+        Args:
+            problem (Problem): the problem being solved.
+            bounds (dict[str, float]): the user provided bounds preference.
+            solver (BaseSolver | None, optional): solver used to solve the problem.
+                If None, then a solver is utilized bases on the problem's properties. Defaults to None.
+            bound_th (float, optional): a threshold for comparing the bounds to the set epsilon constraints.
+        """
+        self.problem = problem
+        self.bounds = bounds
+        self.bound_th = bound_th
+
+        # if a solver creator was provided, use that, else, guess the best one
+        self.solver_init = guess_best_solver(problem) if solver is None else solver
+
+        # symbols of the epsilon constraints, and of the constants holding the epsilon values, for each objective
+        self.eps_symbols = {obj.symbol: f"{obj.symbol}_eps" for obj in problem.objectives}
+        self.eps_value_symbols = {obj.symbol: f"{obj.symbol}_eps_value" for obj in problem.objectives}
 
         # User bounds
         if bounds is not None:
-            bound_constraints = [
+            self.bound_constraints = [
                 Constraint(
                     name=f"User bound for {obj.symbol}",
                     symbol=f"{obj.symbol}_user",
@@ -155,80 +148,151 @@ def solve_reachable_bounds(
                 )
                 for obj in problem.objectives
             ]
-            eps_problem = eps_problem.add_constraints(bound_constraints)
-
-        # solve
-        solver = solver_init(eps_problem)
-        res = solver.solve(target)
-
-        if not res.success:
-            # could not optimize eps problem
-            msg = (
-                f"Optimizing the epsilon constrait problem for the objective "
-                f"{objective.symbol} was not successful. Reason: {res.message}"
-            )
-            raise NautilusNavigatorError(msg)
-
-        lower_bound = res.optimal_objectives[objective.symbol]
+        else:
+            self.bound_constraints = []
 
-        if isinstance(lower_bound, list):
-            lower_bound = lower_bound[0]
+        self.persistent = isinstance(self.solver_init, type) and issubclass(self.solver_init, PersistentSolver)
 
-        # solver upper bounds
-        eps_problem, target, _ = add_epsilon_constraints(
-            problem,
-            "target",
-            {f"{obj.symbol}": f"{obj.symbol}_eps" for obj in problem.objectives},
-            objective.symbol,
-            const_bounds,
-        )
-        # We need to add a constrant related to the target objective to bound it to the navigation point
-        # Maybe there should be a replacement to "create_epsilon_constraints_json" that allows for this
-        # for now, we will add the constraint manually
-        # target_expr[1] = -1  # maximize the objective
-        target = "target"
-        max_objective_scal = ScalarizationFunction(
-            symbol=target,
-            name="Max objective",
-            func=["Negate", f"{objective.symbol}_min"],
+        if self.persistent:
+            self._init_persistent()
+        else:
+            self._init_problems()
+
+    def _eps_constraint(self, objective: Objective, eps: float | str) -> Constraint:
+        """Creates the epsilon constraint `f_min - eps <= 0` for an objective.
+
+        Args:
+            objective (Objective): the objective function the constraint is related to.
+            eps (float | str): the epsilon value, or the symbol of the constant holding the value.
+
+        Returns:
+            Constraint: the epsilon constraint.
+        """
+        return Constraint(
+            name=f"Epsilon for {objective.symbol}",
+            symbol=self.eps_symbols[objective.symbol],
+            func=["Add", f"{objective.symbol}_min", ["Negate", eps]],
+            cons_type=ConstraintTypeEnum.LTE,
             is_linear=objective.is_linear,
             is_convex=objective.is_convex,
             is_twice_differentiable=objective.is_twice_differentiable,
         )
 
-        eps_problem = problem.add_scalarization(max_objective_scal)
-
-        bound_to_nav_constraint = Constraint(
-            symbol=f"{objective.symbol}_to_bound",
-            name=f"To bound {objective.symbol} to user bounds",
-            func=["Add", f"{objective.symbol}_min", ["Negate", const_bounds[objective.symbol]]],
-            cons_type=ConstraintTypeEnum.LTE,
-            is_linear=objective.is_linear,
-            is_convex=objective.is_convex,
-            is_twice_differentiable=objective.is_twice_differentiable,
+    def _target_scalarizations(self, objective: Objective) -> tuple[ScalarizationFunction, ScalarizationFunction]:
+        """Creates the scalarization functions to minimize and maximize an objective.
+
+        Args:
+            objective (Objective): the objective function.
+
+        Returns:
+            tuple[ScalarizationFunction, ScalarizationFunction]: the scalarization functions
+                for the lower and upper bound, respectively.
+        """
+        return (
+            ScalarizationFunction(
+                symbol=f"{objective.symbol}_lower_target",
+                name=f"Min objective {objective.symbol}",
+                func=["Multiply", 1, f"{objective.symbol}_min"],
+                is_linear=objective.is_linear,
+                is_convex=objective.is_convex,
+                is_twice_differentiable=objective.is_twice_differentiable,
+            ),
+            ScalarizationFunction(
+                symbol=f"{objective.symbol}_upper_target",
+                name=f"Max objective {objective.symbol}",
+                func=["Negate", f"{objective.symbol}_min"],
+                is_linear=objective.is_linear,
+                is_convex=objective.is_convex,
+                is_twice_differentiable=objective.is_twice_differentiable,
+            ),
         )
 
-        # User bounds, add constraints
-        if bounds is not None:
-            bound_constraints = [
-                Constraint(
-                    name=f"User bound for {obj.symbol}",
-                    symbol=f"{obj.symbol}_user",
-                    func=f"{obj.symbol}_min - {bounds[obj.symbol] * (-1 if obj.maximize else 1)}",
-                    cons_type=ConstraintTypeEnum.LTE,
-                    is_linear=obj.is_linear,
-                    is_convex=obj.is_convex,
-                    is_twice_differentiable=obj.is_twice_differentiable,
-                )
-                for obj in problem.objectives
+    def _init_persistent(self):
+        """Creates a single persistent solver with the targets of all the epsilon constraint problems."""
+        self.persistent_solver = self.solver_init(self.problem)
+
+        for constraint in self.bound_constraints:
+            self.persistent_solver.add_constraint(constraint)
+
+        for objective in self.problem.objectives:
+            self.persistent_solver.add_scalarization_function(list(self._target_scalarizations(objective)))
+
+        # symbols of the epsilon constraints currently in the persistent solver
+        self._active_eps_symbols: list[str] = []
+
+    def _init_problems(self):
+        """Creates the epsilon constraint problems with the epsilon values as constants."""
+        # placeholder values, the actual values are set before solving
+        self._eps_constants = {
+            obj.symbol: Constant(name=f"Epsilon for {obj.symbol}", symbol=self.eps_value_symbols[obj.symbol], value=0)
+            for obj in self.problem.objectives
+        }
+        self._base_constants = self.problem.constants if self.problem.constants is not None else []
+
+        # epsilon constraints for all objectives except the one being minimized
+        self.lower_problems = {}
+        # the objective being maximized is bounded to the navigation point
+        self.upper_problems = {}
+        for objective in self.problem.objectives:
+            lower_scal, upper_scal = self._target_scalarizations(objective)
+
+            lower_constraints = [
+                self._eps_constraint(obj, self.eps_value_symbols[obj.symbol])
+                for obj in self.problem.objectives
+                if obj.symbol != objective.symbol
             ]
-            eps_problem = eps_problem.add_constraints([bound_to_nav_constraint, *bound_constraints])
+            self.lower_problems[objective.symbol] = (
+                self.problem.model_copy(update={"constants": [*self._base_constants, *self._eps_constants.values()]})
+                .add_scalarization(lower_scal)
+                .add_constraints([*lower_constraints, *self.bound_constraints])
+            )
+
+            upper_constraints = [self._eps_constraint(objective, self.eps_value_symbols[objective.symbol])]
+            self.upper_problems[objective.symbol] = (
+                self.problem.model_copy(update={"constants": [*self._base_constants, *self._eps_constants.values()]})
+                .add_scalarization(upper_scal)
+                .add_constraints([*upper_constraints, *self.bound_constraints])
+            )
+
+    def _solve_eps_problem(self, objective: Objective, const_bounds: dict[str, float], *, lower: bool) -> float:
+        """Solves an epsilon constraint problem for the lower or upper bound of an objective.
+
+        Args:
+            objective (Objective): the objective whose bound is computed.
+            const_bounds (dict[str, float]): the epsilon values, given for minimized objectives.
+            lower (bool): whether the objective is minimized (lower bound) or maximized (upper bound).
+
+        Raises:
+            NautilusNavigationError: when optimization of an epsilon constraint problem is not successful.
+
+        Returns:
+            float: the optimal value of the objective.
+        """
+        target = f"{objective.symbol}_lower_target" if lower else f"{objective.symbol}_upper_target"
+        eps_objectives = (
+            [obj for obj in self.problem.objectives if obj.symbol != objective.symbol] if lower else [objective]
+        )
+
+        if self.persistent:
+            # replace the epsilon constraints in the model
+            if len(self._active_eps_symbols) > 0:
+                self.persistent_solver.remove_constraint(self._active_eps_symbols)
+            for obj in eps_objectives:
+                self.persistent_solver.add_constraint(self._eps_constraint(obj, const_bounds[obj.symbol]))
+            self._active_eps_symbols = [self.eps_symbols[obj.symbol] for obj in eps_objectives]
+
+            res = self.persistent_solver.solve(target)
         else:
-            eps_problem = eps_problem.add_constraints([bound_to_nav_constraint])
+            # set the epsilon values in the prebuilt problem
+            eps_problem = self.lower_problems[objective.symbol] if lower else self.upper_problems[objective.symbol]
+            eps_constants = [
+                constant.model_copy(update={"value": const_bounds[symbol]})
+                for symbol, constant in self._eps_constants.items()
+            ]
+            eps_problem = eps_problem.model_copy(update={"constants": [*self._base_constants, *eps_constants]})
+
+            res = self.solver_init(eps_problem).solve(target)
 
-        # solve
-        solver = solver_init(eps_problem)
-        res = solver.solve(target)
         if not res.success:
             # could not optimize eps problem
             msg = (
@@ -237,22 +301,93 @@ def solve_reachable_bounds(
             )
             raise NautilusNavigatorError(msg)
 
-        upper_bound = res.optimal_objectives[objective.symbol]
+        value = res.optimal_objectives[objective.symbol]
 
-        if isinstance(upper_bound, list):
-            upper_bound = upper_bound[0]
+        return value[0] if isinstance(value, list) else value
 
-        if not (abs(upper_bound * (-1 if objective.maximize else 1) - const_bounds[objective.symbol]) < bound_th) and (
-            upper_bound * (-1 if objective.maximize else 1) > const_bounds[objective.symbol]
-        ):
-            msg = "The upper bound is worse than the navigation point. This should not happen."
-            raise NautilusNavigatorError(msg)
+    def solve(self, navigation_point: dict[str, float]) -> tuple[dict[str, float], dict[str, float]]:
+        """Computes the reachable (upper and lower) bounds for a navigation point.
+
+        Args:
+            navigation_point (dict[str, float]): the navigation point limiting the
+                reachable area. The key is the objective function's symbol and the value
+                the navigation point.
+
+        Raises:
+            NautilusNavigationError: when optimization of an epsilon constraint problem is not successful.
+
+        Returns:
+            tuple[dict[str, float], dict[str, float]]: a tuple of dicts, where the first dict are the lower bounds and
+                the second element the upper bounds, the key is the symbol of each objective.
+        """
+        # If an objective is to be maximized, then the navigation point component of that objective should be
+        # multiplied by -1.
+        const_bounds = {
+            objective.symbol: -1 * navigation_point[objective.symbol]
+            if objective.maximize
+            else navigation_point[objective.symbol]
+            for objective in self.problem.objectives
+        }
+
+        lower_bounds = {}
+        upper_bounds = {}
+        for objective in self.problem.objectives:
+            # minimize the objective subject to the other objectives being bounded by the navigation point
+            lower_bound = self._solve_eps_problem(objective, const_bounds, lower=True)
+
+            # maximize the objective subject to it being bounded by the navigation point
+            upper_bound = self._solve_eps_problem(objective, const_bounds, lower=False)
+
+            if not (
+                abs(upper_bound * (-1 if objective.maximize else 1) - const_bounds[objective.symbol]) < self.bound_th
+            ) and (upper_bound * (-1 if objective.maximize else 1) > const_bounds[objective.symbol]):
+                msg = "The upper bound is worse than the navigation point. This should not happen."
+                raise NautilusNavigatorError(msg)
+
+            # add the lower and upper bounds logically depending whether an objective is to be maximized or minimized
+            lower_bounds[objective.symbol] = lower_bound if not objective.maximize else upper_bound
+            upper_bounds[objective.symbol] = upper_bound if not objective.maximize else lower_bound
+
+        return lower_bounds, upper_bounds
+
+
+def solve_reachable_bounds(
+    problem: Problem,
+    navigation_point: dict[str, float],
+    bounds: dict[str, float] | None = None,
+    solver: BaseSolver | None = None,
+    bound_th: float = 1e-3,
+    bounds_solver: ReachableBoundsSolver | None = None,
+) -> tuple[dict[str, float], dict[str, float]]:
+    """Computes the current reachable (upper and lower) bounds of the solutions in the objective space.
+
+    The reachable bound are computed based on the current navigation point. The bounds are computed by
+    solving an epsilon constraint problem.
+
+    Args:
+        problem (Problem): the problem being solved.
+        navigation_point (dict[str, float]): the navigation point limiting the
+            reachable area. The key is the objective function's symbol and the value
+            the navigation point.
+        bounds (dict[str, float]): the user provided bounds preference.
+        solver (BaseSolver | None, optional): solver used to solve the problem.
+            If None, then a solver is utilized bases on the problem's properties. Defaults to None.
+        bound_th (float, optional): a threshold for comparing the bounds to the set epsilon constraints.
+        bounds_solver (ReachableBoundsSolver | None, optional): a bounds solver created for `problem`
+            and `bounds` to be reused between calls. If given, `solver` and `bound_th` are ignored.
+            If None, a new one is created. Defaults to None.
+
+    Raises:
+        NautilusNavigationError: when optimization of an epsilon constraint problem is not successful.
 
-        # add the lower and upper bounds logically depending whether an objective is to be maximized or minimized
-        lower_bounds[objective.symbol] = lower_bound if not objective.maximize else upper_bound
-        upper_bounds[objective.symbol] = upper_bound if not objective.maximize else lower_bound
+    Returns:
+        tuple[dict[str, float], dict[str, float]]: a tuple of dicts, where the first dict are the lower bounds and the
+            second element the upper bounds, the key is the symbol of each objective.
+    """
+    if bounds_solver is None:
+        bounds_solver = ReachableBoundsSolver(problem, bounds=bounds, solver=solver, bound_th=bound_th)
 
-    return lower_bounds, upper_bounds
+    return bounds_solver.solve(navigation_point)
 
 
 def solve_reachable_solution(
@@ -406,6 +541,7 @@ def navigator_step(
     solver: BaseSolver | None = None,
     reference_point: dict | None = None,
     reachable_solution: dict[str, float] | None = None,
+    bounds_solver: ReachableBoundsSolver | None = None,
 ) -> NAUTILUS_Response:
     """Performs a step of the NAUTILUS method.
 
@@ -422,6 +558,8 @@ def navigator_step(
         bounds (dict | None, optional): The bounds of the problem provided by the DM. Defaults to None.
         reachable_solution (dict | None, optional): The previous reachable solution. Must only be provided if the DM
             has not changed their preference. Defaults to None.
+        bounds_solver (ReachableBoundsSolver | None, optional): A bounds solver created for `problem` and `bounds`
+            to be reused between steps. If None, a new one is created. Defaults to None.
 
     Raises:
         NautilusNavigatorError: If neither reference_point nor reachable_solution is provided.
@@ -447,7 +585,9 @@ def navigator_step(
 
     # update_bounds
 
-    lower_bounds, upper_bounds = solve_reachable_bounds(problem, new_nav_point, solver=solver, bounds=bounds)
+    lower_bounds, upper_bounds = solve_reachable_bounds(
+        problem, new_nav_point, solver=solver, bounds=bounds, bounds_solver=bounds_solver
+    )
 
     distance = calculate_distance_to_front(problem, new_nav_point, reachable_point)
 
@@ -472,6 +612,7 @@ def navigator_all_steps(
     previous_responses: list[NAUTILUS_Response],
     bounds: dict | None = None,
     solver: BaseSolver | None = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> list[NAUTILUS_Response]:
     """Performs all steps of the NAUTILUS method.
 
@@ -490,6 +631,8 @@ def navigator_all_steps(
         previous_responses (list[NAUTILUS_Response]): The previous responses of the method.
         solver (BaseSolver | None, optional): The solver to use. Defaults to None, in which case the
             algorithm will guess the best solver for the problem.
+        progress (Callable[[int, int], None] | None, optional): Called after each step with the number of steps
+            taken so far and the number of steps to take. Defaults to None.
 
     Returns:
         list[NAUTILUS_Response]: The new responses of the method after all steps. Note, as only new responses are
@@ -497,6 +640,9 @@ def navigator_all_steps(
             to the "previous_responses" list to keep track of the entire process.
     """
     responses: list[NAUTILUS_Response] = []
+    n_steps = steps_remaining
+    # the epsilon constraint problems for the reachable bounds are built once for all the steps
+    bounds_solver = ReachableBoundsSolver(problem, bounds=bounds, solver=solver)
     nav_point = previous_responses[-1].navigation_point
     step_number = previous_responses[-1].step_number + 1
     first_iteration = True
@@ -511,6 +657,7 @@ def navigator_all_steps(
                 reference_point=reference_point,
                 bounds=bounds,
                 solver=solver,
+                bounds_solver=bounds_solver,
             )
             first_iteration = False
         else:
@@ -522,6 +669,7 @@ def navigator_all_steps(
                 reachable_solution=reachable_solution,
                 bounds=bounds,
                 solver=solver,
+                bounds_solver=bounds_solver,
             )
         response.reference_point = reference_point
         responses.append(response)
@@ -529,6 +677,8 @@ def navigator_all_steps(
         nav_point = response.navigation_point
         steps_remaining -= 1
         step_number += 1
+        if progress is not None:
+            progress(len(responses), n_steps)
     return responses
 
 
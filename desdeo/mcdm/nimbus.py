@@ -6,6 +6,9 @@ References:
         170(3), 909–922.
 """  # noqa: RUF002
 
+from collections.abc import Callable
+from concurrent.futures import Executor
+
 import numpy as np
 import polars as pl
 
@@ -30,6 +33,7 @@ from desdeo.tools import (
     add_stom_sf_diff,
     add_stom_sf_nondiff,
     guess_best_solver,
+    solve_scalarized_problems,
 )
 
 
@@ -242,6 +246,8 @@ def solve_sub_problems(
     scalarization_options: dict | None = None,
     solver: BaseSolver | None = None,
     solver_options: SolverOptions | None = None,
+    executor: Executor | None = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> list[SolverResults]:
     r"""Solves a desired number of sub-problems as defined in the NIMBUS methods.
 
@@ -281,10 +287,18 @@ def solve_sub_problems(
         solver_options (SolverOptions | None, optional): optional options passed
             to the `solver`. Ignored if `solver` is `None`.
             Defaults to None.
+        executor (Executor | None, optional): an executor, e.g., a `ThreadPoolExecutor` or a
+            `ProcessPoolExecutor`, used to solve the independent sub-problems concurrently. Solvers that run
+            on Pyomo, e.g., `PyomoIpoptSolver`, are not thread-safe and need a `ProcessPoolExecutor`; see
+            `desdeo.tools.solve_scalarized_problems` for the other solvers. If None, the sub-problems are
+            solved sequentially. Defaults to None.
+        progress (Callable[[int, int], None] | None, optional): called each time a sub-problem has been
+            solved, with the number of sub-problems solved so far and the number of sub-problems.
+            Defaults to None.
 
     Returns:
         list[SolverResults]: a list of `SolverResults` objects. Contains as many elements
-            as defined in `num_desired`.
+            as defined in `num_desired`, in the order the scalarization functions are listed above.
     """
     if None in problem.get_ideal_point().values() or None in problem.get_nadir_point().values():
         msg = "The given problem must have both an ideal and nadir point defined."
@@ -305,54 +319,35 @@ def solve_sub_problems(
     # objective function values
     classifications = infer_classifications(problem, current_objectives, reference_point)
 
-    solutions = []
+    sub_problems = []
 
-    # solve the nimbus scalarization problem, this is done always
+    # the nimbus scalarization problem, this is solved always
     add_nimbus_sf = add_nimbus_sf_diff if problem.is_twice_differentiable else add_nimbus_sf_nondiff
 
-    problem_w_nimbus, nimbus_target = add_nimbus_sf(
-        problem, "nimbus_sf", classifications, current_objectives, **(scalarization_options or {})
+    sub_problems.append(
+        add_nimbus_sf(problem, "nimbus_sf", classifications, current_objectives, **(scalarization_options or {}))
     )
 
-    nimbus_solver = init_solver(problem_w_nimbus, _solver_options) if _solver_options else init_solver(problem_w_nimbus)
-
-    solutions.append(nimbus_solver.solve(nimbus_target))
-
     if num_desired > 1:
-        # solve STOM
+        # STOM
         add_stom_sf = add_stom_sf_diff if problem.is_twice_differentiable else add_stom_sf_nondiff
 
-        problem_w_stom, stom_target = add_stom_sf(problem, "stom_sf", reference_point, **(scalarization_options or {}))
-        stom_solver = init_solver(problem_w_stom, _solver_options) if _solver_options else init_solver(problem_w_stom)
-
-        solutions.append(stom_solver.solve(stom_target))
+        sub_problems.append(add_stom_sf(problem, "stom_sf", reference_point, **(scalarization_options or {})))
 
     if num_desired > 2:  # noqa: PLR2004
-        # solve ASF
+        # ASF
         add_asf = add_asf_diff if problem.is_twice_differentiable else add_asf_nondiff
 
-        problem_w_asf, asf_target = add_asf(problem, "asf", reference_point, **(scalarization_options or {}))
-
-        asf_solver = init_solver(problem_w_asf, _solver_options) if _solver_options else init_solver(problem_w_asf)
-
-        solutions.append(asf_solver.solve(asf_target))
+        sub_problems.append(add_asf(problem, "asf", reference_point, **(scalarization_options or {})))
 
     if num_desired > 3:  # noqa: PLR2004
-        # solve GUESS
+        # GUESS
         add_guess_sf = add_guess_sf_diff if problem.is_twice_differentiable else add_guess_sf_nondiff
 
-        problem_w_guess, guess_target = add_guess_sf(
-            problem, "guess_sf", reference_point, **(scalarization_options or {})
-        )
-
-        if _solver_options:
-            guess_solver = init_solver(problem_w_guess, _solver_options)
-        else:
-            guess_solver = init_solver(problem_w_guess)
-
-        solutions.append(guess_solver.solve(guess_target))
+        sub_problems.append(add_guess_sf(problem, "guess_sf", reference_point, **(scalarization_options or {})))
 
-    return solutions
+    # the sub-problems are independent of each other, solve them (concurrently if an executor is given)
+    return solve_scalarized_problems(sub_problems, init_solver, _solver_options, executor, progress)
 
 
 def generate_starting_point(
@@ -0,0 +1,278 @@
+"""A cache for the results of expensive simulator and surrogate evaluations.
+
+Evolutionary methods revisit identical decision vectors all the time: crossover of similar parents
+produces duplicates, repaired offspring are clipped onto the same bounds, and restarted runs begin
+from where earlier ones left off. An `EvaluationCache` given to a `SimulatorEvaluator` remembers what
+each simulator and surrogate model returned for each decision vector, so that they are evaluated
+only once.
+
+Entries are keyed on a namespace, which identifies the problem, the simulator or surrogate model and
+its parameters, together with the bytes of the decision vector. The most recently used entries are
+kept in memory. If a path is given, every entry is also stored in an SQLite database, so that the
+cache survives across sessions and can be shared by several processes.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+# SQLite limits the number of parameters in a single statement, so look keys up in batches.
+_SQLITE_BATCH = 500
+
+
+@dataclass(frozen=True)
+class PendingEvaluation:
+    """The decision vectors of a batch that were looked up in an `EvaluationCache`, see `EvaluationCache.lookup`."""
+
+    keys: list[bytes]
+    """The cache key of each decision vector."""
+    rows: list[dict | None]
+    """The cached results of each decision vector, None where they were not in the cache."""
+    missing: dict[bytes, int]
+    """The key and the row index of each distinct decision vector that was not in the cache."""
+
+    @property
+    def n_missing(self) -> int:
+        """The number of distinct decision vectors that still have to be evaluated."""
+        return len(self.missing)
+
+    def to_evaluate(self, xs: pl.DataFrame) -> pl.DataFrame:
+        """Select the decision vectors that still have to be evaluated.
+
+        Args:
+            xs (pl.DataFrame): the decision vectors that were looked up.
+
+        Returns:
+            pl.DataFrame: one row per distinct decision vector that was not in the cache.
+        """
+        return xs[list(self.missing.values())]
+
+
+class EvaluationCache:
+    """A two-tier cache of evaluation results, in memory and optionally on disk.
+
+    The cache is safe to use from several threads at once, e.g., when a `SimulatorEvaluator` evaluates
+    its sources on a thread pool.
+    """
+
+    def __init__(self, max_entries: int = 100_000, path: Path | str | None = None, tolerance: float | None = None):
+        """Create an empty cache, or open an existing one on disk.
+
+        Args:
+            max_entries (int, optional): the largest number of entries kept in memory. The least recently used
+                entries are evicted first. Defaults to 100 000.
+            path (Path | str | None, optional): the SQLite database the entries are also stored in. It is
+                created if it does not exist. If None, the cache only lives in memory. Defaults to None.
+            tolerance (float | None, optional): if given, decision vectors are rounded to the nearest multiple
+                of the tolerance before they are looked up, so that vectors that differ only by floating point
+                noise share their results. If None, only bitwise identical vectors do. Defaults to None.
+
+        Raises:
+            ValueError: `max_entries` or `tolerance` is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be a positive integer, got {max_entries}.")
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError(f"tolerance must be positive, got {tolerance}.")
+
+        self.max_entries = max_entries
+        self.tolerance = tolerance
+        self.path = Path(path) if path is not None else None
+
+        self._memory: OrderedDict[bytes, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._connection = None
+        if self.path is not None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS evaluations (key BLOB PRIMARY KEY, value TEXT)")
+            self._connection.commit()
+
+        self.hits = 0
+        """The number of decision vectors whose results were found in the cache."""
+        self.disk_hits = 0
+        """The number of the hits that were found on disk rather than in memory."""
+        self.misses = 0
+        """The number of decision vectors whose results had to be evaluated."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of the decision vectors looked up so far that were found in the cache.
+
+        Returns:
+            float: the hit rate in [0, 1]. Zero if nothing has been looked up yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def keys(self, namespace: str, xs: pl.DataFrame) -> list[bytes]:
+        """Compute the cache keys of decision vectors.
+
+        Args:
+            namespace (str): identifies what the decision vectors are evaluated with.
+            xs (pl.DataFrame): the decision vectors, one row per vector.
+
+        Returns:
+            list[bytes]: one key per row of `xs`.
+        """
+        values = xs.to_numpy().astype(np.float64)
+        if self.tolerance is not None:
+            values = np.rint(values / self.tolerance)
+        # Adding zero turns -0.0 into 0.0, which are equal but have different bytes.
+        values = np.ascontiguousarray(values + 0.0)
+
+        prefix = hashlib.sha256(f"{namespace}\0{','.join(xs.columns)}".encode()).digest()
+        return [hashlib.blake2b(prefix + row.tobytes(), digest_size=20).digest() for row in values]
+
+    def evaluate(
+        self, namespace: str, evaluate: Callable[[pl.DataFrame], pl.DataFrame], xs: pl.DataFrame
+    ) -> pl.DataFrame:
+        """Return the results of evaluating decision vectors, evaluating only the ones not in the cache.
+
+        Args:
+            namespace (str): identifies what the decision vectors are evaluated with, e.g., the problem, the
+                simulator and its parameters. Results are only shared between calls with the same namespace.
+            evaluate (Callable[[pl.DataFrame], pl.DataFrame]): evaluates decision vectors, returning one row of
+                results per row of decision vectors.
+            xs (pl.DataFrame): the decision vectors, one row per vector.
+
+        Raises:
+            ValueError: `evaluate` returned a different number of rows than it was given.
+
+        Returns:
+            pl.DataFrame: the results, one row per row of `xs`.
+        """
+        if xs.height == 0:
+            return evaluate(xs)
+
+        pending = self.lookup(namespace, xs)
+        results = evaluate(pending.to_evaluate(xs)) if pending.n_missing > 0 else None
+        return self.complete(pending, results)
+
+    def lookup(self, namespace: str, xs: pl.DataFrame) -> "PendingEvaluation":
+        """Look decision vectors up in the cache, without evaluating the ones that are not in it.
+
+        This and `complete` split `evaluate` in two, so that the decision vectors missing from the cache can be
+        evaluated elsewhere, e.g., in another process, while the cache itself stays in this one.
+
+        Args:
+            namespace (str): identifies what the decision vectors are evaluated with, as in `evaluate`.
+            xs (pl.DataFrame): the decision vectors, one row per vector. Must not be empty.
+
+        Returns:
+            PendingEvaluation: the results found in the cache, and which decision vectors are still to be evaluated.
+        """
+        keys = self.keys(namespace, xs)
+        rows = self._lookup(keys)
+        # Evaluate each distinct decision vector once, even if it appears in the batch several times.
+        first_of_key: dict[bytes, int] = {}
+        for i, row in enumerate(rows):
+            if row is None:
+                first_of_key.setdefault(keys[i], i)
+        return PendingEvaluation(keys=keys, rows=rows, missing=first_of_key)
+
+    def complete(self, pending: "PendingEvaluation", results: pl.DataFrame | None) -> pl.DataFrame:
+        """Store the results of the decision vectors that were missing from the cache, and return all the results.
+
+        Args:
+            pending (PendingEvaluation): returned by `lookup`.
+            results (pl.DataFrame | None): the results of evaluating `pending.to_evaluate(xs)`, one row per row.
+                Only None if nothing was missing.
+
+        Raises:
+            ValueError: `results` has a different number of rows than there were decision vectors to evaluate.
+
+        Returns:
+            pl.DataFrame: the results, one row per row of the decision vectors given to `lookup`.
+        """
+        rows = list(pending.rows)
+        if pending.n_missing > 0:
+            n_results = results.height if results is not None else 0
+            if n_results != pending.n_missing:
+                raise ValueError(
+                    f"Evaluating {pending.n_missing} decision vectors returned {n_results} rows of results."
+                )
+
+            fresh = dict(zip(pending.missing, results.to_dicts(), strict=True))
+            self._store(fresh)
+            for i, key in enumerate(pending.keys):
+                if rows[i] is None:
+                    rows[i] = fresh[key]
+
+        return pl.from_dicts(rows, infer_schema_length=None)
+
+    def _lookup(self, keys: list[bytes]) -> list[dict | None]:
+        """Look keys up in memory and then on disk, updating the statistics."""
+        with self._lock:
+            rows = []
+            for key in keys:
+                row = self._memory.get(key)
+                if row is not None:
+                    self._memory.move_to_end(key)
+                rows.append(row)
+
+            on_disk = {}
+            not_in_memory = list({key for key, row in zip(keys, rows, strict=True) if row is None})
+            if self._connection is not None and len(not_in_memory) > 0:
+                for start in range(0, len(not_in_memory), _SQLITE_BATCH):
+                    batch = not_in_memory[start : start + _SQLITE_BATCH]
+                    placeholders = ",".join("?" * len(batch))
+                    cursor = self._connection.execute(
+                        f"SELECT key, value FROM evaluations WHERE key IN ({placeholders})",  # noqa: S608
+                        batch,
+                    )
+                    on_disk.update((key, json.loads(value)) for key, value in cursor)
+                for key, row in on_disk.items():
+                    self._remember(key, row)
+
+            for i, key in enumerate(keys):
+                if rows[i] is None and key in on_disk:
+                    rows[i] = on_disk[key]
+                    self.disk_hits += 1
+
+            n_found = sum(row is not None for row in rows)
+            self.hits += n_found
+            self.misses += len(rows) - n_found
+            return rows
+
+    def _store(self, entries: dict[bytes, dict]):
+        """Store freshly evaluated results in memory and on disk."""
+        with self._lock:
+            for key, row in entries.items():
+                self._remember(key, row)
+            if self._connection is not None:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO evaluations (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(row)) for key, row in entries.items()],
+                )
+                self._connection.commit()
+
+    def _remember(self, key: bytes, row: dict):
+        """Keep an entry in memory, evicting the least recently used entry if the memory tier is full."""
+        self._memory[key] = row
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """Remove every entry from the cache, including those on disk, and reset the statistics."""
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM evaluations")
+                self._connection.commit()
+            self.hits = self.disk_hits = self.misses = 0
+
+    def close(self):
+        """Close the database on disk. The entries in memory stay usable."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -4,6 +4,7 @@ from enum import StrEnum
 
 import numpy as np
 import polars as pl
+from scipy.spatial import KDTree
 
 from desdeo.problem.json_parser import MathParser, replace_str
 from desdeo.problem.schema import (
@@ -180,6 +181,7 @@ class PolarsEvaluator:
         if self.evaluator_mode in [PolarsEvaluatorModesEnum.variables, PolarsEvaluatorModesEnum.mixed]:
             self.evaluate = self._polars_evaluate
             self.evaluate_flat = self._polars_evaluate_flat
+            self.evaluate_array = self._polars_evaluate_array
         elif self.evaluator_mode == PolarsEvaluatorModesEnum.discrete:
             self.evaluate = self._from_discrete_data
         else:
@@ -187,6 +189,14 @@ class PolarsEvaluator:
                 f"Provided 'evaluator_mode' {evaluator_mode} not supported. Must be one of {PolarsEvaluatorModesEnum}."
             )
 
+    def __reduce__(self):
+        """Pickle the evaluator by its problem and mode.
+
+        The parsed expressions cannot be pickled, so the evaluator is
+        re-created from the problem when unpickled, e.g., in worker processes.
+        """
+        return (self.__class__, (self.problem, self.evaluator_mode))
+
     def _polars_init(self):  # noqa: C901
         """Initialization of the evaluator for parser type 'polars'."""
         # If any constants are defined in problem, replace their symbol with the defined numerical
@@ -334,6 +344,73 @@ class PolarsEvaluator:
         else:
             self.discrete_df = None
 
+        # symbols of the objectives whose values are looked up from the discrete representation
+        self.data_based_symbols = [symbol for symbol, expr in self.objective_expressions if expr is None]
+
+        # build a spatial index over the discrete variable values once, it is shared by all the data-based objectives
+        if (
+            self.evaluator_mode != PolarsEvaluatorModesEnum.discrete
+            and self.discrete_df is not None
+            and len(self.data_based_symbols) > 0
+        ):
+            self.discrete_tree = KDTree(self.discrete_df[self.problem_variable_symbols].to_numpy().astype(np.float64))
+        else:
+            self.discrete_tree = None
+
+        self._compile_evaluation_plan()
+
+    def _compile_evaluation_plan(self):
+        """Compile the parsed expressions into stages of mutually independent expressions.
+
+        The extra functions, objective functions, the minimization forms of the
+        objective functions, scalarization functions, and constraints are
+        visited in this order. Each expression is placed in the first stage
+        after all the stages that compute a column it refers to, so the
+        expressions within a single stage can be evaluated with a single
+        'with_columns'. Functions without an expression (data-based, simulator,
+        or surrogate based) are not part of the plan.
+
+        Sets `self.evaluation_stages` (list of stages, each a list of aliased
+        expressions), `self.evaluation_columns` (the names of the columns
+        added during evaluation, in their output order), and
+        `self.array_columns` (the default column layout of `evaluate_array`).
+        """
+        plan = []
+        plan.extend((symbol, expr) for symbol, expr in self.extra_expressions or [] if expr is not None)
+        plan.extend((symbol, expr) for symbol, expr in self.objective_expressions if expr is not None)
+        plan.extend(
+            (f"{symbol}_min", min_max_mult * pl.col(f"{symbol}"))
+            for symbol, min_max_mult in self.objective_mix_max_mult
+        )
+        plan.extend(self.scalarization_expressions or [])
+        plan.extend((symbol, expr) for symbol, expr in self.constraint_expressions or [] if expr is not None)
+
+        stage_of_symbol = {}
+        self.evaluation_stages = []
+        for symbol, expr in plan:
+            stage = max(
+                (stage_of_symbol[name] + 1 for name in expr.meta.root_names() if name in stage_of_symbol), default=0
+            )
+            stage_of_symbol[symbol] = stage
+            if stage == len(self.evaluation_stages):
+                self.evaluation_stages.append([])
+            self.evaluation_stages[stage].append(expr.alias(symbol))
+
+        # The default columns of the arrays returned by `evaluate_array`.
+        self.array_columns = [
+            *[symbol for symbol, _ in self.objective_expressions],
+            *[symbol for symbol, expr in self.constraint_expressions or [] if expr is not None],
+            *[symbol for symbol, _ in self.scalarization_expressions or []],
+        ]
+
+        self.evaluation_columns = [
+            *[symbol for symbol, expr in self.extra_expressions or [] if expr is not None],
+            *[symbol for symbol, _ in self.objective_expressions],
+            *[f"{symbol}_min" for symbol, _ in self.objective_mix_max_mult],
+            *[symbol for symbol, _ in self.scalarization_expressions or []],
+            *[symbol for symbol, expr in self.constraint_expressions or [] if expr is not None],
+        ]
+
     def _polars_evaluate(
         self,
         xs: pl.DataFrame | dict[str, list[float | int | bool]],
@@ -372,58 +449,29 @@ class PolarsEvaluator:
                     pl.Series(np.array(agg_df.height * [self.tensor_constants[tc_symbol]])).alias(tc_symbol)
                 )
 
-        # Evaluate any extra functions and put the results in the aggregate dataframe.
-        # If an extra function is simulator or surrogate based (expression None), skip it here
-        if self.extra_expressions is not None:
-            for symbol, expr in self.extra_expressions:
-                if expr is not None:
-                    # expression given
-                    extra_column = agg_df.select(expr.alias(symbol))
-                    agg_df = agg_df.hstack(extra_column)
-
-        # Evaluate the objective functions and put the results in the aggregate dataframe.
-        # obj_columns = agg_df.select(*[expr.alias(symbol) for symbol, expr in self.objective_expressions])
-        # agg_df = agg_df.hstack(obj_columns)
-
-        for symbol, expr in self.objective_expressions:
-            if expr is not None:
-                # expression given
-                obj_col = agg_df.select(expr.alias(symbol))
-                agg_df = agg_df.hstack(obj_col)
-            # elif self.evaluator_mode != PolarsEvaluatorModesEnum.mixed:
-            else:
-                # expr is None and there are no no simulator or surrogate based objectives,
-                # therefore we must get the objective function's value somehow else, usually from data
-                obj_col = find_closest_points(agg_df, self.discrete_df, self.problem_variable_symbols, symbol)
-                agg_df = agg_df.hstack(obj_col)
-
-        # Evaluate the minimization form of the objective functions
-        # Note that the column name of these should be 'the objective function's symbol'_min
-        # e.g., 'f_1' -> 'f_1_min'
-        min_obj_columns = agg_df.select(
-            *[
-                (min_max_mult * pl.col(f"{symbol}")).alias(f"{symbol}_min")
-                for symbol, min_max_mult in self.objective_mix_max_mult
-            ]
-        )
-        agg_df = agg_df.hstack(min_obj_columns)
-
-        # Evaluate any scalarization functions and put the result in the aggregate dataframe
-        if self.scalarization_expressions is not None:
-            scal_columns = agg_df.select(*[expr.alias(symbol) for symbol, expr in self.scalarization_expressions])
-            agg_df = agg_df.hstack(scal_columns)
+        # The values of data-based objectives are looked up from the discrete representation. The closest
+        # points are found once for all the data-based objectives.
+        input_columns = agg_df.columns
+        if len(self.data_based_symbols) > 0:
+            closest_df = find_closest_points(
+                agg_df,
+                self.discrete_df,
+                self.problem_variable_symbols,
+                self.data_based_symbols,
+                tree=self.discrete_tree,
+            )
+            agg_df = agg_df.hstack(closest_df)
 
-        # Evaluate any constraints and put the results in the aggregate dataframe
-        # If a constraint is simulator or surrogate based (expression None), skip it here
-        if self.constraint_expressions is not None:
-            for symbol, expr in self.constraint_expressions:
-                if expr is not None:
-                    # expression given
-                    cons_columns = agg_df.select(expr.alias(symbol))
-                    agg_df = agg_df.hstack(cons_columns)
+        # Evaluate the extra functions, objective functions, their minimization forms, scalarization functions,
+        # and constraints according to the plan compiled at initialization. Each stage is a single 'with_columns'
+        # in one lazy query, which lets polars share common subexpressions between the functions.
+        lazy_df = agg_df.lazy()
+        for stage in self.evaluation_stages:
+            lazy_df = lazy_df.with_columns(stage)
 
-        # return the dataframe and let the solver figure it out
-        return agg_df
+        # Keep the columns in the order: variables, extra functions, objectives, minimization forms of the
+        # objectives, scalarization functions, and constraints. Return the dataframe and let the solver figure it out.
+        return lazy_df.select(*input_columns, *self.evaluation_columns).collect()
 
     def _polars_evaluate_flat(
         self,
@@ -473,6 +521,48 @@ class PolarsEvaluator:
         # return result of regular evaluate
         return self.evaluate(unflattened_xs)
 
+    def _polars_evaluate_array(self, xs: np.ndarray, targets: list[str] | None = None) -> np.ndarray:
+        """Evaluate the problem with decision variable values given as a 2D numpy array.
+
+        This is meant for solvers that work on numpy arrays. The array is
+        passed to polars column-wise without building intermediate Python
+        dicts or lists.
+
+        Args:
+            xs (np.ndarray): a 2D array of shape (n_samples, n_variables), where
+                each row is a decision variable vector. The columns must be in
+                the order of the problem's flattened variables, i.e., the order
+                given by `Problem.get_flattened_variables`. A 1D array is
+                treated as a single sample.
+            targets (list[str] | None, optional): the symbols of the columns to
+                return, e.g., `["f_1_min", "g_1"]`. Any column computed by
+                `evaluate` may be given. If None, the columns in
+                `self.array_columns` are returned, which are the symbols of the
+                objective functions, followed by the symbols of the constraints,
+                followed by the symbols of the scalarization functions, each in
+                the order they are defined in the problem. Defaults to None.
+
+        Returns:
+            np.ndarray: a C-contiguous float64 array of shape (n_samples, len(targets)),
+                where the columns correspond to `targets` (or `self.array_columns`).
+        """
+        xs = np.atleast_2d(np.asarray(xs, dtype=np.float64))
+        targets = self.array_columns if targets is None else targets
+
+        # a Fortran-ordered array can be handed to polars column by column without copying
+        xs_df = pl.from_numpy(
+            np.asfortranarray(xs),
+            schema=[var.symbol for var in self.problem.get_flattened_variables()],
+            orient="row",
+        )
+
+        if variable_dimension_enumerate(self.problem) == VariableDimensionEnum.scalar:
+            result = self._polars_evaluate(xs_df)
+        else:
+            result = self._polars_evaluate_flat(xs_df)
+
+        return result.select(pl.col(targets).cast(pl.Float64)).to_numpy(order="c")
+
     def _from_discrete_data(self) -> pl.DataFrame:
         """Evaluates the problem based on its discrete representation only.
 
@@ -517,7 +607,11 @@ class PolarsEvaluator:
 
 
 def find_closest_points(
-    xs: pl.DataFrame, discrete_df: pl.DataFrame, variable_symbols: list[str], objective_symbol: list[str]
+    xs: pl.DataFrame,
+    discrete_df: pl.DataFrame,
+    variable_symbols: list[str],
+    objective_symbol: str | list[str],
+    tree: KDTree | None = None,
 ) -> pl.DataFrame:
     """Finds the closest points between the variable columns in xs and discrete_df.
 
@@ -529,32 +623,32 @@ def find_closest_points(
     Both `xs` and `discrete_df` must have the columns `variable_symbols`. `discrete_df` must
     also have the column `objective_symbol`.
 
+    The closest points are found for all the rows in `xs` at once by querying a KD-tree
+    built over the `variable_symbols` columns of `discrete_df`. If the same `discrete_df` is
+    queried repeatedly, the tree should be built once and passed as `tree`.
+
     Args:
         xs (pl.DataFrame): a polars dataframe with the variable values we are
             interested in finding the closest corresponding variable values in
             `discrete_df`.
         discrete_df (pl.DataFrame): a polars dataframe to compare the rows in `xs` to.
         variable_symbols (list[str]): the names of the columns with decision variable values.
-        objective_symbol (str): the name of the column in `discrete_df` that has the objective function values.
+        objective_symbol (str | list[str]): the name of the column in `discrete_df` that has
+            the objective function values. A list of names may be given to look up several
+            objectives with the same closest points.
+        tree (KDTree | None, optional): a KD-tree built over the `variable_symbols` columns
+            of `discrete_df`, in the same order. If None, the tree is built here. Defaults to None.
 
     Returns:
         pl.DataFrame: a dataframe with the columns `objective_symbol` with the
             objective function value that corresponds to each decision variable
             vector in `xs`.
     """
-    xs_vars_only = xs[variable_symbols]
-
-    results = []
-
-    for row in xs_vars_only.rows(named=True):
-        distance_expr = (
-            sum((pl.col(var_symbol) - row[var_symbol]) ** 2 for var_symbol in variable_symbols).sqrt().alias("distance")
-        )
-
-        combined_df = discrete_df.with_columns(distance_expr)
+    if tree is None:
+        tree = KDTree(discrete_df[variable_symbols].to_numpy().astype(np.float64))
 
-        closest = combined_df.sort("distance").head(1)
+    _, closest_idxs = tree.query(xs[variable_symbols].to_numpy().astype(np.float64), k=1)
 
-        results.append(closest[f"{objective_symbol}"][0])
+    objective_symbols = [objective_symbol] if isinstance(objective_symbol, str) else objective_symbol
 
-    return pl.DataFrame({f"{objective_symbol}": results})
+    return discrete_df[objective_symbols][closest_idxs]
@@ -685,6 +685,24 @@ class Url(BaseModel):
         default=None,
     )
     """Optional. A tuple of username and password to be used for authentication when making requests to the URL."""
+    timeout: float | None = Field(
+        description="Optional. The number of seconds to wait for the simulator to respond. If None, waits forever.",
+        default=None,
+    )
+    """Optional. The number of seconds to wait for the simulator to respond. If None, waits forever."""
+    wire_format: Literal["json", "arrow"] = Field(
+        description=(
+            "The format batches are exchanged in. With 'json', the request body is a JSON object with the decision"
+            " variables under 'd' and the parameters under 'p', and the response is a JSON object of lists. With"
+            " 'arrow', the request and response bodies are compressed Arrow IPC streams, and the parameters are sent"
+            " as JSON in the 'X-Simulator-Params' header. Defaults to 'json'."
+        ),
+        default="json",
+    )
+    """The format batches are exchanged in. With 'json', the request body is a JSON object with the decision
+    variables under 'd' and the parameters under 'p', and the response is a JSON object of lists. With 'arrow',
+    the request and response bodies are compressed Arrow IPC streams, and the parameters are sent as JSON in the
+    'X-Simulator-Params' header. Defaults to 'json'."""
     # Add headers and stuff for a proper HTTP request if needed in the future idk
 
 
@@ -1,13 +1,18 @@
 """Evaluators are defined to evaluate simulator based and surrogate based objectives, constraints and extras."""
 
+import hashlib
 import json
 import subprocess
 import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import closing
+from functools import partial
 from inspect import getfullargspec
 from pathlib import Path
 from urllib.parse import urlparse
 
-import joblib
 import numpy as np
 import polars as pl
 import requests
@@ -18,8 +23,13 @@ from desdeo.problem import (
     PolarsEvaluator,
     PolarsEvaluatorModesEnum,
     Problem,
+    Simulator,
 )
+from desdeo.problem.evaluation_cache import EvaluationCache
 from desdeo.problem.external import ProviderParams, get_resolver, supported_schemes
+from desdeo.problem.simulator_http import HTTPSimulatorClient, HTTPSimulatorOptions, evaluate_in_chunks
+from desdeo.problem.simulator_worker import SimulatorWorkerError, SimulatorWorkerPool
+from desdeo.problem.surrogate_registry import MmapMode, load_surrogate
 
 # external resolver to resolve providers for problems defined externally of DESDEO
 _external_resolver = get_resolver()
@@ -34,10 +44,143 @@ def _safe_hstack(left: pl.DataFrame, right: pl.DataFrame) -> pl.DataFrame:
     return right if left.width == 0 else left.hstack(right)
 
 
+def _timed(func: Callable[..., pl.DataFrame], *args) -> tuple[pl.DataFrame, float]:
+    """Call a function and measure how long the call took.
+
+    Returns:
+        tuple[pl.DataFrame, float]: the value returned by the function and the wall-clock duration of the call
+            in seconds.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _hstack_all(frames: list[pl.DataFrame]) -> pl.DataFrame:
+    """Horizontally stack any number of frames, returning an empty frame if there are none."""
+    res = pl.DataFrame()
+    for frame in frames:
+        res = _safe_hstack(res, frame)
+    return res
+
+
 class EvaluatorError(Exception):
     """Error raised when exceptions are encountered in an Evaluator."""
 
 
+# A source of function values: its name, the namespace its results are cached under (None if they are not cached),
+# a factory of the function evaluating it, and the decision variables. The factory is only called if some decision
+# vectors are missing from the cache. The function it returns takes the decision variables as its only argument,
+# and is a partial of a module level function, so that only what it needs is sent to other processes.
+_Source = tuple[str, str | None, Callable[[], Callable[[pl.DataFrame], pl.DataFrame]], pl.DataFrame]
+
+
+def _call_simulator(
+    sim: Simulator,
+    params: dict,
+    xs_df: pl.DataFrame,
+    *,
+    http_options: HTTPSimulatorOptions,
+    worker_pool: SimulatorWorkerPool | None = None,
+    http_client: HTTPSimulatorClient | None = None,
+) -> pl.DataFrame:
+    """Call a single simulator with the given decision variables.
+
+    Args:
+        sim (Simulator): the simulator.
+        params (dict): the parameters of the simulator.
+        xs_df (pl.DataFrame): the decision variables.
+        http_options (HTTPSimulatorOptions): how batches are sent to a URL based simulator.
+        worker_pool (SimulatorWorkerPool | None, optional): the persistent workers of a file based simulator. If
+            None, the simulator file is run as a new process. Defaults to None.
+        http_client (HTTPSimulatorClient | None, optional): the session of a simulator served over HTTP(S). If
+            None, a session is opened for this call only. Defaults to None.
+
+    Returns:
+        pl.DataFrame: the function values returned by the simulator.
+    """
+    if sim.file is not None and worker_pool is not None:
+        try:
+            return worker_pool.evaluate(xs_df, params)
+        except SimulatorWorkerError as e:
+            raise EvaluatorError(f"Simulator {sim.name} failed in a worker process: {e}") from e
+    if sim.file is not None:
+        # call the simulator with the decision variable values and parameters as dicts
+        xs = xs_df.to_dict(as_series=False)
+        res = subprocess.run(  # noqa: PLW1510, S603
+            [sys.executable, sim.file, "-d", str(xs), "-p", str(params)], capture_output=True, text=True
+        )
+        if res.returncode == 0:
+            # gather the simulation results (a dict) into a dataframe
+            return pl.DataFrame(json.loads(res.stdout))
+        raise EvaluatorError(res.stderr)
+    # call the endpoint
+    try:
+        scheme = urlparse(sim.url.url).scheme
+        if scheme in supported_schemes:
+            # desdeo
+            return evaluate_in_chunks(
+                lambda chunk: pl.DataFrame(
+                    _external_resolver.evaluate(sim.url.url, params, chunk.to_dict(as_series=False))
+                ),
+                xs_df,
+                http_options,
+            )
+        # http, https, etc...
+        if http_client is not None:
+            return http_client.evaluate(xs_df, params)
+        with closing(HTTPSimulatorClient(sim.url, http_options)) as client:
+            return client.evaluate(xs_df, params)
+    except requests.RequestException as e:
+        raise EvaluatorError(f"Failed to call the simulator at {sim.url}. Is the simulator server running?") from e
+
+
+def _call_surrogate(model, symbol: str, xs: pl.DataFrame) -> pl.DataFrame:
+    """Predict the values of a single function using its surrogate model.
+
+    Args:
+        model: the surrogate model, with a scikit-learn style `predict` method.
+        symbol (str): the symbol of the objective, constraint or extra function.
+        xs (pl.DataFrame): the decision variables.
+
+    Returns:
+        pl.DataFrame: the predicted values in a column named `symbol`, and the uncertainty predictions in a
+            column named `{symbol}_uncert`.
+    """
+    # rows are samples, columns are variables (what sklearn models expect)
+    var = xs.to_numpy()
+    # get a list of args accepted by the model's predict function
+    accepted_args = getfullargspec(model.predict).args
+    # if "return_std" accepted, gather the uncertainty predictions as well
+    if "return_std" in accepted_args:
+        value, uncertainty = model.predict(var, return_std=True)
+    # otherwise, set the uncertainties as NaN
+    else:
+        value = model.predict(var)
+        uncertainty = np.full(np.shape(value), np.nan)
+    # values go into columns with the symbol as the column names,
+    # uncertainties go into columns with {symbol}_uncert as the column names
+    return pl.DataFrame([pl.Series(value).alias(symbol), pl.Series(uncertainty).alias(f"{symbol}_uncert")])
+
+
+def _call_surrogate_file(path: Path, mmap_mode: MmapMode | None, symbol: str, xs: pl.DataFrame) -> pl.DataFrame:
+    """Predict the values of a single function using the surrogate model saved in a file.
+
+    The model is loaded through the registry of the calling process, so that a worker process reads each model
+    file only once, instead of being sent a copy of the model with every batch.
+
+    Args:
+        path (Path): the file of the surrogate model.
+        mmap_mode (MmapMode | None): the mode the arrays of the model are memory-mapped in, if any.
+        symbol (str): the symbol of the objective, constraint or extra function.
+        xs (pl.DataFrame): the decision variables.
+
+    Returns:
+        pl.DataFrame: the same as `_call_surrogate`.
+    """
+    return _call_surrogate(load_surrogate(path, mmap_mode=mmap_mode), symbol, xs)
+
+
 class SimulatorEvaluator:
     """A class for creating evaluators for simulator based and surrogate based objectives, constraints and extras."""
 
@@ -46,6 +189,11 @@ class SimulatorEvaluator:
         problem: Problem,
         params: dict[str, dict] | ProviderParams | None = None,
         surrogate_paths: dict[str, Path] | None = None,
+        simulator_workers: int | None = None,
+        executor: Executor | None = None,
+        http_options: HTTPSimulatorOptions | None = None,
+        cache: EvaluationCache | None = None,
+        surrogate_mmap_mode: MmapMode | None = None,
     ):
         """Creating an evaluator for simulator based and surrogate based objectives, constraints and extras.
 
@@ -58,6 +206,36 @@ class SimulatorEvaluator:
                 constraints and extra functions and the values are the paths to the surrogate models saved on disk.
                 The names of the objectives, constraints and extra functions should match the names of the objectives,
                 constraints and extra functions in the problem JSON. Defaults to None.
+            simulator_workers (int, optional): If given, each file based simulator is kept loaded in this many
+                persistent worker processes, which evaluate each batch concurrently, instead of being run as a
+                new process for every batch. The simulator files must then define a module level function
+                `simulator(xs: dict, params: dict) -> dict`; see `desdeo.problem.simulator_worker`. The workers
+                are started on first use and stopped by `close`. Defaults to None.
+            executor (Executor, optional): If given, the simulators and the surrogate models are evaluated
+                concurrently on this executor, so that evaluating a batch takes as long as the slowest of them
+                instead of the sum of all of them. Simulators mostly wait on processes or the network and many
+                surrogate models release the GIL while predicting, so a `ThreadPoolExecutor` is usually the right
+                choice. A `ProcessPoolExecutor` only pays off for surrogate models that hold the GIL while
+                predicting; create it with `mp_context=multiprocessing.get_context("spawn")`, as forking a process
+                that runs polars may deadlock. The `cache` is still consulted in this process, and only the
+                decision vectors missing from it are sent to the workers, together with the simulator or the path
+                of the surrogate model file, which each worker loads once. The workers run the file based simulators
+                as a new process and open a session per batch to the simulator servers, instead of using the
+                `simulator_workers` and the sessions of this process. If None, the sources are evaluated one after
+                another. Defaults to None.
+            http_options (HTTPSimulatorOptions, optional): How batches are sent to the URL based simulators: the
+                chunk size, the number of chunks in flight at once, and the retries. Each simulator served over
+                HTTP(S) gets a session of its own that keeps its connections open across batches until `close` is
+                called. If None, the defaults of `HTTPSimulatorOptions` are used. Defaults to None.
+            cache (EvaluationCache, optional): If given, the values returned by each simulator and surrogate model
+                are cached, and decision vectors already in the cache are not evaluated again. Results are only
+                shared between evaluations of the same problem, with the same simulator and parameters or the same
+                surrogate model file. The analytical functions are always evaluated. If None, nothing is cached.
+                Defaults to None.
+            surrogate_mmap_mode (MmapMode, optional): If given, the NumPy arrays of the surrogate models are
+                memory-mapped from their files in this mode, usually "r", instead of being read into memory. This
+                makes loading large models fast and lets processes forked from this one share their memory. Only
+                arrays dumped uncompressed with joblib can be memory-mapped. Defaults to None.
         """
         self.problem = problem
         # store the symbol and min or max multiplier as well (symbol, min/max multiplier [1 | -1])
@@ -80,15 +258,6 @@ class SimulatorEvaluator:
             obj.symbol
             for obj in list(filter(lambda x: x.objective_type == ObjectiveTypeEnum.surrogate, problem.objectives))
         ]
-        if problem.scalarization_funcs is not None:
-            parser = MathParser()
-            self.scalarization_funcs = [
-                (func.symbol, parser.parse(func.func))
-                for func in problem.scalarization_funcs
-                if func.symbol is not None
-            ]
-        else:
-            self.scalarization_funcs = []
         # Gather any constraints' symbols
         if problem.constraints is not None:
             self.analytical_symbols = self.analytical_symbols + [
@@ -132,7 +301,30 @@ class SimulatorEvaluator:
                     sim_params[key] = sim.parameter_options[key]
             self.params[sim.name] = sim_params
 
+        if simulator_workers is not None and simulator_workers < 1:
+            raise EvaluatorError(f"simulator_workers must be a positive integer, got {simulator_workers}.")
+        self.simulator_workers = simulator_workers
+        # Worker pools of the file based simulators, keyed by the simulator's name and started on first use.
+        self._worker_pools: dict[str, SimulatorWorkerPool] = {}
+
+        self.http_options = http_options if http_options is not None else HTTPSimulatorOptions()
+        # Sessions of the simulators served over HTTP(S), keyed by the simulator's name and opened on first use.
+        self._http_clients: dict[str, HTTPSimulatorClient] = {}
+
+        self.executor = executor
+        # Wall-clock time in seconds spent on each source of function values during the latest call to
+        # `evaluate`, keyed by "analytical", "simulator:{name}" and "surrogate:{symbol}". Replaced as a whole
+        # once a call is done, so that with concurrent calls it holds the timings of the call that finished last.
+        self.timings: dict[str, float] = {}
+
+        self.cache = cache
+        # Computed on first use, as hashing the problem is only needed for caching.
+        self._problem_digest: str | None = None
+
+        self.surrogate_mmap_mode = surrogate_mmap_mode
         self.surrogates = {}
+        # The files the surrogate models were loaded from, keyed by symbol, to tell apart retrained models in the cache.
+        self._surrogate_files: dict[str, Path] = {}
         if surrogate_paths is not None:
             self._load_surrogates(surrogate_paths)
         else:
@@ -147,13 +339,36 @@ class SimulatorEvaluator:
             if len(missing_surrogates) > 0:
                 raise EvaluatorError(f"Some surrogates missing: {missing_surrogates}.")
 
-    def _evaluate_simulator(self, xs: dict[str, list[int | float]]) -> pl.DataFrame:
+        self._parse_functions()
+
+    def _parse_functions(self):
+        """Parse the scalarization functions and the analytical and data-based functions of the problem.
+
+        The functions are parsed once, and the parsed functions are reused on every call to `evaluate`.
+        """
+        if self.problem.scalarization_funcs is not None:
+            parser = MathParser()
+            self.scalarization_funcs = [
+                (func.symbol, parser.parse(func.func))
+                for func in self.problem.scalarization_funcs
+                if func.symbol is not None
+            ]
+        else:
+            self.scalarization_funcs = []
+
+        if len(self.analytical_symbols + self.data_based_symbols) > 0:
+            self.polars_evaluator = PolarsEvaluator(self.problem, evaluator_mode=PolarsEvaluatorModesEnum.mixed)
+        else:
+            self.polars_evaluator = None
+
+    def _evaluate_simulator(self, xs: dict[str, list[int | float]] | pl.DataFrame) -> pl.DataFrame:
         """Evaluate the problem for the given decision variables using the problem's simulators.
 
         Args:
-            xs (dict[str, list[int | float]]): The decision variables for which the functions are to be evaluated.
-                Given as a dictionary with the decision variable symbols as keys and a list of decision variable values
-                as the values. The length of the lists is the number of samples and each list should have the same
+            xs (dict[str, list[int | float]] | pl.DataFrame): The decision variables for which the functions are to be
+                evaluated. Given as a dictionary with the decision variable symbols as keys and a list of decision
+                variable values as the values, or as a polars dataframe with the decision variable symbols as the
+                column names. The length of the lists is the number of samples and each list should have the same
                 length (same number of samples).
 
         Returns:
@@ -162,44 +377,122 @@ class SimulatorEvaluator:
                 and the length of the columns is the number of samples. Will return those objective, constraint and
                 extra function values that are gained from simulators listed in the problem object.
         """
-        res_df = pl.DataFrame()
+        values, self.timings = self._run_sources(self._simulator_sources(xs))
+        return self._add_derived_columns(_hstack_all(values))
+
+    def _simulator_sources(self, xs: dict[str, list[int | float]] | pl.DataFrame) -> list[_Source]:
+        """Gather the calls that evaluate each of the problem's simulators.
+
+        Args:
+            xs (dict[str, list[int | float]] | pl.DataFrame): The decision variables, as in `_evaluate_simulator`.
+
+        Returns:
+            list[_Source]: one source per simulator, to be passed to `_run_sources`.
+        """
+        xs_df = xs if isinstance(xs, pl.DataFrame) else pl.DataFrame(xs)
+        sources = []
         for sim in self.simulators:
-            # gather the possible parameters for the simulator
-            params = self.params.get(sim.name, {})
-            if sim.file is not None:
-                # call the simulator with the decision variable values and parameters as dicts
-                res = subprocess.run(  # noqa: PLW1510, S603
-                    [sys.executable, sim.file, "-d", str(xs), "-p", str(params)], capture_output=True, text=True
-                )
-                if res.returncode == 0:
-                    # gather the simulation results (a dict) into the results dataframe
-                    res_df = _safe_hstack(res_df, pl.DataFrame(json.loads(res.stdout)))
-                else:
-                    raise EvaluatorError(res.stderr)
-            elif sim.url is not None:
-                # call the endpoint
-                try:
-                    if isinstance(xs, pl.DataFrame):
-                        # if xs is a polars dataframe, convert it to a dict
-                        xs = xs.to_dict(as_series=False)
-                    scheme = urlparse(sim.url.url).scheme
-                    if scheme in supported_schemes:
-                        # desdeo
-                        res = _external_resolver.evaluate(sim.url.url, params, xs)
-                        res_df = _safe_hstack(res_df, pl.DataFrame(res))
-                        # parse res
-                    else:
-                        # http, https, etc...
-                        res = requests.get(
-                            sim.url.url, auth=sim.url.auth, json={"d": xs, "p": params}, timeout=sim.url.timeout
-                        )
-                        res.raise_for_status()  # raise an error if the request failed
-                        res_df = _safe_hstack(res_df, pl.DataFrame(res.json()))
-                except requests.RequestException as e:
-                    raise EvaluatorError(
-                        f"Failed to call the simulator at {sim.url}. Is the simulator server running?"
-                    ) from e
+            namespace = None
+            if self.cache is not None:
+                namespace = self._cache_namespace("simulator", sim.model_dump_json(), self.params.get(sim.name, {}))
+            sources.append((f"simulator:{sim.name}", namespace, partial(self._simulator_call, sim), xs_df))
+        return sources
+
+    def _simulator_call(self, sim: Simulator) -> Callable[[pl.DataFrame], pl.DataFrame]:
+        """Build the function that calls a single simulator, starting its workers or session on first use.
+
+        Args:
+            sim (Simulator): the simulator.
+
+        Returns:
+            Callable[[pl.DataFrame], pl.DataFrame]: `_call_simulator` with everything but the decision variables
+                given. The workers and the sessions of this process are left out if the simulator is called on a
+                `ProcessPoolExecutor`, as they cannot be sent to other processes.
+        """
+        resources = {}
+        if not isinstance(self.executor, ProcessPoolExecutor):
+            if sim.file is not None and self.simulator_workers is not None:
+                resources["worker_pool"] = self._worker_pool(sim)
+            elif sim.file is None and urlparse(sim.url.url).scheme not in supported_schemes:
+                resources["http_client"] = self._http_client(sim)
+        return partial(_call_simulator, sim, self.params.get(sim.name, {}), http_options=self.http_options, **resources)
+
+    def _cache_namespace(self, kind: str, identity: str, params: dict | None = None) -> str:
+        """Build the namespace under which the results of a single simulator or surrogate model are cached.
+
+        Args:
+            kind (str): "simulator" or "surrogate".
+            identity (str): identifies the simulator or surrogate model, e.g., its definition or the path and
+                modification time of the model file.
+            params (dict | None, optional): the parameters the simulator is called with. Defaults to None.
+
+        Returns:
+            str: the namespace, which changes whenever the problem, the source or its parameters change.
+        """
+        if self._problem_digest is None:
+            self._problem_digest = hashlib.sha256(self.problem.model_dump_json().encode()).hexdigest()
+        params_json = json.dumps(params or {}, sort_keys=True, default=str)
+        return f"{self._problem_digest}|{kind}|{identity}|{params_json}"
+
+    def _http_client(self, sim: Simulator) -> HTTPSimulatorClient:
+        """Return the client of a simulator served over HTTP(S), opening its session on first use.
+
+        Args:
+            sim (Simulator): the simulator.
+
+        Returns:
+            HTTPSimulatorClient: the client that keeps the connections to the simulator open.
+        """
+        if sim.name not in self._http_clients:
+            self._http_clients[sim.name] = HTTPSimulatorClient(sim.url, self.http_options)
+        return self._http_clients[sim.name]
+
+    def _run_sources(self, sources: list[_Source]) -> tuple[list[pl.DataFrame], dict[str, float]]:
+        """Evaluate independent sources of function values.
 
+        The cache, if there is one, is consulted in this process, and only the decision vectors missing from it
+        are evaluated: on `self.executor` if one was given, and one after another otherwise.
+
+        Args:
+            sources (list[_Source]): the sources, as returned by `_simulator_sources` and `_surrogate_sources`.
+
+        Returns:
+            tuple[list[pl.DataFrame], dict[str, float]]: the columns of each source, in the order of `sources`, and
+                the time in seconds spent evaluating each source, keyed by the name of the source.
+        """
+        pending = [
+            self.cache.lookup(namespace, xs) if namespace is not None and xs.height > 0 else None
+            for _, namespace, _, xs in sources
+        ]
+        calls = []
+        for (_, _, make_call, xs), lookup in zip(sources, pending, strict=True):
+            if lookup is None:
+                calls.append((make_call(), xs))
+            else:
+                calls.append((make_call(), lookup.to_evaluate(xs)) if lookup.n_missing > 0 else None)
+
+        if self.executor is None:
+            results = [_timed(*call) if call is not None else (None, 0.0) for call in calls]
+        else:
+            futures = [self.executor.submit(_timed, *call) if call is not None else None for call in calls]
+            results = [future.result() if future is not None else (None, 0.0) for future in futures]
+
+        values = [
+            result if lookup is None else self.cache.complete(lookup, result)
+            for (result, _), lookup in zip(results, pending, strict=True)
+        ]
+        timings = {name: elapsed for (name, *_), (_, elapsed) in zip(sources, results, strict=True)}
+        return values, timings
+
+    def _add_derived_columns(self, res_df: pl.DataFrame) -> pl.DataFrame:
+        """Add the minimization forms of the objectives and the scalarization functions to evaluated values.
+
+        Args:
+            res_df (pl.DataFrame): the values of the objectives, constraints and extra functions.
+
+        Returns:
+            pl.DataFrame: `res_df` with the derived columns appended.
+        """
         # Evaluate the minimization form of the objective functions
         min_obj_columns = pl.DataFrame()
         for symbol, min_max_mult in self.objective_mix_max_mult:
@@ -213,13 +506,72 @@ class SimulatorEvaluator:
         scalarization_columns = res_df.select(*[expr.alias(symbol) for symbol, expr in self.scalarization_funcs])
         return res_df.hstack(scalarization_columns)
 
-    def _evaluate_surrogates(self, xs: dict[str, list[int | float]]) -> pl.DataFrame:
+    def _worker_pool(self, sim: Simulator) -> SimulatorWorkerPool:
+        """Return the worker pool of a file based simulator, starting the workers on first use.
+
+        Args:
+            sim (Simulator): the simulator.
+
+        Returns:
+            SimulatorWorkerPool: the pool of workers that have the simulator file loaded.
+        """
+        if sim.name not in self._worker_pools:
+            self._worker_pools[sim.name] = SimulatorWorkerPool(sim.file, n_workers=self.simulator_workers)
+        return self._worker_pools[sim.name]
+
+    def close(self):
+        """Stop the persistent simulator workers and close the connections to simulator servers, if any were opened.
+
+        The evaluator can still be used afterwards, in which case the workers and connections are opened again.
+        """
+        for pool in self._worker_pools.values():
+            pool.close()
+        self._worker_pools = {}
+        for client in self._http_clients.values():
+            client.close()
+        self._http_clients = {}
+
+    def __getstate__(self) -> dict:
+        """Pickle the evaluator without its executor, simulator workers, connections, cache and parsed functions.
+
+        The executor, the workers, the connections and the cache belong to the process the evaluator was created
+        in and cannot be pickled. A copy of the evaluator unpickled in another process runs the file based
+        simulators as a new process for every batch, opens a new session to each simulator server it calls, and
+        caches nothing. The parsed functions are parsed again.
+
+        Returns:
+            dict: the picklable state of the evaluator.
+        """
+        state = self.__dict__.copy()
+        state.update(executor=None, simulator_workers=None, _worker_pools={}, _http_clients={}, cache=None)
+        del state["scalarization_funcs"], state["polars_evaluator"]
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore a pickled evaluator, parsing its functions again.
+
+        Args:
+            state (dict): the state returned by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        self._parse_functions()
+
+    def __enter__(self):
+        """Use the evaluator as a context manager that calls `close` on exit."""
+        return self
+
+    def __exit__(self, *_):
+        """Stop the simulator workers and close the connections to simulator servers."""
+        self.close()
+
+    def _evaluate_surrogates(self, xs: dict[str, list[int | float]] | pl.DataFrame) -> pl.DataFrame:
         """Evaluate the problem for the given decision variables using the surrogate models.
 
         Args:
-            xs (dict[str, list[int | float]]): The decision variables for which the functions are to be evaluated.
-                Given as a dictionary with the decision variable symbols as keys and a list of decision variable values
-                as the values. The length of the lists is the number of samples and each list should have the same
+            xs (dict[str, list[int | float]] | pl.DataFrame): The decision variables for which the functions are to be
+                evaluated. Given as a dictionary with the decision variable symbols as keys and a list of decision
+                variable values as the values, or as a polars dataframe with the decision variable symbols as the
+                column names. The length of the lists is the number of samples and each list should have the same
                 length (same number of samples).
 
         Returns:
@@ -227,113 +579,118 @@ class SimulatorEvaluator:
                 dataframe. The uncertainty prediction values are also returned. If a model does not provide
                 uncertainty predictions, then they are set as NaN.
         """
-        res = pl.DataFrame()
-        var = np.array([value for _, value in xs.items()]).T  # has to be transpose (at least for sklearn models)
+        values, self.timings = self._run_sources(self._surrogate_sources(xs))
+        return self._add_derived_columns(_hstack_all(values))
+
+    def _surrogate_sources(self, xs: dict[str, list[int | float]] | pl.DataFrame) -> list[_Source]:
+        """Gather the calls that evaluate each of the surrogate models.
+
+        Args:
+            xs (dict[str, list[int | float]] | pl.DataFrame): The decision variables, as in `_evaluate_surrogates`.
+
+        Returns:
+            list[_Source]: one source per surrogate model, to be passed to `_run_sources`.
+        """
+        xs_df = xs if isinstance(xs, pl.DataFrame) else pl.DataFrame(xs)
+        sources = []
         for symbol in self.surrogates:
-            # get a list of args accepted by the model's predict function
-            accepted_args = getfullargspec(self.surrogates[symbol].predict).args
-            # if "return_std" accepted, gather the uncertainty predictions as well
-            if "return_std" in accepted_args:
-                value, uncertainty = self.surrogates[symbol].predict(var, return_std=True)
-            # otherwise, set the uncertainties as NaN
-            else:
-                value = self.surrogates[symbol].predict(var)
-                uncertainty = np.full(np.shape(value), np.nan)
-            # add the objects, constraints and extra functions into the polars dataframe
-            # values go into columns with the symbol as the column names
-            res = res.with_columns(pl.Series(value).alias(symbol))
-            # uncertainties go into columns with {symbol}_uncert as the column names
-            res = res.with_columns(pl.Series(uncertainty).alias(f"{symbol}_uncert"))
+            namespace = None
+            if self.cache is not None:
+                path = self._surrogate_files.get(symbol)
+                # a retrained model saved over the old one gets a new modification time, and thus a namespace of its own
+                identity = f"{symbol}|{path}|{path.stat().st_mtime_ns}" if path is not None else symbol
+                namespace = self._cache_namespace("surrogate", identity)
+            sources.append((f"surrogate:{symbol}", namespace, partial(self._surrogate_call, symbol), xs_df))
+        return sources
+
+    def _surrogate_call(self, symbol: str) -> Callable[[pl.DataFrame], pl.DataFrame]:
+        """Build the function that predicts the values of a single function with its surrogate model.
 
-        # Evaluate the minimization form of the objective functions
-        min_obj_columns = pl.DataFrame()
-        for symbol, min_max_mult in self.objective_mix_max_mult:
-            if symbol in res.columns:
-                min_obj_columns = _safe_hstack(
-                    min_obj_columns, res.select((min_max_mult * pl.col(f"{symbol}")).alias(f"{symbol}_min"))
-                )
-        res_df = res.hstack(min_obj_columns)
-        # If there are scalarization functions, evaluate them as well
-        scalarization_columns = res_df.select(*[expr.alias(symbol) for symbol, expr in self.scalarization_funcs])
-        return res_df.hstack(scalarization_columns)
+        Args:
+            symbol (str): the symbol of the objective, constraint or extra function.
+
+        Returns:
+            Callable[[pl.DataFrame], pl.DataFrame]: `_call_surrogate` with the model given or, if the model is
+                called on a `ProcessPoolExecutor`, `_call_surrogate_file` with the file of the model given, so
+                that the workers load the model once instead of being sent a copy of it with every batch.
+        """
+        path = self._surrogate_files.get(symbol)
+        if isinstance(self.executor, ProcessPoolExecutor) and path is not None:
+            return partial(_call_surrogate_file, path, self.surrogate_mmap_mode, symbol)
+        return partial(_call_surrogate, self.surrogates[symbol], symbol)
 
     def _load_surrogates(self, surrogate_paths: dict[str, Path] | None = None):
         """Load the surrogate models from disk and store them within the evaluator.
 
         This is used during initialization of the evaluator or when the analyst wants to replace the current surrogate
-        models with other models. However if a new model is trained after initialization of the evaluator, the problem
-        JSON should be updated with the new model paths and the evaluator should be re-initialized. This can happen
-        with any solver that does model management.
+        models with other models. The models are loaded through the process-wide registry in
+        `desdeo.problem.surrogate_registry`, so that each model file is read from disk only once per process, and
+        again only if the file has been modified since. A model retrained and saved over its old file is thus picked
+        up by evaluators created afterwards, but the problem JSON should still be updated if the new model is saved
+        to a different path.
 
         Args:
             surrogate_paths (dict[str, Path]): A dictionary where the keys are the names of the objectives, constraints
                 and extra functions and the values are the paths to the surrogate models saved on disk. The names of
                 the objectives should match the names of the objectives in the problem JSON. At the moment the supported
-                file format is .skops (through skops.io). TODO: if skops.io used, should be added to pyproject.toml.
+                file format is that of joblib. TODO: support .skops (through skops.io) as well, and add it to
+                pyproject.toml.
         """
-        if surrogate_paths is not None:
-            for symbol in surrogate_paths:
-                with Path.open(f"{surrogate_paths[symbol]}", "rb") as file:
-                    self.surrogates[symbol] = joblib.load(file)
-                    """unknown_types = sio.get_untrusted_types(file=file)
-                    if len(unknown_types) == 0:
-                        self.surrogates[symbol] = sio.load(file, unknown_types)
-                    else: # TODO: if there are unknown types they should be checked
-                        self.surrogates[symbol] = sio.load(file, unknown_types)
-                        #raise EvaluatorError(f"Untrusted types found in the model of {obj.symbol}: {unknown_types}")"""
-        else:
+        if surrogate_paths is None:
             # check each surrogate based objective, constraint and extra function for surrogate path
-            for obj in self.problem.objectives:
-                if obj.surrogates is not None:
-                    with Path.open(f"{obj.surrogates[0]}", "rb") as file:
-                        self.surrogates[obj.symbol] = joblib.load(file)
-            for con in self.problem.constraints or []:  # if there are no constraints, an empty list is used
-                if con.surrogates is not None:
-                    with Path.open(f"{con.surrogates[0]}", "rb") as file:
-                        self.surrogates[con.symbol] = joblib.load(file)
-            for extra in self.problem.extra_funcs or []:  # if there are no extra functions, an empty list is used
-                if extra.surrogates is not None:
-                    with Path.open(f"{extra.surrogates[0]}", "rb") as file:
-                        self.surrogates[extra.symbol] = joblib.load(file)
-
-    def evaluate(self, xs: dict[str, list[int | float]], flat: bool = False) -> pl.DataFrame:
+            # if there are no constraints or extra functions, empty lists are used
+            funcs = [*self.problem.objectives, *(self.problem.constraints or []), *(self.problem.extra_funcs or [])]
+            surrogate_paths = {func.symbol: func.surrogates[0] for func in funcs if func.surrogates is not None}
+
+        for symbol, path in surrogate_paths.items():
+            self.surrogates[symbol] = load_surrogate(path, mmap_mode=self.surrogate_mmap_mode)
+            self._surrogate_files[symbol] = Path(path)
+
+    def evaluate(self, xs: dict[str, list[int | float]] | pl.DataFrame, flat: bool = False) -> pl.DataFrame:
         """Evaluate the functions for the given decision variables.
 
         Evaluates analytical, simulation based and surrogate based functions. For now, the evaluator assumes that there
         are no data based objectives.
 
         Args:
-            xs (dict[str, list[int | float]]): The decision variables for which the functions are to be evaluated.
-                Given as a dictionary with the decision variable symbols as keys and a list of decision variable values
-                as the values. The length of the lists is the number of samples and each list should have the same
+            xs (dict[str, list[int | float]] | pl.DataFrame): The decision variables for which the functions are to be
+                evaluated. Given as a dictionary with the decision variable symbols as keys and a list of decision
+                variable values as the values, or as a polars dataframe with the decision variable symbols as the
+                column names. The length of the lists is the number of samples and each list should have the same
                 length (same number of samples).
             flat (bool, optional): whether the valuation is done using flattened variables or not. Defaults to False.
 
         Returns:
             pl.DataFrame: polars dataframe with the evaluated function values.
         """
-        # TODO (@gialmisi): Make work with polars dataframes as well in addition to dict.
-        # See, e.g., PolarsEvaluator._polars_evaluate. Then, remove the arg `flat`.
         res = pl.DataFrame()
+        timings = {}
 
         # Evaluate the analytical functions
-        if len(self.analytical_symbols + self.data_based_symbols) > 0:
-            polars_evaluator = PolarsEvaluator(self.problem, evaluator_mode=PolarsEvaluatorModesEnum.mixed)
-            analytical_values = (
-                polars_evaluator._polars_evaluate(xs) if not flat else polars_evaluator._polars_evaluate_flat(xs)
+        if self.polars_evaluator is not None:
+            analytical_values, timings["analytical"] = _timed(
+                self.polars_evaluator._polars_evaluate if not flat else self.polars_evaluator._polars_evaluate_flat, xs
             )
             # polars >=1.41 rejects hstack onto a 0-height frame, so seed res from the first
             # result instead of an empty DataFrame.
             res = analytical_values if res.width == 0 else res.hstack(analytical_values)
 
+        # The simulators and surrogate models are independent of each other, so they are all dispatched
+        # together, and only joined once every one of them is done.
+        simulator_sources = self._simulator_sources(xs) if len(self.simulator_symbols) > 0 else []
+        surrogate_sources = self._surrogate_sources(xs) if len(self.surrogate_symbols) > 0 else []
+        values, source_timings = self._run_sources(simulator_sources + surrogate_sources)
+        timings.update(source_timings)
+        self.timings = timings
+
         # Evaluate the simulator based functions
         if len(self.simulator_symbols) > 0:
-            simulator_values = self._evaluate_simulator(xs)
+            simulator_values = self._add_derived_columns(_hstack_all(values[: len(simulator_sources)]))
             res = simulator_values if res.width == 0 else res.hstack(simulator_values)
 
         # Evaluate the surrogate based functions
         if len(self.surrogate_symbols) > 0:
-            surrogate_values = self._evaluate_surrogates(xs)
+            surrogate_values = self._add_derived_columns(_hstack_all(values[len(simulator_sources) :]))
             res = surrogate_values if res.width == 0 else res.hstack(surrogate_values)
 
         # Check that everything is evaluated
@@ -0,0 +1,168 @@
+"""Clients for simulators that are called over the network.
+
+A `SimulatorEvaluator` keeps one `HTTPSimulatorClient` per URL based simulator. The client holds a
+`requests.Session`, so that the connection (and the TLS handshake) to a simulator is reused across
+batches instead of being set up anew for every batch. Failed requests are retried with an exponential
+backoff. Large batches can be split into chunks that are sent concurrently.
+
+The batches are exchanged as JSON by default. A simulator whose `Url.wire_format` is "arrow" instead
+exchanges them as compressed Arrow IPC streams: the request body holds the decision variables, the
+parameters are sent as JSON in the `X-Simulator-Params` header, and the response body holds the
+function values.
+"""
+
+import io
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+import requests
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from desdeo.problem.schema import Url
+
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+"""The content type of Arrow IPC request and response bodies."""
+
+PARAMS_HEADER = "X-Simulator-Params"
+"""The header the parameters of a simulator are sent in when batches are exchanged as Arrow IPC."""
+
+
+class HTTPSimulatorOptions(BaseModel):
+    """Defines how batches are sent to simulators that are called over the network."""
+
+    chunk_size: int | None = Field(
+        description="The largest number of samples sent in a single request. If None, batches are not split.",
+        default=None,
+        gt=0,
+    )
+    """The largest number of samples sent in a single request. If None, batches are not split. Defaults to None."""
+
+    max_in_flight: int = Field(
+        description="The largest number of chunks of a batch that are waiting for a response at the same time.",
+        default=4,
+        gt=0,
+    )
+    """The largest number of chunks of a batch that are waiting for a response at the same time. Defaults to 4."""
+
+    retries: int = Field(
+        description="The number of times a failed request (connection error or a 429, 502, 503 or 504) is retried.",
+        default=3,
+        ge=0,
+    )
+    """The number of times a failed request (connection error or a 429, 502, 503 or 504) is retried. Defaults to 3."""
+
+    backoff_factor: float = Field(
+        description="The base of the exponential backoff between retries, in seconds.",
+        default=0.5,
+        ge=0,
+    )
+    """The base of the exponential backoff between retries, in seconds. The n-th retry waits
+    `backoff_factor * 2 ** (n - 1)` seconds. Defaults to 0.5."""
+
+
+def to_arrow_stream(df: pl.DataFrame) -> bytes:
+    """Serialize a DataFrame to a compressed Arrow IPC stream."""
+    buffer = io.BytesIO()
+    df.write_ipc_stream(buffer, compression="zstd")
+    return buffer.getvalue()
+
+
+def from_arrow_stream(payload: bytes) -> pl.DataFrame:
+    """Deserialize a DataFrame from an Arrow IPC stream."""
+    return pl.read_ipc_stream(io.BytesIO(payload))
+
+
+def evaluate_in_chunks(
+    evaluate: Callable[[pl.DataFrame], pl.DataFrame], xs: pl.DataFrame, options: HTTPSimulatorOptions
+) -> pl.DataFrame:
+    """Evaluate a batch in chunks, with up to `options.max_in_flight` chunks being evaluated at once.
+
+    Args:
+        evaluate (Callable[[pl.DataFrame], pl.DataFrame]): evaluates a single chunk of decision variables.
+        xs (pl.DataFrame): the decision variables, one row per sample.
+        options (HTTPSimulatorOptions): the chunk size and the number of concurrent chunks.
+
+    Returns:
+        pl.DataFrame: the results of every chunk, stacked in the original row order.
+    """
+    if options.chunk_size is None or xs.height <= options.chunk_size:
+        return evaluate(xs)
+
+    chunks = [xs.slice(offset, options.chunk_size) for offset in range(0, xs.height, options.chunk_size)]
+    with ThreadPoolExecutor(max_workers=min(options.max_in_flight, len(chunks))) as executor:
+        return pl.concat(list(executor.map(evaluate, chunks)))
+
+
+class HTTPSimulatorClient:
+    """A client with a pooled, keep-alive connection to a simulator served over HTTP(S)."""
+
+    def __init__(self, url: Url, options: HTTPSimulatorOptions | None = None):
+        """Create the session used to call the simulator.
+
+        Args:
+            url (Url): the URL of the simulator, with its authentication, timeout and wire format.
+            options (HTTPSimulatorOptions | None, optional): how batches are sent to the simulator. If None,
+                the defaults of `HTTPSimulatorOptions` are used. Defaults to None.
+        """
+        self.url = url
+        self.options = options if options is not None else HTTPSimulatorOptions()
+
+        retry = Retry(
+            total=self.options.retries,
+            backoff_factor=self.options.backoff_factor,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=None,  # the simulator is called with GET, but retry POST based variants as well
+            raise_on_status=False,
+        )
+        # Every chunk in flight needs a connection of its own.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.options.max_in_flight, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.auth = url.auth
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def evaluate(self, xs: pl.DataFrame, params: dict) -> pl.DataFrame:
+        """Evaluate a batch of decision variables with the simulator.
+
+        Args:
+            xs (pl.DataFrame): the decision variables, one column per variable and one row per sample.
+            params (dict): the parameters of the simulator.
+
+        Raises:
+            requests.RequestException: the simulator could not be called, or it returned an error.
+
+        Returns:
+            pl.DataFrame: the values returned by the simulator, one row per sample.
+        """
+        return evaluate_in_chunks(lambda chunk: self._evaluate_chunk(chunk, params), xs, self.options)
+
+    def _evaluate_chunk(self, xs: pl.DataFrame, params: dict) -> pl.DataFrame:
+        """Send a single request to the simulator."""
+        if self.url.wire_format == "arrow":
+            res = self.session.get(
+                self.url.url,
+                data=to_arrow_stream(xs),
+                headers={
+                    "Content-Type": ARROW_CONTENT_TYPE,
+                    "Accept": ARROW_CONTENT_TYPE,
+                    PARAMS_HEADER: json.dumps(params),
+                },
+                timeout=self.url.timeout,
+            )
+            res.raise_for_status()  # raise an error if the request failed
+            return from_arrow_stream(res.content)
+
+        res = self.session.get(
+            self.url.url, json={"d": xs.to_dict(as_series=False), "p": params}, timeout=self.url.timeout
+        )
+        res.raise_for_status()  # raise an error if the request failed
+        return pl.DataFrame(res.json())
+
+    def close(self):
+        """Close the pooled connections."""
+        self.session.close()
@@ -0,0 +1,286 @@
+"""Persistent worker processes for file based simulators.
+
+By default, `SimulatorEvaluator` runs a simulator file as a fresh Python process for every batch of
+decision variables, passing the batch on the command line. For cheap simulators, the cost of starting
+the interpreter and importing the simulator's dependencies dominates, and large batches run into the
+operating system's limit on the length of the argument list.
+
+The classes here instead keep a simulator file loaded in one or more long-lived worker processes. The
+evaluator and the workers talk over the workers' stdin and stdout using length-prefixed frames: a JSON
+header followed by the batch as a polars DataFrame in Arrow IPC format. The same file acts as the
+worker program, run as `python simulator_worker.py <simulator file>`, so that a worker does not import
+the rest of DESDEO.
+
+To be run in a worker, a simulator file must define a module level function
+`simulator(xs: dict, params: dict) -> dict`, taking the decision variables and parameters as dicts of
+lists and returning the function values as a dict of lists. The file's `if __name__ == "__main__":`
+block is not executed in a worker.
+"""
+
+import io
+import json
+import math
+import runpy
+import struct
+import subprocess
+import sys
+import threading
+import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+import polars as pl
+
+# Frames are prefixed with their length as an unsigned 64 bit big endian integer.
+_FRAME_HEADER = struct.Struct(">Q")
+
+
+class SimulatorWorkerError(Exception):
+    """Error raised when a simulator worker fails to start or to evaluate a batch."""
+
+
+def _write_frame(stream: BinaryIO, payload: bytes):
+    """Write a single length-prefixed frame to a binary stream."""
+    stream.write(_FRAME_HEADER.pack(len(payload)))
+    stream.write(payload)
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes | None:
+    """Read exactly `size` bytes from a binary stream, or return None if the stream ends first."""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_frame(stream: BinaryIO) -> bytes | None:
+    """Read a single length-prefixed frame from a binary stream, or return None at the end of the stream."""
+    header = _read_exactly(stream, _FRAME_HEADER.size)
+    if header is None:
+        return None
+    (size,) = _FRAME_HEADER.unpack(header)
+    return _read_exactly(stream, size) if size > 0 else b""
+
+
+def _to_ipc(df: pl.DataFrame) -> bytes:
+    """Serialize a DataFrame to Arrow IPC bytes."""
+    buffer = io.BytesIO()
+    df.write_ipc(buffer)
+    return buffer.getvalue()
+
+
+def _from_ipc(payload: bytes) -> pl.DataFrame:
+    """Deserialize a DataFrame from Arrow IPC bytes."""
+    return pl.read_ipc(io.BytesIO(payload))
+
+
+class _SimulatorWorker:
+    """A single worker process with a simulator file loaded into it."""
+
+    def __init__(self, file: Path):
+        """Start the worker process and wait until it has loaded the simulator file.
+
+        Args:
+            file (Path): path to the simulator file.
+
+        Raises:
+            SimulatorWorkerError: the simulator file could not be loaded.
+        """
+        # The worker's stderr is inherited, so that whatever the simulator logs stays visible and
+        # an unread pipe can never fill up and block the worker.
+        self.process = subprocess.Popen(  # noqa: S603
+            [sys.executable, str(Path(__file__).resolve()), str(file)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.lock = threading.Lock()
+        try:
+            self._check_reply(self._read_reply())
+        except SimulatorWorkerError:
+            _shutdown(self.process)
+            raise
+
+    def _read_reply(self) -> dict:
+        """Read the JSON header of a reply from the worker."""
+        reply = _read_frame(self.process.stdout)
+        if reply is None:
+            raise SimulatorWorkerError(f"The simulator worker exited unexpectedly with code {self.process.wait()}.")
+        return json.loads(reply)
+
+    def _check_reply(self, reply: dict):
+        """Raise the error reported by the worker, if any."""
+        if not reply.get("ok", False):
+            raise SimulatorWorkerError(reply.get("error", "The simulator worker reported an unknown error."))
+
+    def evaluate(self, xs: pl.DataFrame, params: dict) -> pl.DataFrame:
+        """Evaluate a batch of decision variables in the worker.
+
+        Args:
+            xs (pl.DataFrame): the decision variables, one column per variable.
+            params (dict): the parameters of the simulator.
+
+        Returns:
+            pl.DataFrame: the values returned by the simulator.
+        """
+        with self.lock:
+            try:
+                _write_frame(self.process.stdin, json.dumps({"params": params}).encode())
+                _write_frame(self.process.stdin, _to_ipc(xs))
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                raise SimulatorWorkerError(
+                    f"The simulator worker exited unexpectedly with code {self.process.poll()}."
+                ) from e
+
+            self._check_reply(self._read_reply())
+            payload = _read_frame(self.process.stdout)
+            if payload is None:
+                raise SimulatorWorkerError(f"The simulator worker exited unexpectedly with code {self.process.wait()}.")
+            return _from_ipc(payload)
+
+    def close(self):
+        """Ask the worker to exit and wait for it, killing it if it does not comply."""
+        _shutdown(self.process)
+
+
+def _shutdown(process: subprocess.Popen, timeout: float = 5.0):
+    """Stop a worker process by closing its stdin, killing it if it does not exit in time."""
+    if process.poll() is not None:
+        return
+    try:
+        process.stdin.close()
+        process.wait(timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        process.kill()
+        process.wait()
+
+
+class SimulatorWorkerPool:
+    """A pool of persistent worker processes that all have the same simulator file loaded.
+
+    A batch is split into contiguous chunks, one per worker, that are evaluated concurrently. The
+    results are stacked back together in the original row order.
+    """
+
+    def __init__(self, file: Path | str, n_workers: int = 1):
+        """Start the worker processes.
+
+        Args:
+            file (Path | str): path to the simulator file. The file must define a module level
+                function `simulator(xs: dict, params: dict) -> dict`.
+            n_workers (int, optional): the number of worker processes. Defaults to 1.
+
+        Raises:
+            SimulatorWorkerError: the number of workers is not positive, or the simulator file could not
+                be loaded.
+        """
+        if n_workers < 1:
+            raise SimulatorWorkerError(f"The number of simulator workers must be positive, got {n_workers}.")
+
+        self.file = Path(file)
+        self.workers: list[_SimulatorWorker] = []
+        self._executor = ThreadPoolExecutor(max_workers=n_workers) if n_workers > 1 else None
+        # The processes are stopped when the pool is closed, garbage collected, or at interpreter exit,
+        # whichever comes first.
+        self._finalizer = weakref.finalize(self, _close_workers, self.workers, self._executor)
+        try:
+            for _ in range(n_workers):
+                self.workers.append(_SimulatorWorker(self.file))
+        except Exception:
+            self.close()
+            raise
+
+    def evaluate(self, xs: pl.DataFrame, params: dict) -> pl.DataFrame:
+        """Evaluate a batch of decision variables using the workers.
+
+        Args:
+            xs (pl.DataFrame): the decision variables, one column per variable and one row per sample.
+            params (dict): the parameters of the simulator. Must be serializable to JSON.
+
+        Returns:
+            pl.DataFrame: the values returned by the simulator, one row per sample.
+        """
+        if not self._finalizer.alive:
+            raise SimulatorWorkerError("The simulator worker pool has been closed.")
+
+        chunk_size = max(1, math.ceil(xs.height / len(self.workers)))
+        chunks = [xs.slice(offset, chunk_size) for offset in range(0, max(xs.height, 1), chunk_size)]
+
+        if self._executor is None or len(chunks) == 1:
+            return pl.concat([self.workers[0].evaluate(chunk, params) for chunk in chunks])
+
+        futures = [
+            self._executor.submit(worker.evaluate, chunk, params)
+            for worker, chunk in zip(self.workers, chunks, strict=False)
+        ]
+        return pl.concat([future.result() for future in futures])
+
+    def close(self):
+        """Stop the worker processes."""
+        self._finalizer()
+
+    def __enter__(self):
+        """Use the pool as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *_):
+        """Close the pool."""
+        self.close()
+
+
+def _close_workers(workers: list[_SimulatorWorker], executor: ThreadPoolExecutor | None):
+    """Stop every worker of a pool. Kept outside of the class so that the finalizer holds no reference to it."""
+    if executor is not None:
+        executor.shutdown(wait=True)
+    for worker in workers:
+        worker.close()
+
+
+def _serve(file: str):
+    """Load a simulator file and evaluate the batches sent over stdin until it is closed.
+
+    Args:
+        file (str): path to the simulator file.
+    """
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    # Anything the simulator prints would corrupt the frames, so route it to stderr instead.
+    sys.stdout = sys.stderr
+
+    # Resolve the simulator's own imports as if the file had been run directly.
+    sys.path[0] = str(Path(file).resolve().parent)
+
+    try:
+        simulator = runpy.run_path(file, run_name="__desdeo_simulator__")["simulator"]
+    except Exception:
+        _write_frame(stdout, json.dumps({"ok": False, "error": traceback.format_exc()}).encode())
+        stdout.flush()
+        return
+    _write_frame(stdout, json.dumps({"ok": True}).encode())
+    stdout.flush()
+
+    while (header := _read_frame(stdin)) is not None:
+        params = json.loads(header)["params"]
+        payload = _read_frame(stdin)
+        if payload is None:
+            return
+        try:
+            xs = _from_ipc(payload).to_dict(as_series=False)
+            result = _to_ipc(pl.DataFrame(simulator(xs, params)))
+        except Exception:
+            _write_frame(stdout, json.dumps({"ok": False, "error": traceback.format_exc()}).encode())
+        else:
+            _write_frame(stdout, json.dumps({"ok": True}).encode())
+            _write_frame(stdout, result)
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    _serve(sys.argv[1])
@@ -0,0 +1,84 @@
+"""A process-wide registry of the surrogate models loaded from disk.
+
+Loading a surrogate model can take seconds for large models, e.g., Gaussian processes that hold their
+training data, and a `SimulatorEvaluator` is often created anew for every request in the API. The
+registry loads each model file once per process and hands the same model to every evaluator after
+that. A file is loaded again only when its modification time changes, i.e., when a retrained model is
+saved over it.
+
+The models in the registry are shared, so they must be treated as read-only; predicting with them is
+fine, refitting them is not. Models loaded before a process forks are shared with the child
+processes, e.g., the workers of an EMO method. When they are loaded with `mmap_mode="r"`, the NumPy
+arrays inside the models are memory-mapped from the file instead of being read into memory, so that
+the pages are shared by every process that maps them and only the parts that are used are read.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Literal
+
+import joblib
+
+MmapMode = Literal["r", "r+", "w+", "c"]
+"""The modes in which joblib can memory-map the NumPy arrays of a model."""
+
+# Loaded models keyed by the resolved path of their file, with the modification time and the mmap mode
+# of the file when it was loaded.
+_registry: dict[Path, tuple[int, MmapMode | None, Any]] = {}
+_registry_lock = threading.Lock()
+# One lock per file, so that a large model is loaded only once even if it is asked for from several
+# threads at the same time, without blocking the loading of other files.
+_file_locks: dict[Path, threading.Lock] = {}
+
+
+def load_surrogate(path: Path | str, mmap_mode: MmapMode | None = None) -> Any:
+    """Load a surrogate model saved with joblib, or return it from the registry if it has been loaded already.
+
+    Args:
+        path (Path | str): path to the file the model was saved in with `joblib.dump`.
+        mmap_mode (MmapMode | None, optional): if given, the NumPy arrays of the model are memory-mapped from
+            the file in this mode instead of being read into memory. Only arrays that were dumped uncompressed can
+            be memory-mapped. A model loaded with a different mode is loaded again. Defaults to None.
+
+    Returns:
+        Any: the model.
+    """
+    resolved = Path(path).resolve()
+    with _registry_lock:
+        file_lock = _file_locks.setdefault(resolved, threading.Lock())
+
+    with file_lock:
+        mtime = resolved.stat().st_mtime_ns
+        entry = _registry.get(resolved)
+        if entry is not None and entry[0] == mtime and entry[1] == mmap_mode:
+            return entry[2]
+
+        model = joblib.load(resolved, mmap_mode=mmap_mode)
+        _registry[resolved] = (mtime, mmap_mode, model)
+        return model
+
+
+def loaded_surrogates() -> list[Path]:
+    """List the files of the surrogate models currently held in the registry.
+
+    Returns:
+        list[Path]: the resolved paths of the files.
+    """
+    with _registry_lock:
+        return list(_registry)
+
+
+def clear_surrogate_registry(path: Path | str | None = None):
+    """Drop models from the registry, so that they are loaded again on next use.
+
+    Evaluators that already hold a model keep using it.
+
+    Args:
+        path (Path | str | None, optional): the file of the model to drop. If None, every model is dropped.
+            Defaults to None.
+    """
+    with _registry_lock:
+        if path is None:
+            _registry.clear()
+        else:
+            _registry.pop(Path(path).resolve(), None)
@@ -1,15 +1,16 @@
 """Server utilities for serving benchmark test problems."""
 
 # A FastAPI server to expose pymoo benchmark problems
-from typing import Any
+from typing import Any, Literal
 
 import polars as pl
 import requests
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from pydantic import BaseModel
 from pymoo.problems import get_problem
 
 from desdeo.problem.schema import Objective, Problem, Simulator, Url, Variable
+from desdeo.problem.simulator_http import ARROW_CONTENT_TYPE, PARAMS_HEADER, from_arrow_stream, to_arrow_stream
 
 
 class PymooParameters(BaseModel):
@@ -41,17 +42,32 @@ def get_pymoo_problem(p: PymooParameters):
     return get_problem(**params)
 
 
+def _evaluate_batch(xs_df: pl.DataFrame, p: PymooParameters) -> pl.DataFrame:
+    """Evaluate a pymoo problem instance, returning the input values along with the objective values."""
+    problem = get_pymoo_problem(p)
+
+    output = problem.evaluate(xs_df.to_numpy())
+    output_df = pl.DataFrame(output, schema=[f"f_{i + 1}" for i in range(problem.n_obj)])
+
+    return xs_df.hstack(output_df)
+
+
 @app.get("/evaluate")
 def evaluate(d: dict[str, list[float]], p: PymooParameters) -> dict[str, Any]:
     """Evaluate a pymoo problem instance with given parameters and input values."""
-    problem = get_pymoo_problem(p)
+    return _evaluate_batch(pl.DataFrame(d), p).to_dict(as_series=False)
 
-    xs_df = pl.DataFrame(d)
 
-    output = problem.evaluate(xs_df.to_numpy())
-    output_df = pl.DataFrame(output, schema=[f"f_{i + 1}" for i in range(problem.n_obj)])
+@app.get("/evaluate/arrow")
+async def evaluate_arrow(request: Request) -> Response:
+    """Evaluate a pymoo problem instance with input values and results exchanged as Arrow IPC streams.
+
+    The parameters are given as JSON in the `X-Simulator-Params` header.
+    """
+    p = PymooParameters.model_validate_json(request.headers[PARAMS_HEADER])
+    xs_df = from_arrow_stream(await request.body())
 
-    return d | output_df.to_dict(as_series=False)
+    return Response(content=to_arrow_stream(_evaluate_batch(xs_df, p)), media_type=ARROW_CONTENT_TYPE)
 
 
 @app.get("/info")
@@ -71,8 +87,17 @@ url = "http://127.0.0.1"
 port = 8000
 
 
-def server_problem(parameters: PymooParameters) -> Problem:
-    """Create a Problem instance from pymoo parameters."""
+def server_problem(parameters: PymooParameters, wire_format: Literal["json", "arrow"] = "json") -> Problem:
+    """Create a Problem instance from pymoo parameters.
+
+    Args:
+        parameters (PymooParameters): the pymoo problem to serve.
+        wire_format (Literal["json", "arrow"], optional): the format the batches are exchanged with the server in.
+            Defaults to "json".
+
+    Returns:
+        Problem: a problem whose objectives are evaluated by the server.
+    """
     try:
         info = requests.get(url + f":{port}/info", json=parameters.model_dump(), timeout=30)
         info.raise_for_status()
@@ -80,7 +105,10 @@ def server_problem(parameters: PymooParameters) -> Problem:
         raise RuntimeError("Failed to fetch problem info. Is the server running?") from e
     info: ProblemInfo = ProblemInfo.model_validate(info.json())
 
-    simulator_url = Url(url=f"{url}:{port}/evaluate")
+    simulator_url = Url(
+        url=f"{url}:{port}/evaluate" if wire_format == "json" else f"{url}:{port}/evaluate/arrow",
+        wire_format=wire_format,
+    )
 
     return Problem(
         name=parameters.name,
@@ -69,6 +69,7 @@ __all__ = [
     "guess_best_solver",
     "payoff_table_method",
     "solve_all_scenarios",
+    "solve_scalarized_problems",
     "solve_scenario",
 ]
 
@@ -147,4 +148,5 @@ from desdeo.tools.utils import (
     get_corrected_ideal_and_nadir,
     guess_best_solver,
     payoff_table_method,
+    solve_scalarized_problems,
 )
@@ -52,38 +52,166 @@ def non_dominated(data: np.ndarray) -> np.ndarray:
 
 
 @njit()
-def fast_non_dominated_sort(data: np.ndarray) -> np.ndarray:
-    """Conduct fast non-dominated sorting on a population of solutions.
+def _two_objective_ranks(unique_sorted: np.ndarray) -> np.ndarray:
+    """Computes the front ranks of unique, lexicographically sorted, bi-objective solutions in O(n log n).
+
+    A solution can only be dominated by the solutions preceding it. Since the solutions are unique and sorted,
+    a preceding solution dominates the current one if its second objective is not worse. Each front is
+    therefore represented by the best second objective value of its members, which is increasing across
+    the fronts, and the front of a solution can be found by a binary search.
+
+    Args:
+        unique_sorted (np.ndarray): 2-D array of unique solutions with two objectives, sorted lexicographically.
+
+    Returns:
+        np.ndarray: the front rank of each solution, the first front having the rank 0.
+    """
+    num_solutions = len(unique_sorted)
+    ranks = np.zeros(num_solutions, dtype=np.int64)
+    front_best = np.empty(num_solutions, dtype=np.float64)
+    num_fronts = 0
+
+    for i in range(num_solutions):
+        # the first front whose best second objective value is worse than the solution's
+        rank = np.searchsorted(front_best[:num_fronts], unique_sorted[i, 1], side="right")
+        front_best[rank] = unique_sorted[i, 1]
+        if rank == num_fronts:
+            num_fronts += 1
+        ranks[i] = rank
+
+    return ranks
+
+
+@njit()
+def _efficient_non_dominated_ranks(data: np.ndarray, order: np.ndarray, n_survive: int) -> np.ndarray:
+    """Computes the front ranks of solutions with the efficient non-dominated sort (ENS-BS).
+
+    The solutions are visited in lexicographic order, so that a solution can only be dominated by the
+    solutions already assigned to a front. The front of each solution is found by a binary search over the
+    fronts, checking the members of a front from the most recently added one. Each front is stored as
+    a linked list, so the memory used is linear in the number of solutions.
+
+    Reference: Zhang, X., Tian, Y., Cheng, R., & Jin, Y. (2015). An efficient approach to nondominated
+    sorting for evolutionary multiobjective optimization. IEEE Transactions on Evolutionary Computation,
+    19(2), 201-213.
 
     Args:
         data (np.ndarray): 2-D array of solutions, with each row being a single solution.
+        order (np.ndarray): the indices of the solutions in lexicographic order.
+        n_survive (int): if positive, fronts that are not needed to cover the first `n_survive`
+            solutions are not computed.
 
     Returns:
-        np.ndarray: n x f boolean array. n is the number of solutions, f is the number of fronts.
-            The value of an array element is true if the corresponding solution id (column) belongs in
-            the corresponding front (row).
+        np.ndarray: the front rank of each solution, the first front having the rank 0. Solutions
+            in fronts that were not computed have the rank -1.
     """
     num_solutions = len(data)
-    indices = np.arange(num_solutions)
-    taken = np.zeros(num_solutions, dtype=np.bool_)
-    fronts = np.zeros((num_solutions, num_solutions), dtype=np.bool_)
+    ranks = np.full(num_solutions, -1, dtype=np.int64)
+    previous_in_front = np.full(num_solutions, -1, dtype=np.int64)
+    front_last = np.full(num_solutions, -1, dtype=np.int64)
+    front_sizes = np.zeros(num_solutions, dtype=np.int64)
+    num_fronts = 0
+    # the number of fronts needed to cover the first n_survive solutions, can only decrease
+    max_fronts = num_solutions
+
+    for i in order:
+        low, high = 0, min(num_fronts, max_fronts)
+        while low < high:
+            mid = (low + high) // 2
+            dominated = False
+            j = front_last[mid]
+            while j != -1:
+                if dominates(data[j], data[i]):
+                    dominated = True
+                    break
+                j = previous_in_front[j]
+            if dominated:
+                low = mid + 1
+            else:
+                high = mid
+
+        if low >= max_fronts:
+            # the solution is in a front that is not needed
+            continue
 
-    for i in indices:
-        current_front = non_dominated(data[~taken])
+        if low == num_fronts:
+            num_fronts += 1
+        ranks[i] = low
+        previous_in_front[i] = front_last[low]
+        front_last[low] = i
+        front_sizes[low] += 1
 
-        current_front_all = np.zeros(num_solutions, dtype=np.bool_)
-        current_front_all[~taken] = current_front
-        fronts[i] = current_front_all
+        if n_survive > 0:
+            covered = 0
+            for front in range(min(num_fronts, max_fronts)):
+                covered += front_sizes[front]
+                if covered >= n_survive:
+                    max_fronts = front + 1
+                    break
 
-        taken = taken + fronts[i]
-        if taken.all():
-            # if all the solutions have been sorted, stop
-            break
+    return ranks
 
-    return fronts[: i + 1]
 
+def non_dominated_sort_ranks(data: np.ndarray, n_survive: int | None = None) -> np.ndarray:
+    """Computes the non-dominated front rank of each solution in a population of solutions.
 
-def fast_non_dominated_sort_indices(data: np.ndarray) -> list[list[int]]:
+    The memory used is linear in the number of solutions. Bi-objective populations are sorted in
+    O(n log n) time, while populations with more objectives are sorted with the efficient
+    non-dominated sort.
+
+    Args:
+        data (np.ndarray): 2-D array of solutions, with each row being a single solution.
+        n_survive (int | None, optional): if given, only the fronts needed to cover at least the
+            first `n_survive` solutions are computed, i.e., the front containing the `n_survive`-th
+            solution is the last computed front. Defaults to None.
+
+    Returns:
+        np.ndarray: 1-D integer array with the front rank of each solution, the first
+            (non-dominated) front having the rank 0. Solutions that are not in the computed fronts
+            have the rank -1.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    num_solutions = len(data)
+
+    if num_solutions == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if data.shape[1] == 2:  # noqa: PLR2004
+        # duplicate solutions do not dominate each other and belong to the same front
+        unique_sorted, inverse = np.unique(data, axis=0, return_inverse=True)
+        ranks = _two_objective_ranks(unique_sorted)[inverse.reshape(-1)]
+    else:
+        order = np.lexsort(data.T[::-1])
+        ranks = _efficient_non_dominated_ranks(data, order, 0 if n_survive is None else n_survive)
+
+    if n_survive is not None and n_survive > 0:
+        # drop the fronts that are not needed to cover the first n_survive solutions
+        covered = np.cumsum(np.bincount(ranks[ranks >= 0]))
+        last_front = min(np.searchsorted(covered, n_survive), len(covered) - 1)
+        ranks[ranks > last_front] = -1
+
+    return ranks
+
+
+def fast_non_dominated_sort(data: np.ndarray, n_survive: int | None = None) -> np.ndarray:
+    """Conduct fast non-dominated sorting on a population of solutions.
+
+    Args:
+        data (np.ndarray): 2-D array of solutions, with each row being a single solution.
+        n_survive (int | None, optional): if given, only the fronts needed to cover at least the
+            first `n_survive` solutions are returned. See `non_dominated_sort_ranks`. Defaults to None.
+
+    Returns:
+        np.ndarray: f x n boolean array. n is the number of solutions, f is the number of fronts.
+            The value of an array element is true if the corresponding solution id (column) belongs in
+            the corresponding front (row).
+    """
+    ranks = non_dominated_sort_ranks(data, n_survive)
+
+    return ranks == np.arange(ranks.max() + 1)[:, None]
+
+
+def fast_non_dominated_sort_indices(data: np.ndarray, n_survive: int | None = None) -> list[list[int]]:
     """Conduct fast non-dominated sorting on a population of solutions.
 
     This function returns identical results as `fast_non_dominated_sort`, but in a different format.
@@ -91,14 +219,22 @@ def fast_non_dominated_sort_indices(data: np.ndarray) -> list[list[int]]:
 
     Args:
         data (np.ndarray): 2-D array of solutions, with each row being a single solution.
+        n_survive (int | None, optional): if given, only the fronts needed to cover at least the
+            first `n_survive` solutions are returned. See `non_dominated_sort_ranks`. Defaults to None.
 
     Returns:
         list[list[int]]: A list with f elements where f is the number of fronts in the data,
             arranged in ascending order. Each element is a list of the indices of solutions
             belonging to the corresponding front.
     """
-    fronts = fast_non_dominated_sort(data)
-    return [np.where(fronts[i])[0].tolist() for i in range(len(fronts))]
+    ranks = non_dominated_sort_ranks(data, n_survive)
+
+    # group the solution indices by their rank, stable sorting keeps the indices in ascending order
+    order = np.argsort(ranks, kind="stable")
+    order = order[ranks[order] >= 0]
+    splits = np.cumsum(np.bincount(ranks[order]))[:-1]
+
+    return [front.tolist() for front in np.split(order, splits)]
 
 
 @njit()
@@ -3,8 +3,12 @@
 These solvers can solve various scalarized problems of multiobjective optimization problems.
 """
 
+import os
+from collections import OrderedDict
 from collections.abc import Callable
 from enum import StrEnum
+from multiprocessing import get_context
+from multiprocessing.pool import Pool
 
 import numpy as np
 from pydantic import BaseModel, Field
@@ -31,6 +35,12 @@ class ScipyDeOptions(BaseModel):
     de_kwargs: dict | None = Field(
         description="Custom keyword arguments to be forwarded to `scipy.optimize.differential_evolution`.", default=None
     )
+    cache_size: int = Field(
+        description="The maximum number of evaluation results kept in the solver's evaluation cache. "
+        "If 0, nothing is cached.",
+        default=128,
+        ge=0,
+    )
 
 
 _default_scipy_de_options = ScipyDeOptions()
@@ -55,6 +65,12 @@ class ScipyMinimizeOptions(BaseModel):
     )
     tol: float | None = Field(description="Tolerance for termination.", default=None)
     additional_options: dict | None = Field(description="Additional solver options.", default=None)
+    cache_size: int = Field(
+        description="The maximum number of evaluation results kept in the solver's evaluation cache. "
+        "If 0, nothing is cached.",
+        default=128,
+        ge=0,
+    )
 
 
 _default_scipy_minimize_options = ScipyMinimizeOptions()
@@ -67,6 +83,99 @@ class EvalTargetEnum(StrEnum):
     constraint = "constraint"
 
 
+class ScipyEvaluationCache:
+    """A bounded LRU cache of the results of a PolarsEvaluator.
+
+    The results are keyed on the exact bytes of the decision variable values.
+    Scipy routines call the objective and the constraint functions (and their
+    finite difference approximations) at the same points, and with a shared
+    cache the problem is evaluated only once per point. The counters `hits`
+    and `misses` keep track of how often the cache was utilized.
+    """
+
+    def __init__(self, evaluator: PolarsEvaluator, maxsize: int = 128):
+        """Initializes the cache.
+
+        Args:
+            evaluator (PolarsEvaluator): the evaluator used to compute the results not found in the cache.
+            maxsize (int, optional): the maximum number of results kept in the cache. If 0,
+                nothing is cached. Defaults to 128.
+        """
+        self.evaluator = evaluator
+        self.maxsize = maxsize
+        # all the columns computed by the evaluator, except the variables
+        self.columns = evaluator.evaluation_columns
+        self.column_indices = {symbol: i for i, symbol in enumerate(self.columns)}
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+    def evaluate(self, xs: np.ndarray, targets: list[str]) -> np.ndarray:
+        """Evaluate the given points, or return the cached results.
+
+        Args:
+            xs (np.ndarray): a 2D float64 array with one decision variable vector per row.
+            targets (list[str]): the symbols of the columns to return.
+
+        Returns:
+            np.ndarray: an array of shape (n_points, len(targets)).
+        """
+        key = (xs.shape, xs.tobytes())
+        res = self._results.get(key)
+
+        if res is not None:
+            self.hits += 1
+            self._results.move_to_end(key)
+        else:
+            self.misses += 1
+            res = self.evaluator.evaluate_array(xs, self.columns)
+            if self.maxsize > 0:
+                self._results[key] = res
+                if len(self._results) > self.maxsize:
+                    # drop the least recently used result
+                    self._results.popitem(last=False)
+
+        return res[:, [self.column_indices[target] for target in targets]]
+
+    def clear(self):
+        """Empty the cache and reset the counters."""
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# The evaluator of a worker process of `ScipyDeSolver`, built once when the worker starts.
+_worker_evaluator: PolarsEvaluator | None = None
+
+
+def _initialize_worker(problem: Problem):
+    """Build the evaluator of a worker process."""
+    global _worker_evaluator  # noqa: PLW0603
+    _worker_evaluator = PolarsEvaluator(problem)
+
+
+def _evaluate_in_worker(xs: np.ndarray, columns: list[str]) -> np.ndarray:
+    """Evaluate a chunk of points with the evaluator of a worker process."""
+    return _worker_evaluator.evaluate_array(xs, columns)
+
+
+class _PoolEvaluator:
+    """Evaluates the points of a batch in the worker processes of a pool, one chunk of points per worker.
+
+    Only the points and the results are sent between the processes; each worker evaluates them
+    with the evaluator it built when it started, see `_initialize_worker`.
+    """
+
+    def __init__(self, evaluator: PolarsEvaluator, pool: Pool, n_workers: int):
+        self.evaluation_columns = evaluator.evaluation_columns
+        self.pool = pool
+        self.n_workers = n_workers
+
+    def evaluate_array(self, xs: np.ndarray, columns: list[str]) -> np.ndarray:
+        chunks = np.array_split(xs, min(self.n_workers, len(xs)))
+        return np.vstack(self.pool.starmap(_evaluate_in_worker, [(chunk, columns) for chunk in chunks]))
+
+
 def get_variable_bounds_pairs(problem: Problem) -> list[tuple[float | int, float | int]]:
     """Returns the variable bounds defined in a Problem as a list of tuples.
 
@@ -109,7 +218,9 @@ def set_initial_guess(problem: Problem) -> list[float | int]:
     return guesses
 
 
-def create_scipy_dict_constraints(problem: Problem, evaluator: PolarsEvaluator) -> dict:
+def create_scipy_dict_constraints(
+    problem: Problem, evaluator: PolarsEvaluator, cache: ScipyEvaluationCache | None = None
+) -> dict:
     """Creates a dict with scipy compatible constraints.
 
     It is assumed that there are constraints defined in problem.
@@ -117,20 +228,28 @@ def create_scipy_dict_constraints(problem: Problem, evaluator: PolarsEvaluator)
     Args:
         problem (Problem): the Problem with the constraints.
         evaluator (GenericEvaluator): the evaluator utilized to evaluate problem.
+        cache (ScipyEvaluationCache | None, optional): an evaluation cache shared by the constraints.
+            If None, a new cache is created. Defaults to None.
 
     Returns:
         dict: a dict with scipy compatible constraints.
     """
+    cache = ScipyEvaluationCache(evaluator) if cache is None else cache
+
     return [
         {
             "type": "ineq" if constraint.cons_type == ConstraintTypeEnum.LTE else "eq",
-            "fun": get_scipy_eval(problem, evaluator, constraint.symbol, eval_target=EvalTargetEnum.constraint),
+            "fun": get_scipy_eval(
+                problem, evaluator, constraint.symbol, eval_target=EvalTargetEnum.constraint, cache=cache
+            ),
         }
         for constraint in problem.constraints
     ]
 
 
-def create_scipy_object_constraints(problem: Problem, evaluator: PolarsEvaluator) -> list[NonlinearConstraint]:
+def create_scipy_object_constraints(
+    problem: Problem, evaluator: PolarsEvaluator, cache: ScipyEvaluationCache | None = None
+) -> list[NonlinearConstraint]:
     """Creates a list with scipy constraint object `NonLinearConstraints` used by some scipy routines.
 
     For more infor, see https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.NonlinearConstraint.html#scipy-optimize-nonlinearconstraint
@@ -139,26 +258,95 @@ def create_scipy_object_constraints(problem: Problem, evaluator: PolarsEvaluator
         problem (Problem): the problem with the original constraint to be utilized in creating the list of constraints.
         evaluator (GenericEvaluator): the evaluator corresponding to problem that can be used to evaluate
             the constraints.
+        cache (ScipyEvaluationCache | None, optional): an evaluation cache to be used when evaluating the constraints.
+            If None, a new cache is created. Defaults to None.
 
     Returns:
         list[NonlinearConstraint]: a list of scipy's NonLinearConstraint objects.
     """
     return NonlinearConstraint(
-        fun=get_scipy_eval(problem, evaluator, "", eval_target=EvalTargetEnum.constraint),
+        fun=get_scipy_eval(problem, evaluator, "", eval_target=EvalTargetEnum.constraint, cache=cache),
         lb=0,  # constraint value must be between 0 and inf, e.g., positive.
         ub=float("inf"),  # since in scipy, a constraint is respected when its value is positive. See scipy_eval.
     )
 
 
+class ScipyEval:
+    """A callable that evaluates a problem with a PolarsEvaluator for scipy routines.
+
+    Instances are picklable, so they can be used with scipy routines that distribute
+    the evaluations to worker processes, e.g., `differential_evolution` with `workers > 1`.
+    See `get_scipy_eval`.
+    """
+
+    def __init__(
+        self,
+        problem: Problem,
+        evaluator: PolarsEvaluator,
+        target: str,
+        eval_target: EvalTargetEnum,
+        cache: ScipyEvaluationCache | None = None,
+    ):
+        """Initializes the callable. See `get_scipy_eval` for the arguments."""
+        if eval_target not in list(EvalTargetEnum):
+            # non-existing eval_target
+            msg = f"'eval_target' = '{eval_target} not supported. Must be one of {list(EvalTargetEnum)}."
+            raise SolverError(msg)
+
+        self.evaluator = evaluator
+        self.cache = ScipyEvaluationCache(evaluator) if cache is None else cache
+        self.target = target
+        self.eval_target = eval_target
+        self.con_symbols = (
+            [constraint.symbol for constraint in problem.constraints] if problem.constraints is not None else []
+        )
+
+    def __call__(self, x: list[float | int]) -> list[float | int]:
+        """An evaluator to be used in scipy routines.
+
+        Args:
+            x (list[float  |  int]): an array like, such as a numpy array or list. Either a single
+                point with shape (n_variables,), or several points with shape (n_variables, n_points),
+                as passed by vectorized scipy routines.
+
+        Returns:
+            list[float | int]: an array like. For objectives, a scalar for a single point, or an
+                array with shape (n_points,). For constraints, an array with shape (n_constraints,) for
+                a single point, or an array with shape (n_constraints, n_points).
+        """
+        x = np.asarray(x, dtype=np.float64)
+        # the evaluator expects one point per row, all the points are evaluated at once
+        xs = x.reshape(1, -1) if x.ndim == 1 else x.T
+
+        if self.eval_target == EvalTargetEnum.objective:
+            # evaluata objective (scalarized)
+            res = self.cache.evaluate(xs, [self.target])[:, 0]
+
+            return res[0] if x.ndim == 1 else res
+
+        # evaluate constraint
+        # put the minus here because scipy expect positive constraints values when the constraint
+        # is respected. But in DESDEO, we define constraints s.t., a negative value means the constraint
+        # is recpected, therefore, it needs to be flipped here.
+        res = -self.cache.evaluate(xs, self.con_symbols)
+
+        # scipy expects the shape (n_constraints,) for a single point and (n_constraints, n_points) otherwise
+        return res[0] if x.ndim == 1 else res.T
+
+
 def get_scipy_eval(
     problem: Problem,
     evaluator: PolarsEvaluator,
     target: str,
     eval_target: EvalTargetEnum,
+    cache: ScipyEvaluationCache | None = None,
 ) -> Callable[[list[float | int]], list[float | int]]:
     """Wraps the problem and evaluator into a callable function that can be used by scipy routines.
 
     The returned function expects an array-like argument, such as a numpy array or list.
+    The argument may also be a 2D array with shape (n_variables, n_points), in which case
+    all the points are evaluated with a single call to the evaluator. The returned function
+    can be pickled.
 
     Args:
         problem (Problem): the problem being solved.
@@ -169,6 +357,12 @@ def get_scipy_eval(
             of the single-objective optimization problem being solved, e.g., a scalarization function
             defined in problem. If constraint, then the evalution is assumed to be about evaluating
             the constraints defined in problem.
+        cache (ScipyEvaluationCache | None, optional): the cache of evaluation results. Functions sharing
+            the same cache evaluate the problem only once for the same point. If None, a new cache is
+            created. Defaults to None.
+
+    Raises:
+        SolverError: when an invalid evaluator target is specified.
 
     Returns:
       Callable[[list[float | int]], list[float | int]]: a function that takes as its argument
@@ -181,50 +375,7 @@ def get_scipy_eval(
             constraint values, but this does not affect the constraint values computed
             for the true constraints.
     """
-
-    def scipy_eval(x: list[float | int]) -> list[float | int]:
-        """An evaluator to be used in scipy routines.
-
-        Args:
-            x (list[float  |  int]): an array like, such as a numpy array or list.append
-
-        Raises:
-            SolverError: when an invalid evaluator target is specified.
-
-        Returns:
-            list[float | int]: an array like.
-        """
-        # TODO: Consider caching the results of evaluator.evaluate
-        evalutor_args = {
-            problem.variables[i].symbol: [x[i]] if isinstance(x[i], float | int) else x[i]
-            for i in range(len(problem.variables))
-        }
-
-        if eval_target == EvalTargetEnum.objective:
-            evaluator_res = evaluator.evaluate(evalutor_args)
-
-            # evaluata objective (scalarized)
-            return evaluator_res.to_dict(as_series=False)[target]
-
-        if eval_target == EvalTargetEnum.constraint:
-            evaluator_df = evaluator.evaluate(evalutor_args)
-            # evaluate constraint
-            # put the minus here because scipy expect positive constraints values when the constraint
-            # is respected. But in DESDEO, we define constraints s.t., a negative value means the constraint
-            # is recpected, therefore, it needs to be flipped here.
-            con_symbols = [constraint.symbol for constraint in problem.constraints]
-            res_dict = evaluator_df[con_symbols].to_dict(as_series=False)
-
-            res = np.array([np.array(res_dict[symbol]) for symbol in con_symbols])
-
-            # squeeze important for minimization routines
-            return -np.squeeze(res, axis=-1) if res.shape[-1] == 1 else -res
-
-        # non-existing eval_target
-        msg = f"'eval_target' = '{eval_target} not supported. Must be one of {list(EvalTargetEnum)}."
-        raise SolverError(msg)
-
-    return scipy_eval
+    return ScipyEval(problem, evaluator, target, eval_target, cache=cache)
 
 
 def parse_scipy_optimization_result(
@@ -325,9 +476,11 @@ class ScipyMinimizeSolver(BaseSolver):
             self.initial_guess = set_initial_guess(problem)
 
         self.evaluator = PolarsEvaluator(problem)
+        # shared by the objective and the constraints, see `self.evaluation_cache.hits` and `.misses`
+        self.evaluation_cache = ScipyEvaluationCache(self.evaluator, maxsize=options.cache_size)
 
         self.constraints = (
-            create_scipy_dict_constraints(self.problem, self.evaluator)
+            create_scipy_dict_constraints(self.problem, self.evaluator, cache=self.evaluation_cache)
             if self.problem.constraints is not None
             else None
         )
@@ -346,7 +499,9 @@ class ScipyMinimizeSolver(BaseSolver):
         eval_target = f"{target}_min" if target in objective_symbols else target
 
         optimization_result: _ScipyOptimizeResult = _scipy_minimize(
-            get_scipy_eval(self.problem, self.evaluator, eval_target, EvalTargetEnum.objective),
+            get_scipy_eval(
+                self.problem, self.evaluator, eval_target, EvalTargetEnum.objective, cache=self.evaluation_cache
+            ),
             self.initial_guess,
             method=self.method,
             bounds=self.bounds,
@@ -376,6 +531,14 @@ class ScipyDeSolver(BaseSolver):
         Args:
             problem (Problem): the multiobjective optimization problem to be solved.
             options (ScipyDeOptions): Pydantic model containing arguments used by scipy DE solver.
+
+        Note:
+            By default, the whole population is evaluated with a single call to the evaluator
+            (`vectorized=True`), for both the objective and the constraints. Alternatively, the
+            evaluations can be distributed to worker processes by setting `workers` in `de_kwargs`
+            to an integer. The worker processes are spawned, and each builds its own evaluator once.
+            The population is then split into one chunk per worker, and the points not found in
+            `evaluation_cache` are evaluated in the workers.
         """
         initial_guess = options.initial_guess
         de_kwargs = options.de_kwargs
@@ -402,7 +565,7 @@ class ScipyDeSolver(BaseSolver):
                 "updating": "deferred",
                 "workers": 1,
                 "integrality": None,
-                "vectorized": True,  # the constraints for scipy_de need to be fixed first for this to work
+                "vectorized": True,  # the whole population is evaluated at once, ignored if workers != 1
             }
         self.de_kwargs = de_kwargs
 
@@ -417,8 +580,10 @@ class ScipyDeSolver(BaseSolver):
             self.initial_guess = initial_guess
 
         self.evaluator = PolarsEvaluator(problem)
+        # shared by the objective and the constraints, see `self.evaluation_cache.hits` and `.misses`
+        self.evaluation_cache = ScipyEvaluationCache(self.evaluator, maxsize=options.cache_size)
         self.constraints = (
-            create_scipy_object_constraints(self.problem, self.evaluator)
+            create_scipy_object_constraints(self.problem, self.evaluator, cache=self.evaluation_cache)
             if self.problem.constraints is not None
             else ()
         )
@@ -436,13 +601,37 @@ class ScipyDeSolver(BaseSolver):
         objective_symbols = {obj.symbol for obj in self.problem.objectives}
         eval_target = f"{target}_min" if target in objective_symbols else target
 
-        optimization_result: _ScipyOptimizeResult = _scipy_de(
-            get_scipy_eval(self.problem, self.evaluator, eval_target, EvalTargetEnum.objective),
-            bounds=self.bounds,
-            x0=self.initial_guess,
-            constraints=self.constraints,
-            **self.de_kwargs,
+        objective_eval = get_scipy_eval(
+            self.problem, self.evaluator, eval_target, EvalTargetEnum.objective, cache=self.evaluation_cache
         )
 
+        workers = self.de_kwargs.get("workers", 1)
+        if isinstance(workers, int) and workers != 1:
+            n_workers = os.cpu_count() if workers == -1 else workers
+            # polars is not fork-safe, so the worker processes are spawned instead of forked,
+            # which is what scipy would do with an integer number of workers.
+            with get_context("spawn").Pool(n_workers, initializer=_initialize_worker, initargs=(self.problem,)) as pool:
+                # scipy passes the whole population to the objective and the constraints, and the
+                # cache they share evaluates the points it has not seen in the workers
+                self.evaluation_cache.evaluator = _PoolEvaluator(self.evaluator, pool, n_workers)
+                try:
+                    optimization_result: _ScipyOptimizeResult = _scipy_de(
+                        objective_eval,
+                        bounds=self.bounds,
+                        x0=self.initial_guess,
+                        constraints=self.constraints,
+                        **{**self.de_kwargs, "workers": 1, "vectorized": True},
+                    )
+                finally:
+                    self.evaluation_cache.evaluator = self.evaluator
+        else:
+            optimization_result: _ScipyOptimizeResult = _scipy_de(
+                objective_eval,
+                bounds=self.bounds,
+                x0=self.initial_guess,
+                constraints=self.constraints,
+                **self.de_kwargs,
+            )
+
         # parse the results
         return parse_scipy_optimization_result(optimization_result, self.problem, self.evaluator)
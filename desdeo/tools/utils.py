@@ -1,7 +1,12 @@
 """General utilities related to solvers."""
 
+import hashlib
 import shutil
+import threading
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Executor, as_completed
 
 import numpy as np
 import polars as pl
@@ -9,13 +14,14 @@ import polars as pl
 from desdeo.problem import (
     ObjectiveTypeEnum,
     Problem,
+    Variable,
     VariableDimensionEnum,
     VariableDomainTypeEnum,
     numpy_array_to_objective_dict,
     variable_dimension_enumerate,
 )
 from desdeo.tools.cvxpy_solver_interfaces import CVXPYSolver, CVXPYSolverOptions, check_cvxpy_suitability
-from desdeo.tools.generics import BaseSolver
+from desdeo.tools.generics import BaseSolver, SolverOptions, SolverResults
 from desdeo.tools.gurobipy_solver_interfaces import GurobipySolver, PersistentGurobipySolver, check_gurobi_license
 from desdeo.tools.ng_solver_interfaces import NevergradGenericOptions, NevergradGenericSolver
 from desdeo.tools.proximal_solver import ProximalSolver
@@ -344,26 +350,214 @@ def flip_maximized_objective_values(problem: Problem, objective_values: dict[str
     }
 
 
-def payoff_table_method(problem: Problem, solver: BaseSolver = None) -> tuple[dict[str, float], dict[str, float]]:
+def _solve_scalarized_problem(
+    solver: BaseSolver, problem: Problem, target: str, solver_options: SolverOptions | None = None
+) -> SolverResults:
+    """Initializes a solver for a scalarized problem and solves it.
+
+    Defined on the module level so that it can be submitted to a process pool.
+    """
+    _solver = solver(problem, solver_options) if solver_options else solver(problem)
+
+    return _solver.solve(target)
+
+
+def solve_scalarized_problems(
+    problems: list[tuple[Problem, str]],
+    solver: BaseSolver,
+    solver_options: SolverOptions | None = None,
+    executor: Executor | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[SolverResults]:
+    """Solves a number of independent scalarized problems, optionally concurrently.
+
+    Which executor can be used depends on the solver:
+
+    - The solvers that run on Pyomo, e.g., `PyomoIpoptSolver`, `PyomoBonminSolver`, `PyomoCBCSolver`,
+      and `PyomoGurobiSolver`, must be run on a `ProcessPoolExecutor`. Pyomo is not thread-safe: the
+      temporary files it writes the models to the solver executables in are managed globally, so solves
+      in concurrent threads interfere with each other.
+    - `GurobipySolver` works with both kinds of executors. Each solver creates a model of its own, and
+      Gurobi releases the GIL while it solves, so a `ThreadPoolExecutor` is the cheaper choice.
+    - The SciPy, Nevergrad, proximal, and CVXPY solvers work with both kinds of executors. They run
+      mostly in Python, so only a `ProcessPoolExecutor` solves the problems in parallel.
+
+    With a `ProcessPoolExecutor`, the problems, the solver, and its options are pickled, so the solver
+    must be a class or a module-level function rather than, e.g., a lambda.
+
+    Args:
+        problems (list[tuple[Problem, str]]): the problems to be solved. Each element is a tuple
+            with a problem and the symbol of the scalarization function to be optimized in it.
+        solver (BaseSolver): the solver used to solve each of the problems.
+        solver_options (SolverOptions | None, optional): optional options passed to the `solver`.
+            Defaults to None.
+        executor (Executor | None, optional): an executor, e.g., a `ThreadPoolExecutor` or a
+            `ProcessPoolExecutor`, the problems are solved on. See above for which executors work with which
+            solvers. If None, the problems are solved sequentially. Defaults to None.
+        progress (Callable[[int, int], None] | None, optional): called in the calling thread each time a
+            problem has been solved, with the number of problems solved so far and the number of problems.
+            Defaults to None.
+
+    Returns:
+        list[SolverResults]: the results of solving each problem, in the same order as `problems`.
+    """
+    if executor is None:
+        results = []
+        for problem, target in problems:
+            results.append(_solve_scalarized_problem(solver, problem, target, solver_options))
+            if progress is not None:
+                progress(len(results), len(problems))
+        return results
+
+    futures = [
+        executor.submit(_solve_scalarized_problem, solver, problem, target, solver_options)
+        for problem, target in problems
+    ]
+
+    if progress is not None:
+        for n_solved, _future in enumerate(as_completed(futures), start=1):
+            progress(n_solved, len(futures))
+
+    return [future.result() for future in futures]
+
+
+# ideal and nadir points computed by `payoff_table_method`, keyed by the content hash of the problem and solver
+_PAYOFF_TABLE_CACHE_SIZE = 64
+_payoff_table_cache: OrderedDict[str, tuple[dict[str, float], dict[str, float]]] = OrderedDict()
+# guards the cache, which `payoff_table_method` may be called on from many threads at once
+_payoff_table_lock = threading.Lock()
+# content hashes of the problems seen so far, keyed by their ids, so that each problem is serialized only once
+_problem_digests: dict[int, tuple[weakref.ref, str]] = {}
+
+
+def _problem_digest(problem: Problem) -> str:
+    """Computes a hash of the contents of a problem, reusing the hash computed earlier for the same problem object.
+
+    Problems are immutable, so the contents of a problem object never change after it has been hashed.
+    """
+    problem_id = id(problem)
+    entry = _problem_digests.get(problem_id)
+    if entry is not None and entry[0]() is problem:
+        return entry[1]
+
+    digest = hashlib.sha256(problem.model_dump_json().encode()).hexdigest()
+
+    def _forget(ref: weakref.ref):
+        # the id may already belong to a newer problem
+        if _problem_digests.get(problem_id, (None,))[0] is ref:
+            _problem_digests.pop(problem_id, None)
+
+    _problem_digests[problem_id] = (weakref.ref(problem, _forget), digest)
+
+    return digest
+
+
+def _payoff_table_key(
+    problem: Problem, solver: BaseSolver, solver_options: SolverOptions | None, *, warm_start: bool
+) -> str | None:
+    """Computes a key for the payoff table cache based on the contents of the problem and the solver used.
+
+    Warm starting changes the points the solver starts from, and so, for nonconvex problems, the solutions
+    it finds. The executor, if any, only changes where the problems are solved, and is not a part of the key.
+
+    Only solver classes are named by their qualified names. Other callables, e.g., lambdas and closures
+    that create solvers with options of their own, may share a name while solving differently, so they
+    get no key, and their points are not cached.
+    """
+    if not isinstance(solver, type):
+        return None
+
+    solver_name = f"{solver.__module__}.{solver.__qualname__}"
+
+    return f"{_problem_digest(problem)}|{solver_name}|{solver_options!r}|{warm_start}"
+
+
+def _with_initial_values(problem: Problem, variable_values: dict) -> Problem:
+    """Returns a copy of the problem with the initial values of its (scalar) variables set to the given values."""
+    variables = [
+        var.model_copy(update={"initial_value": variable_values[var.symbol]})
+        if isinstance(var, Variable) and var.symbol in variable_values
+        else var
+        for var in problem.variables
+    ]
+
+    return problem.model_copy(update={"variables": variables})
+
+
+def payoff_table_method(
+    problem: Problem,
+    solver: BaseSolver = None,
+    solver_options: SolverOptions | None = None,
+    executor: Executor | None = None,
+    *,
+    warm_start: bool = False,
+    use_cache: bool = True,
+) -> tuple[dict[str, float], dict[str, float]]:
     """Solves a representation for the ideal and nadir points for a multiobjective optimization problem.
 
+    The computed points are cached based on the contents of the problem, the solver (and its options), and
+    whether warm starting is used, so that repeated calls with the same problem return the points without
+    solving anything. The cache is safe to use from many threads; concurrent calls with the same problem may,
+    however, each solve it before the first of them has stored its points.
+
     Args:
         problem (Problem): The problem for which the ideal and nadir are solved.
         solver (BaseSolver): The solver to be used in solving the points. Defaults to None.
+        solver_options (SolverOptions | None, optional): optional options passed to the `solver`.
+            Defaults to None.
+        executor (Executor | None, optional): an executor, e.g., a `ThreadPoolExecutor` or a
+            `ProcessPoolExecutor`, used to solve the single-objective problems concurrently.
+            If None, the problems are solved sequentially. Defaults to None.
+        warm_start (bool, optional): whether the optimal variable values of each single-objective
+            problem are used as the initial values of the next one. Only scalar variables are warm started.
+            Ignored when an `executor` is given. Defaults to False.
+        use_cache (bool, optional): whether previously computed points are reused (and newly computed
+            ones stored). Points solved with a `solver` that is not a class, e.g., a lambda, are never
+            cached. Defaults to True.
 
     Returns:
         tuple[dict[str, float], dict[str, float]]: The estimated ideal and nadir points.
     """
     solver = solver if solver is not None else guess_best_solver(problem)
-    solver = solver(problem)
+
+    # warm starting is ignored when the problems are solved on an executor
+    key = (
+        _payoff_table_key(problem, solver, solver_options, warm_start=warm_start and executor is None)
+        if use_cache
+        else None
+    )
+
+    if key is not None:
+        with _payoff_table_lock:
+            cached = _payoff_table_cache.get(key)
+            if cached is not None:
+                _payoff_table_cache.move_to_end(key)
+        if cached is not None:
+            ideal, nadir = cached
+            return dict(ideal), dict(nadir)
+
+    targets = [f"{objective.symbol}_min" for objective in problem.objectives]
+
+    if executor is not None:
+        # the single-objective problems are independent of each other
+        results = solve_scalarized_problems([(problem, target) for target in targets], solver, solver_options, executor)
+    elif warm_start:
+        results = []
+        _problem = problem
+        for target in targets:
+            res = _solve_scalarized_problem(solver, _problem, target, solver_options)
+            results.append(res)
+            _problem = _with_initial_values(_problem, res.optimal_variables)
+    else:
+        _solver = solver(problem, solver_options) if solver_options else solver(problem)
+        results = [_solver.solve(target) for target in targets]
 
     k = len(problem.objectives)
     po_table = np.zeros((k, k))
 
     for i in range(k):
-        res = solver.solve(f"{problem.objectives[i].symbol}_min")
         for j in range(k):
-            po_table[i][j] = res.optimal_objectives[problem.objectives[j].symbol]
+            po_table[i][j] = results[i].optimal_objectives[problem.objectives[j].symbol]
 
     ideal = np.diag(po_table)
     nadir = []
@@ -373,7 +567,18 @@ def payoff_table_method(problem: Problem, solver: BaseSolver = None) -> tuple[di
             nadir.append(np.min(po_table.T[i]))
         else:
             nadir.append(np.max(po_table.T[i]))
-    return numpy_array_to_objective_dict(problem, ideal), numpy_array_to_objective_dict(problem, nadir)
+
+    ideal = numpy_array_to_objective_dict(problem, ideal)
+    nadir = numpy_array_to_objective_dict(problem, nadir)
+
+    if key is not None:
+        with _payoff_table_lock:
+            _payoff_table_cache[key] = (dict(ideal), dict(nadir))
+            _payoff_table_cache.move_to_end(key)
+            if len(_payoff_table_cache) > _PAYOFF_TABLE_CACHE_SIZE:
+                _payoff_table_cache.popitem(last=False)
+
+    return ideal, nadir
 
 
 def repair(lower_bounds: dict[str, float], upper_bounds: dict[str, float]) -> Callable[[pl.DataFrame], pl.DataFrame]:
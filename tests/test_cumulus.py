@@ -1,5 +1,7 @@
 """Tests related to the CUMULUS method."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import polars as pl
 import pytest
@@ -241,6 +243,50 @@ def test_solve_sub_problems_all_scalarizations(river_current):
         assert res.success
 
 
+@pytest.mark.cumulus
+def test_solve_sub_problems_executor(river_current):
+    """Solving the sub-problems on an executor should give the same results as solving them sequentially."""
+    problem, current = river_current
+    rp = {"f_1": -6.0, "f_5": 8.0}
+    scals = list(CumulusScalarization)
+
+    sequential_progress = []
+    sequential = solve_sub_problems(
+        problem,
+        current,
+        rp,
+        scals,
+        solver=ScipyMinimizeSolver,
+        progress=lambda done, total: sequential_progress.append((done, total)),
+    )
+
+    concurrent_progress = []
+    with ThreadPoolExecutor(max_workers=len(scals)) as executor:
+        concurrent = solve_sub_problems(
+            problem,
+            current,
+            rp,
+            scals,
+            solver=ScipyMinimizeSolver,
+            executor=executor,
+            progress=lambda done, total: concurrent_progress.append((done, total)),
+        )
+
+    # progress is reported once per solved sub-problem, either way
+    expected_progress = [(done, len(scals)) for done in range(1, len(scals) + 1)]
+    assert sequential_progress == expected_progress
+    assert concurrent_progress == expected_progress
+
+    assert list(concurrent.keys()) == list(sequential.keys())
+    for sf in scals:
+        assert concurrent[sf] is not None
+        assert concurrent[sf].success
+        for obj in problem.objectives:
+            assert concurrent[sf].optimal_objectives[obj.symbol] == pytest.approx(
+                sequential[sf].optimal_objectives[obj.symbol]
+            )
+
+
 @pytest.mark.cumulus
 def test_solve_sub_problems_partial_leaves_other_objectives_free(river_current):
     """Unconstrained objectives should differ between a partial and a full CUMULONIMBUS call.
@@ -47,6 +47,7 @@ from desdeo.emo.operators.selection import (
     ReferenceVectorOptions,
     RVEASelector,
     _nsga2_crowding_distance_assignment,
+    _rvea_selection,
 )
 from desdeo.emo.operators.termination import (
     CompositeTerminator,
@@ -55,6 +56,12 @@ from desdeo.emo.operators.termination import (
     MaxGenerationsTerminator,
 )
 from desdeo.emo.options.crossover import SimulatedBinaryCrossoverOptions
+from desdeo.emo.options.termination import (
+    CompositeTerminatorOptions,
+    ExternalCheckTerminatorOptions,
+    MaxGenerationsTerminatorOptions,
+    terminator_constructor,
+)
 from desdeo.problem import VariableDomainTypeEnum, VariableTypeEnum
 from desdeo.problem.testproblems import (
     dtlz2,
@@ -66,7 +73,8 @@ from desdeo.problem.testproblems import (
     simple_knapsack_vectors,
     simple_test_problem,
 )
-from desdeo.tools.message import EvaluatorMessageTopics, IntMessage, TerminatorMessageTopics
+from desdeo.tools.message import EvaluatorMessageTopics, IntMessage, PolarsDataFrameMessage, TerminatorMessageTopics
+from desdeo.tools.non_dominated_sorting import non_dominated
 from desdeo.tools.patterns import Publisher, Subscriber
 from desdeo.tools.utils import repair
 
@@ -177,6 +185,36 @@ def test_generation():
         assert outputs.shape == (10, n_obj * 2 + 1)
 
 
+@pytest.mark.ea
+def test_non_dominated_archive_incremental():
+    """Test that the incremental non-dominated archive keeps exactly the non-dominated solutions seen."""
+    problem = dtlz2(n_objectives=3, n_variables=5)
+    publisher = Publisher()
+    archive = NonDominatedArchive(problem=problem, publisher=publisher)
+
+    rng = np.random.default_rng(0)
+    batches = []
+    for generation in range(1, 21):
+        values = rng.random((30, 3)) + 1.0 / generation
+        batch = pl.DataFrame(
+            {"x": np.arange(30) + 30 * generation, **{f"f_{i + 1}_min": values[:, i] for i in range(3)}}
+        )
+        batches.append(batch)
+        archive.update(IntMessage(topic=TerminatorMessageTopics.GENERATION, value=generation, source="test"))
+        archive.update(
+            PolarsDataFrameMessage(topic=EvaluatorMessageTopics.VERBOSE_OUTPUTS, value=batch, source="test")
+        )
+
+    all_solutions = pl.concat(batches)
+    expected = all_solutions.filter(non_dominated(all_solutions[archive.targets].to_numpy()))
+
+    assert sorted(archive.solutions["x"].to_list()) == sorted(expected["x"].to_list())
+    assert "generation" in archive.solutions.columns
+
+    # materializing the solutions again does not change them
+    assert archive.solutions["x"].to_list() == archive.solutions["x"].to_list()
+
+
 @pytest.mark.ea
 def test_archives():
     """Test whether the archives work."""
@@ -214,12 +252,19 @@ def test_archives():
 
 
 @pytest.mark.ea
-def test_template1():
+def test_template1(monkeypatch):
     """Test whether creating an EA from components and a template works."""
     problem = dtlz2(n_objectives=3, n_variables=12)
     publisher = Publisher()
 
     evaluator = EMOEvaluator(problem=problem, publisher=publisher, verbosity=2)
+    n_closed = 0
+
+    def count_close():
+        nonlocal n_closed
+        n_closed += 1
+
+    monkeypatch.setattr(evaluator.simulator_evaluator, "close", count_close)
 
     generator = LHSGenerator(
         problem=problem, evaluator=evaluator, publisher=publisher, n_points=10, seed=0, verbosity=2
@@ -272,6 +317,8 @@ def test_template1():
     )
 
     assert results is not None
+    # the evaluator was closed once the run ended
+    assert n_closed == 1
 
     norm = non_dom_archive.solutions.with_columns(
         (pl.col("f_1") ** 2 + pl.col("f_2") ** 2 + pl.col("f_3") ** 2).sqrt().alias("norm")
@@ -1076,6 +1123,40 @@ def test_simulated_binary_crossover_defaults_to_the_truncated_variant():
     )
 
 
+@pytest.mark.ea
+@pytest.mark.parametrize("truncated", [True, False])
+def test_simulated_binary_crossover_pairs_are_independent(truncated: bool):
+    """Test that batching SBX over all pairs keeps each pair's offspring next to its parents.
+
+    Pair k is mated from rows 2k and 2k + 1, and its children must land in those same rows. With a
+    zero crossover probability every child is a copy of its own parent, whatever the batch size.
+    """
+    problem = dtlz2(n_objectives=3, n_variables=6)
+    symbols = [var.symbol for var in problem.get_flattened_variables()]
+    values = np.random.default_rng(0).uniform(0, 1, (40, len(symbols)))
+    parents = pl.DataFrame(values, schema=symbols)
+
+    crossover = SimulatedBinaryCrossover(
+        problem=problem, publisher=Publisher(), seed=0, verbosity=1, xover_probability=0.0, truncated=truncated
+    )
+    offspring = crossover.do(population=parents, to_mate=list(range(parents.height)))
+    npt.assert_allclose(offspring.to_numpy(), values)
+
+    # Offspring are reproducible for a given seed, and the batch does not leak between pairs: a pair
+    # of identical parents can only produce copies of them.
+    values[:2] = 0.5
+    parents = pl.DataFrame(values, schema=symbols)
+    results = [
+        SimulatedBinaryCrossover(problem=problem, publisher=Publisher(), seed=0, verbosity=1, truncated=truncated)
+        .do(population=parents, to_mate=list(range(parents.height)))
+        .to_numpy()
+        for _ in range(2)
+    ]
+    npt.assert_allclose(results[0], results[1])
+    npt.assert_allclose(results[0][:2], 0.5)
+    assert (results[0] >= 0.0).all() and (results[0] <= 1.0).all()
+
+
 @pytest.mark.ea
 def test_crossover_offspring_count_for_odd_mating_pools():
     """Every crossover operator must return exactly one offspring per mated parent."""
@@ -1436,6 +1517,54 @@ def test_mutation_provided_topics_match_state(mutation_class, domain: str, verbo
     assert {message.topic for message in mutation.state()} == set(mutation.provided_topics[verbosity])
 
 
+class _CountingGenerator:
+    """Wrap a numpy Generator and count how many times it is asked for random numbers."""
+
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+        self.calls = 0
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.rng, name)
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return attribute(*args, **kwargs)
+
+        return counted
+
+
+@pytest.mark.ea
+@pytest.mark.parametrize(
+    ("mutation_class", "domain"),
+    [(MPTMutation, "mixed"), (NonUniformMutation, "mixed"), (SelfAdaptiveGaussianMutation, "continuous")],
+)
+def test_mutation_is_batched_and_reproducible(mutation_class, domain: str):
+    """Test that mutating the population draws its random numbers in batches, not per individual.
+
+    The number of draws from the generator is a proxy for the Python overhead of a generation:
+    it must not grow with the size of the population. The offspring must still be reproducible
+    for a given seed.
+    """
+    problem = _problem_for(domain)
+
+    draws = []
+    for n_rows in (4, 40, 400):
+        population = _population(problem, n_rows)
+        mutation = mutation_class(problem=problem, publisher=Publisher(), seed=0, verbosity=1, mutation_probability=0.5)
+        mutation.rng = _CountingGenerator(mutation.rng)
+
+        result = mutation.do(offsprings=population, parents=population)
+
+        assert result.shape == population.shape
+        draws.append(mutation.rng.calls)
+
+        again = mutation_class(problem=problem, publisher=Publisher(), seed=0, verbosity=1, mutation_probability=0.5)
+        npt.assert_allclose(again.do(offsprings=population, parents=population).to_numpy(), result.to_numpy())
+
+    assert len(set(draws)) == 1, f"{mutation_class.__name__} drew {draws} batches for growing populations"
+
+
 @pytest.mark.ea
 def test_non_uniform_mutation():
     """Test whether the Non-Uniform mutation operator works as intended."""
@@ -2021,6 +2150,18 @@ def test_external_terminator():
 
     assert term.current_generation == 51
 
+    # the check can also be given through the options of a (composite) terminator
+    stop = False
+    options = CompositeTerminatorOptions(
+        terminators=[MaxGenerationsTerminatorOptions(max_generations=1000), ExternalCheckTerminatorOptions()]
+    )
+    composite = terminator_constructor(options, Publisher(), external_check=lambda: stop)
+
+    assert isinstance(composite.terminators[1], ExternalCheckTerminator)
+    assert not composite.check()
+    stop = True
+    assert composite.check()
+
 
 @pytest.mark.ea
 def test_nsga2_selection():
@@ -2179,3 +2320,34 @@ def test_nsga2_crowding():
     assert all(distances[1:4] == np.inf)
     assert distances[0] < np.inf
     assert distances[-1] < np.inf
+
+
+@pytest.mark.ea
+def test_rvea_selection_apd():
+    """Test that RVEA selects the individual with the smallest APD for each reference vector."""
+    rng = np.random.default_rng(0)
+    fitness = rng.random((60, 3))
+    reference_vectors = rng.random((10, 3))
+    reference_vectors /= np.linalg.norm(reference_vectors, axis=1)[:, None]
+    ideal = np.zeros(3)
+    gamma = np.full(10, 0.3)
+
+    selection, apd = _rvea_selection(fitness, reference_vectors, ideal, 0.5, gamma)
+
+    # brute force over the solutions and reference vectors
+    norms = np.linalg.norm(fitness, axis=1)
+    cosines = np.array([[np.dot(f, v) / n for v in reference_vectors] for f, n in zip(fitness, norms, strict=True)])
+    assignment = np.argmax(cosines, axis=1)
+    expected_apd = np.array(
+        [(1 + 0.5 * np.arccos(cosines[i, assignment[i]]) / gamma[assignment[i]]) * norms[i] for i in range(60)]
+    )
+    npt.assert_allclose(apd, expected_apd)
+
+    expected_selection = np.zeros(60, dtype=bool)
+    for j in range(10):
+        assigned = np.flatnonzero(assignment == j)
+        if len(assigned) > 0:
+            expected_selection[assigned[np.argmin(expected_apd[assigned])]] = True
+        else:
+            expected_selection[-1] = True
+    npt.assert_equal(selection, expected_selection)
@@ -4,6 +4,7 @@ import numpy as np
 import polars as pl
 import pytest
 
+from desdeo.mcdm import enautilus
 from desdeo.mcdm.enautilus import (
     ENautilusResult,
     calculate_closeness,
@@ -111,6 +112,41 @@ def test_calculate_lower_bounds():
     np.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.enautilus
+def test_calculate_lower_bounds_batch():
+    """Test that calculate_lower_bounds gives the same bounds for many intermediate points at once."""
+    rng = np.random.default_rng(0)
+    nd_points = rng.random((200, 3))
+    z_intermediates = rng.random((5, 3)) * 0.5 + 0.5
+
+    result = calculate_lower_bounds(nd_points, z_intermediates)
+
+    assert result.shape == z_intermediates.shape
+    for z_intermediate, bounds in zip(z_intermediates, result, strict=True):
+        np.testing.assert_allclose(bounds, calculate_lower_bounds(nd_points, z_intermediate))
+
+    # no feasible points
+    np.testing.assert_array_equal(calculate_lower_bounds(nd_points, np.full(3, -1.0)), np.full(3, np.inf))
+
+
+@pytest.mark.enautilus
+def test_calculate_lower_bounds_chunked(monkeypatch):
+    """Test that calculate_lower_bounds gives the same bounds when the intermediate points are split in chunks."""
+    rng = np.random.default_rng(1)
+    nd_points = rng.random((200, 3))
+    z_intermediates = rng.random((7, 3)) * 0.5 + 0.5
+
+    expected = calculate_lower_bounds(nd_points, z_intermediates)
+
+    # room for two intermediate points per chunk
+    monkeypatch.setattr(enautilus, "_LOWER_BOUNDS_CHUNK_ELEMENTS", 2 * nd_points.size)
+    np.testing.assert_array_equal(calculate_lower_bounds(nd_points, z_intermediates), expected)
+
+    # less room than a single intermediate point needs still handles one point at a time
+    monkeypatch.setattr(enautilus, "_LOWER_BOUNDS_CHUNK_ELEMENTS", 1)
+    np.testing.assert_array_equal(calculate_lower_bounds(nd_points, z_intermediates), expected)
+
+
 @pytest.mark.enautilus
 def test_calculate_closeness():
     """Tests that the closeness is calculated correctly."""
@@ -1,5 +1,7 @@
 """Tests related to the GNIMBUS method."""
 
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import numpy.testing as npt
 import pytest
@@ -156,6 +158,43 @@ def test_voting_procedure():
     print(next_current_solution)
     """
 
+@pytest.mark.gnimbus
+def test_solve_group_sub_problems_executor():
+    """Test that solving the sub-problems on an executor gives the same solutions, in the same order."""
+    problem = dtlz2(5, 3)
+    solver_options = IpoptOptions()
+
+    initial_fs = {"f_1": 0.385, "f_2": 0.485, "f_3": 0.776}
+    dms_rps = {
+        "DM1": {"f_1": 0.35, "f_2": 0.485, "f_3": 1.0},
+        "DM2": {"f_1": 0.3, "f_2": 0.8, "f_3": 0.5},
+    }
+
+    sequential = solve_group_sub_problems(
+        problem, initial_fs, dms_rps, "learning", create_solver=PyomoIpoptSolver, solver_options=solver_options
+    )
+
+    # Pyomo is not thread-safe, so the Ipopt solves run in processes
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        concurrent = solve_group_sub_problems(
+            problem,
+            initial_fs,
+            dms_rps,
+            "learning",
+            create_solver=PyomoIpoptSolver,
+            solver_options=solver_options,
+            executor=executor,
+        )
+
+    assert len(concurrent) == len(sequential) == 4 + len(dms_rps)
+    for seq_solution, con_solution in zip(sequential, concurrent, strict=True):
+        assert con_solution.success
+        for obj in problem.objectives:
+            npt.assert_almost_equal(
+                con_solution.optimal_objectives[obj.symbol], seq_solution.optimal_objectives[obj.symbol]
+            )
+
+
 @pytest.mark.gnimbus
 @pytest.mark.slow
 def test_solve_sub_problems_nondiff():
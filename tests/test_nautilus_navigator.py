@@ -6,13 +6,25 @@ import pytest
 from fixtures import dtlz2_5x_3f_data_based  # noqa: F401
 
 from desdeo.mcdm.nautilus_navigator import (
+    ReachableBoundsSolver,
     calculate_distance_to_front,
     calculate_navigation_point,
+    navigator_all_steps,
+    navigator_init,
     solve_reachable_bounds,
     solve_reachable_solution,
 )
-from desdeo.problem import objective_dict_to_numpy_array
+from desdeo.problem import (
+    Constraint,
+    ConstraintTypeEnum,
+    Objective,
+    Problem,
+    Variable,
+    VariableTypeEnum,
+    objective_dict_to_numpy_array,
+)
 from desdeo.problem.testproblems import binh_and_korn, river_pollution_problem
+from desdeo.tools import GurobipySolver, PersistentGurobipySolver
 
 
 @pytest.mark.nautilus_navigator
@@ -195,6 +207,92 @@ def test_solve_reachable_bounds():
         assert upper_bounds[symbol] > lower_bounds[symbol]
 
 
+@pytest.mark.slow
+@pytest.mark.nautilus_navigator
+def test_reachable_bounds_solver_reuse():
+    """Test that a reused bounds solver gives the same bounds as solving the bounds from scratch."""
+    problem = binh_and_korn(maximize=(False, True))  # min max
+
+    bounds_solver = ReachableBoundsSolver(problem)
+
+    for nav_point in [{"f_1": 60.0, "f_2": -20.1}, {"f_1": 50.0, "f_2": -15.0}, {"f_1": 80.0, "f_2": -10.0}]:
+        lower_bounds, upper_bounds = solve_reachable_bounds(problem, nav_point, bounds_solver=bounds_solver)
+        lower_expected, upper_expected = solve_reachable_bounds(problem, nav_point)
+
+        for symbol in [objective.symbol for objective in problem.objectives]:
+            npt.assert_allclose(lower_bounds[symbol], lower_expected[symbol], atol=1e-3)
+            npt.assert_allclose(upper_bounds[symbol], upper_expected[symbol], atol=1e-3)
+
+
+def _linear_biobjective_problem() -> Problem:
+    """A linear problem whose Pareto front is the line x_1 + x_2 = 2, with one minimized and one maximized objective."""
+    return Problem(
+        name="Linear biobjective problem",
+        description="A small linear problem for testing the persistent reachable bounds solver.",
+        variables=[
+            Variable(name="x_1", symbol="x_1", variable_type=VariableTypeEnum.real, lowerbound=0, upperbound=4),
+            Variable(name="x_2", symbol="x_2", variable_type=VariableTypeEnum.real, lowerbound=0, upperbound=4),
+        ],
+        objectives=[
+            Objective(name="f_1", symbol="f_1", func="x_1", maximize=False, ideal=0, nadir=2, is_linear=True),
+            Objective(name="f_2", symbol="f_2", func="-x_2", maximize=True, ideal=0, nadir=-2, is_linear=True),
+        ],
+        constraints=[
+            Constraint(name="g_1", symbol="g_1", cons_type=ConstraintTypeEnum.LTE, func="2 - x_1 - x_2", is_linear=True)
+        ],
+        is_linear=True,
+        is_convex=True,
+        is_twice_differentiable=True,
+    )
+
+
+@pytest.mark.nautilus_navigator
+@pytest.mark.gurobipy
+def test_reachable_bounds_persistent_solver():
+    """Test that the persistent bounds solver builds its model once and matches the non-persistent bounds."""
+    problem = _linear_biobjective_problem()
+    n_models = 0
+
+    class CountingPersistentSolver(PersistentGurobipySolver):
+        def __init__(self, *args, **kwargs):
+            nonlocal n_models
+            n_models += 1
+            super().__init__(*args, **kwargs)
+
+    persistent_solver = ReachableBoundsSolver(problem, solver=CountingPersistentSolver)
+    rebuilding_solver = ReachableBoundsSolver(problem, solver=GurobipySolver)
+    assert persistent_solver.persistent
+    assert not rebuilding_solver.persistent
+
+    for nav_point in [{"f_1": 2.0, "f_2": -2.0}, {"f_1": 1.5, "f_2": -1.0}, {"f_1": 1.0, "f_2": -1.5}]:
+        lower_bounds, upper_bounds = persistent_solver.solve(nav_point)
+        lower_expected, upper_expected = rebuilding_solver.solve(nav_point)
+
+        for symbol in ["f_1", "f_2"]:
+            npt.assert_allclose(lower_bounds[symbol], lower_expected[symbol], atol=1e-6)
+            npt.assert_allclose(upper_bounds[symbol], upper_expected[symbol], atol=1e-6)
+
+    assert n_models == 1
+
+    # in navigation, the model of the bounds is built once for all the steps; the remaining model is that of the
+    # reachable solution, which is only solved on the first step
+    initial_response = navigator_init(problem, solver=GurobipySolver)
+    reference_point = {"f_1": 0.5, "f_2": -1.5}
+
+    n_models = 0
+    responses = navigator_all_steps(problem, 4, reference_point, [initial_response], solver=CountingPersistentSolver)
+    assert n_models == 2
+
+    expected_responses = navigator_all_steps(problem, 4, reference_point, [initial_response], solver=GurobipySolver)
+
+    for response, expected in zip(responses, expected_responses, strict=True):
+        for kind in ["lower_bounds", "upper_bounds"]:
+            for symbol in ["f_1", "f_2"]:
+                npt.assert_allclose(
+                    response.reachable_bounds[kind][symbol], expected.reachable_bounds[kind][symbol], atol=1e-6
+                )
+
+
 @pytest.mark.nautilus_navigator
 def test_solve_reachable_bounds_discrete(dtlz2_5x_3f_data_based):  # noqa: F811
     """Test the solving of reachable bounds with a discrete problem."""
@@ -1,5 +1,7 @@
 """Tests related to the Synchronous NIMBUS method."""
 
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import numpy.testing as npt
 import pytest
@@ -210,6 +212,44 @@ def test_solve_sub_problems():
         assert fs["f_3"] < initial_fs["f_3"]
 
 
+@pytest.mark.nimbus
+@pytest.mark.slow
+def test_solve_sub_problems_executor():
+    """Test that solving the sub-problems concurrently gives the same solutions in the same order."""
+    problem = dtlz2(8, 3)
+
+    solver_options = IpoptOptions()
+
+    current_fs = {"f_1": 0.4355, "f_2": 0.3355, "f_3": 0.8355}
+    rp = {"f_1": 0.6, "f_2": 0.3355, "f_3": 0.6}
+
+    num_desired = 4
+    sequential = solve_sub_problems(
+        problem, current_fs, rp, num_desired, solver=PyomoIpoptSolver, solver_options=solver_options
+    )
+
+    # Pyomo is not thread-safe, so the Ipopt solves run in processes
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        concurrent = solve_sub_problems(
+            problem,
+            current_fs,
+            rp,
+            num_desired,
+            solver=PyomoIpoptSolver,
+            solver_options=solver_options,
+            executor=executor,
+        )
+
+    assert len(concurrent) == num_desired
+
+    for seq_solution, con_solution in zip(sequential, concurrent, strict=True):
+        assert con_solution.success
+        for obj in problem.objectives:
+            npt.assert_almost_equal(
+                con_solution.optimal_objectives[obj.symbol], seq_solution.optimal_objectives[obj.symbol]
+            )
+
+
 @pytest.mark.nimbus
 def test_article_example():
     """Check that we get similar results for NIMBUS as in the original article.
@@ -3,7 +3,12 @@
 import numpy as np
 import numpy.testing as npt
 
-from desdeo.tools.non_dominated_sorting import fast_non_dominated_sort
+from desdeo.tools.non_dominated_sorting import (
+    dominates,
+    fast_non_dominated_sort,
+    fast_non_dominated_sort_indices,
+    non_dominated_sort_ranks,
+)
 
 
 def test_simple():
@@ -69,3 +74,55 @@ def test_simple():
             ]
         ),
     )
+
+
+def _brute_force_ranks(data: np.ndarray) -> np.ndarray:
+    """Computes the front ranks by peeling off the non-dominated solutions one front at a time."""
+    ranks = np.full(len(data), -1)
+    rank = 0
+    while (ranks == -1).any():
+        remaining = np.flatnonzero(ranks == -1)
+        front = [i for i in remaining if not any(dominates(data[j], data[i]) for j in remaining)]
+        ranks[front] = rank
+        rank += 1
+    return ranks
+
+
+def test_ranks_match_brute_force():
+    """Test that the front ranks match a brute force sort for two and more objectives, with duplicates."""
+    rng = np.random.default_rng(1)
+
+    for n_objectives in [2, 3, 5]:
+        # rounded to get duplicate and partially equal solutions
+        data = np.round(rng.random((150, n_objectives)), 1)
+
+        ranks = non_dominated_sort_ranks(data)
+        npt.assert_equal(ranks, _brute_force_ranks(data))
+
+        fronts = fast_non_dominated_sort_indices(data)
+        assert len(fronts) == ranks.max() + 1
+        for rank, front in enumerate(fronts):
+            npt.assert_equal(front, np.flatnonzero(ranks == rank))
+
+
+def test_ranks_n_survive():
+    """Test that only the fronts needed to cover the survivors are computed."""
+    rng = np.random.default_rng(2)
+
+    for n_objectives in [2, 4]:
+        data = rng.random((200, n_objectives))
+        all_ranks = non_dominated_sort_ranks(data)
+
+        n_survive = 50
+        ranks = non_dominated_sort_ranks(data, n_survive=n_survive)
+
+        last_front = ranks.max()
+        # the computed fronts are the same as when sorting everything
+        npt.assert_equal(ranks[ranks >= 0], all_ranks[ranks >= 0])
+        npt.assert_equal(ranks == -1, all_ranks > last_front)
+        # the last computed front is the one containing the n_survive-th solution
+        assert np.sum(ranks >= 0) >= n_survive
+        assert np.sum((ranks >= 0) & (ranks < last_front)) < n_survive
+
+        fronts = fast_non_dominated_sort(data, n_survive=n_survive)
+        assert len(fronts) == last_front + 1
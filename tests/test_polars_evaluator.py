@@ -1,10 +1,15 @@
 """Tests for the Polars evaluator."""
 
+import numpy as np
 import numpy.testing as npt
 import polars as pl
 import pytest
+from scipy.spatial import KDTree
 
 from desdeo.problem import (
+    Constraint,
+    ConstraintTypeEnum,
+    ExtraFunction,
     Objective,
     ObjectiveTypeEnum,
     PolarsEvaluator,
@@ -144,6 +149,17 @@ def test_find_closest_points():
         closest_points_df_single_var[objective_symbol_single_var].to_numpy(), expected_single_var
     )
 
+    # several objectives looked up at once with a prebuilt tree
+    discrete_df_multi = discrete_df_basic.with_columns((-pl.col("f_2")).alias("f_3"))
+    tree = KDTree(discrete_df_multi[variable_symbols_basic].to_numpy())
+
+    closest_points_df_multi = find_closest_points(
+        xs_basic, discrete_df_multi, variable_symbols_basic, ["f_2", "f_3"], tree=tree
+    )
+    assert closest_points_df_multi.columns == ["f_2", "f_3"]
+    npt.assert_array_almost_equal(closest_points_df_multi["f_2"].to_numpy(), expected_basic)
+    npt.assert_array_almost_equal(closest_points_df_multi["f_3"].to_numpy(), [-v for v in expected_basic])
+
 
 @pytest.mark.polars
 def test_knapsack_problem():
@@ -245,3 +261,75 @@ def test_evaluate_w_flattened():
     # check correct objective function values
     npt.assert_allclose(res_flat["f_1"].to_numpy(), [-1.6, -1.1])
     npt.assert_allclose(res_flat["f_2"].to_numpy(), [-16, -3.8])
+
+
+@pytest.mark.polars
+def test_evaluation_plan_with_dependent_functions():
+    """Test that functions referring to other functions are evaluated in the correct stages."""
+    variables = [
+        Variable(name="x_1", symbol="x_1", variable_type=VariableTypeEnum.real, lowerbound=0, upperbound=10),
+        Variable(name="x_2", symbol="x_2", variable_type=VariableTypeEnum.real, lowerbound=0, upperbound=10),
+    ]
+    extras = [
+        ExtraFunction(name="e_1", symbol="e_1", func="x_1 + x_2"),
+        ExtraFunction(name="e_2", symbol="e_2", func="2 * e_1"),
+    ]
+    objectives = [
+        Objective(name="f_1", symbol="f_1", func="e_2 + x_1", maximize=False),
+        Objective(name="f_2", symbol="f_2", func="x_1 * x_2", maximize=True),
+    ]
+    constraints = [
+        Constraint(name="g_1", symbol="g_1", func="f_1 - 5", cons_type=ConstraintTypeEnum.LTE),
+        Constraint(name="g_2", symbol="g_2", func="x_1 - x_2", cons_type=ConstraintTypeEnum.LTE),
+    ]
+    problem = Problem(
+        name="Plan problem",
+        description="",
+        variables=variables,
+        objectives=objectives,
+        constraints=constraints,
+        extra_funcs=extras,
+    )
+
+    evaluator = PolarsEvaluator(problem)
+
+    # e_1, f_2, g_2 | e_2, f_2_min | f_1 | f_1_min, g_1
+    assert len(evaluator.evaluation_stages) == 4
+
+    result = evaluator.evaluate({"x_1": [1.0, 2.0], "x_2": [3.0, 0.5]})
+
+    assert result.columns == ["x_1", "x_2", "e_1", "e_2", "f_1", "f_2", "f_1_min", "f_2_min", "g_1", "g_2"]
+    npt.assert_allclose(result["e_2"].to_numpy(), [8.0, 5.0])
+    npt.assert_allclose(result["f_1"].to_numpy(), [9.0, 7.0])
+    npt.assert_allclose(result["f_2_min"].to_numpy(), [-3.0, -1.0])
+    npt.assert_allclose(result["g_1"].to_numpy(), [4.0, 2.0])
+    npt.assert_allclose(result["g_2"].to_numpy(), [-2.0, 1.5])
+
+
+@pytest.mark.polars
+def test_evaluate_array():
+    """Test that evaluating with a numpy array matches evaluating with a dict."""
+    problem = river_pollution_problem()
+    evaluator = PolarsEvaluator(problem)
+
+    xs = np.array([[0.35, 0.95], [0.55, 0.75], [0.95, 0.35]])
+    expected = evaluator.evaluate({"x_1": xs[:, 0].tolist(), "x_2": xs[:, 1].tolist()})
+
+    # default layout: objectives, constraints, and scalarization functions
+    result = evaluator.evaluate_array(xs)
+    assert evaluator.array_columns == [obj.symbol for obj in problem.objectives]
+    assert result.shape == (3, len(problem.objectives))
+    assert result.flags["C_CONTIGUOUS"]
+    npt.assert_allclose(result, expected[evaluator.array_columns].to_numpy())
+
+    # chosen targets and a single point
+    result = evaluator.evaluate_array(xs[0], ["f_2_min", "f_1"])
+    assert result.shape == (1, 2)
+    npt.assert_allclose(result[0], [expected["f_2_min"][0], expected["f_1"][0]])
+
+    # tensor variables are given in flattened order
+    problem = simple_knapsack_vectors()
+    evaluator = PolarsEvaluator(problem)
+
+    result = evaluator.evaluate_array(np.array([[0, 0, 0, 0], [1, 1, 1, 1]]))
+    npt.assert_allclose(result, [[0, 0, -5], [22, 16, 9]])
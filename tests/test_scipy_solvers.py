@@ -1,10 +1,20 @@
 """Tests for the scipy solver interfaces."""
 
+import numpy as np
+import numpy.testing as npt
 import pytest
 
-from desdeo.problem import Objective, Problem, ScalarizationFunction, Variable
+from desdeo.problem import Objective, PolarsEvaluator, Problem, ScalarizationFunction, Variable
 from desdeo.problem.testproblems import binh_and_korn
-from desdeo.tools.scipy_solver_interfaces import ScipyDeSolver, ScipyMinimizeSolver, set_initial_guess
+from desdeo.tools.scipy_solver_interfaces import (
+    EvalTargetEnum,
+    ScipyDeOptions,
+    ScipyDeSolver,
+    ScipyMinimizeOptions,
+    ScipyMinimizeSolver,
+    get_scipy_eval,
+    set_initial_guess,
+)
 
 
 @pytest.mark.scipy
@@ -29,6 +39,49 @@ def test_scipy_de_with_constraints():
     solver.solve(target)
 
 
+@pytest.mark.scipy
+def test_scipy_eval_vectorized_shapes():
+    """Tests that the scipy evaluator evaluates a whole population at once with the shapes scipy expects."""
+    problem = binh_and_korn((False, False))
+    evaluator = PolarsEvaluator(problem)
+
+    obj_eval = get_scipy_eval(problem, evaluator, "f_1_min", EvalTargetEnum.objective)
+    con_eval = get_scipy_eval(problem, evaluator, "", EvalTargetEnum.constraint)
+
+    population = np.array([[1.0, 2.0, 3.0], [0.5, 1.0, 1.5]])  # (n_variables, n_points)
+    expected = evaluator.evaluate({"x_1": population[0].tolist(), "x_2": population[1].tolist()})
+
+    npt.assert_allclose(obj_eval(population), expected["f_1_min"].to_numpy())
+    assert np.ndim(obj_eval(population[:, 0])) == 0
+
+    n_constraints = len(problem.constraints)
+    assert con_eval(population).shape == (n_constraints, 3)
+    assert con_eval(population[:, 0]).shape == (n_constraints,)
+    npt.assert_allclose(con_eval(population)[0], -expected[problem.constraints[0].symbol].to_numpy())
+
+
+@pytest.mark.scipy
+def test_scipy_de_with_workers():
+    """Tests the scipy differential evolution solver with the evaluations distributed to worker processes."""
+    problem = binh_and_korn((False, False))
+    de_kwargs = {"maxiter": 5, "popsize": 5, "seed": 1, "updating": "deferred", "polish": False}
+
+    solver = ScipyDeSolver(problem, ScipyDeOptions(de_kwargs={**de_kwargs, "workers": 2}))
+    res = solver.solve("f_1")
+
+    assert res.optimal_objectives["f_1"] >= 0
+    # the evaluations in the workers went through the solver's cache
+    assert solver.evaluation_cache.misses > 0
+    assert solver.evaluation_cache.evaluator is solver.evaluator
+
+    # the population is evaluated the same way as in a single process
+    single = ScipyDeSolver(problem, ScipyDeOptions(de_kwargs={**de_kwargs, "workers": 1, "vectorized": True}))
+    res_single = single.solve("f_1")
+
+    assert res.optimal_variables == pytest.approx(res_single.optimal_variables)
+    assert solver.evaluation_cache.misses == single.evaluation_cache.misses
+
+
 def _make_mixed_problem() -> Problem:
     """Creates a problem with both a minimize and a maximize objective.
 
@@ -212,3 +265,24 @@ def test_scipy_minimize_still_minimizes_when_maximize_is_false():
     assert result.optimal_variables["y"] == pytest.approx(0.0, abs=0.1), (
         f"Expected y ≈ 0.0 for a minimized objective, got {result.optimal_variables['y']}."
     )
+
+
+@pytest.mark.scipy
+def test_scipy_minimize_evaluation_cache():
+    """Tests that the objective and the constraints share the evaluation results of the same points."""
+    problem = binh_and_korn((False, False))
+
+    solver = ScipyMinimizeSolver(problem, ScipyMinimizeOptions(method="SLSQP"))
+    res = solver.solve("f_1")
+
+    assert res.success
+    assert solver.evaluation_cache.hits > 0
+    assert solver.evaluation_cache.misses > 0
+
+    # without caching, every call is a miss
+    solver_no_cache = ScipyMinimizeSolver(problem, ScipyMinimizeOptions(method="SLSQP", cache_size=0))
+    res_no_cache = solver_no_cache.solve("f_1")
+
+    assert solver_no_cache.evaluation_cache.hits == 0
+    assert solver_no_cache.evaluation_cache.misses > solver.evaluation_cache.misses
+    assert res_no_cache.optimal_objectives["f_1"] == pytest.approx(res.optimal_objectives["f_1"])
@@ -1,7 +1,19 @@
 """Tests for simulator and surrogate evaluator."""
 
+import os
+import pickle
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+
+import numpy as np
+import polars as pl
 import pytest
 from fixtures import surrogate_file, surrogate_file2  # noqa: F401
+from polars.testing import assert_frame_equal
 
 from desdeo.problem import (
     Constraint,
@@ -14,9 +26,38 @@ from desdeo.problem import (
     Variable,
     VariableTypeEnum,
 )
+from desdeo.problem.evaluation_cache import EvaluationCache
+from desdeo.problem.simulator_http import HTTPSimulatorOptions
+from desdeo.problem.surrogate_registry import clear_surrogate_registry, loaded_surrogates
 from desdeo.problem.testproblems import simulator_problem
 
 
+@pytest.fixture
+def benchmarks_server(monkeypatch):
+    """Serve the pymoo benchmark problems on a free local port for the duration of a test."""
+    uvicorn = pytest.importorskip("uvicorn")
+    benchmarks_server = pytest.importorskip("desdeo.problem.testproblems.benchmarks_server")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(benchmarks_server.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            pytest.fail("the benchmarks server did not start")
+        time.sleep(0.01)
+
+    monkeypatch.setattr(benchmarks_server, "port", port)
+    yield benchmarks_server
+
+    server.should_exit = True
+    thread.join()
+
+
 @pytest.mark.simulator_support
 def test_w_analytical_simulator_surrogate_problem(surrogate_file, surrogate_file2):  # noqa: F811
     """Test the evaluator with a problem that has analytical, simulator and surrogate based functions."""
@@ -103,3 +144,243 @@ def test_w_o_given_surrogate_paths(surrogate_file, surrogate_file2):  # noqa: F8
     res = evaluator.evaluate(
         {"x_1": [0, 1, 2, 3, 4], "x_2": [4, 3, 2, 1, 0], "x_3": [0, 4, 1, 3, 2], "x_4": [3, 1, 3, 2, 3]}
     )
+
+
+@pytest.mark.simulator_support
+def test_evaluate_with_dataframe(surrogate_file, surrogate_file2):  # noqa: F811
+    """Test that the evaluator can be reused and accepts a polars dataframe as well as a dict."""
+    problem = simulator_problem("tests/data")
+
+    surrogates = {"f_5": surrogate_file, "f_6": surrogate_file2, "g_3": surrogate_file, "e_3": surrogate_file2}
+
+    evaluator = SimulatorEvaluator(problem=problem, surrogate_paths=surrogates)
+
+    xs = {"x_1": [0, 1, 2, 3, 4], "x_2": [4, 3, 2, 1, 0], "x_3": [0, 4, 1, 3, 2], "x_4": [3, 1, 3, 2, 3]}
+
+    res_dict = evaluator.evaluate(xs)
+    res_df = evaluator.evaluate(pl.DataFrame(xs))
+
+    assert res_dict.columns == res_df.columns
+    assert res_dict.equals(res_df)
+
+
+@pytest.mark.simulator_support
+@pytest.mark.parametrize("simulator_workers", [1, 3])
+def test_persistent_simulator_workers(surrogate_file, surrogate_file2, simulator_workers):  # noqa: F811
+    """Test that persistent simulator workers give the same results as running the simulator files per batch."""
+    problem = simulator_problem("tests/data")
+
+    surrogates = {"f_5": surrogate_file, "f_6": surrogate_file2, "g_3": surrogate_file, "e_3": surrogate_file2}
+    params = {"s_1": {"alpha": 0.1, "beta": 0.2}, "s_2": {"epsilon": 10, "gamma": 20}}
+
+    xs = {"x_1": [0, 1, 2, 3, 4], "x_2": [4, 3, 2, 1, 0], "x_3": [0, 4, 1, 3, 2], "x_4": [3, 1, 3, 2, 3]}
+
+    expected = SimulatorEvaluator(problem=problem, params=params, surrogate_paths=surrogates).evaluate(xs)
+
+    with SimulatorEvaluator(
+        problem=problem, params=params, surrogate_paths=surrogates, simulator_workers=simulator_workers
+    ) as evaluator:
+        # the workers are reused across batches, whether given as a dict or a dataframe
+        for batch in (xs, pl.DataFrame(xs), xs):
+            res = evaluator.evaluate(batch)
+
+            assert res.columns == expected.columns
+            assert res.equals(expected)
+
+        pools = list(evaluator._worker_pools.values())
+        assert len(pools) == len(problem.simulators)
+        assert all(len(pool.workers) == simulator_workers for pool in pools)
+
+    # closing the evaluator stops the workers
+    assert all(worker.process.poll() is not None for pool in pools for worker in pool.workers)
+
+
+@pytest.mark.simulator_support
+@pytest.mark.parametrize(
+    "executor_type",
+    [ThreadPoolExecutor, partial(ProcessPoolExecutor, mp_context=get_context("spawn"))],
+    ids=["threads", "processes"],
+)
+def test_concurrent_sources(surrogate_file, surrogate_file2, executor_type):  # noqa: F811
+    """Test that evaluating the simulators and surrogates concurrently gives the same results, timings and caching."""
+    problem = simulator_problem("tests/data")
+
+    surrogates = {"f_5": surrogate_file, "f_6": surrogate_file2, "g_3": surrogate_file, "e_3": surrogate_file2}
+    params = {"s_1": {"alpha": 0.1, "beta": 0.2}, "s_2": {"epsilon": 10, "gamma": 20}}
+
+    xs = {"x_1": [0, 1, 2, 3, 4], "x_2": [4, 3, 2, 1, 0], "x_3": [0, 4, 1, 3, 2], "x_4": [3, 1, 3, 2, 3]}
+
+    sequential = SimulatorEvaluator(problem=problem, params=params, surrogate_paths=surrogates)
+    expected = sequential.evaluate(xs)
+
+    cache = EvaluationCache()
+    with executor_type(max_workers=4) as executor:
+        evaluator = SimulatorEvaluator(
+            problem=problem, params=params, surrogate_paths=surrogates, executor=executor, cache=cache
+        )
+        res = evaluator.evaluate(xs)
+        # the cache is consulted in this process, so the second batch is not sent to the workers at all
+        assert evaluator.evaluate(xs).equals(res)
+    n_sources = len(problem.simulators) + len(surrogates)
+    assert (cache.misses, cache.hits) == (n_sources * 5, n_sources * 5)
+
+    # the columns are joined in the same order, whichever source finished first
+    assert res.columns == expected.columns
+    assert res.equals(expected)
+
+    # every source is timed
+    sources = (
+        {"analytical"}
+        | {f"simulator:{sim.name}" for sim in problem.simulators}
+        | {f"surrogate:{symbol}" for symbol in surrogates}
+    )
+    for timings in (sequential.timings, evaluator.timings):
+        assert set(timings) == sources
+        assert all(elapsed >= 0.0 for elapsed in timings.values())
+
+
+@pytest.mark.simulator_support
+def test_pickled_evaluator(surrogate_file, surrogate_file2):  # noqa: F811
+    """Test that an evaluator is pickled without the state of its process, and still evaluates the same."""
+    problem = simulator_problem("tests/data")
+
+    surrogates = {"f_5": surrogate_file, "f_6": surrogate_file2, "g_3": surrogate_file, "e_3": surrogate_file2}
+    params = {"s_1": {"alpha": 0.1, "beta": 0.2}, "s_2": {"epsilon": 10, "gamma": 20}}
+
+    xs = {"x_1": [0, 1, 2, 3, 4], "x_2": [4, 3, 2, 1, 0], "x_3": [0, 4, 1, 3, 2], "x_4": [3, 1, 3, 2, 3]}
+
+    with (
+        ThreadPoolExecutor(max_workers=2) as executor,
+        SimulatorEvaluator(
+            problem=problem,
+            params=params,
+            surrogate_paths=surrogates,
+            simulator_workers=1,
+            executor=executor,
+            cache=EvaluationCache(),
+        ) as evaluator,
+    ):
+        expected = evaluator.evaluate(xs)
+        assert len(evaluator._worker_pools) > 0
+
+        copy = pickle.loads(pickle.dumps(evaluator))  # noqa: S301
+
+    assert copy.executor is None
+    assert copy.cache is None
+    assert copy.simulator_workers is None
+    assert copy._worker_pools == {}
+    assert copy.evaluate(xs).equals(expected)
+
+
+@pytest.mark.simulator_support
+@pytest.mark.parametrize("wire_format", ["json", "arrow"])
+def test_http_simulator_chunks_over_pooled_session(benchmarks_server, wire_format):
+    """Test that batches sent in concurrent chunks over a pooled session match a single request."""
+    parameters = benchmarks_server.PymooParameters(name="dtlz2", n_var=5, n_obj=3)
+    xs = pl.DataFrame({f"x_{i + 1}": [j / 10 for j in range(11)] for i in range(parameters.n_var)})
+
+    expected = SimulatorEvaluator(benchmarks_server.server_problem(parameters)).evaluate(xs)
+
+    problem = benchmarks_server.server_problem(parameters, wire_format=wire_format)
+    with SimulatorEvaluator(
+        problem, http_options=HTTPSimulatorOptions(chunk_size=3, max_in_flight=2, retries=0)
+    ) as evaluator:
+        # the same session is reused for every batch
+        for _ in range(2):
+            res = evaluator.evaluate(xs)
+
+            assert res.columns == expected.columns
+            assert res.equals(expected)
+
+        assert len(evaluator._http_clients) == 1
+
+
+@pytest.mark.simulator_support
+def test_evaluation_cache(surrogate_file, surrogate_file2, tmp_path):  # noqa: F811
+    """Test that cached simulator and surrogate values are reused, within a session and from disk."""
+    problem = simulator_problem("tests/data")
+
+    surrogates = {"f_5": surrogate_file, "f_6": surrogate_file2, "g_3": surrogate_file, "e_3": surrogate_file2}
+    params = {"s_1": {"alpha": 0.1, "beta": 0.2}, "s_2": {"epsilon": 10, "gamma": 20}}
+    n_sources = len(problem.simulators) + len(surrogates)
+
+    # the last sample is a duplicate of the first one
+    xs = {"x_1": [0, 1, 2, 3, 0], "x_2": [4, 3, 2, 1, 4], "x_3": [0, 4, 1, 3, 0], "x_4": [3, 1, 3, 2, 3]}
+    expected = SimulatorEvaluator(problem=problem, params=params, surrogate_paths=surrogates).evaluate(xs)
+
+    cache = EvaluationCache(path=tmp_path / "evaluations.sqlite")
+    evaluator = SimulatorEvaluator(problem=problem, params=params, surrogate_paths=surrogates, cache=cache)
+
+    assert_frame_equal(evaluator.evaluate(xs), expected, rel_tol=1e-9)
+    assert cache.hits == 0
+    assert cache.misses == 5 * n_sources
+
+    assert_frame_equal(evaluator.evaluate(xs), expected, rel_tol=1e-9)
+    assert cache.hits == 5 * n_sources
+    assert cache.hit_rate == 0.5
+    cache.close()
+
+    # a new cache opened on the same file finds the values on disk
+    reopened = EvaluationCache(path=tmp_path / "evaluations.sqlite")
+    evaluator = SimulatorEvaluator(problem=problem, params=params, surrogate_paths=surrogates, cache=reopened)
+    assert_frame_equal(evaluator.evaluate(xs), expected, rel_tol=1e-9)
+    assert reopened.disk_hits == 5 * n_sources
+    assert reopened.misses == 0
+
+    # other parameters give other results, so they do not share the cached values
+    other_params = {"s_1": {"alpha": 0.5, "beta": 0.2}, "s_2": {"epsilon": 10, "gamma": 20}}
+    evaluator = SimulatorEvaluator(problem=problem, params=other_params, surrogate_paths=surrogates, cache=reopened)
+    evaluator.evaluate(xs)
+    assert reopened.misses == 5
+    reopened.close()
+
+
+def test_evaluation_cache_tolerance():
+    """Test that decision vectors within the tolerance of each other share their cached values."""
+    calls = []
+
+    def evaluate(xs: pl.DataFrame) -> pl.DataFrame:
+        calls.append(xs.height)
+        return xs.select((pl.col("x_1") + pl.col("x_2")).alias("f_1"))
+
+    cache = EvaluationCache(max_entries=2, tolerance=1e-6)
+    cache.evaluate("sum", evaluate, pl.DataFrame({"x_1": [1.0, 2.0], "x_2": [0.0, 0.0]}))
+    res = cache.evaluate("sum", evaluate, pl.DataFrame({"x_1": [1.0 + 1e-9, 2.0], "x_2": [-0.0, 1e-10]}))
+
+    assert calls == [2]
+    assert res["f_1"].to_list() == [1.0, 2.0]
+
+    # only the most recently used entries are kept in memory
+    cache.evaluate("sum", evaluate, pl.DataFrame({"x_1": [3.0], "x_2": [0.0]}))
+    cache.evaluate("sum", evaluate, pl.DataFrame({"x_1": [1.0], "x_2": [0.0]}))
+    assert calls == [2, 1, 1]
+
+
+@pytest.mark.simulator_support
+def test_surrogate_registry(surrogate_file, surrogate_file2):  # noqa: F811
+    """Test that surrogate models are loaded once per process, and again only when their files change."""
+    problem = simulator_problem("tests/data")
+    surrogates = {"f_5": surrogate_file, "f_6": surrogate_file2, "g_3": surrogate_file, "e_3": surrogate_file2}
+    clear_surrogate_registry()
+
+    first = SimulatorEvaluator(problem=problem, surrogate_paths=surrogates)
+    second = SimulatorEvaluator(problem=problem, surrogate_paths=surrogates)
+
+    # each file is loaded once, and the model is shared by every function and evaluator that uses it
+    assert set(loaded_surrogates()) == {surrogate_file.resolve(), surrogate_file2.resolve()}
+    assert first.surrogates["f_5"] is first.surrogates["g_3"]
+    assert all(first.surrogates[symbol] is second.surrogates[symbol] for symbol in surrogates)
+
+    # a model saved over its old file is loaded again
+    stat = surrogate_file.stat()
+    os.utime(surrogate_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = SimulatorEvaluator(problem=problem, surrogate_paths=surrogates)
+    assert third.surrogates["f_5"] is not first.surrogates["f_5"]
+    assert third.surrogates["f_6"] is first.surrogates["f_6"]
+
+    # the arrays of a memory-mapped model are read from the file on demand
+    mapped = SimulatorEvaluator(problem=problem, surrogate_paths=surrogates, surrogate_mmap_mode="r")
+    assert isinstance(mapped.surrogates["f_5"].X_train_, np.memmap)
+    xs = {"x_1": [0, 1], "x_2": [4, 3], "x_3": [0, 4], "x_4": [3, 1]}
+    assert mapped.evaluate(xs).equals(first.evaluate(xs))
+    clear_surrogate_registry()
@@ -1,17 +1,23 @@
 """Tests the utils in the desdeo.tools package."""
 
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 from fixtures import dtlz2_5x_3f_data_based  # noqa: F401
 
+from desdeo.problem import Problem
 from desdeo.problem.testproblems import (
     dtlz2,
     re21,
     river_pollution_problem,
     simple_constrained_quadratic_tensor_test_problem,
 )
+from desdeo.tools import PyomoIpoptSolver, ScipyMinimizeSolver
+from desdeo.tools.scipy_solver_interfaces import ScipyMinimizeOptions
 from desdeo.tools.utils import (
+    _payoff_table_cache,
+    _payoff_table_key,
     available_solvers,
     find_compatible_solvers,
     guess_best_solver,
@@ -82,3 +88,73 @@ def test_payoff_dtlz2():
     problem = dtlz2(6, 4)
 
     ideal, nadir = payoff_table_method(problem)  # noqa: RUF059
+
+
+@pytest.mark.utils
+def test_payoff_table_executor_and_cache():
+    """Tests that the payoff-table method gives the same points concurrently and when cached."""
+    problem = dtlz2(6, 3)
+
+    ideal, nadir = payoff_table_method(problem, PyomoIpoptSolver, use_cache=False)
+
+    # Pyomo is not thread-safe, so the Ipopt solves run in processes
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        ideal_ex, nadir_ex = payoff_table_method(problem, PyomoIpoptSolver, executor=executor)
+
+    ideal_ws, nadir_ws = payoff_table_method(problem, PyomoIpoptSolver, warm_start=True, use_cache=False)
+
+    for obj in problem.objectives:
+        assert ideal_ex[obj.symbol] == pytest.approx(ideal[obj.symbol], abs=1e-6)
+        assert nadir_ex[obj.symbol] == pytest.approx(nadir[obj.symbol], abs=1e-6)
+        assert ideal_ws[obj.symbol] == pytest.approx(ideal[obj.symbol], abs=1e-6)
+        assert nadir_ws[obj.symbol] == pytest.approx(nadir[obj.symbol], abs=1e-6)
+
+    # the points computed with the executor were cached
+    n_cached = len(_payoff_table_cache)
+    ideal_cached, nadir_cached = payoff_table_method(problem, PyomoIpoptSolver)
+
+    assert len(_payoff_table_cache) == n_cached
+    assert ideal_cached == ideal_ex
+    assert nadir_cached == nadir_ex
+
+
+@pytest.mark.utils
+def test_payoff_table_cache_key(monkeypatch):
+    """Tests that the cache key tells warm starting apart, and that a problem is serialized only once."""
+    n_dumps = 0
+    model_dump_json = Problem.model_dump_json
+
+    def counting_model_dump_json(self, **kwargs):
+        nonlocal n_dumps
+        n_dumps += 1
+        return model_dump_json(self, **kwargs)
+
+    monkeypatch.setattr(Problem, "model_dump_json", counting_model_dump_json)
+
+    problem = river_pollution_problem()
+    key = _payoff_table_key(problem, PyomoIpoptSolver, None, warm_start=False)
+
+    assert _payoff_table_key(problem, PyomoIpoptSolver, None, warm_start=False) == key
+    assert _payoff_table_key(problem, PyomoIpoptSolver, None, warm_start=True) != key
+    assert n_dumps == 1
+
+    # an equal problem gets the same key
+    assert _payoff_table_key(river_pollution_problem(), PyomoIpoptSolver, None, warm_start=False) == key
+    assert n_dumps == 2
+
+    # lambdas share their names whatever they capture, so solvers that are not classes get no key
+    slsqp = ScipyMinimizeOptions(method="SLSQP")
+    assert _payoff_table_key(problem, lambda p: ScipyMinimizeSolver(p, slsqp), None, warm_start=False) is None
+
+
+@pytest.mark.utils
+def test_payoff_table_not_cached_for_lambdas():
+    """Tests that the points solved with a solver that is not a class are not cached."""
+    problem = dtlz2(5, 3)
+    n_cached = len(_payoff_table_cache)
+
+    slsqp = ScipyMinimizeOptions(method="SLSQP")
+    ideal, nadir = payoff_table_method(problem, lambda p: ScipyMinimizeSolver(p, slsqp))
+
+    assert len(_payoff_table_cache) == n_cached
+    assert set(ideal) == set(nadir) == {obj.symbol for obj in problem.objectives}